@@ -42,7 +42,9 @@ Usage
 -----
 
     user@host:$ python exufs_fetch.py --<yaml_file> --<cycle> --<work_path> \
-                    --<expt_name> [--platform] [--fetch_type] [--fileid]
+                    --<expt_name> [--platform] [--fetch_type] [--fileid] \
+                    [--plan_file] [--prefetch_cycles] [--service_socket] \
+                    [--shard]
 
 Author(s)
 ---------
@@ -67,6 +69,11 @@ import time
 
 from schema import Optional, Or
 from staging.fetch import Fetch
+from staging.prefetch import Prefetch
+from staging.service import FETCH_MAND_ATTR_LIST, FETCH_OPT_ATTR_LIST
+from staging.service import error as service_error
+from staging.service import request
+from tools import parser_interface
 from utils.arguments_interface import Arguments
 from utils.logger_interface import Logger
 
@@ -206,6 +213,63 @@ def main() -> None:
 
         --fileid=ham,eggs or -fileid=ham,eggs
 
+    plan_file: str, optional
+
+        A Python string specifying the path to a precompiled fetch
+        plan (see exufs_plan.py) for the respective forecast cycle; if
+        specified, the fetch configuration attributes are collected
+        from the fetch plan rather than from the YAML-formatted
+        configuration file(s); the platform, fetch_type, and fileid
+        keywords may be used to filter the fetch plan.
+
+        --plan_file=/path/to/plan/file or -plan_file=/path/to/plan/file
+
+    prefetch_cycles: int, optional
+
+        A Python integer specifying the number of forecast cycles,
+        following the respective forecast cycle, for which to collect
+        files into the local object cache (see the cache and prefetch
+        attributes of the YAML-formatted configuration file); if
+        specified, the application executes in prefetch mode and the
+        files for the respective forecast cycle are not collected.
+
+        --prefetch_cycles=2 or -prefetch_cycles=2
+
+    service_socket: str, optional
+
+        A Python string specifying the Unix domain socket path for a
+        resident staging service (see exufs_service.py); if
+        specified, the fetch request is submitted to the staging
+        service and this application waits for the fetch request to
+        complete rather than collecting the files itself.
+
+        --service_socket=/path/to/socket or -service_socket=/path/to/socket
+
+    shard: str, optional
+
+        A Python string specifying the shard of the fetch to be
+        collected by this application; the objects (i.e., file
+        identifier and timestamp) are partitioned across the shards
+        by size and the collected files are concatenated once all
+        shards have completed by the last shard to complete; the
+        shards must be launched using identical attributes and must
+        share the experiment work_path filesystem.
+
+        For the second of four shards (the shard index is zero-based),
+        the keyword value may be entered as:
+
+        --shard=1/4 or -shard=1/4
+
+        For Slurm job arrays, the shard index and the number of shards
+        are determined from the Slurm job array environment variables:
+
+        --shard=slurm or -shard=slurm
+
+        For a work queue, from which any number of applications claim
+        the objects, largest first, until all have been collected:
+
+        --shard=queue or -shard=queue
+
     """
 
     # Define the schema attributes.
@@ -217,6 +281,10 @@ def main() -> None:
         Optional("fetch_type"): str,
         Optional("platform"): str,
         Optional("fileid"): str,
+        Optional("plan_file"): str,
+        Optional("prefetch_cycles"): Or(str, int),
+        Optional("service_socket"): str,
+        Optional("shard"): str,
     }
 
     # Collect the command line arguments.
@@ -226,9 +294,47 @@ def main() -> None:
     Logger().info(msg=msg)
     options_obj = Arguments().run(eval_schema=True, cls_schema=cls_schema)
 
-    # Launch the task.
-    task = Fetch(options_obj=options_obj)
-    task.run()
+    # Launch the task; proceed accordingly.
+    prefetch_cycles = parser_interface.object_getattr(
+        object_in=options_obj, key="prefetch_cycles", force=True
+    )
+    service_socket = parser_interface.object_getattr(
+        object_in=options_obj, key="service_socket", force=True
+    )
+
+    if service_socket is not None and prefetch_cycles is None:
+        request_dict = {
+            key: parser_interface.object_getattr(
+                object_in=options_obj, key=key, force=True
+            )
+            for key in FETCH_MAND_ATTR_LIST + FETCH_OPT_ATTR_LIST
+        }
+
+        # The file paths are defined relative to this application
+        # rather than the staging service.
+        for key in ["plan_file", "work_path", "yaml_file"]:
+            if request_dict[key] is not None:
+                request_dict[key] = os.path.abspath(request_dict[key])
+
+        response = request(
+            socket_path=service_socket, request_dict={"op": "fetch", **request_dict}
+        )
+
+        if response["status"] != "ok":
+            msg = (
+                f"The staging service {service_socket} fetch request failed; "
+                f"received {response.get('message')}. Aborting!!!"
+            )
+            service_error(msg=msg)
+
+    if service_socket is None and prefetch_cycles is None:
+        task = Fetch(options_obj=options_obj)
+        task.run()
+
+    if prefetch_cycles is not None:
+        task = Prefetch(options_obj=options_obj)
+        task.run()
+
     stop_time = time.time()
     msg = f"Completed application {script_name}."
     Logger().info(msg=msg)
@@ -0,0 +1,141 @@
+# =========================================================================
+
+# Script: scripts/exufs_service.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Script
+------
+
+    exufs_service.py
+
+Description
+-----------
+
+    This script contains a functional application interface to
+    launch the resident staging service; the staging service accepts
+    fetch requests from the fetch application (see exufs_fetch.py,
+    via the --service_socket keyword) on the specified Unix domain
+    socket path until it is shutdown.
+
+Functions
+---------
+
+    main()
+
+        This is the driver-level method to invoke the tasks within
+        this script.
+
+Usage
+-----
+
+    user@host:$ python exufs_service.py --<socket_path> [--nworkers]
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+# pylint: disable=no-name-in-module
+
+# ----
+
+import os
+import time
+
+from schema import Optional, Or
+from staging.service import StagingService
+from tools import parser_interface
+from utils.arguments_interface import Arguments
+from utils.logger_interface import Logger
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+
+def main() -> None:
+    """
+    Description
+    -----------
+
+    This is the driver-level function to invoke the tasks within this
+    script.
+
+    Parameters
+    ----------
+
+    socket_path: str
+
+        A Python string specifying the Unix domain socket path on
+        which the staging service listens for fetch requests; this
+        path must be local to the respective host.
+
+        --socket_path=/path/to/socket or -socket_path=/path/to/socket
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of fetch requests that
+        the staging service may execute concurrently; the default is
+        a single fetch request.
+
+        --nworkers=4 or -nworkers=4
+
+    """
+
+    # Define the schema attributes.
+    cls_schema = {"socket_path": str, Optional("nworkers"): Or(str, int)}
+
+    # Collect the command line arguments.
+    script_name = os.path.basename(__file__)
+    start_time = time.time()
+    msg = f"Beginning application {script_name}."
+    Logger().info(msg=msg)
+    options_obj = Arguments().run(eval_schema=True, cls_schema=cls_schema)
+
+    # Launch the task.
+    nworkers = parser_interface.object_getattr(
+        object_in=options_obj, key="nworkers", force=True
+    )
+    task = StagingService(socket_path=options_obj.socket_path, nworkers=nworkers or 1)
+    task.serve()
+    stop_time = time.time()
+    msg = f"Completed application {script_name}."
+    Logger().info(msg=msg)
+    total_time = stop_time - start_time
+    msg = f"Total Elapsed Time: {total_time} seconds."
+    Logger().info(msg=msg)
+
+
+# ----
+
+
+if __name__ == "__main__":
+    main()
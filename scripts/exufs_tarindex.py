@@ -0,0 +1,164 @@
+# =========================================================================
+
+# Script: scripts/exufs_tarindex.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Script
+------
+
+    exufs_tarindex.py
+
+Description
+-----------
+
+    This script contains a functional application interface to build
+    the sidecar indices (i.e., the member data offsets and sizes) for
+    (uncompressed) tar archives such that the members may be
+    subsequently collected by the fetch application (see
+    exufs_fetch.py) tar platform without reading the respective tar
+    archives.
+
+Functions
+---------
+
+    main()
+
+        This is the driver-level method to invoke the tasks within
+        this script.
+
+Usage
+-----
+
+    user@host:$ python exufs_tarindex.py --<tar_path> [--index_path]
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+# pylint: disable=no-name-in-module
+
+# ----
+
+import os
+import time
+
+from schema import Optional
+from staging import tarindex
+from tools import parser_interface
+from utils.arguments_interface import Arguments
+from utils.logger_interface import Logger
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+
+def main() -> None:
+    """
+    Description
+    -----------
+
+    This is the driver-level function to invoke the tasks within this
+    script.
+
+    Parameters
+    ----------
+
+    tar_path: str
+
+        A Python string specifying the path to the tar archive to be
+        indexed; this argument may also contain a comma-delimited
+        string for multiple tar archives (no spaces between
+        comma-delimited values).
+
+        --tar_path=/path/to/tar/archive or -tar_path=/path/to/tar/archive
+
+    Keywords
+    --------
+
+    index_path: str, optional
+
+        A Python string specifying the path to the sidecar index for
+        a single tar archive; if not specified, the sidecar index is
+        written to <tar_path>.index; this must be consistent with the
+        tar_index attribute of the respective file identifiers.
+
+        --index_path=/path/to/index or -index_path=/path/to/index
+
+    """
+
+    # Define the schema attributes.
+    cls_schema = {
+        "tar_path": str,
+        Optional("index_path"): str,
+    }
+
+    # Collect the command line arguments.
+    script_name = os.path.basename(__file__)
+    start_time = time.time()
+    msg = f"Beginning application {script_name}."
+    Logger().info(msg=msg)
+    options_obj = Arguments().run(eval_schema=True, cls_schema=cls_schema)
+
+    # Launch the task.
+    tar_paths = options_obj.tar_path.split(",")
+    index_path = parser_interface.object_getattr(
+        object_in=options_obj, key="index_path", force=True
+    )
+    if index_path is not None and len(tar_paths) > 1:
+        msg = (
+            "The index_path argument may only be specified for a single "
+            "tar archive. Aborting!!!"
+        )
+        tarindex.error(msg=msg)
+
+    for tar_path in tar_paths:
+        index_dict = tarindex.build_index(tar_path=tar_path, index_path=index_path)
+        msg = (
+            f"Indexed {len(index_dict['members'])} member(s) of tar archive "
+            f"{tar_path}."
+        )
+        Logger().info(msg=msg)
+
+    stop_time = time.time()
+    msg = f"Completed application {script_name}."
+    Logger().info(msg=msg)
+    total_time = stop_time - start_time
+    msg = f"Total Elapsed Time: {total_time} seconds."
+    Logger().info(msg=msg)
+
+
+# ----
+
+
+if __name__ == "__main__":
+    main()
@@ -98,6 +98,24 @@ class Launch:
         A Python object containing the attributes collect via the
         command line from the application driver script.
 
+    Keywords
+    --------
+
+    task_id: str, optional
+
+        A Python string specifying the task identifier for the
+        YAML-formatted experiment configuration file name.
+
+    attrs_dict: dict, optional
+
+        A Python dictionary containing the (precompiled) experiment
+        attributes (i.e., com_root, expt_name, itrc_root, and
+        work_path); if specified, the experiment attributes are
+        collected from this dictionary and the YAML-formatted
+        configuration file is not parsed (i.e., the attribute
+        yaml_dict is NoneType and the experiment configuration files
+        cannot be built).
+
     Raises
     ------
 
@@ -111,8 +129,9 @@ class Launch:
 
     """
 
-    @classmethod
-    def __init__(cls, options_obj: object, task_id: str = "launch"):
+    def __init__(
+        self, options_obj: object, task_id: str = "launch", attrs_dict: dict = None
+    ):
         """
         Description
         -----------
@@ -122,7 +141,6 @@ class Launch:
         """
 
         # Define the base-class attributes.
-        self = cls
         self.options_obj = options_obj
         self.logger = Logger()
 
@@ -167,16 +185,23 @@ class Launch:
             )
             error(msg=msg)
 
-        # Parse the configuration file.
-        self.yaml_dict = YAML().read_yaml(yaml_file=self.yaml_file)
-
         # Define the directory tree paths relative to the respective
-        # forecast cycle.
-        self.com_root = os.path.join(
-            self.work_path, self.expt_name, "com", self.cycle)
-        self.itrc_root = os.path.join(
-            self.work_path, self.expt_name, self.cycle, "intercom"
-        )
+        # forecast cycle; if the experiment attributes have been
+        # specified, the configuration file is not parsed.
+        if attrs_dict is not None:
+            self.yaml_dict = None
+            for attr in ["com_root", "expt_name", "itrc_root", "work_path"]:
+                self = parser_interface.object_setattr(
+                    object_in=self, key=attr, value=attrs_dict[attr]
+                )
+
+        if attrs_dict is None:
+            self.yaml_dict = YAML().read_yaml(yaml_file=self.yaml_file)
+            self.com_root = os.path.join(
+                self.work_path, self.expt_name, "com", self.cycle)
+            self.itrc_root = os.path.join(
+                self.work_path, self.expt_name, self.cycle, "intercom"
+            )
 
         # Define the YAML-formatted experiment configuration file for
         # the respective task.
@@ -202,8 +227,21 @@ class Launch:
             * raised if a mandatory experiment attribute has not been
               defined.
 
+            * raised if the experiment attributes have been collected
+              from precompiled experiment attributes (i.e., the
+              YAML-formatted configuration file has not been parsed).
+
         """
 
+        # Check that the YAML-formatted configuration file has been
+        # parsed; proceed accordingly.
+        if self.yaml_dict is None:
+            msg = (
+                "The experiment configuration files cannot be built from "
+                "precompiled experiment attributes. Aborting!!!"
+            )
+            error(msg=msg)
+
         # Define the mandatory experiment attributes within the
         # YAML-formatted configuration file.
         attrs_list = [
@@ -45,6 +45,11 @@ Functions
         This function is the exception handler for the respective
         module.
 
+    posix_filepath(root_path, object_path)
+
+        This function defines the POSIX filesystem path for the
+        specified object path beneath the specified root path.
+
 Requirements
 ------------
 
@@ -75,12 +80,13 @@ import os
 import numpy
 from confs.yaml_interface import YAML
 from exceptions import StagingError
-from ioapps import boto3_interface, hashlib_interface, netcdf4_interface
+from ioapps import hashlib_interface
 from launch import Launch
+from staging import awss3, decompress, ncconcat, plan, tarindex
+from staging.cache import materialize
+from staging.stagelog import StagingLogger, msg_except_handle
 from tools import datetime_interface, fileio_interface, parser_interface
 from utils import timestamp_interface
-from utils.error_interface import msg_except_handle
-from utils.logger_interface import Logger
 
 # ----
 
@@ -120,8 +126,7 @@ class Staging:
 
     """
 
-    @classmethod
-    def __init__(cls, options_obj: object, task_id: str = None):
+    def __init__(self, options_obj: object, task_id: str = None):
         """
         Description
         -----------
@@ -131,12 +136,8 @@ class Staging:
         """
 
         # Define the base-class attributes.
-        self = cls
         self.options_obj = options_obj
-        self.logger = Logger()
-        self.launch = Launch(options_obj=self.options_obj, task_id=task_id)
-        self.launch.build_dirpath()
-        self.launch.build_configs()
+        self.logger = StagingLogger()
 
         # Check that the mandatory arguments have been provided within
         # the options_obj parameter; proceed accordingly.
@@ -181,18 +182,43 @@ class Staging:
             )
             error(msg=msg)
 
-        # Parse the configuration file.
-        self.yaml_dict = YAML().read_concat_yaml(
-            yaml_file=self.yaml_file, return_obj=False
+        # Parse the configuration file and build the experiment
+        # configuration files; if a precompiled fetch plan has been
+        # specified, the configuration and experiment attributes are
+        # collected from the fetch plan and the configuration file is
+        # not parsed.
+        self.plan_file = parser_interface.object_getattr(
+            object_in=self.options_obj, key="plan_file", force=True
         )
 
-    def _nc_concat(self, fileid_obj: object, fileconcat_obj: object) -> None:
+        if self.plan_file is None:
+            self.plan_dict = None
+            self.launch = Launch(options_obj=self.options_obj, task_id=task_id)
+            self.launch.build_dirpath()
+            self.launch.build_configs()
+            self.yaml_dict = YAML().read_concat_yaml(
+                yaml_file=self.yaml_file, return_obj=False
+            )
+
+        if self.plan_file is not None:
+            self.plan_dict = plan.read_plan(plan_file=self.plan_file, cycle=self.cycle)
+            self.launch = Launch(
+                options_obj=self.options_obj,
+                task_id=task_id,
+                attrs_dict=self.plan_dict["launch"],
+            )
+            self.launch.build_dirpath()
+            self.yaml_dict = None
+
+    def _nc_concat(self, fileid_obj: object, fileconcat_obj: object) -> dict:
         """
         Description
         -----------
 
-        This method concatenates netCDF-formatted files in accordance
-        with the respective file identifier attributes.
+        This method defines the netCDF-formatted file concatenation
+        job in accordance with the respective file identifier
+        attributes; the concatenation is executed by run_concat (see
+        below).
 
         Parameters
         ----------
@@ -208,6 +234,15 @@ class Staging:
             A Python object containing the netCDF-formatted file
             concatentation attributes.
 
+        Returns
+        -------
+
+        concat_job: dict
+
+            A Python dictionary containing the keyword arguments for
+            staging.ncconcat.nc_concat; if none of the
+            netCDF-formatted member files exist, NoneType is returned.
+
         Raises
         ------
 
@@ -221,14 +256,10 @@ class Staging:
 
         # Define the list of files to be concatenated.
         ncfilelist = []
-        for timestamp in fileid_obj.timestamps_list:
+        for filepath_dict in self.get_filepaths_list(fileid_obj=fileid_obj):
 
             # Define the netCDF-formatted file path.
-            ncfile = datetime_interface.datestrupdate(
-                datestr=str(timestamp),
-                in_frmttyp=timestamp_interface.GLOBAL,
-                out_frmttyp=fileid_obj.local_path,
-            )
+            ncfile = filepath_dict["local_path"]
 
             # Check that the netCDF-formatted file path exists;
             # proceed accordingly.
@@ -304,26 +335,369 @@ class Staging:
             > 0
         ):
 
-            # Check that the directory tree corresponding to the
-            # concatenated output file exists; proceed accordingly.
-            fileio_interface.dirpath_tree(path=os.path.dirname(ncconcat_obj.ncfile))
-
-            # Concatenate the respective files to the specified output
+            # Define the concatenation job for the respective output
             # file path.
-            netcdf4_interface.ncconcat(
-                ncfilelist=ncfilelist,
-                ncfile=ncconcat_obj.ncfile,
-                ncdim=ncconcat_obj.ncdim,
-                ncfrmt=ncconcat_obj.ncfrmt,
+            concat_job = {
+                "ncfilelist": ncfilelist,
+                "ncfile": ncconcat_obj.ncfile,
+                "ncdim": ncconcat_obj.ncdim,
+                "ncfrmt": ncconcat_obj.ncfrmt,
+                "subset": self._nc_subset(
+                    fileid_obj=fileid_obj, fileconcat_obj=fileconcat_obj
+                ),
+                "layout": self._nc_layout(fileconcat_obj=fileconcat_obj),
+                "sort": self._nc_sort(fileconcat_obj=fileconcat_obj),
+                "tree": self._nc_tree(fileconcat_obj=fileconcat_obj),
+                "virtual": bool(
+                    parser_interface.dict_key_value(
+                        dict_in=fileconcat_obj.nc_concat,
+                        key="virtual",
+                        force=True,
+                        no_split=True,
+                    )
+                ),
+            }
+
+            if concat_job["virtual"] and (
+                concat_job["subset"]
+                or concat_job["layout"]
+                or concat_job["sort"]
+                or concat_job["tree"]
+            ):
+                msg = (
+                    "A virtual netCDF aggregation cannot be subset, sorted, "
+                    "reduced as a tree, or specify a storage layout; either "
+                    "disable virtual or remove the subset, sort, tree, and "
+                    "layout attributes. Aborting!!!"
+                )
+                error(msg=msg)
+
+            return concat_job
+
+        msg = (
+            f"No netCDF files within list {ncfilelist} exist; netCDF-formatted "
+            f"file path {ncconcat_obj.ncfile} will not be created."
+        )
+        self.logger.warn(msg=msg)
+
+        return None
+
+    def _nc_layout(self, fileconcat_obj: object) -> dict:
+        """
+        Description
+        -----------
+
+        This method defines the (optional) storage layout of the
+        variables, within the concatenated netCDF-formatted file,
+        dependent upon the concatenation dimension.
+
+        Parameters
+        ----------
+
+        fileconcat_obj: object
+
+            A Python object containing the netCDF-formatted file
+            concatentation attributes.
+
+        Returns
+        -------
+
+        layout: dict
+
+            A Python dictionary containing the storage layout
+            attributes for staging.ncconcat.nc_concat; if a storage
+            layout has not been specified, NoneType is returned.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the compression level is not between 0 and 9
+              or if the chunk size is not a positive integer.
+
+            * raised if a contiguous layout is specified together with
+              compression and/or chunk sizes.
+
+        """
+
+        # Collect the storage layout attributes; proceed accordingly.
+        layout_dict = parser_interface.dict_key_value(
+            dict_in=fileconcat_obj.nc_concat, key="layout", force=True, no_split=True
+        )
+
+        if not layout_dict:
+            return None
+
+        layout = {
+            key: layout_dict[key]
+            for key in ["chunksize", "complevel", "contiguous", "shuffle"]
+            if layout_dict.get(key) is not None
+        }
+
+        if not 0 <= int(layout.get("complevel", 0)) <= 9:
+            msg = (
+                "The netCDF concatenation layout attribute complevel must "
+                f"be between 0 and 9; received {layout['complevel']}. "
+                "Aborting!!!"
+            )
+            error(msg=msg)
+
+        if int(layout.get("chunksize", 1)) <= 0:
+            msg = (
+                "The netCDF concatenation layout attribute chunksize must "
+                f"be a positive integer; received {layout['chunksize']}. "
+                "Aborting!!!"
+            )
+            error(msg=msg)
+
+        if layout.get("contiguous") and (
+            layout.get("complevel") or layout.get("chunksize")
+        ):
+            msg = (
+                "A contiguous netCDF concatenation layout cannot be "
+                "compressed or chunked; either disable contiguous or "
+                "remove the complevel and chunksize attributes. Aborting!!!"
+            )
+            error(msg=msg)
+
+        return layout
+
+    def _nc_sort(self, fileconcat_obj: object) -> dict:
+        """
+        Description
+        -----------
+
+        This method defines the (optional) sorting and exact duplicate
+        removal of the locations within the concatenated
+        netCDF-formatted file; if the sort keys are not specified, the
+        locations are sorted by the time variable (i.e., the subset
+        time attribute; see _nc_subset) and an empty list of sort keys
+        retains the member file order.
+
+        Parameters
+        ----------
+
+        fileconcat_obj: object
+
+            A Python object containing the netCDF-formatted file
+            concatentation attributes.
+
+        Returns
+        -------
+
+        sort: dict
+
+            A Python dictionary containing the sort attributes for
+            staging.ncconcat.nc_concat; if neither sort keys nor
+            duplicate removal has been specified, NoneType is
+            returned.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the sort keys are not a list of variable names
+              or if the unique attribute is neither a boolean nor a
+              list of variable names.
+
+        """
+
+        # Collect the sort attributes; proceed accordingly.
+        sort_dict = parser_interface.dict_key_value(
+            dict_in=fileconcat_obj.nc_concat, key="sort", force=True, no_split=True
+        )
+
+        if not sort_dict:
+            return None
+
+        keys = sort_dict.get("keys")
+        unique = sort_dict.get("unique") or False
+        if keys is None:
+            subset_dict = parser_interface.dict_key_value(
+                dict_in=fileconcat_obj.nc_concat, key="subset", force=True, no_split=True
             )
+            keys = (subset_dict or {}).get("time") or "time"
 
-        else:
+        if isinstance(keys, str):
+            keys = [keys]
 
+        if not isinstance(keys, list) or not isinstance(unique, (bool, list)):
             msg = (
-                f"No netCDF files within list {ncfilelist} exist; netCDF-formatted "
-                f"file path {ncconcat_obj.ncfile} will not be created."
+                "The netCDF concatenation sort attribute keys must be a list "
+                "of variable names and unique must be either a boolean or a "
+                f"list of variable names; received {sort_dict}. Aborting!!!"
             )
-            self.logger.warn(msg=msg)
+            error(msg=msg)
+
+        if not keys and not unique:
+            return None
+
+        sort = {"keys": keys, "unique": unique}
+
+        return sort
+
+    def _nc_subset(self, fileid_obj: object, fileconcat_obj: object) -> dict:
+        """
+        Description
+        -----------
+
+        This method defines the (optional) subset to be applied to the
+        netCDF-formatted member files during the concatenation; the
+        time window start_offset_seconds and stop_offset_seconds
+        attributes are relative to the forecast cycle and the file
+        identifier offset_seconds attribute.
+
+        Parameters
+        ----------
+
+        fileid_obj: object
+
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
+
+        fileconcat_obj: object
+
+            A Python object containing the netCDF-formatted file
+            concatentation attributes.
+
+        Returns
+        -------
+
+        subset: dict
+
+            A Python dictionary containing the subset attributes for
+            staging.ncconcat.nc_concat; if a subset has not been
+            specified, NoneType is returned.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the bounding box is not a list of [lat_min,
+              lat_max, lon_min, lon_max] values.
+
+            * raised if only one of the time window
+              start_offset_seconds and stop_offset_seconds attributes
+              has been specified or if the time window is empty.
+
+        """
+
+        # Collect the subset attributes; proceed accordingly.
+        subset_dict = parser_interface.dict_key_value(
+            dict_in=fileconcat_obj.nc_concat, key="subset", force=True, no_split=True
+        )
+
+        if not subset_dict:
+            return None
+
+        subset = {
+            key: subset_dict[key]
+            for key in ["latitude", "longitude", "time", "variables"]
+            if subset_dict.get(key) is not None
+        }
+
+        # Define the geographical bounding box.
+        bbox = subset_dict.get("bbox")
+        if bbox is not None:
+            if len(bbox) != 4 or not -90.0 <= bbox[0] <= bbox[1] <= 90.0:
+                msg = (
+                    "The netCDF concatenation subset attribute bbox must "
+                    "be specified as [lat_min, lat_max, lon_min, lon_max]; "
+                    f"received {bbox}. Aborting!!!"
+                )
+                error(msg=msg)
+            subset["bbox"] = [float(value) for value in bbox]
+
+        # Define the time window relative to the forecast cycle.
+        offsets_list = [
+            subset_dict.get(key)
+            for key in ["start_offset_seconds", "stop_offset_seconds"]
+        ]
+        if offsets_list.count(None) == 1 or (
+            None not in offsets_list and offsets_list[0] > offsets_list[1]
+        ):
+            msg = (
+                "The netCDF concatenation subset attributes "
+                "start_offset_seconds and stop_offset_seconds must both "
+                "be specified and define a valid time window; received "
+                f"{offsets_list}. Aborting!!!"
+            )
+            error(msg=msg)
+
+        if None not in offsets_list:
+            subset["time_window"] = [
+                datetime_interface.datestrupdate(
+                    datestr=str(self.cycle),
+                    in_frmttyp=timestamp_interface.GLOBAL,
+                    out_frmttyp=timestamp_interface.GLOBAL,
+                    offset_seconds=(fileid_obj.offset_seconds + offset_seconds),
+                )
+                for offset_seconds in offsets_list
+            ]
+
+        return subset
+
+    def _nc_tree(self, fileconcat_obj: object) -> dict:
+        """
+        Description
+        -----------
+
+        This method defines the (optional) tree reduction of the
+        netCDF-formatted file concatenation; the tree attribute is
+        either a boolean or a Python dictionary containing the number
+        of processes (nworkers).
+
+        Parameters
+        ----------
+
+        fileconcat_obj: object
+
+            A Python object containing the netCDF-formatted file
+            concatentation attributes.
+
+        Returns
+        -------
+
+        tree: dict
+
+            A Python dictionary containing the tree reduction
+            attributes for staging.ncconcat.nc_concat; if a tree
+            reduction has not been specified, NoneType is returned.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the number of processes is not a positive
+              integer.
+
+        """
+
+        # Collect the tree reduction attributes; proceed accordingly.
+        tree_dict = parser_interface.dict_key_value(
+            dict_in=fileconcat_obj.nc_concat, key="tree", force=True, no_split=True
+        )
+
+        if not tree_dict:
+            return None
+
+        tree = {"nworkers": None}
+        if isinstance(tree_dict, dict):
+            tree["nworkers"] = tree_dict.get("nworkers")
+
+        if tree["nworkers"] is not None and int(tree["nworkers"]) <= 0:
+            msg = (
+                "The netCDF concatenation tree attribute nworkers must be a "
+                f"positive integer; received {tree['nworkers']}. Aborting!!!"
+            )
+            error(msg=msg)
+
+        return tree
 
     def awss3_fetch(
         self,
@@ -331,6 +705,8 @@ class Staging:
         checksum_filepath: str = None,
         checksum_index: bool = False,
         checksum_level: str = "md5",
+        cache: object = None,
+        limiter: object = None,
     ) -> None:
         """
         Description
@@ -340,7 +716,10 @@ class Staging:
         Services (AWS) s3 object path from a specified AWS s3 bucket;
         this method accepts an Python dictionary parameter containing
         the attributes required to correctly collect the specified AWS
-        s3 bucket and object path file.
+        s3 bucket and object path file; the checksum hash indices for
+        the files which are verified against an upstream md5 manifest
+        are defined by the calling application once the files have
+        been verified (see Fetch.verify_manifest).
 
         Parameters
         ----------
@@ -371,6 +750,18 @@ class Staging:
             A Python string specifying the hash index level (e.g.,
             type) for the respective AWS s3 collected files.
 
+        cache: object, optional
+
+            A Python object containing the local object cache (see
+            staging.cache.ObjectCache); if NoneType, the local object
+            cache is not used.
+
+        limiter: object, optional
+
+            A Python object containing the bandwidth limiter (see
+            staging.ratelimit.RateLimiter); if NoneType, the fetch
+            bandwidth is not bounded.
+
         Raises
         ------
 
@@ -395,61 +786,54 @@ class Staging:
             )
             error(msg=msg)
 
-        # Loop through each specified time and determine whether the
-        # request AWS s3 bucket and object path exists; if so, update
-        # the local Python list containing the files to be collected.
-        aws_filelist = []
-        for timestamp in timestamps_list:
-
-            # Collect the file list using boto3 for the respective
-            # object path.
-            msg = f"Collecting filelist for timestamp {timestamp}."
-            self.logger.info(msg=msg)
+        # Define the local and AWS s3 object file paths for the
+        # respective timestamps.
+        filepaths_list = self.get_filepaths_list(fileid_obj=fileid_obj)
+        md5_manifest = parser_interface.object_getattr(
+            object_in=fileid_obj, key="md5_manifest", force=True
+        )
 
-            boto3_filelist = boto3_interface.filelist(
-                bucket=fileid_obj.bucket,
-                object_path=datetime_interface.datestrupdate(
-                    datestr=timestamp,
-                    in_frmttyp=timestamp_interface.GLOBAL,
-                    out_frmttyp=fileid_obj.object_path,
-                ),
+        # Determine which of the requested AWS s3 bucket and object
+        # paths exist; the object paths are listed beneath each
+        # requested object path one page at a time and the listing
+        # stops once the requested object path has been found.
+        wanted_set = {filepath_dict["object_path"] for filepath_dict in filepaths_list}
+        aws_filelist = set()
+        for filepath_dict in filepaths_list:
+
+            # Check whether the respective object path has already
+            # been found; proceed accordingly.
+            if filepath_dict["object_path"] in aws_filelist:
+                continue
+
+            self.logger.debug(
+                "Collecting filelist for timestamp %s.", filepath_dict["timestamp"]
             )
 
-            # Update the local Python list containing the files to be
-            # collected.
-            for boto3_file in boto3_filelist:
-                aws_filelist.append(boto3_file)
-
-        # Maintain only unique file names.
-        aws_filelist = list(set(aws_filelist))
-        if aws_filelist:
-            msg = (
-                "The following files were found within the AWS resource bucket "
-                f"{fileid_obj.bucket}: {aws_filelist}."
+            aws_filelist.update(
+                awss3.list_objects(
+                    bucket=fileid_obj.bucket,
+                    prefix=filepath_dict["object_path"],
+                    profile_name=fileid_obj.profile_name,
+                    wanted=(wanted_set - aws_filelist),
+                )
             )
-            self.logger.info(msg=msg)
 
-        if not aws_filelist:
-            msg = f"No files were found in AWS resource bucket {fileid_obj.bucket}."
+        msg = (
+            f"Found {len(aws_filelist)} of {len(wanted_set)} requested object "
+            f"path(s) within AWS resource bucket {fileid_obj.bucket}."
+        )
+        self.logger.info(msg=msg)
 
         # Loop through each specified time; if the specified object
         # path exists, collect the respective file; proceed
         # accordingly.
-        for timestamp in timestamps_list:
+        for filepath_dict in filepaths_list:
 
             # Define the respective file path names in accordance with
-            # the respective timestamp; check that the directory tree
-            # for the local filename exists.
-            local_path = datetime_interface.datestrupdate(
-                datestr=timestamp,
-                in_frmttyp=timestamp_interface.GLOBAL,
-                out_frmttyp=fileid_obj.local_path,
-            )
-            object_path = datetime_interface.datestrupdate(
-                datestr=timestamp,
-                in_frmttyp=timestamp_interface.GLOBAL,
-                out_frmttyp=fileid_obj.object_path,
-            )
+            # the respective timestamp.
+            local_path = filepath_dict["local_path"]
+            object_path = filepath_dict["object_path"]
 
             # Check that the respective object path exists in the AWS
             # resource bucket; proceed accordingly.
@@ -461,67 +845,226 @@ class Staging:
 
                 # Collect the file from the specified AWS resource
                 # bucket and object path and stage it locally.
-                filedict = {local_path: object_path}
-
-                boto3_interface.get(
-                    bucket=fileid_obj.bucket,
-                    filedict=filedict,
-                    profile_name=fileid_obj.profile_name,
+                self.awss3_get(
+                    fileid_obj=fileid_obj,
+                    local_path=local_path,
+                    object_path=object_path,
+                    cache=cache,
+                    limiter=limiter,
                 )
 
                 # Define the checksum index value for the collected
-                # file.
-                if checksum_index:
-
-                    hash_index = self.get_hash_index(
-                        filepath=local_path, hash_level=checksum_level
-                    )
-                    msg = f"The hash index for file path {local_path} is {hash_index}."
-                    self.logger.warn(msg=msg)
-
-                # Check the checksum index writing parameter value and
-                # proceed accordingly.
-                if checksum_index and checksum_filepath is not None:
-
-                    # Write the checksum index value to the specified
-                    # external file path.
-                    self.write_fetch_checksum(
-                        checksum_filepath=checksum_filepath,
-                        local_path=local_path,
-                        hash_index=hash_index,
-                    )
+                # file and, if applicable, decompress it; proceed
+                # accordingly.
+                if md5_manifest is not None:
+                    continue
+
+                self.process_filepath(
+                    fileid_obj=fileid_obj,
+                    local_path=local_path,
+                    checksum_filepath=checksum_filepath,
+                    checksum_index=checksum_index,
+                    checksum_level=checksum_level,
+                )
 
-    def build_fileid_obj(
+    def awss3_get(
         self,
-        filesdict: dict,
-        fileid: str,
-        mand_attr_list: list = None,
-        opt_attr_dict: dict = None,
-    ) -> object:
+        fileid_obj: object,
+        local_path: str,
+        object_path: str,
+        cache: object = None,
+        limiter: object = None,
+    ) -> None:
         """
         Description
         -----------
 
-        This method builds a Python object containing the attributes
-        gathered from the YAML-formatted configuration file for the
-        specified file identifier; refer to the top-level README for
-        additional information.
+        This method collects the specified AWS s3 object path and
+        stages it at the specified local file path; if a local object
+        cache is specified, the object is materialized from the
+        object cache if it exists (i.e., a metadata request only) and
+        is otherwise downloaded and subsequently stored within the
+        object cache; downloads are resumable (see awss3.download)
+        such that a partially collected file is never written to the
+        local file path.
 
         Parameters
         ----------
 
-        filesdict: dict
+        fileid_obj: object
 
-            A Python dictionary containing the local and remote paths
-            for the files to be collected; the Python dictionary keys
-            are the local host path(s) for the collected files while
-            the Python dictionary values are the corresponding remote
-            host file paths.
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
 
-        fileid: str
+        local_path: str
 
-            A Python string specifying the file identifier; this is a
-            respective key in the respective YAML-formatted
+            A Python string specifying the local file path.
+
+        object_path: str
+
+            A Python string specifying the AWS s3 object path.
+
+        Keywords
+        --------
+
+        cache: object, optional
+
+            A Python object containing the local object cache (see
+            staging.cache.ObjectCache); if NoneType, the local object
+            cache is not used.
+
+        limiter: object, optional
+
+            A Python object containing the bandwidth limiter (see
+            staging.ratelimit.RateLimiter); if NoneType, the fetch
+            bandwidth is not bounded.
+
+        """
+
+        # Check whether the object exists within the local object
+        # cache; proceed accordingly.
+        if cache is not None:
+            etag = awss3.get_etag(
+                bucket=fileid_obj.bucket,
+                object_path=object_path,
+                profile_name=fileid_obj.profile_name,
+            )
+            cache_filepath = cache.lookup(
+                bucket=fileid_obj.bucket, object_path=object_path, etag=etag
+            )
+
+            if cache_filepath is not None:
+                method = materialize(src_path=cache_filepath, dst_path=local_path)
+                self.logger.info(
+                    "AWS s3 object path %s collected from the object cache "
+                    "file path %s (%s).",
+                    object_path,
+                    cache_filepath,
+                    method,
+                )
+
+                return
+
+        # Collect the file from the specified AWS resource bucket and
+        # object path; the file is collected to a partial file path,
+        # which is resumed if a previous collection was interrupted,
+        # and is renamed to the local file path upon completion; if a
+        # bandwidth limiter is specified, the file is collected in
+        # accordance with the bandwidth limits.
+        etag = awss3.download(
+            bucket=fileid_obj.bucket,
+            object_path=object_path,
+            local_path=local_path,
+            profile_name=fileid_obj.profile_name,
+            limiter=limiter,
+        )
+
+        # Store the collected file within the local object cache;
+        # proceed accordingly.
+        if cache is not None:
+            cache.store(
+                filepath=local_path,
+                bucket=fileid_obj.bucket,
+                object_path=object_path,
+                etag=etag,
+            )
+
+    def build_checksum(
+        self,
+        local_path: str,
+        checksum_filepath: str = None,
+        checksum_index: bool = False,
+        checksum_level: str = "md5",
+    ) -> None:
+        """
+        Description
+        -----------
+
+        This method defines the checksum hash index value for a
+        collected local file path and, if applicable, writes it to the
+        specified checksum file path.
+
+        Parameters
+        ----------
+
+        local_path: str
+
+            A Python string specifying the collected local file path.
+
+        Keywords
+        --------
+
+        checksum_filepath: str, optional
+
+            A Python string specifying the path to the file containing
+            the checksum hash index values for specified local file
+            paths.
+
+        checksum_index: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            define the checksum hash index for the local file path.
+
+        checksum_level: str, optional
+
+            A Python string specifying the hash index level (e.g.,
+            type) for the local file path.
+
+        """
+
+        # Define the checksum index value for the collected file.
+        if checksum_index:
+
+            hash_index = self.get_hash_index(
+                filepath=local_path, hash_level=checksum_level
+            )
+            msg = f"The hash index for file path {local_path} is {hash_index}."
+            self.logger.warn(msg=msg)
+
+        # Check the checksum index writing parameter value and proceed
+        # accordingly.
+        if checksum_index and checksum_filepath is not None:
+
+            # Write the checksum index value to the specified external
+            # file path.
+            self.write_fetch_checksum(
+                checksum_filepath=checksum_filepath,
+                local_path=local_path,
+                hash_index=hash_index,
+            )
+
+    def build_fileid_obj(
+        self,
+        filesdict: dict,
+        fileid: str,
+        mand_attr_list: list = None,
+        opt_attr_dict: dict = None,
+    ) -> object:
+        """
+        Description
+        -----------
+
+        This method builds a Python object containing the attributes
+        gathered from the YAML-formatted configuration file for the
+        specified file identifier; refer to the top-level README for
+        additional information.
+
+        Parameters
+        ----------
+
+        filesdict: dict
+
+            A Python dictionary containing the local and remote paths
+            for the files to be collected; the Python dictionary keys
+            are the local host path(s) for the collected files while
+            the Python dictionary values are the corresponding remote
+            host file paths.
+
+        fileid: str
+
+            A Python string specifying the file identifier; this is a
+            respective key in the respective YAML-formatted
             configuration file.
 
         Keywords
@@ -560,6 +1103,7 @@ class Staging:
         # respective interface fetch method; proceed accordingly.
         if opt_attr_dict is not None:
 
+            defaults_list = []
             for opt_attr in opt_attr_dict.keys():
 
                 value = parser_interface.dict_key_value(
@@ -574,27 +1118,47 @@ class Staging:
                         dict_in=opt_attr_dict, key=opt_attr, no_split=True
                     )
 
-                    msg = (
-                        f"The attribute {opt_attr} for file identifier "
-                        f"{fileid} could not be determined from the "
-                        "YAML-formatted configuration file; setting to "
-                        f"default value {attr_value}."
+                    defaults_list.append(opt_attr)
+                    self.logger.debug(
+                        "The attribute %s for file identifier %s could not be "
+                        "determined from the YAML-formatted configuration file; "
+                        "setting to default value %s.",
+                        opt_attr,
+                        fileid,
+                        attr_value,
                     )
-                    self.logger.warn(msg=msg)
 
                 if value is not None:
                     attr_value = value
-                    msg = (
-                        f"The attribute {opt_attr} for file identifier "
-                        f"{fileid} has value {attr_value}."
+                    self.logger.debug(
+                        "The attribute %s for file identifier %s has value %s.",
+                        opt_attr,
+                        fileid,
+                        attr_value,
                     )
-                    self.logger.info(msg=msg)
 
                 # Define the respective Python object attribute.
                 fileid_obj = parser_interface.object_setattr(
                     object_in=fileid_obj, key=opt_attr, value=attr_value
                 )
 
+            # Summarize the optional attributes for the respective
+            # file identifier.
+            self.logger.info(
+                "File identifier %s: %s of %s optional attribute(s) "
+                "specified within the YAML-formatted configuration file.",
+                fileid,
+                len(opt_attr_dict) - len(defaults_list),
+                len(opt_attr_dict),
+            )
+            if defaults_list:
+                self.logger.warn(
+                    "File identifier %s: default value(s) assigned for "
+                    "attribute(s) %s.",
+                    fileid,
+                    ", ".join(defaults_list),
+                )
+
         # Define the mandatory Python object attributes for the
         # respective interface fetch method; proceed accordingly.
         if mand_attr_list is not None:
@@ -622,14 +1186,15 @@ class Staging:
 
         return fileid_obj
 
-    def concat_filepath(self, fileid_obj: object) -> None:
+    def concat_filepath(self, fileid_obj: object) -> dict:
         """
         Description
         -----------
 
-        This method concatenates local host file paths in accordance
-        with the specifications within the experiment configuration
-        file.
+        This method defines the concatenation job for the local host
+        file paths in accordance with the specifications within the
+        experiment configuration file; the concatenation jobs are
+        executed by run_concat (see below).
 
         Parameters
         ----------
@@ -640,6 +1205,15 @@ class Staging:
             the experiment configuration for the respective file
             identifier.
 
+        Returns
+        -------
+
+        concat_job: dict
+
+            A Python dictionary containing the concatenation job
+            attributes; if no concatenation is specified for the
+            respective file identifier, NoneType is returned.
+
         Raises
         ------
 
@@ -685,7 +1259,7 @@ class Staging:
                 "will be done."
             )
             self.logger.warn(msg=msg)
-            return
+            return None
 
         if len(fileid_concat_types) > 1:
             msg = (
@@ -696,14 +1270,84 @@ class Staging:
             )
             error(msg=msg)
 
-        # Concatenate the local file paths in accordance with the file
-        # identifier object upon entry.
+        # Define the concatenation job for the local file paths in
+        # accordance with the file identifier object upon entry.
         concat_type = fileid_concat_types[0]
+        concat_job = None
 
         if str(concat_type).lower() == "nc_concat":
 
-            # Concatenate the respective netCDF-formatted file.
-            self._nc_concat(fileid_obj=fileid_obj, fileconcat_obj=fileconcat_obj)
+            # Define the respective netCDF-formatted file
+            # concatenation job.
+            concat_job = self._nc_concat(
+                fileid_obj=fileid_obj, fileconcat_obj=fileconcat_obj
+            )
+
+        return concat_job
+
+    def get_filepaths_list(self, fileid_obj: object) -> list:
+        """
+        Description
+        -----------
+
+        This method defines a list of the local and remote file paths
+        for each timestamp corresponding to the respective file
+        identifier; if the file identifier object already contains
+        the attribute filepaths_list (e.g., as collected from a
+        precompiled fetch plan), that list is returned.
+
+        Parameters
+        ----------
+
+        fileid_obj: object
+
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
+
+        Returns
+        -------
+
+        filepaths_list: list
+
+            A Python list of Python dictionaries, each containing the
+            timestamp, local_path, and object_path attributes (and,
+            for tar archive members, the tar_path and tar_index
+            attributes) for the respective timestamp.
+
+        """
+
+        # Check whether the file paths have already been defined for
+        # the respective file identifier; proceed accordingly.
+        filepaths_list = parser_interface.object_getattr(
+            object_in=fileid_obj, key="filepaths_list", force=True
+        )
+
+        if filepaths_list is not None:
+            return filepaths_list
+
+        # Define the respective file path names in accordance with
+        # each timestamp.
+        filepaths_list = []
+        for timestamp in fileid_obj.timestamps_list:
+
+            filepath_dict = {"timestamp": str(timestamp)}
+            for path_attr in ["local_path", "object_path", "tar_index", "tar_path"]:
+                path = parser_interface.object_getattr(
+                    object_in=fileid_obj, key=path_attr, force=True
+                )
+                if path is None and path_attr in ["tar_index", "tar_path"]:
+                    continue
+
+                filepath_dict[path_attr] = datetime_interface.datestrupdate(
+                    datestr=str(timestamp),
+                    in_frmttyp=timestamp_interface.GLOBAL,
+                    out_frmttyp=path,
+                )
+
+            filepaths_list.append(filepath_dict)
+
+        return filepaths_list
 
     def get_hash_index(self, filepath: str, hash_level: str = None) -> str:
         """
@@ -906,34 +1550,44 @@ class Staging:
 
             timestamps_list = sorted(list(set(timestamps_list)))
 
-        # For each timestamp, check that the timestamps are valid;
-        # proceed accordingly.
-        timestamps_list_check = timestamps_list
+        # Retain only the timestamps within the specified stream start
+        # and stop timestamps; proceed accordingly.
+        stream_start = int(fileid_obj.stream_start)
+        stream_stop = int(fileid_obj.stream_stop)
+        ntimestamps = len(timestamps_list)
+        excluded_list = [
+            timestamp
+            for timestamp in timestamps_list
+            if not stream_start <= int(timestamp) <= stream_stop
+        ]
+        timestamps_list = [
+            timestamp
+            for timestamp in timestamps_list
+            if stream_start <= int(timestamp) <= stream_stop
+        ]
         for timestamp in timestamps_list:
+            self.logger.debug(
+                "The timestamp %s is within the specified stream range and "
+                "will be collected.",
+                timestamp,
+            )
 
-            # If the timestamp is outside of the specified stream
-            # start and stop timestamps, proceed accordingly.
-            if (int(timestamp) < int(fileid_obj.stream_start)) or (
-                int(timestamp) > int(fileid_obj.stream_stop)
-            ):
-
-                # Remove the respective timestamp from the list.
-                msg = (
-                    f"The timestamp {timestamp} is not within the specified "
-                    f"stream range {fileid_obj.stream_start} and "
-                    f"{fileid_obj.stream_stop} and will not be "
-                    "included/retrieved."
-                )
-                self.logger.warn(msg=msg)
-                timestamps_list_check.remove(timestamp)
-
-            else:
-
-                msg = (
-                    f"The timestamp {timestamp} is within the specified "
-                    "stream range and will be collected."
-                )
-                self.logger.info(msg=msg)
+        self.logger.info(
+            "%s of %s timestamp(s) are within the specified stream range %s "
+            "and %s and will be collected.",
+            len(timestamps_list),
+            ntimestamps,
+            fileid_obj.stream_start,
+            fileid_obj.stream_stop,
+        )
+        if excluded_list:
+            self.logger.warn(
+                "The timestamp(s) %s are not within the specified stream "
+                "range %s and %s and will not be included/retrieved.",
+                ", ".join(str(timestamp) for timestamp in excluded_list),
+                fileid_obj.stream_start,
+                fileid_obj.stream_stop,
+            )
 
         # Update the file identifier object.
         fileid_out_obj = parser_interface.object_deepcopy(object_in=fileid_obj)
@@ -943,6 +1597,379 @@ class Staging:
 
         return fileid_out_obj
 
+    def posix_fetch(
+        self,
+        fileid_obj: object,
+        checksum_filepath: str = None,
+        checksum_index: bool = False,
+        checksum_level: str = "md5",
+    ) -> None:
+        """
+        Description
+        -----------
+
+        This method collects (i.e., materializes) the specified object
+        paths beneath the specified root path of a POSIX filesystem
+        (e.g., a local mirror of the respective AWS s3 bucket); each
+        file is materialized at the respective local file path using
+        a hardlink (if permitted by the hardlink attribute), reflink,
+        or kernel copy (see staging.cache.materialize) such that the
+        file contents are not read by the respective application.
+
+        Parameters
+        ----------
+
+        fileid_obj: object
+
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
+
+        Keywords
+        --------
+
+        checksum_filepath: str, optional
+
+            A Python string specifying the path to the file containing
+            the checksum hash index values for specified local file
+            paths.
+
+        checksum_index: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            define checksum hash indices for each local file collected
+            from the specified root path.
+
+        checksum_level: str, optional
+
+            A Python string specifying the hash index level (e.g.,
+            type) for the respective collected files.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the timestamp list cannot be determined for
+              the respective file identifier object (see fileid_obj
+              above) provided upon entry.
+
+        """
+
+        # Define the timestamp strings for the respective file
+        # identifier.
+        timestamps_list = parser_interface.object_getattr(
+            object_in=fileid_obj, key="timestamps_list", force=True
+        )
+
+        if timestamps_list is None:
+            msg = (
+                "The attribute timestamps_list could not be determined "
+                "from the specified file identifier object. Aborting!!!"
+            )
+            error(msg=msg)
+
+        # Loop through each specified time; if the specified object
+        # path exists beneath the root path, materialize the
+        # respective file; proceed accordingly.
+        filepaths_list = self.get_filepaths_list(fileid_obj=fileid_obj)
+        nfound = 0
+        for filepath_dict in filepaths_list:
+
+            # Define the respective file path names in accordance with
+            # the respective timestamp.
+            local_path = filepath_dict["local_path"]
+            src_path = posix_filepath(
+                root_path=fileid_obj.root_path, object_path=filepath_dict["object_path"]
+            )
+
+            if not os.path.isfile(src_path):
+                continue
+
+            # Check that the directory tree exists; proceed
+            # accordingly.
+            fileio_interface.dirpath_tree(path=os.path.dirname(local_path))
+
+            # Materialize the file at the local file path.
+            method = materialize(
+                src_path=src_path, dst_path=local_path, hardlink=fileid_obj.hardlink
+            )
+            msg = f"File path {src_path} collected as {local_path} ({method})."
+            self.logger.info(msg=msg)
+            nfound += 1
+
+            # Define the checksum index value for the collected file
+            # and, if applicable, decompress it.
+            self.process_filepath(
+                fileid_obj=fileid_obj,
+                local_path=local_path,
+                checksum_filepath=checksum_filepath,
+                checksum_index=checksum_index,
+                checksum_level=checksum_level,
+            )
+
+        msg = (
+            f"Found {nfound} of {len(filepaths_list)} requested file path(s) "
+            f"beneath root path {fileid_obj.root_path}."
+        )
+        self.logger.info(msg=msg)
+
+    def process_filepath(
+        self,
+        fileid_obj: object,
+        local_path: str,
+        checksum_filepath: str = None,
+        checksum_index: bool = False,
+        checksum_level: str = "md5",
+    ) -> None:
+        """
+        Description
+        -----------
+
+        This method defines the checksum hash index value for a
+        collected local file path and, if the file identifier
+        specifies the decompress attribute with the each mode,
+        decompresses the local file path (see staging.decompress);
+        the checksum hash index is defined for either the collected
+        or the decompressed file in accordance with the decompress
+        checksum attribute. Files for the decompress pool mode, and
+        files which are verified against an upstream md5 manifest,
+        are decompressed by the calling application once all files
+        have been collected (see Fetch.decompress_files).
+
+        Parameters
+        ----------
+
+        fileid_obj: object
+
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
+
+        local_path: str
+
+            A Python string specifying the collected local file path.
+
+        Keywords
+        --------
+
+        checksum_filepath: str, optional
+
+            A Python string specifying the path to the file containing
+            the checksum hash index values for specified local file
+            paths.
+
+        checksum_index: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            define the checksum hash index for the local file path.
+
+        checksum_level: str, optional
+
+            A Python string specifying the hash index level (e.g.,
+            type) for the local file path.
+
+        """
+
+        # Collect the decompression attributes; proceed accordingly.
+        decompress_dict = decompress.get_attrs(
+            decompress_attr=parser_interface.object_getattr(
+                object_in=fileid_obj, key="decompress", force=True
+            )
+        )
+        checksum_kwargs = {
+            "local_path": local_path,
+            "checksum_filepath": checksum_filepath,
+            "checksum_index": checksum_index,
+            "checksum_level": checksum_level,
+        }
+
+        if decompress_dict is None or decompress_dict["checksum"] == "compressed":
+            self.build_checksum(**checksum_kwargs)
+
+        if decompress_dict is None:
+            return
+
+        # Decompress the collected file; proceed accordingly.
+        each = decompress_dict["mode"] == "each" and (
+            parser_interface.object_getattr(
+                object_in=fileid_obj, key="md5_manifest", force=True
+            )
+            is None
+        )
+        if not each:
+            return
+
+        fmt = decompress.decompress(filepath=local_path, fmt=decompress_dict["format"])
+        if fmt is None:
+            msg = (
+                f"The file path {local_path} is not {decompress_dict['format']} "
+                "compressed and will not be decompressed."
+            )
+            self.logger.warn(msg=msg)
+
+        if decompress_dict["checksum"] == "decompressed":
+            self.build_checksum(**checksum_kwargs)
+
+    def run_concat(self, concat_jobs_list: list, nworkers: int = None) -> None:
+        """
+        Description
+        -----------
+
+        This method executes the specified (independent)
+        netCDF-formatted file concatenation jobs using a pool of
+        processes; the results for each job are collected and
+        reported and an exception is raised after all jobs have
+        completed if any job failed.
+
+        Parameters
+        ----------
+
+        concat_jobs_list: list
+
+            A Python list of concatenation jobs (see concat_filepath
+            above); NoneType values are ignored.
+
+        Keywords
+        --------
+
+        nworkers: int, optional
+
+            A Python integer specifying the number of processes; if
+            NoneType, the number of processes available to the
+            respective application is used.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if one or more concatenation jobs failed.
+
+        """
+
+        # Execute the concatenation jobs.
+        concat_jobs_list = [job for job in concat_jobs_list if job is not None]
+        if not concat_jobs_list:
+            return
+
+        msg = (
+            f"Executing {len(concat_jobs_list)} netCDF-formatted file "
+            f"concatenation(s) using {ncconcat.get_nworkers(nworkers=nworkers)} "
+            "process(es)."
+        )
+        self.logger.info(msg=msg)
+        results_list = ncconcat.concat_pool(
+            concat_jobs_list=concat_jobs_list, nworkers=nworkers
+        )
+
+        # Report the results for each concatenation job; proceed
+        # accordingly.
+        failed_list = []
+        for (concat_job, exc) in results_list:
+            if exc is None:
+                msg = f"Created netCDF-formatted file path {concat_job['ncfile']}."
+                self.logger.info(msg=msg)
+
+            if exc is not None:
+                msg = (
+                    f"The netCDF-formatted file concatenation for file path "
+                    f"{concat_job['ncfile']} failed with: {exc}"
+                )
+                self.logger.warn(msg=msg)
+                failed_list.append(concat_job["ncfile"])
+
+        if failed_list:
+            msg = (
+                "The netCDF-formatted file concatenation failed for file "
+                f"path(s) {failed_list}. Aborting!!!"
+            )
+            error(msg=msg)
+
+    def tar_get(
+        self,
+        fileid_obj: object,
+        local_path: str,
+        tar_path: str,
+        member: tuple,
+        checksum_filepath: str = None,
+        checksum_index: bool = False,
+        checksum_level: str = "md5",
+    ) -> None:
+        """
+        Description
+        -----------
+
+        This method collects (i.e., extracts) the specified tar
+        archive member and stages it at the specified local file path;
+        only the member data is read from the tar archive (see
+        staging.tarindex.extract).
+
+        Parameters
+        ----------
+
+        fileid_obj: object
+
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
+
+        local_path: str
+
+            A Python string specifying the local file path.
+
+        tar_path: str
+
+            A Python string specifying the tar archive path.
+
+        member: tuple
+
+            A Python tuple containing the data offset and size, in
+            bytes, of the tar archive member (see
+            staging.tarindex.TarIndex.lookup).
+
+        Keywords
+        --------
+
+        checksum_filepath: str, optional
+
+            A Python string specifying the path to the file containing
+            the checksum hash index values for specified local file
+            paths.
+
+        checksum_index: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            define the checksum hash index for the local file path.
+
+        checksum_level: str, optional
+
+            A Python string specifying the hash index level (e.g.,
+            type) for the local file path.
+
+        """
+
+        # Check that the directory tree exists; proceed accordingly.
+        fileio_interface.dirpath_tree(path=os.path.dirname(local_path))
+
+        # Extract the member data, define the checksum index value for
+        # the collected file, and, if applicable, decompress it.
+        (offset, size) = member
+        tarindex.extract(tar_path=tar_path, offset=offset, size=size, dst_path=local_path)
+        msg = (
+            f"Tar archive {tar_path} member at offset {offset} ({size} bytes) "
+            f"collected as {local_path}."
+        )
+        self.logger.info(msg=msg)
+
+        self.process_filepath(
+            fileid_obj=fileid_obj,
+            local_path=local_path,
+            checksum_filepath=checksum_filepath,
+            checksum_index=checksum_index,
+            checksum_level=checksum_level,
+        )
+
     def write_fetch_checksum(
         self, checksum_filepath: str, local_path: str, hash_index: str
     ) -> None:
@@ -991,6 +2018,44 @@ class Staging:
 # ----
 
 
+def posix_filepath(root_path: str, object_path: str) -> str:
+    """
+    Description
+    -----------
+
+    This function defines the POSIX filesystem path for the specified
+    object path beneath the specified root path; object paths are
+    always relative to the root path.
+
+    Parameters
+    ----------
+
+    root_path: str
+
+        A Python string specifying the root path.
+
+    object_path: str
+
+        A Python string specifying the object path.
+
+    Returns
+    -------
+
+    filepath: str
+
+        A Python string specifying the POSIX filesystem path.
+
+    """
+
+    # Define the POSIX filesystem path.
+    filepath = os.path.join(root_path, object_path.lstrip(os.sep))
+
+    return filepath
+
+
+# ----
+
+
 @msg_except_handle(StagingError)
 def error(msg: str) -> None:
     """
@@ -0,0 +1,942 @@
+# =========================================================================
+
+# Module: ush/staging/awss3.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    awss3.py
+
+Description
+-----------
+
+    This module contains functions for Amazon Web Services (AWS) s3
+    bucket and object path requests that are not provided by the
+    ufs_pyutils boto3 interface (e.g., object metadata and
+    bandwidth-limited and resumable downloads).
+
+Classes
+-------
+
+    PartFile(local_path, bucket, object_path, etag, offset=0)
+
+        This is the base-class object for writing (or resuming) the
+        partial file path corresponding to a local file path and
+        recording the respective checkpoints.
+
+Functions
+---------
+
+    commit_part(local_path)
+
+        This function atomically renames the completed partial file
+        path to the specified local file path.
+
+    download(bucket, object_path, local_path, profile_name=None,
+             limiter=None)
+
+        This function downloads (or resumes the download of) the
+        specified AWS s3 bucket and object path to the specified
+        local file path.
+
+    get_client(profile_name=None)
+
+        This function returns a (cached) AWS s3 client for the
+        specified AWS profile.
+
+    get_object_kwargs(bucket, object_path, offset=0, etag=None)
+
+        This function defines the AWS s3 object request attributes for
+        (or resuming) the download of the specified AWS s3 bucket and
+        object path.
+
+    get_etag(bucket, object_path, profile_name=None)
+
+        This function returns the entity tag (ETag) for the specified
+        AWS s3 bucket and object path.
+
+    get_size(bucket, object_path, profile_name=None)
+
+        This function returns the size, in bytes, of the specified AWS
+        s3 bucket and object path.
+
+    list_objects(bucket, prefix, profile_name=None, wanted=None)
+
+        This function (a generator) yields the AWS s3 object paths
+        beneath the specified AWS s3 bucket and prefix.
+
+    part_filepaths(local_path)
+
+        This function defines the partial and checkpoint file paths
+        for the specified local file path.
+
+    read_checkpoint(local_path, bucket, object_path)
+
+        This function reads the checkpoint for the partial file path
+        corresponding to the specified local file path.
+
+    restart_download(exc, offset)
+
+        This function determines whether a failed resumed download is
+        to be restarted from the beginning of the object.
+
+    write_checkpoint(local_path, bucket, object_path, etag, offset)
+
+        This function writes the checkpoint for the partial file path
+        corresponding to the specified local file path.
+
+Requirements
+------------
+
+- boto3; https://github.com/boto/boto3
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import functools
+import json
+import os
+
+import boto3
+from botocore import UNSIGNED
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# ----
+
+# Define all available functions.
+__all__ = [
+    "PartFile",
+    "commit_part",
+    "download",
+    "get_client",
+    "get_etag",
+    "get_object_kwargs",
+    "get_size",
+    "list_objects",
+    "part_filepaths",
+    "read_checkpoint",
+    "restart_download",
+    "write_checkpoint",
+]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the chunk size, in bytes, for reading AWS s3 object bodies.
+CHUNK_SIZE = 1024 * 1024
+
+# Define the number of bytes collected between partial file
+# checkpoints.
+CHECKPOINT_SIZE = 64 * 1024 * 1024
+
+# Define the AWS s3 error codes corresponding to missing objects.
+MISSING_CODES = ["404", "NoSuchKey", "NotFound"]
+
+# Define the AWS s3 error codes for which a resumed download is
+# restarted (i.e., the object has changed or the range is invalid).
+RESTART_CODES = ["412", "416", "InvalidRange", "PreconditionFailed"]
+
+# ----
+
+
+class PartFile:
+    """
+    Description
+    -----------
+
+    This is the base-class object for writing (or resuming) the
+    partial file path (see part_filepaths) corresponding to a local
+    file path; the offset and ETag are recorded within the checkpoint
+    file path every CHECKPOINT_SIZE bytes such that an interrupted
+    download is resumed by a subsequent download, and the partial
+    file path is renamed to the local file path upon completion.
+
+    Parameters
+    ----------
+
+    local_path: str
+
+        A Python string specifying the local file path.
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    etag: str
+
+        A Python string specifying the ETag of the object being
+        collected.
+
+    Keywords
+    --------
+
+    offset: int, optional
+
+        A Python integer specifying the offset, in bytes, from which
+        the partial file path is resumed.
+
+    """
+
+    def __init__(
+        self,
+        local_path: str,
+        bucket: str,
+        object_path: str,
+        etag: str,
+        offset: int = 0,
+    ):
+        """
+        Description
+        -----------
+
+        Creates a new PartFile object.
+
+        """
+
+        # Define the base-class attributes.
+        (self.local_path, self.bucket, self.object_path, self.etag) = (
+            local_path,
+            bucket,
+            object_path,
+            etag,
+        )
+        (self.offset, self.checkpoint) = (offset, offset)
+        self.file = None
+
+    def __enter__(self) -> object:
+        """
+        Description
+        -----------
+
+        This method opens the partial file path.
+
+        """
+
+        # Open the partial file path.
+        self.open()
+
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        """
+        Description
+        -----------
+
+        This method closes the partial file path; the partial file
+        path is committed only if no exception was raised.
+
+        """
+
+        # Close the partial file path.
+        self.close(commit=exc_type is None)
+
+    def _write_checkpoint(self) -> None:
+        """
+        Description
+        -----------
+
+        This method records the current offset of the partial file
+        path within the checkpoint file path.
+
+        """
+
+        # Record the partial file path offset.
+        write_checkpoint(
+            local_path=self.local_path,
+            bucket=self.bucket,
+            object_path=self.object_path,
+            etag=self.etag,
+            offset=self.offset,
+        )
+        self.checkpoint = self.offset
+
+    def close(self, commit: bool = True) -> None:
+        """
+        Description
+        -----------
+
+        This method closes the partial file path and, if specified,
+        renames it to the local file path (see commit_part).
+
+        Keywords
+        --------
+
+        commit: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            commit the partial file path; if False, the partial and
+            checkpoint file paths are retained such that the download
+            may be resumed.
+
+        """
+
+        # Close the partial file path; proceed accordingly.
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+        if commit:
+            commit_part(local_path=self.local_path)
+
+    def open(self) -> None:
+        """
+        Description
+        -----------
+
+        This method opens the partial file path at the respective
+        offset, discards any bytes beyond the offset, and records the
+        initial checkpoint.
+
+        """
+
+        # Open the partial file path.
+        part_path = part_filepaths(local_path=self.local_path)[0]
+        self.file = open(  # pylint: disable=consider-using-with
+            part_path, "r+b" if self.offset > 0 else "wb"
+        )
+        self.file.seek(self.offset)
+        self.file.truncate()
+        self._write_checkpoint()
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Description
+        -----------
+
+        This method writes the specified chunk to the partial file
+        path and records a checkpoint every CHECKPOINT_SIZE bytes.
+
+        Parameters
+        ----------
+
+        chunk: bytes
+
+            A Python bytes object containing the collected object
+            bytes.
+
+        """
+
+        # Write the chunk; proceed accordingly.
+        self.file.write(chunk)
+        self.offset = self.offset + len(chunk)
+
+        if self.offset - self.checkpoint >= CHECKPOINT_SIZE:
+            self.file.flush()
+            self._write_checkpoint()
+
+
+# ----
+
+
+def commit_part(local_path: str) -> None:
+    """
+    Description
+    -----------
+
+    This function atomically renames the completed partial file path
+    to the specified local file path and removes the respective
+    checkpoint file path.
+
+    Parameters
+    ----------
+
+    local_path: str
+
+        A Python string specifying the local file path.
+
+    """
+
+    # Rename the partial file path and remove the checkpoint.
+    (part_path, checkpoint_path) = part_filepaths(local_path=local_path)
+    os.replace(part_path, local_path)
+
+    try:
+        os.remove(checkpoint_path)
+    except FileNotFoundError:
+        pass
+
+
+def download(
+    bucket: str,
+    object_path: str,
+    local_path: str,
+    profile_name: str = None,
+    limiter: object = None,
+) -> str:
+    """
+    Description
+    -----------
+
+    This function downloads the specified AWS s3 bucket and object
+    path to the specified local file path; the object is collected to
+    a partial file path (see part_filepaths) whose offset and ETag are
+    recorded within a checkpoint file path such that an interrupted
+    download is resumed, via a HTTP range request conditional upon the
+    ETag, by a subsequent download; the local file path is replaced
+    atomically upon completion. The object body is read in chunks
+    and, if a bandwidth limiter is specified, each chunk is reserved
+    from the bandwidth limiter such that the transfer is throttled
+    (via TCP flow control) to the bandwidth limits.
+
+    Parameters
+    ----------
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    local_path: str
+
+        A Python string specifying the local file path.
+
+    Keywords
+    --------
+
+    profile_name: str, optional
+
+        A Python string specifying the AWS profile name.
+
+    limiter: object, optional
+
+        A Python object containing the bandwidth limiter (see
+        staging.ratelimit.RateLimiter); if NoneType, the download
+        bandwidth is not bounded.
+
+    Returns
+    -------
+
+    etag: str
+
+        A Python string specifying the ETag for the respective AWS s3
+        object path.
+
+    """
+
+    # Collect the AWS s3 object; if a partial file path exists for
+    # the same object, only the remaining bytes are requested.
+    client = get_client(profile_name=profile_name)
+    (offset, etag) = read_checkpoint(
+        local_path=local_path, bucket=bucket, object_path=object_path
+    )
+
+    try:
+        response = client.get_object(
+            **get_object_kwargs(
+                bucket=bucket, object_path=object_path, offset=offset, etag=etag
+            )
+        )
+
+    except ClientError as exc:
+        if not restart_download(exc=exc, offset=offset):
+            raise
+        offset = 0
+        response = client.get_object(
+            **get_object_kwargs(bucket=bucket, object_path=object_path)
+        )
+
+    etag = response["ETag"].strip('"')
+
+    with PartFile(
+        local_path=local_path,
+        bucket=bucket,
+        object_path=object_path,
+        etag=etag,
+        offset=offset,
+    ) as part:
+        while True:
+            chunk = response["Body"].read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if limiter is not None:
+                limiter.acquire(nbytes=len(chunk))
+            part.write(chunk=chunk)
+
+    return etag
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(profile_name: str = None) -> object:
+    """
+    Description
+    -----------
+
+    This function returns an AWS s3 client for the specified AWS
+    profile; the clients are cached such that a respective client is
+    created only once per process.
+
+    Keywords
+    --------
+
+    profile_name: str, optional
+
+        A Python string specifying the AWS profile name within the
+        user ~/.aws/credentials file path; if NoneType, an unsigned
+        (i.e., public bucket) client is returned.
+
+    Returns
+    -------
+
+    client: object
+
+        A Python object containing the AWS s3 client.
+
+    """
+
+    # Define the AWS s3 client for the respective profile; proceed
+    # accordingly.
+    if profile_name is None:
+        client = boto3.session.Session().client(
+            "s3", config=Config(signature_version=UNSIGNED)
+        )
+
+    if profile_name is not None:
+        client = boto3.session.Session(profile_name=profile_name).client("s3")
+
+    return client
+
+
+def get_object_kwargs(
+    bucket: str, object_path: str, offset: int = 0, etag: str = None
+) -> dict:
+    """
+    Description
+    -----------
+
+    This function defines the AWS s3 object request attributes for
+    the download of the specified AWS s3 bucket and object path; if
+    the offset is non-zero, a HTTP range request conditional upon the
+    ETag is defined such that only the remaining bytes of the same
+    object are collected.
+
+    Parameters
+    ----------
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    Keywords
+    --------
+
+    offset: int, optional
+
+        A Python integer specifying the offset, in bytes, from which
+        to resume the download.
+
+    etag: str, optional
+
+        A Python string specifying the ETag of the partially collected
+        object.
+
+    Returns
+    -------
+
+    kwargs: dict
+
+        A Python dictionary containing the AWS s3 object request
+        attributes.
+
+    """
+
+    # Define the AWS s3 object request attributes.
+    kwargs = {"Bucket": bucket, "Key": object_path}
+    if offset > 0:
+        kwargs.update({"Range": f"bytes={offset}-", "IfMatch": etag})
+
+    return kwargs
+
+
+def get_etag(bucket: str, object_path: str, profile_name: str = None) -> str:
+    """
+    Description
+    -----------
+
+    This function returns the entity tag (ETag) for the specified AWS
+    s3 bucket and object path; this is a metadata request only.
+
+    Parameters
+    ----------
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    Keywords
+    --------
+
+    profile_name: str, optional
+
+        A Python string specifying the AWS profile name.
+
+    Returns
+    -------
+
+    etag: str
+
+        A Python string specifying the ETag for the respective AWS s3
+        object path.
+
+    """
+
+    # Collect the AWS s3 object path metadata.
+    response = get_client(profile_name=profile_name).head_object(
+        Bucket=bucket, Key=object_path
+    )
+    etag = response["ETag"].strip('"')
+
+    return etag
+
+
+def get_size(bucket: str, object_path: str, profile_name: str = None) -> int:
+    """
+    Description
+    -----------
+
+    This function returns the size, in bytes, of the specified AWS s3
+    bucket and object path; this is a metadata request only.
+
+    Parameters
+    ----------
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    Keywords
+    --------
+
+    profile_name: str, optional
+
+        A Python string specifying the AWS profile name.
+
+    Returns
+    -------
+
+    size: int
+
+        A Python integer specifying the size, in bytes, of the AWS s3
+        object path; if the object path does not exist, NoneType is
+        returned.
+
+    """
+
+    # Collect the AWS s3 object path metadata; proceed accordingly.
+    try:
+        response = get_client(profile_name=profile_name).head_object(
+            Bucket=bucket, Key=object_path
+        )
+
+    except ClientError as exc:
+        if exc.response["Error"]["Code"] not in MISSING_CODES:
+            raise
+        return None
+
+    return int(response["ContentLength"])
+
+
+def list_objects(
+    bucket: str, prefix: str, profile_name: str = None, wanted: set = None
+) -> object:
+    """
+    Description
+    -----------
+
+    This function (a generator) yields the AWS s3 object paths beneath
+    the specified AWS s3 bucket and prefix; the object paths are
+    collected one page at a time such that the complete listing is
+    never held in memory.
+
+    Parameters
+    ----------
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    prefix: str
+
+        A Python string specifying the AWS s3 object path prefix.
+
+    Keywords
+    --------
+
+    profile_name: str, optional
+
+        A Python string specifying the AWS profile name.
+
+    wanted: set, optional
+
+        A Python set of AWS s3 object paths; if specified, only the
+        object paths within the set are yielded and the listing stops
+        once all object paths beneath the prefix have been found or
+        once the (lexicographically ordered) listing has passed the
+        last object path.
+
+    Yields
+    ------
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    """
+
+    # Define the object paths to be matched beneath the prefix;
+    # proceed accordingly.
+    if wanted is not None:
+        wanted = {object_path for object_path in wanted if object_path.startswith(prefix)}
+        if not wanted:
+            return
+        last = max(wanted)
+
+    # Collect the object paths one page at a time.
+    paginator = get_client(profile_name=profile_name).get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for content in page.get("Contents", []):
+            object_path = content["Key"]
+            if wanted is None:
+                yield object_path
+                continue
+
+            if object_path in wanted:
+                wanted.discard(object_path)
+                yield object_path
+
+            if not wanted or object_path >= last:
+                return
+
+
+def part_filepaths(local_path: str) -> tuple:
+    """
+    Description
+    -----------
+
+    This function defines the partial and checkpoint file paths for
+    the specified local file path.
+
+    Parameters
+    ----------
+
+    local_path: str
+
+        A Python string specifying the local file path.
+
+    Returns
+    -------
+
+    (part_path, checkpoint_path): tuple
+
+        A Python tuple containing the partial file path and the
+        checkpoint file path.
+
+    """
+
+    # Define the partial and checkpoint file paths.
+    part_path = f"{local_path}.part"
+    checkpoint_path = f"{local_path}.part.json"
+
+    return (part_path, checkpoint_path)
+
+
+def read_checkpoint(local_path: str, bucket: str, object_path: str) -> tuple:
+    """
+    Description
+    -----------
+
+    This function reads the checkpoint for the partial file path
+    corresponding to the specified local file path; the offset is
+    the lesser of the recorded offset and the partial file path size
+    such that bytes which were not written prior to an interruption
+    are collected again.
+
+    Parameters
+    ----------
+
+    local_path: str
+
+        A Python string specifying the local file path.
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    Returns
+    -------
+
+    (offset, etag): tuple
+
+        A Python tuple containing the offset, in bytes, from which to
+        resume the download and the ETag of the partially collected
+        object; if the partial file path cannot be resumed, the
+        offset is 0 and the ETag is NoneType.
+
+    """
+
+    # Read the checkpoint; proceed accordingly.
+    (part_path, checkpoint_path) = part_filepaths(local_path=local_path)
+
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as file:
+            checkpoint_dict = json.load(file)
+        size = os.path.getsize(part_path)
+    except (OSError, ValueError):
+        return (0, None)
+
+    if (checkpoint_dict.get("bucket"), checkpoint_dict.get("object_path")) != (
+        bucket,
+        object_path,
+    ):
+        return (0, None)
+
+    offset = min(int(checkpoint_dict.get("offset", 0)), size)
+
+    return (offset, checkpoint_dict.get("etag"))
+
+
+def restart_download(exc: ClientError, offset: int) -> bool:
+    """
+    Description
+    -----------
+
+    This function determines whether a failed AWS s3 object request
+    is to be restarted from the beginning of the object; this is the
+    case only for resumed downloads for which the object has changed
+    or the range is invalid (see RESTART_CODES).
+
+    Parameters
+    ----------
+
+    exc: ClientError
+
+        A Python ClientError object containing the failed AWS s3
+        object request.
+
+    offset: int
+
+        A Python integer specifying the offset, in bytes, from which
+        the download was resumed.
+
+    Returns
+    -------
+
+    restart: bool
+
+        A Python boolean valued variable specifying whether to
+        restart the download.
+
+    """
+
+    # Check whether to restart the download.
+    restart = offset > 0 and (
+        exc.response.get("Error", {}).get("Code") in RESTART_CODES
+    )
+
+    return restart
+
+
+def write_checkpoint(
+    local_path: str, bucket: str, object_path: str, etag: str, offset: int
+) -> None:
+    """
+    Description
+    -----------
+
+    This function atomically writes the checkpoint for the partial
+    file path corresponding to the specified local file path.
+
+    Parameters
+    ----------
+
+    local_path: str
+
+        A Python string specifying the local file path.
+
+    bucket: str
+
+        A Python string specifying the AWS s3 bucket.
+
+    object_path: str
+
+        A Python string specifying the AWS s3 object path.
+
+    etag: str
+
+        A Python string specifying the ETag of the object being
+        collected.
+
+    offset: int
+
+        A Python integer specifying the number of bytes written to
+        the partial file path.
+
+    """
+
+    # Write the checkpoint.
+    checkpoint_path = part_filepaths(local_path=local_path)[1]
+    checkpoint_dict = {
+        "bucket": bucket,
+        "object_path": object_path,
+        "etag": etag,
+        "offset": offset,
+    }
+
+    with open(f"{checkpoint_path}.tmp", "w", encoding="utf-8") as file:
+        json.dump(checkpoint_dict, file)
+    os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
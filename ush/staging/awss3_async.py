@@ -0,0 +1,511 @@
+# =========================================================================
+
+# Module: ush/staging/awss3_async.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    awss3_async.py
+
+Description
+-----------
+
+    This module contains an asyncio-based Amazon Web Services (AWS) s3
+    fetch engine; all object requests for the respective file
+    identifiers are issued from a single thread with a bounded number
+    of in-flight requests and the collected objects are written
+    within worker threads; this engine is well suited for file identifiers
+    containing many small objects for which the request latency,
+    rather than the bandwidth, dominates.
+
+Functions
+---------
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    fetch(fileid_obj_list, max_concurrency=256, cache=None,
+          limiter=None)
+
+        This function collects the AWS s3 objects for each of the
+        specified file identifier objects.
+
+Requirements
+------------
+
+- aiobotocore; https://github.com/aio-libs/aiobotocore
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import asyncio
+import contextlib
+import os
+
+from botocore import UNSIGNED
+from botocore.exceptions import ClientError
+from exceptions import StagingError
+from tools import fileio_interface
+
+from staging import awss3
+from staging.cache import materialize
+from staging.stagelog import StagingLogger, msg_except_handle
+
+# ----
+
+# Define all available functions.
+__all__ = ["fetch"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the chunk size, in bytes, for reading AWS s3 object bodies.
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# ----
+
+
+def _import_engine() -> tuple:
+    """
+    Description
+    -----------
+
+    This function imports the (optional) package required by the
+    asyncio fetch engine.
+
+    Returns
+    -------
+
+    (AioSession, AioConfig): tuple
+
+        A Python tuple containing the aiobotocore session and client
+        configuration classes.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the aiobotocore package is not available.
+
+    """
+
+    # Import the asyncio fetch engine package; proceed accordingly.
+    # pylint: disable=import-outside-toplevel
+    try:
+        from aiobotocore.config import AioConfig
+        from aiobotocore.session import AioSession
+
+    except ImportError as exc:
+        msg = (
+            "The asyncio fetch engine requires the aiobotocore package; "
+            f"received {exc}. Aborting!!!"
+        )
+        error(msg=msg)
+
+    return (AioSession, AioConfig)
+
+
+async def _get(
+    client: object,
+    semaphore: object,
+    fileid_obj: object,
+    filepath_dict: dict,
+    cache: object,
+    limiter: object,
+) -> str:
+    """
+    Description
+    -----------
+
+    This function collects a single AWS s3 object path and writes it
+    to the respective local file path.
+
+    Parameters
+    ----------
+
+    client: object
+
+        A Python object containing the asynchronous AWS s3 client.
+
+    semaphore: object
+
+        A Python asyncio.Semaphore object bounding the number of
+        in-flight requests.
+
+    fileid_obj: object
+
+        A Python object containing the compiled attributes for the
+        respective file identifier.
+
+    filepath_dict: dict
+
+        A Python dictionary containing the timestamp, local_path, and
+        object_path attributes.
+
+    cache: object
+
+        A Python object containing the local object cache (see
+        staging.cache.ObjectCache); may be NoneType.
+
+    limiter: object
+
+        A Python object containing the bandwidth limiter (see
+        staging.ratelimit.RateLimiter); may be NoneType.
+
+    Returns
+    -------
+
+    local_path: str
+
+        A Python string specifying the collected local file path; if
+        the AWS s3 object path does not exist, NoneType is returned.
+
+    """
+
+    # Define the file paths.
+    (local_path, object_path) = (
+        filepath_dict["local_path"],
+        filepath_dict["object_path"],
+    )
+    bucket = fileid_obj.bucket
+
+    async with semaphore:
+
+        try:
+
+            # Check whether the object exists within the local object
+            # cache; proceed accordingly.
+            if cache is not None:
+                response = await client.head_object(Bucket=bucket, Key=object_path)
+                etag = response["ETag"].strip('"')
+                cache_filepath = await asyncio.to_thread(
+                    cache.lookup, bucket=bucket, object_path=object_path, etag=etag
+                )
+
+                if cache_filepath is not None:
+                    await asyncio.to_thread(
+                        fileio_interface.dirpath_tree, path=os.path.dirname(local_path)
+                    )
+                    await asyncio.to_thread(
+                        materialize, src_path=cache_filepath, dst_path=local_path
+                    )
+
+                    return local_path
+
+            # Collect the AWS s3 object; if a partial file path exists
+            # for the same object, only the remaining bytes are
+            # requested.
+            (offset, etag) = await asyncio.to_thread(
+                awss3.read_checkpoint,
+                local_path=local_path,
+                bucket=bucket,
+                object_path=object_path,
+            )
+
+            try:
+                response = await client.get_object(
+                    **awss3.get_object_kwargs(
+                        bucket=bucket, object_path=object_path, offset=offset, etag=etag
+                    )
+                )
+
+            except ClientError as exc:
+                if not awss3.restart_download(exc=exc, offset=offset):
+                    raise
+                offset = 0
+                response = await client.get_object(
+                    **awss3.get_object_kwargs(bucket=bucket, object_path=object_path)
+                )
+
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in awss3.MISSING_CODES:
+                return None
+            raise
+
+        # Write the AWS s3 object to the partial file path (see
+        # staging.awss3.PartFile); the file operations (and the
+        # bandwidth reservations, which may lock the node-wide broker
+        # file path) are performed within worker threads such that the
+        # event loop is not blocked.
+        await asyncio.to_thread(
+            fileio_interface.dirpath_tree, path=os.path.dirname(local_path)
+        )
+        etag = response["ETag"].strip('"')
+        part = awss3.PartFile(
+            local_path=local_path,
+            bucket=bucket,
+            object_path=object_path,
+            etag=etag,
+            offset=offset,
+        )
+        await asyncio.to_thread(part.open)
+
+        try:
+            async with response["Body"] as stream:
+                while True:
+                    chunk = await stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if limiter is not None:
+                        await asyncio.sleep(
+                            await asyncio.to_thread(limiter.reserve, nbytes=len(chunk))
+                        )
+                    await asyncio.to_thread(part.write, chunk=chunk)
+
+        except BaseException:
+            await asyncio.to_thread(part.close, commit=False)
+            raise
+
+        await asyncio.to_thread(part.close)
+
+    # Store the collected file within the local object cache (which
+    # may evict objects from the local object cache); proceed
+    # accordingly.
+    if cache is not None:
+        await asyncio.to_thread(
+            cache.store,
+            filepath=local_path,
+            bucket=bucket,
+            object_path=object_path,
+            etag=etag,
+        )
+
+    return local_path
+
+
+async def _fetch(
+    fileid_obj_list: list, max_concurrency: int, cache: object, limiter: object
+) -> list:
+    """
+    Description
+    -----------
+
+    This function creates an asynchronous AWS s3 client for each AWS
+    profile and collects all AWS s3 objects concurrently.
+
+    Parameters
+    ----------
+
+    fileid_obj_list: list
+
+        A Python list of compiled file identifier objects.
+
+    max_concurrency: int
+
+        A Python integer specifying the maximum number of in-flight
+        requests.
+
+    cache: object
+
+        A Python object containing the local object cache; may be
+        NoneType.
+
+    limiter: object
+
+        A Python object containing the bandwidth limiter; may be
+        NoneType.
+
+    Returns
+    -------
+
+    local_paths_list: list
+
+        A Python list, ordered identically to fileid_obj_list,
+        containing the list of the collected local file paths for
+        each file identifier.
+
+    """
+
+    # Define the asyncio fetch engine attributes.
+    # pylint: disable=invalid-name
+    (AioSession, AioConfig) = _import_engine()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with contextlib.AsyncExitStack() as stack:
+
+        # Define an asynchronous AWS s3 client for each AWS profile.
+        clients_dict = {}
+        for fileid_obj in fileid_obj_list:
+            profile_name = fileid_obj.profile_name
+            if profile_name in clients_dict:
+                continue
+
+            if profile_name is None:
+                config = AioConfig(
+                    signature_version=UNSIGNED, max_pool_connections=max_concurrency
+                )
+            else:
+                config = AioConfig(max_pool_connections=max_concurrency)
+
+            session = AioSession(profile=profile_name)
+            clients_dict[profile_name] = await stack.enter_async_context(
+                session.create_client("s3", config=config)
+            )
+
+        # Collect all AWS s3 objects concurrently; if an AWS s3 object
+        # cannot be collected, the remaining tasks are cancelled and
+        # awaited prior to closing the AWS s3 clients and the
+        # respective exception is raised.
+        tasks_list = []
+        for (idx, fileid_obj) in enumerate(fileid_obj_list):
+            for filepath_dict in fileid_obj.filepaths_list:
+                task = asyncio.create_task(
+                    _get(
+                        client=clients_dict[fileid_obj.profile_name],
+                        semaphore=semaphore,
+                        fileid_obj=fileid_obj,
+                        filepath_dict=filepath_dict,
+                        cache=cache,
+                        limiter=limiter,
+                    )
+                )
+                tasks_list.append((idx, task))
+
+        try:
+            local_paths = await asyncio.gather(*[task for (_, task) in tasks_list])
+
+        except BaseException:
+            for (_, task) in tasks_list:
+                task.cancel()
+            await asyncio.gather(*[task for (_, task) in tasks_list], return_exceptions=True)
+            raise
+
+    # Define the collected local file paths for each file identifier.
+    local_paths_list = [[] for _ in fileid_obj_list]
+    for ((idx, _), local_path) in zip(tasks_list, local_paths):
+        if local_path is not None:
+            local_paths_list[idx].append(local_path)
+
+    return local_paths_list
+
+
+def fetch(
+    fileid_obj_list: list,
+    max_concurrency: int = 256,
+    cache: object = None,
+    limiter: object = None,
+) -> list:
+    """
+    Description
+    -----------
+
+    This function collects the AWS s3 objects for each of the
+    specified file identifier objects using the asyncio fetch engine;
+    AWS s3 object paths that do not exist are ignored.
+
+    Parameters
+    ----------
+
+    fileid_obj_list: list
+
+        A Python list of compiled file identifier objects (i.e.,
+        containing the attribute filepaths_list).
+
+    Keywords
+    --------
+
+    max_concurrency: int, optional
+
+        A Python integer specifying the maximum number of in-flight
+        requests.
+
+    cache: object, optional
+
+        A Python object containing the local object cache (see
+        staging.cache.ObjectCache); if NoneType, the local object
+        cache is not used.
+
+    limiter: object, optional
+
+        A Python object containing the bandwidth limiter (see
+        staging.ratelimit.RateLimiter); if NoneType, the fetch
+        bandwidth is not bounded.
+
+    Returns
+    -------
+
+    local_paths_list: list
+
+        A Python list, ordered identically to fileid_obj_list,
+        containing the list of the collected local file paths for
+        each file identifier.
+
+    """
+
+    # Collect the AWS s3 objects.
+    ntasks = sum(len(fileid_obj.filepaths_list) for fileid_obj in fileid_obj_list)
+    msg = (
+        f"Collecting {ntasks} AWS s3 object paths using the asyncio fetch "
+        f"engine with at most {max_concurrency} in-flight requests."
+    )
+    StagingLogger().info(msg=msg)
+
+    local_paths_list = asyncio.run(
+        _fetch(
+            fileid_obj_list=fileid_obj_list,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            limiter=limiter,
+        )
+    )
+
+    return local_paths_list
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
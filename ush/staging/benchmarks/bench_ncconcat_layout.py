@@ -0,0 +1,415 @@
+# =========================================================================
+
+# Script: ush/staging/benchmarks/bench_ncconcat_layout.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Script
+------
+
+    bench_ncconcat_layout.py
+
+Description
+-----------
+
+    This script benchmarks the storage layouts available for the
+    concatenated netCDF-formatted files (see the nc_concat layout
+    attributes within parm/staging/README.md); for each layout, the
+    write (i.e., concatenation) time, the concatenated file size, and
+    the downstream read times for both the full file and a contiguous
+    slab of locations are reported.
+
+    If member files are not specified, representative IODA-formatted
+    SST and ADT superob member files are generated beneath the
+    specified working path; the observation values are quantized as
+    the respective observation files are such that the compression
+    ratios are representative.
+
+Functions
+---------
+
+    build_members(work_path, nmembers, nlocs)
+
+        This function generates representative IODA-formatted SST and
+        ADT superob member files.
+
+    get_ncvars(group, ncdim)
+
+        This function collects the variables dependent upon the
+        concatenation dimension.
+
+    main()
+
+        This is the driver-level method to invoke the tasks within
+        this script.
+
+    read_times(ncfile, ncdim)
+
+        This function measures the downstream read times for the
+        specified netCDF-formatted file.
+
+Usage
+-----
+
+    user@host:$ python bench_ncconcat_layout.py [--work_path] \
+                    [--ncfilelist] [--ncdim] [--nmembers] [--nlocs] \
+                    [--ntrials]
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+# pylint: disable=no-name-in-module
+
+# ----
+
+import os
+import tempfile
+import time
+
+import netCDF4
+import numpy
+from schema import Optional
+from staging.ncconcat import nc_concat
+from utils.arguments_interface import Arguments
+from utils.logger_interface import Logger
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the storage layouts to be benchmarked; NoneType denotes the
+# default netcdf4_interface.ncconcat concatenation.
+LAYOUTS_DICT = {
+    "default": None,
+    "contiguous": {"contiguous": True},
+    "chunk=4096": {"chunksize": 4096},
+    "chunk=65536": {"chunksize": 65536},
+    "zlib=1": {"complevel": 1, "shuffle": True, "chunksize": 65536},
+    "zlib=4": {"complevel": 4, "shuffle": True, "chunksize": 65536},
+    "zlib=4,noshuffle": {"complevel": 4, "shuffle": False, "chunksize": 65536},
+}
+
+# Define the representative observation types and their quantization.
+OBSTYPES_DICT = {
+    "sst": ("seaSurfaceTemperature", 0.01),
+    "adt": ("absoluteDynamicTopography", 0.001),
+}
+
+# ----
+
+
+def build_members(work_path: str, nmembers: int, nlocs: int) -> list:
+    """
+    Description
+    -----------
+
+    This function generates representative IODA-formatted SST and ADT
+    superob member files.
+
+    Parameters
+    ----------
+
+    work_path: str
+
+        A Python string specifying the path beneath which to write
+        the member files.
+
+    nmembers: int
+
+        A Python integer specifying the number of member files for
+        each observation type.
+
+    nlocs: int
+
+        A Python integer specifying the number of locations within
+        each member file.
+
+    Returns
+    -------
+
+    ncfiles_dict: dict
+
+        A Python dictionary containing the list of member file paths
+        for each observation type.
+
+    """
+
+    # Generate the member files for each observation type; the
+    # locations are along-track (i.e., spatially coherent) and hourly.
+    rng = numpy.random.default_rng(seed=0)
+    ncfiles_dict = {}
+    for (obstype, (varname, quantum)) in OBSTYPES_DICT.items():
+        ncfiles_dict[obstype] = []
+        for member in range(nmembers):
+            ncfile = os.path.join(work_path, f"{obstype}.{member:03d}.nc")
+            track = numpy.cumsum(rng.normal(0.0, 0.05, (nlocs, 2)), axis=0)
+            lats = numpy.clip(rng.uniform(-60.0, 60.0) + track[:, 0], -90.0, 90.0)
+            lons = numpy.mod(rng.uniform(0.0, 360.0) + track[:, 1], 360.0) - 180.0
+            values = (30.0 * numpy.cos(numpy.radians(lats))) + rng.normal(
+                0.0, 0.5, nlocs
+            )
+            if obstype == "adt":
+                values = values / 30.0
+
+            with netCDF4.Dataset(ncfile, "w") as ncobj:
+                ncobj.createDimension("nlocs", None)
+                for group in ["MetaData", "ObsValue", "ObsError", "PreQC"]:
+                    ncobj.createGroup(group)
+                ncobj.createVariable("MetaData/latitude", "f4", ("nlocs",))[:] = lats
+                ncobj.createVariable("MetaData/longitude", "f4", ("nlocs",))[:] = lons
+                ncvar = ncobj.createVariable("MetaData/dateTime", "i8", ("nlocs",))
+                ncvar.units = "seconds since 1970-01-01T00:00:00Z"
+                ncvar[:] = 946684800 + 3600 * member + numpy.sort(
+                    rng.integers(0, 3600, nlocs)
+                )
+                ncobj.createVariable(f"ObsValue/{varname}", "f4", ("nlocs",))[:] = (
+                    numpy.round(values / quantum) * quantum
+                )
+                ncobj.createVariable(f"ObsError/{varname}", "f4", ("nlocs",))[:] = (
+                    numpy.round(rng.uniform(0.2, 1.0, nlocs) / quantum) * quantum
+                )
+                ncobj.createVariable(f"PreQC/{varname}", "i4", ("nlocs",))[:] = (
+                    rng.choice([0, 0, 0, 1, 2], nlocs)
+                )
+
+            ncfiles_dict[obstype].append(ncfile)
+
+    return ncfiles_dict
+
+
+def get_ncvars(group: object, ncdim: str) -> list:
+    """
+    Description
+    -----------
+
+    This function collects the variables, within the specified group
+    and all child groups, dependent upon the concatenation dimension.
+
+    Parameters
+    ----------
+
+    group: object
+
+        A Python netCDF4.Dataset or netCDF4.Group object.
+
+    ncdim: str
+
+        A Python string specifying the netCDF concatenation dimension.
+
+    Returns
+    -------
+
+    ncvars_list: list
+
+        A Python list of netCDF4.Variable objects.
+
+    """
+
+    # Collect the respective variables.
+    ncvars_list = [
+        ncvar for ncvar in group.variables.values() if ncdim in ncvar.dimensions
+    ]
+    for child in group.groups.values():
+        ncvars_list.extend(get_ncvars(group=child, ncdim=ncdim))
+
+    return ncvars_list
+
+
+def read_times(ncfile: str, ncdim: str) -> tuple:
+    """
+    Description
+    -----------
+
+    This function measures the downstream read times for the
+    specified netCDF-formatted file.
+
+    Parameters
+    ----------
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path.
+
+    ncdim: str
+
+        A Python string specifying the netCDF concatenation dimension.
+
+    Returns
+    -------
+
+    full_time: float
+
+        A Python float specifying the time, in seconds, to read all
+        variables dependent upon the concatenation dimension.
+
+    slab_time: float
+
+        A Python float specifying the time, in seconds, to read a
+        contiguous slab of 1% of the locations for the same
+        variables.
+
+    """
+
+    # Read the variables dependent upon the concatenation dimension.
+    with netCDF4.Dataset(ncfile) as ncobj:
+        nlocs = len(ncobj.dimensions[ncdim])
+        (start, stop) = (nlocs // 2, nlocs // 2 + max(nlocs // 100, 1))
+        ncvars_list = get_ncvars(group=ncobj, ncdim=ncdim)
+
+        start_time = time.perf_counter()
+        for ncvar in ncvars_list:
+            ncvar[...]
+        full_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for ncvar in ncvars_list:
+            ncvar[start:stop]
+        slab_time = time.perf_counter() - start_time
+
+    return (full_time, slab_time)
+
+
+def main() -> None:
+    """
+    Description
+    -----------
+
+    This is the driver-level function to invoke the tasks within this
+    script.
+
+    Keywords
+    --------
+
+    work_path: str, optional
+
+        A Python string specifying the path beneath which to write
+        the member and concatenated files; if not specified, a
+        temporary directory is used and removed upon completion.
+
+    ncfilelist: str, optional
+
+        A Python string specifying a comma-delimited list of
+        netCDF-formatted member file paths (no spaces between
+        comma-delimited values); if not specified, representative SST
+        and ADT member files are generated.
+
+    ncdim: str, optional
+
+        A Python string specifying the netCDF concatenation dimension;
+        the default is nlocs.
+
+    nmembers: int, optional
+
+        A Python integer specifying the number of generated member
+        files for each observation type; the default is 6.
+
+    nlocs: int, optional
+
+        A Python integer specifying the number of locations within
+        each generated member file; the default is 200000.
+
+    ntrials: int, optional
+
+        A Python integer specifying the number of trials for each
+        layout; the minimum time across the trials is reported; the
+        default is 3.
+
+    """
+
+    # Define the schema attributes.
+    cls_schema = {
+        Optional("work_path"): str,
+        Optional("ncfilelist"): str,
+        Optional("ncdim"): str,
+        Optional("nmembers"): int,
+        Optional("nlocs"): int,
+        Optional("ntrials"): int,
+    }
+
+    # Collect the command line arguments.
+    options_obj = Arguments().run(eval_schema=True, cls_schema=cls_schema)
+    options_dict = vars(options_obj)
+    ncdim = options_dict.get("ncdim") or "nlocs"
+    ntrials = int(options_dict.get("ntrials") or 3)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        work_path = options_dict.get("work_path") or tmpdir
+        os.makedirs(work_path, exist_ok=True)
+
+        # Define the member files to be concatenated.
+        if options_dict.get("ncfilelist") is not None:
+            ncfiles_dict = {"members": options_dict["ncfilelist"].split(",")}
+        else:
+            ncfiles_dict = build_members(
+                work_path=work_path,
+                nmembers=int(options_dict.get("nmembers") or 6),
+                nlocs=int(options_dict.get("nlocs") or 200000),
+            )
+
+        # Benchmark each layout for each observation type.
+        msg = (
+            f"{'type':<8} {'layout':<18} {'write (s)':>10} {'size (MB)':>10} "
+            f"{'read (s)':>10} {'slab (s)':>10}"
+        )
+        Logger().info(msg=msg)
+        for (obstype, ncfilelist) in ncfiles_dict.items():
+            for (name, layout) in LAYOUTS_DICT.items():
+                ncfile = os.path.join(work_path, f"{obstype}.{name}.concat.nc")
+                timings_list = []
+                for _ in range(ntrials):
+                    start_time = time.perf_counter()
+                    nc_concat(
+                        ncfilelist=ncfilelist,
+                        ncfile=ncfile,
+                        ncdim=ncdim,
+                        ncfrmt="NETCDF4",
+                        layout=layout,
+                    )
+                    write_time = time.perf_counter() - start_time
+                    timings_list.append(
+                        (write_time,) + read_times(ncfile=ncfile, ncdim=ncdim)
+                    )
+
+                (write_time, full_time, slab_time) = numpy.min(timings_list, axis=0)
+                size = os.path.getsize(ncfile) / 1024.0**2
+                msg = (
+                    f"{obstype:<8} {name:<18} {write_time:>10.3f} {size:>10.2f} "
+                    f"{full_time:>10.3f} {slab_time:>10.4f}"
+                )
+                Logger().info(msg=msg)
+
+
+# ----
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+# =========================================================================
+
+# Script: ush/staging/benchmarks/bench_ncconcat_tree.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Script
+------
+
+    bench_ncconcat_tree.py
+
+Description
+-----------
+
+    This script benchmarks the sequential and tree reduction
+    concatenations of netCDF-formatted member files (see the nc_concat
+    tree attribute within parm/staging/README.md); for each number of
+    processes, the concatenation time and the speedup relative to the
+    sequential concatenation are reported, and the concatenated files
+    are checked to be identical (i.e., the variables, their ordering,
+    and their values).
+
+    If member files are not specified, representative IODA-formatted
+    SST superob member files for a dense multifile window are
+    generated beneath the specified working path.
+
+Functions
+---------
+
+    build_members(work_path, nmembers, nlocs)
+
+        This function generates representative IODA-formatted SST
+        superob member files.
+
+    compare(ncfile, reference)
+
+        This function checks that the specified concatenated file is
+        identical to the reference concatenated file.
+
+    main()
+
+        This is the driver-level method to invoke the tasks within
+        this script.
+
+Usage
+-----
+
+    user@host:$ python bench_ncconcat_tree.py [--work_path] \
+                    [--ncfilelist] [--ncdim] [--nmembers] [--nlocs] \
+                    [--nworkers] [--subset] [--ntrials]
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+# pylint: disable=no-name-in-module
+
+# ----
+
+import os
+import tempfile
+import time
+
+import netCDF4
+import numpy
+from schema import Optional
+from staging.ncconcat import get_nworkers, nc_concat
+from utils.arguments_interface import Arguments
+from utils.logger_interface import Logger
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the subset and sort applied when the subset option is
+# specified; the bounding box retains approximately one-third of the
+# locations.
+SUBSET_DICT = {
+    "bbox": [-20.0, 20.0, -180.0, 180.0],
+    "latitude": "MetaData/latitude",
+    "longitude": "MetaData/longitude",
+}
+SORT_DICT = {"keys": ["MetaData/dateTime"], "unique": True}
+
+# ----
+
+
+def build_members(work_path: str, nmembers: int, nlocs: int) -> list:
+    """
+    Description
+    -----------
+
+    This function generates representative IODA-formatted SST superob
+    member files; each member file spans a successive one-minute
+    window.
+
+    Parameters
+    ----------
+
+    work_path: str
+
+        A Python string specifying the path beneath which to write
+        the member files.
+
+    nmembers: int
+
+        A Python integer specifying the number of member files.
+
+    nlocs: int
+
+        A Python integer specifying the number of locations within
+        each member file.
+
+    Returns
+    -------
+
+    ncfilelist: list
+
+        A Python list of the member file paths.
+
+    """
+
+    # Generate the member files.
+    rng = numpy.random.default_rng(seed=0)
+    ncfilelist = []
+    for member in range(nmembers):
+        ncfile = os.path.join(work_path, f"sst.{member:04d}.nc")
+        lats = rng.uniform(-60.0, 60.0, nlocs)
+        with netCDF4.Dataset(ncfile, "w") as ncobj:
+            ncobj.createDimension("nlocs", None)
+            for group in ["MetaData", "ObsValue", "ObsError", "PreQC"]:
+                ncobj.createGroup(group)
+            ncobj.createVariable("MetaData/latitude", "f4", ("nlocs",))[:] = lats
+            ncobj.createVariable("MetaData/longitude", "f4", ("nlocs",))[:] = (
+                rng.uniform(-180.0, 180.0, nlocs)
+            )
+            ncvar = ncobj.createVariable("MetaData/dateTime", "i8", ("nlocs",))
+            ncvar.units = "seconds since 1970-01-01T00:00:00Z"
+            ncvar[:] = 946684800 + 60 * member + numpy.sort(rng.integers(0, 60, nlocs))
+            ncobj.createVariable("ObsValue/seaSurfaceTemperature", "f4", ("nlocs",))[:] = (
+                30.0 * numpy.cos(numpy.radians(lats)) + rng.normal(0.0, 0.5, nlocs)
+            )
+            ncobj.createVariable("ObsError/seaSurfaceTemperature", "f4", ("nlocs",))[:] = (
+                rng.uniform(0.2, 1.0, nlocs)
+            )
+            ncobj.createVariable("PreQC/seaSurfaceTemperature", "i4", ("nlocs",))[:] = (
+                rng.choice([0, 0, 0, 1, 2], nlocs)
+            )
+
+        ncfilelist.append(ncfile)
+
+    return ncfilelist
+
+
+def compare(ncfile: str, reference: str) -> bool:
+    """
+    Description
+    -----------
+
+    This function checks that the specified concatenated file is
+    identical (i.e., the groups, variables, variable ordering, and
+    values) to the reference concatenated file.
+
+    Parameters
+    ----------
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path.
+
+    reference: str
+
+        A Python string specifying the reference netCDF-formatted
+        file path.
+
+    Returns
+    -------
+
+    identical: bool
+
+        A Python boolean valued variable specifying whether the
+        concatenated files are identical.
+
+    """
+
+    # Compare the groups and variables of the concatenated files.
+    with netCDF4.Dataset(ncfile) as ncobj, netCDF4.Dataset(reference) as refobj:
+        groups_list = [(ncobj, refobj)]
+        while groups_list:
+            (group, refgroup) = groups_list.pop(0)
+            if list(group.groups) != list(refgroup.groups):
+                return False
+            if list(group.variables) != list(refgroup.variables):
+                return False
+            for (varname, ncvar) in group.variables.items():
+                if not numpy.array_equal(ncvar[...], refgroup[varname][...]):
+                    return False
+            groups_list.extend(
+                (child, refgroup.groups[name]) for (name, child) in group.groups.items()
+            )
+
+    return True
+
+
+def main() -> None:
+    """
+    Description
+    -----------
+
+    This is the driver-level function to invoke the tasks within this
+    script.
+
+    Keywords
+    --------
+
+    work_path: str, optional
+
+        A Python string specifying the path beneath which to write
+        the member and concatenated files; if not specified, a
+        temporary directory is used and removed upon completion.
+
+    ncfilelist: str, optional
+
+        A Python string specifying a comma-delimited list of
+        netCDF-formatted member file paths (no spaces between
+        comma-delimited values); if not specified, representative SST
+        member files are generated.
+
+    ncdim: str, optional
+
+        A Python string specifying the netCDF concatenation dimension;
+        the default is nlocs.
+
+    nmembers: int, optional
+
+        A Python integer specifying the number of generated member
+        files; the default is 240.
+
+    nlocs: int, optional
+
+        A Python integer specifying the number of locations within
+        each generated member file; the default is 20000.
+
+    nworkers: str, optional
+
+        A Python string specifying a comma-delimited list of the
+        numbers of processes for the tree reduction; the default is
+        2, 4, and the number of processes available to the
+        application.
+
+    subset: bool, optional
+
+        A Python boolean valued variable specifying whether to apply
+        a representative subset and sort (generated member files
+        only); the default is False.
+
+    ntrials: int, optional
+
+        A Python integer specifying the number of trials for each
+        concatenation; the minimum time across the trials is
+        reported; the default is 3.
+
+    """
+
+    # Define the schema attributes.
+    cls_schema = {
+        Optional("work_path"): str,
+        Optional("ncfilelist"): str,
+        Optional("ncdim"): str,
+        Optional("nmembers"): int,
+        Optional("nlocs"): int,
+        Optional("nworkers"): str,
+        Optional("subset"): bool,
+        Optional("ntrials"): int,
+    }
+
+    # Collect the command line arguments.
+    options_obj = Arguments().run(eval_schema=True, cls_schema=cls_schema)
+    options_dict = vars(options_obj)
+    ncdim = options_dict.get("ncdim") or "nlocs"
+    ntrials = int(options_dict.get("ntrials") or 3)
+    nworkers_list = sorted(
+        {2, 4, get_nworkers()}
+        if options_dict.get("nworkers") is None
+        else {int(nworkers) for nworkers in str(options_dict["nworkers"]).split(",")}
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        work_path = options_dict.get("work_path") or tmpdir
+        os.makedirs(work_path, exist_ok=True)
+
+        # Define the member files to be concatenated.
+        kwargs = {}
+        if options_dict.get("ncfilelist") is not None:
+            ncfilelist = options_dict["ncfilelist"].split(",")
+        else:
+            ncfilelist = build_members(
+                work_path=work_path,
+                nmembers=int(options_dict.get("nmembers") or 240),
+                nlocs=int(options_dict.get("nlocs") or 20000),
+            )
+            if options_dict.get("subset"):
+                kwargs = {"subset": SUBSET_DICT, "sort": SORT_DICT}
+
+        # Benchmark the sequential and tree reduction concatenations.
+        msg = f"{'mode':<16} {'concat (s)':>10} {'speedup':>8} {'identical':>10}"
+        Logger().info(msg=msg)
+        reference = os.path.join(work_path, "sequential.concat.nc")
+        modes_list = [("sequential", None)] + [
+            (f"tree={nworkers}", {"nworkers": nworkers}) for nworkers in nworkers_list
+        ]
+        for (name, tree) in modes_list:
+            ncfile = os.path.join(work_path, f"{name.replace('=', '.')}.concat.nc")
+            timings_list = []
+            for _ in range(ntrials):
+                start_time = time.perf_counter()
+                nc_concat(
+                    ncfilelist=ncfilelist, ncfile=ncfile, ncdim=ncdim, tree=tree, **kwargs
+                )
+                timings_list.append(time.perf_counter() - start_time)
+
+            concat_time = min(timings_list)
+            if tree is None:
+                sequential_time = concat_time
+
+            msg = (
+                f"{name:<16} {concat_time:>10.3f} {sequential_time / concat_time:>8.2f} "
+                f"{str(compare(ncfile=ncfile, reference=reference)):>10}"
+            )
+            Logger().info(msg=msg)
+
+
+# ----
+
+
+if __name__ == "__main__":
+    main()
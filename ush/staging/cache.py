@@ -0,0 +1,646 @@
+# =========================================================================
+
+# Module: ush/staging/cache.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    cache.py
+
+Description
+-----------
+
+    This module contains classes and functions for a local
+    content-addressed object cache that may be shared across
+    experiments (and forecast cycles); cached objects are keyed by the
+    remote bucket, object path, and entity tag (ETag) such that an
+    object is only downloaded once and subsequently materialized
+    within the respective local file path via a hardlink, reflink, or
+    (kernel) copy.
+
+Classes
+-------
+
+    ObjectCache(cache_path, max_size=None)
+
+        This is the base-class object for the local content-addressed
+        object cache.
+
+Functions
+---------
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    materialize(src_path, dst_path, hardlink=True)
+
+        This function materializes the source file path at the
+        destination file path using a hardlink, reflink, or copy
+        (attempted in that order).
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import fcntl
+import hashlib
+import os
+import shutil
+import threading
+
+from exceptions import StagingError
+from tools import fileio_interface
+
+from staging.stagelog import StagingLogger, msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = ["ObjectCache", "materialize"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the Linux ioctl request for file cloning (i.e., reflink);
+# see linux/fs.h.
+FICLONE = 0x40049409
+
+# Define the fraction of the maximum object cache size to which the
+# object cache is reduced once the maximum size has been exceeded;
+# the object cache is therefore only scanned once for every
+# (1 - EVICT_FRACTION) * max_size bytes stored.
+EVICT_FRACTION = 0.9
+
+# ----
+
+
+class ObjectCache:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the local content-addressed
+    object cache.
+
+    Parameters
+    ----------
+
+    cache_path: str
+
+        A Python string specifying the top-level directory tree path
+        for the object cache; this path should be on the same
+        filesystem as the experiment(s) such that cached objects may
+        be hardlinked.
+
+    Keywords
+    --------
+
+    max_size: int, optional
+
+        A Python integer specifying the maximum size, in bytes, of the
+        object cache; if the object cache exceeds this size, the least
+        recently used objects are removed; if NoneType, the object
+        cache is not bounded.
+
+    Notes
+    -----
+
+    For a bounded object cache, the size of the object cache is
+    recorded within the object cache (i.e., a running size index
+    shared by all applications using the object cache) and updated as
+    each object is stored; the object cache is scanned only once the
+    recorded size exceeds the maximum size. The recorded size is
+    reset to the scanned size upon each eviction such that objects
+    stored concurrently by multiple applications are not counted more
+    than once.
+
+    """
+
+    def __init__(self, cache_path: str, max_size: int = None):
+        """
+        Description
+        -----------
+
+        Creates a new ObjectCache object.
+
+        """
+
+        # Define the base-class attributes.
+        self.logger = StagingLogger()
+        self.cache_path = cache_path
+        self.max_size = max_size
+        self.objects_path = os.path.join(self.cache_path, "objects")
+        self.lock_path = os.path.join(self.cache_path, ".lock")
+        self.size_path = os.path.join(self.cache_path, ".size")
+        fileio_interface.dirpath_tree(path=self.objects_path)
+
+    def _evict(self, target_size: int) -> int:
+        """
+        Description
+        -----------
+
+        This method removes the least recently used objects from the
+        object cache until the object cache size is less than or
+        equal to the specified size; the calling method must hold the
+        object cache lock.
+
+        Parameters
+        ----------
+
+        target_size: int
+
+            A Python integer specifying the size, in bytes, to which
+            the object cache is reduced.
+
+        Returns
+        -------
+
+        cache_size: int
+
+            A Python integer specifying the object cache size, in
+            bytes, following the eviction.
+
+        """
+
+        # Collect the size and (last) access time for each cached
+        # object.
+        objects_list = []
+        for (dirpath, _, filenames) in os.walk(self.objects_path):
+            for filename in filenames:
+                filepath = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(filepath)
+                except FileNotFoundError:
+                    continue
+                objects_list.append((stat.st_mtime, stat.st_size, filepath))
+
+        # Remove the least recently used objects.
+        cache_size = sum(obj[1] for obj in objects_list)
+        for (_, size, filepath) in sorted(objects_list):
+            if cache_size <= target_size:
+                break
+
+            msg = f"Evicting object cache file path {filepath}."
+            self.logger.info(msg=msg)
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+            cache_size = cache_size - size
+
+        return cache_size
+
+    def _read_size(self) -> int:
+        """
+        Description
+        -----------
+
+        This method reads the recorded object cache size; the calling
+        method must hold the object cache lock.
+
+        Returns
+        -------
+
+        cache_size: int
+
+            A Python integer specifying the recorded object cache
+            size, in bytes; if the object cache size has not been
+            recorded, NoneType is returned.
+
+        """
+
+        # Read the recorded object cache size; proceed accordingly.
+        try:
+            with open(self.size_path, "r", encoding="utf-8") as file:
+                cache_size = int(file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+        return cache_size
+
+    def _write_size(self, cache_size: int) -> None:
+        """
+        Description
+        -----------
+
+        This method records the object cache size; the calling method
+        must hold the object cache lock.
+
+        Parameters
+        ----------
+
+        cache_size: int
+
+            A Python integer specifying the object cache size, in
+            bytes.
+
+        """
+
+        # Record the object cache size.
+        tmp_path = f"{self.size_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(str(cache_size))
+        os.replace(tmp_path, self.size_path)
+
+    def cache_filepath(self, bucket: str, object_path: str, etag: str) -> str:
+        """
+        Description
+        -----------
+
+        This method defines the object cache file path for the
+        respective bucket, object path, and ETag.
+
+        Parameters
+        ----------
+
+        bucket: str
+
+            A Python string specifying the remote bucket.
+
+        object_path: str
+
+            A Python string specifying the remote object path.
+
+        etag: str
+
+            A Python string specifying the remote object ETag.
+
+        Returns
+        -------
+
+        cache_filepath: str
+
+            A Python string specifying the object cache file path.
+
+        """
+
+        # Define the content-address for the respective object.
+        key = hashlib.sha256(
+            f"{bucket}/{object_path}/{etag}".encode("utf-8")
+        ).hexdigest()
+        cache_filepath = os.path.join(self.objects_path, key[0:2], key)
+
+        return cache_filepath
+
+    def evict(self, target_size: int = None) -> None:
+        """
+        Description
+        -----------
+
+        This method removes the least recently used objects from the
+        object cache until the object cache size is less than or
+        equal to the specified size; the object cache is locked during
+        the eviction such that concurrent applications do not evict
+        the same objects.
+
+        Keywords
+        --------
+
+        target_size: int, optional
+
+            A Python integer specifying the size, in bytes, to which
+            the object cache is reduced; if NoneType, the object cache
+            is reduced to the maximum size.
+
+        """
+
+        # Check whether the object cache is bounded; proceed
+        # accordingly.
+        if self.max_size is None:
+            return
+
+        if target_size is None:
+            target_size = self.max_size
+
+        with open(self.lock_path, "a", encoding="utf-8") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._write_size(cache_size=self._evict(target_size=target_size))
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def lookup(self, bucket: str, object_path: str, etag: str) -> str:
+        """
+        Description
+        -----------
+
+        This method checks whether the respective object exists
+        within the object cache; if so, the object access time is
+        updated.
+
+        Parameters
+        ----------
+
+        bucket: str
+
+            A Python string specifying the remote bucket.
+
+        object_path: str
+
+            A Python string specifying the remote object path.
+
+        etag: str
+
+            A Python string specifying the remote object ETag.
+
+        Returns
+        -------
+
+        cache_filepath: str
+
+            A Python string specifying the object cache file path; if
+            the object does not exist within the object cache,
+            NoneType is returned.
+
+        """
+
+        # Check whether the object exists within the object cache;
+        # proceed accordingly.
+        cache_filepath = self.cache_filepath(
+            bucket=bucket, object_path=object_path, etag=etag
+        )
+
+        try:
+            os.utime(cache_filepath)
+        except FileNotFoundError:
+            return None
+
+        return cache_filepath
+
+    def store(self, filepath: str, bucket: str, object_path: str, etag: str) -> str:
+        """
+        Description
+        -----------
+
+        This method stores the local file path within the object
+        cache and, if the recorded object cache size exceeds the
+        maximum size, evicts the least recently used objects.
+
+        Parameters
+        ----------
+
+        filepath: str
+
+            A Python string specifying the local file path containing
+            the respective object.
+
+        bucket: str
+
+            A Python string specifying the remote bucket.
+
+        object_path: str
+
+            A Python string specifying the remote object path.
+
+        etag: str
+
+            A Python string specifying the remote object ETag.
+
+        Returns
+        -------
+
+        cache_filepath: str
+
+            A Python string specifying the object cache file path.
+
+        """
+
+        # Store the local file path within the object cache.
+        cache_filepath = self.cache_filepath(
+            bucket=bucket, object_path=object_path, etag=etag
+        )
+        exist = os.path.exists(cache_filepath)
+        fileio_interface.dirpath_tree(path=os.path.dirname(cache_filepath))
+        materialize(src_path=filepath, dst_path=cache_filepath)
+
+        # Update the recorded object cache size and, if the maximum
+        # size has been exceeded, evict objects from the object
+        # cache; proceed accordingly.
+        if self.max_size is None or exist:
+            return cache_filepath
+
+        with open(self.lock_path, "a", encoding="utf-8") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            cache_size = self._read_size()
+            if cache_size is None:
+                cache_size = self._evict(target_size=self.max_size)
+            else:
+                cache_size = cache_size + os.path.getsize(cache_filepath)
+
+            if cache_size > self.max_size:
+                cache_size = self._evict(
+                    target_size=int(EVICT_FRACTION * self.max_size)
+                )
+
+            self._write_size(cache_size=cache_size)
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+        return cache_filepath
+
+
+# ----
+
+
+def _copy_range(src: object, dst: object) -> bool:
+    """
+    Description
+    -----------
+
+    This function copies the source file to the destination file
+    using os.copy_file_range such that the copy is performed within
+    the kernel (and, for filesystems supporting server-side copies,
+    without transferring the file contents to the respective host).
+
+    Parameters
+    ----------
+
+    src: object
+
+        A Python file object for the source file path.
+
+    dst: object
+
+        A Python file object for the (empty) destination file path.
+
+    Returns
+    -------
+
+    copied: bool
+
+        A Python boolean valued variable specifying whether the
+        source file has been copied; if os.copy_file_range is not
+        available or is not supported for the respective
+        filesystems, False is returned.
+
+    """
+
+    # Copy the source file using the kernel copy path; proceed
+    # accordingly.
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    (size, offset) = (os.fstat(src.fileno()).st_size, 0)
+    try:
+        while offset < size:
+            nbytes = copy_file_range(src.fileno(), dst.fileno(), size - offset)
+            if nbytes == 0:
+                return False
+            offset += nbytes
+
+    except OSError:
+        return False
+
+    return True
+
+
+def materialize(src_path: str, dst_path: str, hardlink: bool = True) -> str:
+    """
+    Description
+    -----------
+
+    This function materializes the source file path at the
+    destination file path; a hardlink is attempted first, then a
+    reflink (i.e., copy-on-write clone), and finally a copy (which
+    uses os.copy_file_range, and otherwise the kernel copy path of
+    shutil, where supported); the destination file path is replaced
+    atomically.
+
+    Parameters
+    ----------
+
+    src_path: str
+
+        A Python string specifying the source file path.
+
+    dst_path: str
+
+        A Python string specifying the destination file path.
+
+    Keywords
+    --------
+
+    hardlink: bool, optional
+
+        A Python boolean valued variable specifying whether a
+        hardlink may be used; a hardlink shares the source file
+        inode such that a modification of the destination file path
+        also modifies the source file path.
+
+    Returns
+    -------
+
+    method: str
+
+        A Python string specifying the method used to materialize the
+        destination file path; values are hardlink, reflink, or copy.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the source file path does not exist.
+
+    """
+
+    # Check that the source file path exists; proceed accordingly.
+    if not fileio_interface.fileexist(path=src_path):
+        msg = f"The file path {src_path} does not exist. Aborting!!!"
+        error(msg=msg)
+
+    # Check whether the destination file path is already a hardlink
+    # to the source file path; proceed accordingly.
+    if hardlink and os.path.exists(dst_path) and os.path.samefile(src_path, dst_path):
+        return "hardlink"
+
+    tmp_path = f"{dst_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+
+    # Attempt to hardlink the source file path.
+    method = None
+    if hardlink:
+        try:
+            os.link(src_path, tmp_path)
+            method = "hardlink"
+
+        except OSError:
+            pass
+
+    # Attempt to reflink the source file path; if the filesystem does
+    # not support reflinks, copy the source file path.
+    copied = False
+    if method is None:
+        with open(src_path, "rb") as src, open(tmp_path, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                method = "reflink"
+            except OSError:
+                method = "copy"
+                copied = _copy_range(src=src, dst=dst)
+
+        if method == "copy" and not copied:
+            shutil.copyfile(src_path, tmp_path)
+
+    os.replace(tmp_path, dst_path)
+
+    return method
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -0,0 +1,429 @@
+# =========================================================================
+
+# Module: ush/staging/decompress.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    decompress.py
+
+Description
+-----------
+
+    This module contains functions to decompress collected (e.g.,
+    gzip or bzip2 compressed) files in place; the files are
+    decompressed using the block-parallel implementations (i.e., pigz
+    and pbzip2) where available and otherwise using the respective
+    Python modules, either individually (i.e., as each file is
+    collected) or using a pool of processes.
+
+    The file identifier decompress attribute is either a format
+    (i.e., auto, gzip, or bzip2) or a Python dictionary containing
+    the following attributes.
+
+    format: the compression format; auto determines the format from
+            the file contents (default auto).
+
+    mode: each, to decompress each file once it has been
+          collected (i.e., while the remaining files are collected),
+          or pool, to decompress all files once they have been
+          collected using a pool of processes (default pool); files
+          are decompressed once collected and not during the
+          collection.
+
+    checksum: compressed or decompressed, specifying whether the
+              checksum hash indices are defined for the collected or
+              the decompressed files (default decompressed).
+
+Functions
+---------
+
+    decompress(filepath, fmt="auto", nthreads=1)
+
+        This function decompresses the specified file path in place.
+
+    decompress_pool(filepaths_list, fmts_list, nworkers=None)
+
+        This function decompresses the specified file paths in place
+        using a pool of processes.
+
+    detect(filepath)
+
+        This function determines the compression format of the
+        specified file path.
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    get_attrs(decompress_attr)
+
+        This function defines the decompression attributes for a file
+        identifier decompress attribute.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import bz2
+import gzip
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from exceptions import StagingError
+
+from staging.ncconcat import get_nworkers
+from staging.stagelog import msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = ["decompress", "decompress_pool", "detect", "get_attrs"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the block size, in bytes, for decompressing files using the
+# Python modules.
+BLOCK_SIZE = 8 * 1024 * 1024
+
+# Define the supported compression formats; the magic numbers
+# identify the respective formats and the commands are the
+# block-parallel implementations, if available, writing the
+# decompressed file to standard output.
+FORMATS_DICT = {
+    "bzip2": {
+        "magic": b"BZh",
+        "module": bz2,
+        "command": ["pbzip2", "-d", "-c", "-p{nthreads}"],
+    },
+    "gzip": {
+        "magic": b"\x1f\x8b",
+        "module": gzip,
+        "command": ["pigz", "-d", "-c", "-p", "{nthreads}"],
+    },
+}
+
+# Define the default decompression attributes.
+DEFAULTS_DICT = {"format": "auto", "mode": "pool", "checksum": "decompressed"}
+
+# Define the supported decompression attribute values.
+VALUES_DICT = {
+    "format": ["auto"] + sorted(FORMATS_DICT),
+    "mode": ["each", "pool"],
+    "checksum": ["compressed", "decompressed"],
+}
+
+# ----
+
+
+def decompress(filepath: str, fmt: str = "auto", nthreads: int = 1) -> str:
+    """
+    Description
+    -----------
+
+    This function decompresses the specified file path in place; the
+    decompressed file is written to a temporary file path which
+    replaces the specified file path upon completion such that a
+    partially decompressed file is never written to the file path
+    (and a hardlink to the file path, e.g., within the local object
+    cache, is not modified).
+
+    Parameters
+    ----------
+
+    filepath: str
+
+        A Python string specifying the file path.
+
+    Keywords
+    --------
+
+    fmt: str, optional
+
+        A Python string specifying the compression format; if auto,
+        the compression format is determined from the file contents.
+
+    nthreads: int, optional
+
+        A Python integer specifying the number of threads for the
+        block-parallel implementations.
+
+    Returns
+    -------
+
+    fmt: str
+
+        A Python string specifying the compression format of the
+        decompressed file; if the file is not compressed using the
+        specified format (e.g., the file has already been
+        decompressed), the file is not modified and NoneType is
+        returned.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the file path cannot be decompressed.
+
+    """
+
+    # Check the compression format; proceed accordingly.
+    detected = detect(filepath=filepath)
+    if detected is None or fmt not in ["auto", detected]:
+        return None
+
+    # Decompress the file path using the block-parallel
+    # implementation, if available, and otherwise the respective
+    # Python module.
+    format_dict = FORMATS_DICT[detected]
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as dst:
+            if shutil.which(format_dict["command"][0]) is not None:
+                cmd = [
+                    arg.format(nthreads=max(int(nthreads), 1))
+                    for arg in format_dict["command"]
+                ] + [filepath]
+                subprocess.run(cmd, stdout=dst, stderr=subprocess.PIPE, check=True)
+
+            else:
+                with format_dict["module"].open(filepath, "rb") as src:
+                    shutil.copyfileobj(src, dst, BLOCK_SIZE)
+
+    except (OSError, EOFError, subprocess.CalledProcessError) as exc:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        msg = (
+            f"The {detected} compressed file path {filepath} could not be "
+            f"decompressed ({exc}). Aborting!!!"
+        )
+        error(msg=msg)
+
+    os.replace(tmp_path, filepath)
+
+    return detected
+
+
+def decompress_pool(filepaths_list: list, fmts_list: list, nworkers: int = None) -> list:
+    """
+    Description
+    -----------
+
+    This function decompresses the specified file paths in place
+    using a pool of processes; the threads available to the
+    block-parallel implementations are divided amongst the processes
+    and, if only a single process is available, the file paths are
+    decompressed serially using all threads.
+
+    Parameters
+    ----------
+
+    filepaths_list: list
+
+        A Python list of file paths.
+
+    fmts_list: list
+
+        A Python list, ordered identically to filepaths_list, of the
+        compression formats (see decompress).
+
+    Keywords
+    --------
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of processes; if
+        NoneType, the number of processes available to the respective
+        application is used.
+
+    Returns
+    -------
+
+    fmts_list: list
+
+        A Python list, ordered identically to filepaths_list, of the
+        compression formats of the decompressed files (see
+        decompress).
+
+    """
+
+    # Decompress the file paths.
+    ncpus = get_nworkers(nworkers=nworkers)
+    nworkers = min(ncpus, max(len(filepaths_list), 1))
+    nthreads = max(ncpus // nworkers, 1)
+    if nworkers <= 1:
+        return [
+            decompress(filepath=filepath, fmt=fmt, nthreads=nthreads)
+            for (filepath, fmt) in zip(filepaths_list, fmts_list)
+        ]
+
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        fmts_list = list(
+            executor.map(
+                decompress, filepaths_list, fmts_list, [nthreads] * len(filepaths_list)
+            )
+        )
+
+    return fmts_list
+
+
+def detect(filepath: str) -> str:
+    """
+    Description
+    -----------
+
+    This function determines the compression format of the specified
+    file path from the respective magic number.
+
+    Parameters
+    ----------
+
+    filepath: str
+
+        A Python string specifying the file path.
+
+    Returns
+    -------
+
+    fmt: str
+
+        A Python string specifying the compression format; if the
+        file path is not compressed using a supported format,
+        NoneType is returned.
+
+    """
+
+    # Compare the leading bytes of the file path to the magic numbers
+    # of the supported compression formats.
+    with open(filepath, "rb") as file:
+        header = file.read(4)
+
+    for (fmt, format_dict) in FORMATS_DICT.items():
+        if header.startswith(format_dict["magic"]):
+            return fmt
+
+    return None
+
+
+def get_attrs(decompress_attr: object) -> dict:
+    """
+    Description
+    -----------
+
+    This function defines the decompression attributes for the
+    specified file identifier decompress attribute.
+
+    Parameters
+    ----------
+
+    decompress_attr: object
+
+        A Python object specifying the file identifier decompress
+        attribute; either a Python string specifying the compression
+        format or a Python dictionary containing the decompression
+        attributes.
+
+    Returns
+    -------
+
+    attrs_dict: dict
+
+        A Python dictionary containing the format, mode, and checksum
+        decompression attributes; if the decompress attribute is
+        NoneType or False, NoneType is returned.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if a decompression attribute is not supported.
+
+    """
+
+    # Define the decompression attributes; proceed accordingly.
+    if decompress_attr is None or decompress_attr is False:
+        return None
+
+    if decompress_attr is True:
+        decompress_attr = {}
+
+    if isinstance(decompress_attr, str):
+        decompress_attr = {"format": decompress_attr}
+
+    attrs_dict = dict(DEFAULTS_DICT)
+    for (attr, value) in dict(decompress_attr).items():
+        if attr not in VALUES_DICT or str(value).lower() not in VALUES_DICT[attr]:
+            msg = (
+                f"The decompress attribute {attr}: {value} is not supported; "
+                f"supported attributes and values are {VALUES_DICT}. Aborting!!!"
+            )
+            error(msg=msg)
+
+        attrs_dict[attr] = str(value).lower()
+
+    return attrs_dict
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -62,10 +62,30 @@ History
 
 # ----
 
-from tools import parser_interface
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tools import datetime_interface, fileio_interface, parser_interface
+from utils import timestamp_interface
 
 from staging import Staging
 from staging import error as staging_error
+from staging import posix_filepath
+from staging import (
+    awss3,
+    awss3_async,
+    decompress,
+    manifest,
+    ncvalidate,
+    plan,
+    streams,
+    tarindex,
+)
+from staging.cache import ObjectCache, materialize
+from staging.ratelimit import RateLimiter
+from staging.shard import QUEUE_SHARD, Shard, WorkQueue
 
 # ----
 
@@ -78,7 +98,9 @@ __email__ = "henry.winterbottom@noaa.gov"
 # Define the default AWS fetch attribute values.
 aws_opt_attr_dict = {
     "bufr_concat": None,
+    "decompress": None,
     "ignore_missing": True,
+    "md5_manifest": None,
     "multifile": None,
     "nc_concat": None,
     "offset_seconds": 0,
@@ -90,6 +112,49 @@ aws_opt_attr_dict = {
 # Define the mandatory AWS fetch attribute values.
 aws_mand_attr_list = ["bucket", "local_path", "object_path"]
 
+# Define the supported AWS fetch engines.
+aws_engines_list = ["asyncio", "boto3"]
+
+# Define the default POSIX fetch attribute values.
+posix_opt_attr_dict = {
+    "bufr_concat": None,
+    "decompress": None,
+    "hardlink": False,
+    "ignore_missing": True,
+    "multifile": None,
+    "nc_concat": None,
+    "offset_seconds": 0,
+    "stream_start": 19000101000000,
+    "stream_stop": 20991231230000,
+}
+
+# Define the mandatory POSIX fetch attribute values.
+posix_mand_attr_list = ["local_path", "object_path", "root_path"]
+
+# Define the default tar archive fetch attribute values.
+tar_opt_attr_dict = {
+    "bufr_concat": None,
+    "decompress": None,
+    "ignore_missing": True,
+    "multifile": None,
+    "nc_concat": None,
+    "offset_seconds": 0,
+    "stream_start": 19000101000000,
+    "stream_stop": 20991231230000,
+    "tar_index": None,
+}
+
+# Define the mandatory tar archive fetch attribute values.
+tar_mand_attr_list = ["local_path", "object_path", "tar_path"]
+
+# Define the mandatory and optional fetch attributes for each
+# supported interface/platform.
+fetch_attrs_dict = {
+    "aws_s3": {"mand_attr_list": aws_mand_attr_list, "opt_attr_dict": aws_opt_attr_dict},
+    "posix": {"mand_attr_list": posix_mand_attr_list, "opt_attr_dict": posix_opt_attr_dict},
+    "tar": {"mand_attr_list": tar_mand_attr_list, "opt_attr_dict": tar_opt_attr_dict},
+}
+
 # -----
 
 
@@ -110,9 +175,17 @@ class Fetch(Staging):
         A Python object containing the attributes collect via the
         command line from the application driver script.
 
+    Keywords
+    --------
+
+    task_id: str, optional
+
+        A Python string specifying the base-name for the respective
+        task identifier.
+
     """
 
-    def __init__(self, options_obj: object):
+    def __init__(self, options_obj: object, task_id: str = "fetch"):
         """
         Description
         -----------
@@ -122,8 +195,11 @@ class Fetch(Staging):
         """
 
         # Define the supported fetch application interfaces.
-        task_id = "fetch"
-        self.fetch_methods_dict = {"aws_s3": self.aws_s3}
+        self.fetch_methods_dict = {
+            "aws_s3": self.aws_s3,
+            "posix": self.posix,
+            "tar": self.tar,
+        }
 
         # Check whether the base-class arguments contain the
         # respective supported fetch types; update the task identifier
@@ -152,8 +228,28 @@ class Fetch(Staging):
             task_id = task_id + "_".join(list(self.fileids))
 
         # Define the base-class attributes.
+        self.inactive_fileids = set()
+        self.manifest_index = manifest.ManifestIndex()
+        self.archive_index = tarindex.TarIndex()
         super().__init__(options_obj=options_obj, task_id=task_id)
 
+        # Define the shard attributes, if specified; the shard
+        # coordination files are written beneath the experiment /com
+        # path.
+        self.shard = None
+        shard = parser_interface.object_getattr(
+            object_in=options_obj, key="shard", force=True
+        )
+        if shard is not None and str(shard).lower() == QUEUE_SHARD:
+            self.shard = WorkQueue(
+                dirpath=os.path.join(self.launch.com_root, f"{task_id}.shards")
+            )
+
+        if shard is not None and str(shard).lower() != QUEUE_SHARD:
+            self.shard = Shard(
+                shard=shard, dirpath=os.path.join(self.launch.com_root, f"{task_id}.shards")
+            )
+
     def _get_fetch_types(self) -> list:
         """
         Description
@@ -186,163 +282,269 @@ class Fetch(Staging):
 
         return fetch_types_list
 
-    def _get_fileids(self, options_obj: object) -> list:
+    def _collect_fetch_type(self, method: object, fetch_type: str, filesdict: dict) -> tuple:
         """
         Description
         -----------
 
-        This method defines the base-class attribute fileids with
-        respect to the command line option attribute fileid.
+        This method collects the files for the specified fetch type
+        using the number of threads specified by the respective
+        worker budget.
 
         Parameters
         ----------
 
-        options_obj: object
+        method: object
 
-            A Python object containing the attributes collect via the
-            command line from the application driver script.
+            A Python object specifying the base-class method for the
+            respective interface/platform.
+
+        fetch_type: str
+
+            A Python string specifying the fetch type.
+
+        filesdict: dict
+
+            A Python dictionary containing the attributes for each
+            file identifier within the respective fetch type.
 
         Returns
         -------
 
-        fileids: list
+        (concat_jobs_list, elapsed): tuple
 
-            A Python list of file identifiers to be collected.
+            A Python tuple containing the concatenation jobs for the
+            respective fetch type and the elapsed time, in seconds.
 
         """
 
-        # Check whether the base-class arguments contain the file
-        # identifier attribute; proceed accordingly.
-        fileids = None
-        fileid_opt = parser_interface.object_getattr(
-            object_in=options_obj, key="fileid", force=True
-        )
+        # Collect the files for the respective fetch type.
+        nworkers = self._get_nworkers(fetch_type=fetch_type)
+        msg = f"Collecting files for fetch type {fetch_type} using {nworkers} workers."
+        self.logger.info(msg=msg)
 
-        # If the file identifier attribute has been specified, define
-        # a list of values to be returned.
-        if fileid_opt is not None:
-            fileids = list(set(fileid_opt.split(",")))
+        start_time = time.time()
+        concat_jobs_list = method(filesdict=filesdict, nworkers=nworkers)
 
-        return fileids
+        return (concat_jobs_list, time.time() - start_time)
 
-    def _get_platforms(self, options_obj: object) -> list:
+    def _compile_tasks(self, fetch_tasks_list: list) -> list:
         """
         Description
         -----------
 
-        This method defines the base-class attribute platforms with
-        respect to the command line option attribute platform.
+        This method compiles the file identifiers for all fetch types
+        such that the objects (i.e., file identifier and timestamp)
+        may be partitioned identically by all fetch applications (see
+        staging.shard).
 
         Parameters
         ----------
 
-        options_obj: object
+        fetch_tasks_list: list
 
-            A Python object containing the attributes collect via the
-            command line from the application driver script.
+            A Python list of (fetch method, method, fetch type, file
+            identifier attributes) tuples (see collect).
 
         Returns
         -------
 
-        platforms: list
+        compiled_list: list
 
-            A Python list of interface/platforms to be collected.
+            A Python list of (task, file identifier object) tuples,
+            where task is the (fetch method, method, fetch type, file
+            identifier) tuple, for each file identifier.
 
-        Raises
-        ------
+        """
 
-        StagingError:
+        # Compile the file identifiers for all fetch types.
+        compiled_list = []
+        for (fetch_method, method, fetch_type, filesdict) in fetch_tasks_list:
+            filesdict = self._filter_fileids(filesdict=filesdict)
+            for fileid in filesdict:
+                compiled_list.append(
+                    (
+                        (fetch_method, method, fetch_type, fileid),
+                        self.get_fileid_obj(
+                            platform=fetch_method, filesdict=filesdict, fileid=fileid
+                        ),
+                    )
+                )
 
-            * raised if a specified platform is not supported by this
-              application.
+        return compiled_list
 
+    def _filter_fileids(self, filesdict: dict) -> dict:
         """
+        Description
+        -----------
 
-        # Check whether the base-class arguments contain the
-        # respective interface/platform type; proceed accordingly.
-        platform_opt = parser_interface.object_getattr(
-            object_in=options_obj, key="platform", force=True
-        )
-        if platform_opt is None:
+        This method filters the file identifiers within the respective
+        fetch type in accordance with the base-class attribute
+        fileids.
 
-            # Define a list of interface/platform types using the
-            # base-class attributes.
-            platforms = list(self.fetch_methods_dict.keys())
+        Parameters
+        ----------
 
-        if platform_opt is not None:
+        filesdict: dict
 
-            # Define a list of unique interface/platform types.
-            platforms = list(set(platform_opt.split(",")))
+            A Python dictionary containing the attributes for each
+            file identifier within the respective fetch type.
 
-            # Check that the interface/platform is supported; proceed
-            # accordingly.
-            for platform in platforms:
-                if platform not in self.fetch_methods_dict:
-                    msg = f"The interface/platform type {platform} is not supported. Aborting!!!"
-                    staging_error(msg=msg)
+        Returns
+        -------
 
-        return platforms
+        filesdict: dict
+
+            A Python dictionary containing the attributes for only the
+            specified file identifiers; if the base-class attribute
+            fileids is NoneType, the Python dictionary specified upon
+            entry is returned.
+
+        """
+
+        # Check whether file identifiers have been specified; proceed
+        # accordingly.
+        if self.fileids is None:
+            return filesdict
+
+        # Define a Python dictionary containing only the specified
+        # file identifiers; proceed accordingly.
+        tmpdict = {}
+        for fileid in self.fileids:
+
+            if fileid in filesdict:
+                tmpdict[fileid] = parser_interface.dict_key_value(
+                    dict_in=filesdict, key=fileid, force=True, no_split=True
+                )
+
+            if fileid not in filesdict and fileid not in self.inactive_fileids:
+                msg = (
+                    f"Attributes for file identifier {fileid} could "
+                    "not be determined from the configuration file "
+                    "and will not be collected."
+                )
+                self.logger.warn(msg=msg)
 
-    def aws_s3(self, filesdict):
+        return tmpdict
+
+    def _filter_streams(
+        self, fetch_dict: dict, platform: str, fetch_type: str, filesdict: dict
+    ) -> dict:
         """
         Description
         -----------
 
-        This method collects files specified within the YAML-formatted
-        configuration file that are hosted within an Amazon Web
-        Services (AWS) s3 bucket and object path.
+        This method filters the file identifiers within the respective
+        fetch type in accordance with their datestreams (i.e., the
+        stream_start and stream_stop attributes) relative to the
+        base-class attribute cycle; the datestream interval index is
+        built only once for the respective configuration file (see
+        streams.get_index) and the file identifiers which are not
+        active are not compiled.
 
         Parameters
         ----------
 
+        fetch_dict: dict
+
+            A Python dictionary containing the fetch configuration
+            attributes.
+
+        platform: str
+
+            A Python string specifying the interface/platform for the
+            respective fetch type.
+
+        fetch_type: str
+
+            A Python string specifying the fetch type.
+
         filesdict: dict
 
-            A Python dictionary containing the local and remote paths
-            for the files to be collected from AWS s3; the Python
-            dictionary keys are the local host path(s) for the
-            collected files while the Python dictionary values are the
-            AWS s3 object paths.
+            A Python dictionary containing the attributes for each
+            file identifier within the respective fetch type.
+
+        Returns
+        -------
+
+        filesdict: dict
+
+            A Python dictionary containing the attributes for only the
+            active file identifiers; if the fetch configuration has
+            been collected from a precompiled fetch plan, the Python
+            dictionary specified upon entry is returned.
 
         """
 
-        # Check whether file identifiers have been specified; proceed
-        # accordingly.
-        if self.fileids is not None:
+        # Precompiled fetch plans contain only the valid timestamps
+        # for the respective cycle; proceed accordingly.
+        if self.plan_file is not None:
+            return filesdict
+
+        # Collect the active file identifiers for the respective
+        # cycle.
+        stream_index = streams.get_index(
+            fetch_dict=fetch_dict,
+            fetch_attrs_dict=fetch_attrs_dict,
+            key=(
+                os.path.realpath(self.yaml_file),
+                os.stat(self.yaml_file).st_mtime_ns,
+            ),
+        )
+        active_set = stream_index.active(cycle=self.cycle)
+
+        inactive_list = [
+            fileid
+            for fileid in filesdict
+            if (platform, fetch_type, fileid) not in active_set
+        ]
+        if not inactive_list:
+            return filesdict
+
+        msg = (
+            f"{len(inactive_list)} of {len(filesdict)} file identifier(s) for "
+            f"fetch type {fetch_type} are not active for cycle {self.cycle} "
+            "and will not be collected."
+        )
+        self.logger.info(msg=msg)
+        self.inactive_fileids.update(inactive_list)
 
-            # Define a Python dictionary containing only the specified
-            # file identifiers and overwrite the Python dictionary
-            # specified upon entry; proceed accordingly.
-            tmpdict = {}
-            # fileids = [item for item in self.fileids if item in
-            #           list(filesdict.keys())]
-            for fileid in self.fileids:
-
-                if fileid in filesdict:  # list(filesdict.keys()):
-                    tmpdict[fileid] = parser_interface.dict_key_value(
-                        dict_in=filesdict, key=fileid, force=True, no_split=True
-                    )
+        return {
+            fileid: fileid_dict
+            for (fileid, fileid_dict) in filesdict.items()
+            if fileid not in inactive_list
+        }
 
-                if fileid not in filesdict:  # list(filesdict.keys()):
-                    msg = (
-                        f"Attributes for file identifier {fileid} could "
-                        "not be determined from the configuration file "
-                        "and will not be collected."
-                    )
-                    self.logger.warn(msg=msg)
+    def _get_checksum_obj(self, platform: str) -> object:
+        """
+        Description
+        -----------
 
-            filesdict = tmpdict
-            if len(filesdict.keys()) <= 0:
-                msg = (
-                    "No valid file identifiers has been specified; "
-                    "nothing will be collected."
-                )
-                self.logger.warn(msg=msg)
+        This method collects the checksum index attributes (i.e.,
+        <platform>_filepath and <platform>_hash) for the specified
+        interface/platform from the base-class attribute
+        checksum_dict.
 
-                return None
+        Parameters
+        ----------
 
-        # Collect the AWS s3 checksum index attributes.
+        platform: str
+
+            A Python string specifying the interface/platform.
+
+        Returns
+        -------
+
+        checksum_obj: object
+
+            A Python object containing the checksum index attributes
+            for the respective interface/platform.
+
+        """
+
+        # Collect the checksum index attributes.
         checksum_obj = parser_interface.object_define()
-        checksum_attrs_dict = {"aws_s3_filepath": None, "aws_s3_hash": "md5"}
+        checksum_attrs_dict = {f"{platform}_filepath": None, f"{platform}_hash": "md5"}
 
         for (checksum_attr, _) in checksum_attrs_dict.items():
             value = parser_interface.dict_key_value(
@@ -361,249 +563,2108 @@ class Fetch(Staging):
                 object_in=checksum_obj, key=checksum_attr, value=value
             )
 
-        # Loop through all AWS s3 files to be collected; proceed
-        # accordingly.
-        for fileid in filesdict.keys():
+        return checksum_obj
 
-            # Build the Python object containing the experiment
-            # configuration attributes for the respective file(s) to
-            # be collected.
-            fileid_obj = self.build_fileid_obj(
-                filesdict=filesdict,
-                fileid=fileid,
-                mand_attr_list=aws_mand_attr_list,
-                opt_attr_dict=aws_opt_attr_dict,
-            )
+    def _get_fileids(self, options_obj: object) -> list:
+        """
+        Description
+        -----------
+
+        This method defines the base-class attribute fileids with
+        respect to the command line option attribute fileid.
 
-            # Define list of valid timestamps relative to the
-            # respective file attributes.
-            fileid_obj = self.get_timestamps_list(fileid_obj=fileid_obj)
+        Parameters
+        ----------
 
-            # Collect the respective file(s) from AWS s3 and update
-            # the external file accordingly.
-            if checksum_obj.aws_s3_filepath is None:
-                checksum_index = False
+        options_obj: object
 
-            if checksum_obj.aws_s3_filepath is not None:
-                checksum_index = True
+            A Python object containing the attributes collect via the
+            command line from the application driver script.
 
-            self.awss3_fetch(
-                fileid_obj=fileid_obj,
-                checksum_filepath=checksum_obj.aws_s3_filepath,
-                checksum_index=checksum_index,
-                checksum_level=checksum_obj.aws_s3_hash,
-            )
+        Returns
+        -------
 
-            # If applicable, concatenate the respective files in
-            # accordance with the experiment configuration.
-            self.concat_filepath(fileid_obj=fileid_obj)
+        fileids: list
 
-        return None
+            A Python list of file identifiers to be collected.
 
-    def build_fetch_dict(self) -> dict:
+        """
+
+        # Check whether the base-class arguments contain the file
+        # identifier attribute; proceed accordingly.
+        fileids = None
+        fileid_opt = parser_interface.object_getattr(
+            object_in=options_obj, key="fileid", force=True
+        )
+
+        # If the file identifier attribute has been specified, define
+        # a list of values to be returned.
+        if fileid_opt is not None:
+            fileids = list(set(fileid_opt.split(",")))
+
+        return fileids
+
+    def _get_nworkers(self, fetch_type: str) -> int:
         """
         Description
         -----------
 
-        This method parses the YAML-formatted configuration file and
-        defines the attribute fetch_dict; the respective base-class
-        attribute may be further refined in accordance with the
-        optional argument fetch_type.
+        This method defines the number of threads for the specified
+        fetch type in accordance with the fetch type worker budgets
+        (see get_workers_info).
 
-        Returns
-        -------
+        Parameters
+        ----------
 
-        fetch_dict: dict
+        fetch_type: str
 
-            A Python dictionary containing the attributes necessary to
-            collect (i.e., fetch) the respective (e.g., specified)
-            files; the dictionary keys correspond to the respective
-            fetching method (see the base-class attribute
-            fetch_methods_dict) and the corresponding values are the
-            YAML-formed dictionaries for the respective files to be
-            retrieved by the respective fetching method.
+            A Python string specifying the fetch type.
 
-        Raises
-        ------
+        Returns
+        -------
 
-        StagingError:
+        nworkers: int
 
-            * raised if the dictionary key 'fetch' cannot be
-              determined from the YAML-formatted configuration file.
+            A Python integer specifying the number of threads; if the
+            fetch type worker budgets are not specified, the value is
+            1.
 
         """
 
-        # Collect the fetch configuration attributes; proceed
-        # accordingly.
-        fetch_dict = parser_interface.dict_key_value(
-            dict_in=self.yaml_dict, key="fetch", force=True
-        )
+        # Define the number of threads for the respective fetch type.
+        if self.workers_dict is None:
+            return 1
 
-        if fetch_dict is None:
-            msg = (
-                f"The fetch attribute could not be determined from "
-                f"YAML-formatted configuration file {self.yaml_file}. "
-                "Aborting!!!"
+        nworkers = int(
+            parser_interface.dict_key_value(
+                dict_in=self.workers_dict,
+                key=fetch_type,
+                force=True,
+                no_split=True,
             )
-            staging_error(msg=msg)
+            or parser_interface.dict_key_value(
+                dict_in=self.workers_dict, key="default", force=True, no_split=True
+            )
+            or 1
+        )
 
-        return fetch_dict
+        return nworkers
 
-    def collect(self, fetch_dict: dict) -> None:
+    def _get_object_size(self, obj: tuple) -> int:
         """
         Description
         -----------
 
-        This method collects the specified files for the respective
-        interface/platform; all processing is done via the respective
-        method corresponding to the interface/platform fetching
-        method.
+        This method determines the size of the specified object using
+        a metadata request only.
 
         Parameters
         ----------
 
-        fetch_dict: dict
+        obj: tuple
 
-            A Python dictionary containing the attributes necessary to
-            collect (i.e., fetch) the respective (e.g., specified)
-            files; the dictionary keys correspond to the respective
-            fetching method (see the base-class attribute
+            A Python tuple containing the key, task, file identifier
+            object, and file path attributes (see _get_objects).
+
+        Returns
+        -------
+
+        size: int
+
+            A Python integer specifying the object size in bytes;
+            NoneType is returned for missing objects and for objects
+            whose size cannot be determined for the respective
+            interface/platform.
+
+        """
+
+        # Collect the object size; proceed accordingly.
+        (_, task, fileid_obj, filepath_dict) = obj
+        if task[0] == "posix":
+            filepath = posix_filepath(
+                root_path=fileid_obj.root_path, object_path=filepath_dict["object_path"]
+            )
+            if not os.path.isfile(filepath):
+                return None
+
+            return os.path.getsize(filepath)
+
+        if task[0] == "tar":
+            member = self.archive_index.lookup(
+                tar_path=filepath_dict["tar_path"],
+                name=filepath_dict["object_path"],
+                index_path=filepath_dict.get("tar_index"),
+            )
+            if member is None:
+                return None
+
+            return member[1]
+
+        if task[0] != "aws_s3":
+            return None
+
+        size = awss3.get_size(
+            bucket=fileid_obj.bucket,
+            object_path=filepath_dict["object_path"],
+            profile_name=fileid_obj.profile_name,
+        )
+
+        return size
+
+    def _get_object_sizes(self, objects_list: list) -> list:
+        """
+        Description
+        -----------
+
+        This method determines the sizes of the specified objects
+        using metadata requests only; the metadata requests are issued
+        using the sum of the worker budgets for the respective fetch
+        types (see _get_nworkers).
+
+        Parameters
+        ----------
+
+        objects_list: list
+
+            A Python list of (key, task, file identifier object, file
+            path attributes) tuples (see _get_objects).
+
+        Returns
+        -------
+
+        sizes_list: list
+
+            A Python list, ordered identically to objects_list, of the
+            object sizes in bytes; NoneType is returned for missing
+            objects.
+
+        """
+
+        # Collect the object sizes for the AWS s3, POSIX filesystem,
+        # and tar archive objects (see _get_object_size).
+        nworkers = sum(
+            self._get_nworkers(fetch_type=fetch_type)
+            for fetch_type in {task[2] for (_, task, _, _) in objects_list}
+        )
+        msg = (
+            f"Determining the sizes of {len(objects_list)} object(s) using "
+            f"{nworkers} workers."
+        )
+        self.logger.info(msg=msg)
+        with ThreadPoolExecutor(max_workers=max(nworkers, 1)) as executor:
+            sizes_list = list(executor.map(self._get_object_size, objects_list))
+
+        return sizes_list
+
+    def _get_objects(self, compiled_list: list) -> list:
+        """
+        Description
+        -----------
+
+        This method defines the objects (i.e., file identifier and
+        timestamp) for the compiled file identifiers.
+
+        Parameters
+        ----------
+
+        compiled_list: list
+
+            A Python list of the compiled file identifiers (see
+            _compile_tasks).
+
+        Returns
+        -------
+
+        objects_list: list
+
+            A Python list of (key, task, file identifier object, file
+            path attributes) tuples for each object; the keys are
+            unique and identical for all fetch applications.
+
+        """
+
+        # Define the objects for each compiled file identifier.
+        objects_list = [
+            (
+                "/".join([task[0], task[2], task[3], filepath_dict["object_path"]]),
+                task,
+                fileid_obj,
+                filepath_dict,
+            )
+            for (task, fileid_obj) in compiled_list
+            for filepath_dict in fileid_obj.filepaths_list
+        ]
+
+        return objects_list
+
+    def _get_platforms(self, options_obj: object) -> list:
+        """
+        Description
+        -----------
+
+        This method defines the base-class attribute platforms with
+        respect to the command line option attribute platform.
+
+        Parameters
+        ----------
+
+        options_obj: object
+
+            A Python object containing the attributes collect via the
+            command line from the application driver script.
+
+        Returns
+        -------
+
+        platforms: list
+
+            A Python list of interface/platforms to be collected.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if a specified platform is not supported by this
+              application.
+
+        """
+
+        # Check whether the base-class arguments contain the
+        # respective interface/platform type; proceed accordingly.
+        platform_opt = parser_interface.object_getattr(
+            object_in=options_obj, key="platform", force=True
+        )
+        if platform_opt is None:
+
+            # Define a list of interface/platform types using the
+            # base-class attributes.
+            platforms = list(self.fetch_methods_dict.keys())
+
+        if platform_opt is not None:
+
+            # Define a list of unique interface/platform types.
+            platforms = list(set(platform_opt.split(",")))
+
+            # Check that the interface/platform is supported; proceed
+            # accordingly.
+            for platform in platforms:
+                if platform not in self.fetch_methods_dict:
+                    msg = f"The interface/platform type {platform} is not supported. Aborting!!!"
+                    staging_error(msg=msg)
+
+        return platforms
+
+    def _refetch_member(self, platform: str, fileid_obj: object, filepath_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the specified (invalid) netCDF-formatted
+        member file again from the respective interface/platform; AWS
+        s3 objects are downloaded from the AWS s3 bucket (i.e., the
+        local object cache is bypassed and subsequently updated),
+        POSIX filesystem files are copied (rather than hardlinked),
+        and tar archive members are extracted again; the member file
+        is then decompressed if the respective file identifier
+        specifies the decompress attribute.
+
+        Parameters
+        ----------
+
+        platform: str
+
+            A Python string specifying the interface/platform.
+
+        fileid_obj: object
+
+            A Python object containing the attributes collected from
+            the experiment configuration for the respective file
+            identifier.
+
+        filepath_dict: dict
+
+            A Python dictionary containing the file paths for the
+            respective member file (see Staging.get_filepaths_list).
+
+        """
+
+        # Collect the member file from the respective
+        # interface/platform.
+        (local_path, object_path) = (
+            filepath_dict["local_path"],
+            filepath_dict["object_path"],
+        )
+
+        if platform == "aws_s3":
+            etag = awss3.download(
+                bucket=fileid_obj.bucket,
+                object_path=object_path,
+                local_path=local_path,
+                profile_name=fileid_obj.profile_name,
+                limiter=self.limiter,
+            )
+            if self.cache is not None:
+                self.cache.store(
+                    filepath=local_path,
+                    bucket=fileid_obj.bucket,
+                    object_path=object_path,
+                    etag=etag,
+                )
+
+        if platform == "posix":
+            materialize(
+                src_path=posix_filepath(
+                    root_path=fileid_obj.root_path, object_path=object_path
+                ),
+                dst_path=local_path,
+                hardlink=False,
+            )
+
+        if platform == "tar":
+            (offset, size) = self.archive_index.lookup(
+                tar_path=filepath_dict["tar_path"],
+                name=object_path,
+                index_path=filepath_dict.get("tar_index"),
+            )
+            tarindex.extract(
+                tar_path=filepath_dict["tar_path"],
+                offset=offset,
+                size=size,
+                dst_path=local_path,
+            )
+
+        # Decompress the member file; proceed accordingly.
+        decompress_dict = decompress.get_attrs(
+            decompress_attr=parser_interface.object_getattr(
+                object_in=fileid_obj, key="decompress", force=True
+            )
+        )
+        if decompress_dict is not None:
+            decompress.decompress(filepath=local_path, fmt=decompress_dict["format"])
+
+    def _restrict_tasks(self, objects_list: list) -> list:
+        """
+        Description
+        -----------
+
+        This method defines the fetch types containing only the
+        specified objects (i.e., file identifier and timestamp); the
+        file identifiers are passed to the fetching methods as
+        compiled (see plan.is_compiled).
+
+        Parameters
+        ----------
+
+        objects_list: list
+
+            A Python list of the objects (see _get_objects) to be
+            collected.
+
+        Returns
+        -------
+
+        fetch_tasks_list: list
+
+            A Python list of (fetch method, method, fetch type, file
+            identifier attributes) tuples containing only the
+            specified objects.
+
+        """
+
+        # Define the compiled file identifiers containing only the
+        # specified objects.
+        tasks_dict = {}
+        for (_, task, fileid_obj, filepath_dict) in objects_list:
+            filesdict = tasks_dict.setdefault(task[0:3], {})
+            if task[3] not in filesdict:
+                filesdict[task[3]] = plan.build_fileid_dict(
+                    fileid_obj=fileid_obj,
+                    attrs_list=fetch_attrs_dict[task[0]]["mand_attr_list"]
+                    + list(fetch_attrs_dict[task[0]]["opt_attr_dict"].keys()),
+                )
+                filesdict[task[3]]["filepaths_list"] = []
+                filesdict[task[3]]["timestamps_list"] = []
+
+            filesdict[task[3]]["filepaths_list"].append(filepath_dict)
+            filesdict[task[3]]["timestamps_list"].append(filepath_dict["timestamp"])
+
+        fetch_tasks_list = [
+            (fetch_method, method, fetch_type, filesdict)
+            for ((fetch_method, method, fetch_type), filesdict) in tasks_dict.items()
+        ]
+
+        return fetch_tasks_list
+
+    def aws_s3(self, filesdict: dict, nworkers: int = 1) -> list:
+        """
+        Description
+        -----------
+
+        This method collects files specified within the YAML-formatted
+        configuration file that are hosted within an Amazon Web
+        Services (AWS) s3 bucket and object path.
+
+        Parameters
+        ----------
+
+        filesdict: dict
+
+            A Python dictionary containing the local and remote paths
+            for the files to be collected from AWS s3; the Python
+            dictionary keys are the local host path(s) for the
+            collected files while the Python dictionary values are the
+            AWS s3 object paths.
+
+        Keywords
+        --------
+
+        nworkers: int, optional
+
+            A Python integer specifying the number of threads used to
+            collect the file identifiers concurrently for the boto3
+            fetch engine; the asyncio fetch engine bounds the number
+            of in-flight requests instead (see aws_s3_max_concurrency).
+
+        Returns
+        -------
+
+        concat_jobs_list: list
+
+            A Python list of the concatenation jobs for the respective
+            file identifiers (see Staging.concat_filepath); the
+            concatenation jobs are executed by the calling method.
+
+        """
+
+        # Check whether file identifiers have been specified; proceed
+        # accordingly.
+        if self.fileids is not None:
+
+            # Define a Python dictionary containing only the specified
+            # file identifiers and overwrite the Python dictionary
+            # specified upon entry; proceed accordingly.
+            filesdict = self._filter_fileids(filesdict=filesdict)
+            if len(filesdict.keys()) <= 0:
+                msg = (
+                    "No valid file identifiers has been specified; "
+                    "nothing will be collected."
+                )
+                self.logger.warn(msg=msg)
+
+                return []
+
+        # Collect the AWS s3 checksum index attributes.
+        checksum_obj = self._get_checksum_obj(platform="aws_s3")
+
+        # Collect the AWS s3 fetch engine attributes.
+        engine_obj = parser_interface.object_define()
+        engine_attrs_dict = {"aws_s3_engine": "boto3", "aws_s3_max_concurrency": 256}
+
+        for (engine_attr, _) in engine_attrs_dict.items():
+            value = parser_interface.dict_key_value(
+                dict_in=self.engine_dict, key=engine_attr, force=True, no_split=True
+            )
+
+            if value is None:
+                value = parser_interface.dict_key_value(
+                    dict_in=engine_attrs_dict, key=engine_attr, no_split=True
+                )
+
+            engine_obj = parser_interface.object_setattr(
+                object_in=engine_obj, key=engine_attr, value=value
+            )
+
+        if engine_obj.aws_s3_engine not in aws_engines_list:
+            msg = (
+                f"The AWS s3 fetch engine {engine_obj.aws_s3_engine} is not "
+                f"supported; supported values are {aws_engines_list}. Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        # Build the Python objects containing the experiment
+        # configuration attributes, timestamps, and file paths for the
+        # respective file(s) to be collected.
+        fileid_obj_list = [
+            self.get_fileid_obj(platform="aws_s3", filesdict=filesdict, fileid=fileid)
+            for fileid in filesdict.keys()
+        ]
+
+        # Collect the respective file(s) from AWS s3 and update the
+        # external file accordingly.
+        checksum_index = checksum_obj.aws_s3_filepath is not None
+        concat_jobs_list = []
+
+        if engine_obj.aws_s3_engine == "asyncio":
+
+            # Collect all file(s) for all file identifiers
+            # concurrently and subsequently define the checksum index
+            # values.
+            local_paths_list = awss3_async.fetch(
+                fileid_obj_list=fileid_obj_list,
+                max_concurrency=engine_obj.aws_s3_max_concurrency,
+                cache=self.cache,
+                limiter=self.limiter,
+            )
+            self.verify_manifest(fileid_obj_list=fileid_obj_list)
+
+            for (fileid_obj, local_paths) in zip(fileid_obj_list, local_paths_list):
+                for local_path in local_paths:
+                    self.process_filepath(
+                        fileid_obj=fileid_obj,
+                        local_path=local_path,
+                        checksum_filepath=checksum_obj.aws_s3_filepath,
+                        checksum_index=checksum_index,
+                        checksum_level=checksum_obj.aws_s3_hash,
+                    )
+
+            self.decompress_files(
+                fileid_obj_list=fileid_obj_list,
+                checksum_filepath=checksum_obj.aws_s3_filepath,
+                checksum_index=checksum_index,
+                checksum_level=checksum_obj.aws_s3_hash,
+            )
+            self.validate_members(platform="aws_s3", fileid_obj_list=fileid_obj_list)
+
+            # If applicable, define the concatenation jobs for the
+            # respective files in accordance with the experiment
+            # configuration.
+            for fileid_obj in fileid_obj_list:
+                concat_jobs_list.append(self.concat_filepath(fileid_obj=fileid_obj))
+
+            return concat_jobs_list
+
+        # Collect all AWS s3 files for each file identifier using the
+        # specified number of threads; proceed accordingly.
+        awss3_fetch = functools.partial(
+            self.awss3_fetch,
+            checksum_filepath=checksum_obj.aws_s3_filepath,
+            checksum_index=checksum_index,
+            checksum_level=checksum_obj.aws_s3_hash,
+            cache=self.cache,
+            limiter=self.limiter,
+        )
+
+        if nworkers <= 1:
+            for fileid_obj in fileid_obj_list:
+                awss3_fetch(fileid_obj)
+
+        if nworkers > 1:
+            with ThreadPoolExecutor(max_workers=nworkers) as executor:
+                list(executor.map(awss3_fetch, fileid_obj_list))
+
+        # Verify the collected files against the upstream md5
+        # manifests and subsequently define the checksum index values
+        # for the verified files (i.e., such that the checksum index
+        # values for the files collected again are those of the
+        # verified files); if applicable, decompress the collected
+        # files and validate the netCDF-formatted member files;
+        # proceed accordingly.
+        self.verify_manifest(fileid_obj_list=fileid_obj_list)
+        for fileid_obj in fileid_obj_list:
+            md5_manifest = parser_interface.object_getattr(
+                object_in=fileid_obj, key="md5_manifest", force=True
+            )
+            if md5_manifest is None:
+                continue
+
+            for filepath_dict in self.get_filepaths_list(fileid_obj=fileid_obj):
+                if not fileio_interface.fileexist(path=filepath_dict["local_path"]):
+                    continue
+
+                self.process_filepath(
+                    fileid_obj=fileid_obj,
+                    local_path=filepath_dict["local_path"],
+                    checksum_filepath=checksum_obj.aws_s3_filepath,
+                    checksum_index=checksum_index,
+                    checksum_level=checksum_obj.aws_s3_hash,
+                )
+
+        self.decompress_files(
+            fileid_obj_list=fileid_obj_list,
+            checksum_filepath=checksum_obj.aws_s3_filepath,
+            checksum_index=checksum_index,
+            checksum_level=checksum_obj.aws_s3_hash,
+        )
+        self.validate_members(platform="aws_s3", fileid_obj_list=fileid_obj_list)
+
+        # If applicable, define the concatenation jobs for the
+        # respective files in accordance with the experiment
+        # configuration.
+        for fileid_obj in fileid_obj_list:
+            concat_jobs_list.append(self.concat_filepath(fileid_obj=fileid_obj))
+
+        return concat_jobs_list
+
+    def build_fetch_dict(self) -> dict:
+        """
+        Description
+        -----------
+
+        This method parses the YAML-formatted configuration file and
+        defines the attribute fetch_dict; the respective base-class
+        attribute may be further refined in accordance with the
+        optional argument fetch_type.
+
+        Returns
+        -------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
+            fetch_methods_dict) and the corresponding values are the
+            YAML-formed dictionaries for the respective files to be
+            retrieved by the respective fetching method.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the dictionary key 'fetch' cannot be
+              determined from the YAML-formatted configuration file.
+
+        """
+
+        # If a precompiled fetch plan has been specified, collect the
+        # fetch configuration attributes from the fetch plan.
+        if self.plan_file is not None:
+            msg = f"Collecting the fetch configuration from fetch plan {self.plan_file}."
+            self.logger.info(msg=msg)
+
+            return self.plan_dict["fetch"]
+
+        # Collect the fetch configuration attributes; proceed
+        # accordingly.
+        fetch_dict = parser_interface.dict_key_value(
+            dict_in=self.yaml_dict, key="fetch", force=True
+        )
+
+        if fetch_dict is None:
+            msg = (
+                f"The fetch attribute could not be determined from "
+                f"YAML-formatted configuration file {self.yaml_file}. "
+                "Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        return fetch_dict
+
+    def collect(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the specified files for the respective
+        interface/platform; all processing is done via the respective
+        method corresponding to the interface/platform fetching
+        method.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
+            fetch_methods_dict) and the corresponding values are the
+            YAML-formed dictionaries for the respective files to be
+            retrieved by the respective fetching method.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the specified fetch method (i.e.,
+              platform/interface) is not supported.
+
+            * raised if the files for a fetch type could not be
+              collected when the fetch types are collected
+              concurrently (see collect_consolidated).
+
+        """
+
+        # Collect the checksum, object cache, fetch engine, and
+        # bandwidth information from the configuration file
+        # attributes.
+        self.get_checksum_info(fetch_dict=fetch_dict)
+        self.get_cache_info(fetch_dict=fetch_dict)
+        self.get_engine_info(fetch_dict=fetch_dict)
+        self.get_bandwidth_info(fetch_dict=fetch_dict)
+
+        # Define the concatenation attributes from the configuration
+        # file attributes.
+        concat_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="concat", force=True, no_split=True
+        )
+        nworkers = None
+        if concat_dict is not None:
+            nworkers = parser_interface.dict_key_value(
+                dict_in=concat_dict, key="nc_concat_nworkers", force=True, no_split=True
+            )
+
+        # Define the fetch types to be collected for each supported
+        # interface/platform.
+        fetch_tasks_list = []
+        for fetch_method in self.platforms:
+
+            # Define the base-class method to be used for collecting
+            # from the supported interfaces/platforms; proceed
+            # accordingly.
+            method = parser_interface.dict_key_value(
+                dict_in=self.fetch_methods_dict,
+                key=fetch_method,
+                force=True,
+                no_split=True,
+            )
+
+            if method is None:
+                msg = (
+                    f"A method for collecting files from the {fetch_method} "
+                    "platform is not supported. Aborting!!!"
+                )
+                staging_error(msg=msg)
+
+            # Define the respective file attributes for the respective
+            # supported interface/platform.
+            filesdict = parser_interface.dict_key_value(
+                dict_in=fetch_dict, key=fetch_method, force=True, no_split=True
+            )
+
+            if filesdict is None:
+                continue
+
+            # Parse the configuration file attributes in accordance
+            # with the base-class argument; proceed accordingly.
+            if self.fetch_type_opt is None:
+                fetch_types = list(filesdict.keys())
+
+            if self.fetch_type_opt is not None:
+                fetch_types = self._get_fetch_types()
+
+            for fetch_type in fetch_types:
+                if fetch_type in filesdict:
+                    fetch_type_dict = self._filter_streams(
+                        fetch_dict=fetch_dict,
+                        platform=fetch_method,
+                        fetch_type=fetch_type,
+                        filesdict=filesdict[fetch_type],
+                    )
+                    if fetch_type_dict:
+                        fetch_tasks_list.append(
+                            (fetch_method, method, fetch_type, fetch_type_dict)
+                        )
+
+                if fetch_type not in filesdict:
+                    msg = (
+                        "The configuration file does not specify a key "
+                        f"for fetch type {fetch_type}; {fetch_type} files "
+                        "will not be collected."
+                    )
+                    self.logger.warn(msg=msg)
+
+        # Define the fetch type worker budgets.
+        self.get_workers_info(fetch_dict=fetch_dict)
+
+        # If the fetch is sharded, collect only the objects assigned
+        # to the respective shard; if the fetch is collected from a
+        # work queue, the objects are collected as they are claimed.
+        if self.shard is not None:
+            compiled_list = self._compile_tasks(fetch_tasks_list=fetch_tasks_list)
+            fileid_obj_list = [fileid_obj for (_, fileid_obj) in compiled_list]
+
+        if isinstance(self.shard, Shard):
+            fetch_tasks_list = self.shard_tasks(compiled_list=compiled_list)
+
+        if isinstance(self.shard, WorkQueue):
+            self.get_queue_info(fetch_dict=fetch_dict)
+            self.collect_queue(compiled_list=compiled_list)
+            fetch_tasks_list = []
+
+        # Collect files in accordance with the configuration and
+        # options; if fetch type worker budgets have been specified,
+        # the fetch types are collected concurrently.
+        failed_list = []
+        concat_jobs_list = []
+
+        if self.workers_dict is None:
+            for (_, method, fetch_type, fetch_type_dict) in fetch_tasks_list:
+                msg = f"Collecting files for fetch type {fetch_type}."
+                self.logger.info(msg=msg)
+                concat_jobs_list += method(filesdict=fetch_type_dict)
+
+        if self.workers_dict is not None:
+            (concat_jobs_list, failed_list) = self.collect_consolidated(
+                fetch_tasks_list=fetch_tasks_list
+            )
+
+        # If the fetch is sharded, the collected files are
+        # concatenated once all shards have completed by the shard
+        # which claims the reduce task.
+        reduce = False
+        if self.shard is not None:
+            concat_jobs_list = []
+            reduce = not failed_list and self.shard.complete()
+            if reduce:
+                msg = (
+                    "All objects have been collected; concatenating the "
+                    "collected files for all file identifiers."
+                )
+                self.logger.info(msg=msg)
+                concat_jobs_list = [
+                    self.concat_filepath(fileid_obj=fileid_obj)
+                    for fileid_obj in fileid_obj_list
+                ]
+
+        # Concatenate the collected files for all file identifiers
+        # using a pool of processes.
+        try:
+            self.run_concat(concat_jobs_list=concat_jobs_list, nworkers=nworkers)
+
+        except Exception:
+            if reduce:
+                self.shard.release()
+            raise
+
+        # The reduce task has been executed; remove the shard
+        # coordination files such that a subsequent fetch for the
+        # respective forecast cycle is coordinated anew.
+        if reduce:
+            self.shard.remove()
+
+        if failed_list:
+            msg = (
+                f"The files for fetch type(s) {failed_list} could not be "
+                "collected. Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+    def collect_consolidated(self, fetch_tasks_list: list) -> tuple:
+        """
+        Description
+        -----------
+
+        This method collects the files for all specified fetch types
+        concurrently within the respective process; each fetch type is
+        assigned the number of threads specified by its worker budget
+        (see get_workers_info) and a single summary is written for
+        all fetch types; a fetch type that fails does not stop the
+        collection of the remaining fetch types.
+
+        Parameters
+        ----------
+
+        fetch_tasks_list: list
+
+            A Python list of Python tuples containing the
+            interface/platform, the base-class method, the fetch type,
+            and the file identifier attributes for each fetch type to
+            be collected.
+
+        Returns
+        -------
+
+        (concat_jobs_list, failed_list): tuple
+
+            A Python tuple containing the concatenation jobs for all
+            collected fetch types and the fetch types that could not
+            be collected.
+
+        """
+
+        # Collect the files for each fetch type concurrently.
+        with ThreadPoolExecutor(max_workers=max(len(fetch_tasks_list), 1)) as executor:
+            futures_list = [
+                executor.submit(self._collect_fetch_type, method, fetch_type, filesdict)
+                for (_, method, fetch_type, filesdict) in fetch_tasks_list
+            ]
+
+        # Compile and write the summary for all fetch types.
+        (concat_jobs_list, failed_list, summary_list) = ([], [], [])
+        for ((platform, _, fetch_type, _), future) in zip(fetch_tasks_list, futures_list):
+            exc = future.exception()
+            if exc is not None:
+                failed_list.append(fetch_type)
+                summary_list.append(f"{platform}/{fetch_type}: FAILED ({exc})")
+                continue
+
+            (fetch_type_jobs_list, elapsed) = future.result()
+            concat_jobs_list += fetch_type_jobs_list
+            summary_list.append(
+                f"{platform}/{fetch_type}: {len(fetch_type_jobs_list)} file "
+                f"identifiers, {sum(job is not None for job in fetch_type_jobs_list)} "
+                f"concatenations, {elapsed:.1f} seconds"
+            )
+
+        msg = "Fetch summary:\n" + "\n".join(summary_list)
+        self.logger.info(msg=msg)
+
+        return (concat_jobs_list, failed_list)
+
+    def collect_queue(self, compiled_list: list) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the objects (i.e., file identifier and
+        timestamp) from the work queue (see staging.shard.WorkQueue)
+        shared by all workers; each object is collected once it has
+        been claimed by the respective worker and this method returns
+        once all objects have been collected by all workers.
+
+        Parameters
+        ----------
+
+        compiled_list: list
+
+            A Python list of the compiled file identifiers (see
+            _compile_tasks).
+
+        """
+
+        # Define the work queue; the objects are queued in order of
+        # decreasing size.
+        objects_list = self._get_objects(compiled_list=compiled_list)
+        self.shard.populate(
+            keys_list=[key for (key, _, _, _) in objects_list],
+            sizer=functools.partial(self._get_object_sizes, objects_list=objects_list),
+        )
+
+        # Collect the objects as they are claimed.
+        objects_dict = {obj[0]: obj for obj in objects_list}
+        ncollected = 0
+        while True:
+            rank = self.shard.claim()
+            if rank is None:
+                break
+
+            with self.shard.lease(rank=rank) as key:
+                fetch_tasks_list = self._restrict_tasks(objects_list=[objects_dict[key]])
+                for (_, method, _, filesdict) in fetch_tasks_list:
+                    method(filesdict=filesdict)
+
+            ncollected += 1
+
+        msg = (
+            f"The work queue is empty; {ncollected} of {len(objects_list)} "
+            "object(s) have been collected by this worker."
+        )
+        self.logger.info(msg=msg)
+
+    def decompress_files(
+        self,
+        fileid_obj_list: list,
+        checksum_filepath: str = None,
+        checksum_index: bool = False,
+        checksum_level: str = "md5",
+    ) -> None:
+        """
+        Description
+        -----------
+
+        This method decompresses the collected files for the file
+        identifiers specifying the decompress attribute with the pool
+        mode (or specifying the md5_manifest attribute, such that the
+        collected files are verified prior to decompression) using a
+        pool of processes (see staging.decompress.decompress_pool);
+        the checksum hash indices are subsequently defined for the
+        decompressed files if specified by the decompress checksum
+        attribute (see Staging.process_filepath).
+
+        Parameters
+        ----------
+
+        fileid_obj_list: list
+
+            A Python list of Python objects containing the attributes
+            collected from the experiment configuration for the
+            respective file identifiers.
+
+        Keywords
+        --------
+
+        checksum_filepath: str, optional
+
+            A Python string specifying the path to the file containing
+            the checksum hash index values for specified local file
+            paths.
+
+        checksum_index: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            define the checksum hash indices for the local file paths.
+
+        checksum_level: str, optional
+
+            A Python string specifying the hash index level (e.g.,
+            type) for the local file paths.
+
+        """
+
+        # Define the collected files to be decompressed.
+        decompress_list = []
+        for fileid_obj in fileid_obj_list:
+            decompress_dict = decompress.get_attrs(
+                decompress_attr=parser_interface.object_getattr(
+                    object_in=fileid_obj, key="decompress", force=True
+                )
+            )
+            if decompress_dict is None:
+                continue
+
+            md5_manifest = parser_interface.object_getattr(
+                object_in=fileid_obj, key="md5_manifest", force=True
+            )
+            if decompress_dict["mode"] == "each" and md5_manifest is None:
+                continue
+
+            for filepath_dict in self.get_filepaths_list(fileid_obj=fileid_obj):
+                if fileio_interface.fileexist(path=filepath_dict["local_path"]):
+                    decompress_list.append((filepath_dict["local_path"], decompress_dict))
+
+        if not decompress_list:
+            return
+
+        # Decompress the collected files and define the checksum index
+        # values for the decompressed files.
+        fmts_list = decompress.decompress_pool(
+            filepaths_list=[local_path for (local_path, _) in decompress_list],
+            fmts_list=[decompress_dict["format"] for (_, decompress_dict) in decompress_list],
+        )
+        msg = (
+            f"Decompressed {len(fmts_list) - fmts_list.count(None)} of "
+            f"{len(decompress_list)} collected file(s)."
+        )
+        self.logger.info(msg=msg)
+
+        for (local_path, decompress_dict) in decompress_list:
+            if decompress_dict["checksum"] == "decompressed":
+                self.build_checksum(
+                    local_path=local_path,
+                    checksum_filepath=checksum_filepath,
+                    checksum_index=checksum_index,
+                    checksum_level=checksum_level,
+                )
+
+    def get_bandwidth_info(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the fetch bandwidth limits from the
+        YAML-formatted configuration file and defines the base-class
+        attribute limiter; the per-process and node-wide bandwidth
+        limits are optional; if the bandwidth YAML-block is not
+        specified within the YAML-formatted configuration files, the
+        fetch bandwidth is not bounded.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
+            fetch_methods_dict) and the corresponding values are the
+            YAML-formed dictionaries for the respective files to be
+            retrieved by the respective fetching method.
+
+        """
+
+        # Define the fetch bandwidth limits; proceed accordingly.
+        self.limiter = None
+        bandwidth_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="bandwidth", force=True, no_split=True
+        )
+
+        if bandwidth_dict is None:
+            return
+
+        (max_rate, node_max_rate, broker_path) = [
+            parser_interface.dict_key_value(
+                dict_in=bandwidth_dict, key=attr, force=True, no_split=True
+            )
+            for attr in ["max_rate", "node_max_rate", "broker_path"]
+        ]
+
+        if max_rate is None and node_max_rate is None:
+            return
+
+        msg = (
+            f"Fetched files will be collected with a maximum bandwidth of {max_rate} "
+            f"bytes per second per process and {node_max_rate} bytes per second "
+            "per node."
+        )
+        self.logger.info(msg=msg)
+        self.limiter = RateLimiter(
+            max_rate=max_rate, node_max_rate=node_max_rate, broker_path=broker_path
+        )
+
+    def get_workers_info(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the fetch type worker budgets from the
+        YAML-formatted configuration file and defines the base-class
+        attribute workers_dict; the keys are the fetch types (or
+        default) and the values are the number of threads used to
+        collect the respective fetch type; if the workers YAML-block
+        is not specified within the YAML-formatted configuration
+        files, the fetch types are collected serially.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
+            fetch_methods_dict) and the corresponding values are the
+            YAML-formed dictionaries for the respective files to be
+            retrieved by the respective fetching method.
+
+        """
+
+        # Define the fetch type worker budgets.
+        self.workers_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="workers", force=True, no_split=True
+        )
+
+    def get_cache_info(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the local object cache attributes from
+        the YAML-formatted configuration file and defines the
+        base-class attribute cache; if the cache YAML-block is not
+        specified within the YAML-formatted configuration files, the
+        local object cache is not used.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
+            fetch_methods_dict) and the corresponding values are the
+            YAML-formed dictionaries for the respective files to be
+            retrieved by the respective fetching method.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the cache YAML-block does not specify the
+              attribute cache_path.
+
+        """
+
+        # Define the local object cache attributes; proceed
+        # accordingly.
+        self.cache = None
+        cache_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="cache", force=True, no_split=True
+        )
+
+        if cache_dict is None:
+            return
+
+        cache_path = parser_interface.dict_key_value(
+            dict_in=cache_dict, key="cache_path", force=True, no_split=True
+        )
+
+        if cache_path is None:
+            msg = (
+                "The cache attributes do not specify the attribute "
+                "cache_path. Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        cache_max_size = parser_interface.dict_key_value(
+            dict_in=cache_dict, key="cache_max_size", force=True, no_split=True
+        )
+        msg = (
+            f"Fetched files will be collected using the object cache {cache_path} "
+            f"(maximum size {cache_max_size} bytes)."
+        )
+        self.logger.info(msg=msg)
+        self.cache = ObjectCache(cache_path=cache_path, max_size=cache_max_size)
+
+    def get_checksum_info(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the checksum attributes for each
+        platform/interface (if applicable) from the YAML-formatted
+        configuration file and defines the base-class attributes
+        checksum and checksum_dict; if the checksum YAML-block is not
+        specified within the YAML-formatted configuration files, not
+        checksum hash values will be defined/determined during the
+        respective fetching application.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
+            fetch_methods_dict) and the corresponding values are the
+            YAML-formed dictionaries for the respective files to be
+            retrieved by the respective fetching method.
+
+        """
+
+        # Define the checksum hash attributes for the respective
+        # fetching interfaces; proceed accordingly.
+        self.checksum_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="checksum", force=True, no_split=True
+        )
+
+        if self.checksum_dict is None:
+            msg = (
+                "The checksum attributes for fetched files has not "
+                f"specified in {self.yaml_file}; checksum hash values "
+                "will only be written to standard output."
+            )
+            self.logger.warn(msg=msg)
+            self.checksum = False
+
+        if self.checksum_dict is not None:
+            self.checksum = True
+
+    def get_engine_info(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the fetch engine attributes for each
+        platform/interface (if applicable) from the YAML-formatted
+        configuration file and defines the base-class attribute
+        engine_dict; if the engine YAML-block is not specified within
+        the YAML-formatted configuration files, the default fetch
+        engine for each platform/interface is used.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the attributes necessary to
+            collect (i.e., fetch) the respective (e.g., specified)
+            files; the dictionary keys correspond to the respective
+            fetching method (see the base-class attribute
             fetch_methods_dict) and the corresponding values are the
             YAML-formed dictionaries for the respective files to be
             retrieved by the respective fetching method.
 
+        """
+
+        # Define the fetch engine attributes for the respective
+        # fetching interfaces; proceed accordingly.
+        self.engine_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="engine", force=True, no_split=True
+        )
+
+        if self.engine_dict is None:
+            self.engine_dict = {}
+
+    def get_queue_info(self, fetch_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method collects the work queue attributes (see
+        staging.shard.WorkQueue) from the configuration file
+        attributes and updates the base-class attribute shard
+        accordingly.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the fetch configuration
+            attributes.
+
+        """
+
+        # Collect the work queue attributes; proceed accordingly.
+        queue_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="queue", force=True, no_split=True
+        )
+
+        if queue_dict is None:
+            return
+
+        for attr in ["lease_seconds", "poll_seconds"]:
+            value = parser_interface.dict_key_value(
+                dict_in=queue_dict, key=attr, force=True, no_split=True
+            )
+            if value is not None:
+                setattr(self.shard, attr, float(value))
+
+    def get_fileid_obj(self, platform: str, filesdict: dict, fileid: str) -> object:
+        """
+        Description
+        -----------
+
+        This method builds the Python object containing the
+        experiment configuration attributes, the valid timestamps, and
+        the local and remote file paths for the respective file
+        identifier; if the file identifier attributes have been
+        collected from a precompiled fetch plan, the attributes are
+        used as they are.
+
+        Parameters
+        ----------
+
+        platform: str
+
+            A Python string specifying the interface/platform for the
+            respective file identifier.
+
+        filesdict: dict
+
+            A Python dictionary containing the attributes for each
+            file identifier within the respective fetch type.
+
+        fileid: str
+
+            A Python string specifying the file identifier.
+
+        Returns
+        -------
+
+        fileid_obj: object
+
+            A Python object containing the compiled attributes for the
+            respective file identifier.
+
+        """
+
+        # Check whether the file identifier attributes have been
+        # precompiled; proceed accordingly.
+        fileid_dict = parser_interface.dict_key_value(
+            dict_in=filesdict, key=fileid, no_split=True
+        )
+
+        if plan.is_compiled(fileid_dict=fileid_dict):
+            return plan.build_fileid_obj(fileid_dict=fileid_dict)
+
+        # Build the Python object containing the experiment
+        # configuration attributes for the respective file(s) to be
+        # collected.
+        fileid_obj = self.build_fileid_obj(
+            filesdict=filesdict,
+            fileid=fileid,
+            mand_attr_list=fetch_attrs_dict[platform]["mand_attr_list"],
+            opt_attr_dict=fetch_attrs_dict[platform]["opt_attr_dict"],
+        )
+
+        # Define list of valid timestamps and the corresponding file
+        # paths relative to the respective file attributes.
+        fileid_obj = self.get_timestamps_list(fileid_obj=fileid_obj)
+        fileid_obj = parser_interface.object_setattr(
+            object_in=fileid_obj,
+            key="filepaths_list",
+            value=self.get_filepaths_list(fileid_obj=fileid_obj),
+        )
+
+        return fileid_obj
+
+    def posix(self, filesdict: dict, nworkers: int = 1) -> list:
+        """
+        Description
+        -----------
+
+        This method collects files specified within the
+        YAML-formatted configuration file that are hosted beneath a
+        root path of a POSIX filesystem (e.g., a local Lustre or GPFS
+        mirror of the respective AWS s3 bucket); the object path
+        attributes are resolved relative to the root path attribute.
+
+        Parameters
+        ----------
+
+        filesdict: dict
+
+            A Python dictionary containing the attributes for each
+            file identifier within the respective fetch type.
+
+        Keywords
+        --------
+
+        nworkers: int, optional
+
+            A Python integer specifying the number of threads used to
+            collect the file identifiers concurrently.
+
+        Returns
+        -------
+
+        concat_jobs_list: list
+
+            A Python list of the concatenation jobs for the respective
+            file identifiers (see Staging.concat_filepath); the
+            concatenation jobs are executed by the calling method.
+
+        """
+
+        # Check whether file identifiers have been specified; proceed
+        # accordingly.
+        if self.fileids is not None:
+            filesdict = self._filter_fileids(filesdict=filesdict)
+            if len(filesdict.keys()) <= 0:
+                msg = (
+                    "No valid file identifiers has been specified; "
+                    "nothing will be collected."
+                )
+                self.logger.warn(msg=msg)
+
+                return []
+
+        # Build the Python objects containing the experiment
+        # configuration attributes, timestamps, and file paths for the
+        # respective file(s) to be collected.
+        checksum_obj = self._get_checksum_obj(platform="posix")
+        fileid_obj_list = [
+            self.get_fileid_obj(platform="posix", filesdict=filesdict, fileid=fileid)
+            for fileid in filesdict.keys()
+        ]
+
+        # Collect all files for each file identifier using the
+        # specified number of threads; proceed accordingly.
+        posix_fetch = functools.partial(
+            self.posix_fetch,
+            checksum_filepath=checksum_obj.posix_filepath,
+            checksum_index=checksum_obj.posix_filepath is not None,
+            checksum_level=checksum_obj.posix_hash,
+        )
+
+        if nworkers <= 1:
+            for fileid_obj in fileid_obj_list:
+                posix_fetch(fileid_obj)
+
+        if nworkers > 1:
+            with ThreadPoolExecutor(max_workers=nworkers) as executor:
+                list(executor.map(posix_fetch, fileid_obj_list))
+
+        # If applicable, decompress the collected files and validate
+        # the netCDF-formatted member files.
+        self.decompress_files(
+            fileid_obj_list=fileid_obj_list,
+            checksum_filepath=checksum_obj.posix_filepath,
+            checksum_index=checksum_obj.posix_filepath is not None,
+            checksum_level=checksum_obj.posix_hash,
+        )
+        self.validate_members(platform="posix", fileid_obj_list=fileid_obj_list)
+
+        # If applicable, define the concatenation jobs for the
+        # respective files in accordance with the experiment
+        # configuration.
+        concat_jobs_list = [
+            self.concat_filepath(fileid_obj=fileid_obj) for fileid_obj in fileid_obj_list
+        ]
+
+        return concat_jobs_list
+
+    def run(self) -> None:
+        """
+        Description
+        -----------
+
+        This method performs the following tasks:
+
+        (1) Collects and defines the local attributes determined from
+            the YAML-formatted configuration file relative to the
+            fetch application.
+
+        (2) For each supported platform/interface collects (e.g.,
+            fetches) the specified files in accordance with to any
+            options specified/defined within the YAML-formatted
+            configuration file.
+
+        """
+
+        # Define the fetching configuration.
+        fetch_dict = self.build_fetch_dict()
+
+        # Collect the specified files for each interface.
+        self.collect(fetch_dict=fetch_dict)
+
+    def shard_tasks(self, compiled_list: list) -> list:
+        """
+        Description
+        -----------
+
+        This method restricts the fetch types to the objects (i.e.,
+        file identifier and timestamp) assigned to the respective
+        shard (see staging.shard.Shard).
+
+        Parameters
+        ----------
+
+        compiled_list: list
+
+            A Python list of the compiled file identifiers (see
+            _compile_tasks).
+
+        Returns
+        -------
+
+        fetch_tasks_list: list
+
+            A Python list of (fetch method, method, fetch type, file
+            identifier attributes) tuples containing only the objects
+            assigned to the respective shard.
+
+        """
+
+        # Partition the objects across the shards.
+        objects_list = self._get_objects(compiled_list=compiled_list)
+        assigned_list = self.shard.assign(
+            keys_list=[key for (key, _, _, _) in objects_list],
+            sizer=functools.partial(self._get_object_sizes, objects_list=objects_list),
+        )
+        assigned_objects_list = [
+            obj for (obj, assigned) in zip(objects_list, assigned_list) if assigned
+        ]
+
+        msg = (
+            f"Shard {self.shard.index} of {self.shard.count} has been assigned "
+            f"{len(assigned_objects_list)} of {len(objects_list)} object(s)."
+        )
+        self.logger.info(msg=msg)
+
+        return self._restrict_tasks(objects_list=assigned_objects_list)
+
+    def tar(self, filesdict: dict, nworkers: int = 1) -> list:
+        """
+        Description
+        -----------
+
+        This method collects files specified within the
+        YAML-formatted configuration file that are members of
+        (uncompressed) tar archives; the object path attributes are
+        the member names within the respective tar_path attributes.
+        The member data offsets are collected from the sidecar index
+        of each tar archive (see staging.tarindex), which is built
+        if necessary, and the members are extracted concurrently in
+        order of increasing offset within each tar archive.
+
+        Parameters
+        ----------
+
+        filesdict: dict
+
+            A Python dictionary containing the attributes for each
+            file identifier within the respective fetch type.
+
+        Keywords
+        --------
+
+        nworkers: int, optional
+
+            A Python integer specifying the number of threads used to
+            extract the members; if less than or equal to 1, the
+            tar_max_concurrency fetch engine attribute is used.
+
+        Returns
+        -------
+
+        concat_jobs_list: list
+
+            A Python list of the concatenation jobs for the respective
+            file identifiers (see Staging.concat_filepath); the
+            concatenation jobs are executed by the calling method.
+
+        """
+
+        # Check whether file identifiers have been specified; proceed
+        # accordingly.
+        if self.fileids is not None:
+            filesdict = self._filter_fileids(filesdict=filesdict)
+            if len(filesdict.keys()) <= 0:
+                msg = (
+                    "No valid file identifiers has been specified; "
+                    "nothing will be collected."
+                )
+                self.logger.warn(msg=msg)
+
+                return []
+
+        # Build the Python objects containing the experiment
+        # configuration attributes, timestamps, and file paths for the
+        # respective file(s) to be collected.
+        checksum_obj = self._get_checksum_obj(platform="tar")
+        fileid_obj_list = [
+            self.get_fileid_obj(platform="tar", filesdict=filesdict, fileid=fileid)
+            for fileid in filesdict.keys()
+        ]
+
+        # Define the members to be extracted; the members are ordered
+        # by tar archive and data offset such that each tar archive is
+        # read sequentially.
+        (members_list, nrequested) = ([], 0)
+        for fileid_obj in fileid_obj_list:
+            for filepath_dict in self.get_filepaths_list(fileid_obj=fileid_obj):
+                nrequested += 1
+                member = self.archive_index.lookup(
+                    tar_path=filepath_dict["tar_path"],
+                    name=filepath_dict["object_path"],
+                    index_path=filepath_dict.get("tar_index"),
+                )
+                if member is not None:
+                    members_list.append((fileid_obj, filepath_dict, member))
+
+        members_list.sort(key=lambda item: (item[1]["tar_path"], item[2][0]))
+        msg = (
+            f"Found {len(members_list)} of {nrequested} requested tar archive "
+            "member(s)."
+        )
+        self.logger.info(msg=msg)
+
+        # Extract the members using the specified number of threads.
+        if nworkers <= 1:
+            engine_attrs_dict = {"tar_max_concurrency": 8}
+            nworkers = int(
+                parser_interface.dict_key_value(
+                    dict_in=self.engine_dict,
+                    key="tar_max_concurrency",
+                    force=True,
+                    no_split=True,
+                )
+                or engine_attrs_dict["tar_max_concurrency"]
+            )
+
+        tar_get = functools.partial(
+            self.tar_get,
+            checksum_filepath=checksum_obj.tar_filepath,
+            checksum_index=checksum_obj.tar_filepath is not None,
+            checksum_level=checksum_obj.tar_hash,
+        )
+        with ThreadPoolExecutor(max_workers=max(min(nworkers, len(members_list)), 1)) as executor:
+            futures_list = [
+                executor.submit(
+                    tar_get,
+                    fileid_obj=fileid_obj,
+                    local_path=filepath_dict["local_path"],
+                    tar_path=filepath_dict["tar_path"],
+                    member=member,
+                )
+                for (fileid_obj, filepath_dict, member) in members_list
+            ]
+
+        for future in futures_list:
+            future.result()
+
+        # If applicable, decompress the collected files and validate
+        # the netCDF-formatted member files.
+        self.decompress_files(
+            fileid_obj_list=fileid_obj_list,
+            checksum_filepath=checksum_obj.tar_filepath,
+            checksum_index=checksum_obj.tar_filepath is not None,
+            checksum_level=checksum_obj.tar_hash,
+        )
+        self.validate_members(platform="tar", fileid_obj_list=fileid_obj_list)
+
+        # If applicable, define the concatenation jobs for the
+        # respective files in accordance with the experiment
+        # configuration.
+        concat_jobs_list = [
+            self.concat_filepath(fileid_obj=fileid_obj) for fileid_obj in fileid_obj_list
+        ]
+
+        return concat_jobs_list
+
+    def validate_members(self, platform: str, fileid_obj_list: list) -> None:
+        """
+        Description
+        -----------
+
+        This method validates the collected netCDF-formatted member
+        files for the specified file identifiers prior to their
+        concatenation (see staging.ncvalidate); the member files for
+        all file identifiers are validated using a single pool of
+        processes. An invalid member file is either excluded from the
+        respective concatenation or collected again and, if still
+        invalid, excluded; excluded member files are renamed to
+        <local_path>.invalid such that they are not concatenated.
+
+        The validation is specified by the validate attribute of the
+        nc_concat attributes for the respective file identifier;
+        either exclude (default), refetch, or False (i.e., the member
+        files are not validated).
+
+        Parameters
+        ----------
+
+        platform: str
+
+            A Python string specifying the interface/platform.
+
+        fileid_obj_list: list
+
+            A Python list of Python objects containing the attributes
+            collected from the experiment configuration for the
+            respective file identifiers.
+
         Raises
         ------
 
         StagingError:
 
-            * raised if the specified fetch method (i.e.,
-              platform/interface) is not supported.
+            * raised if the validate attribute is not supported.
 
         """
 
-        # Collect the checksum information from the configuration file
-        # attributes.
-        self.get_checksum_info(fetch_dict=fetch_dict)
-
-        # For each supported interface/platform type, collect (i.e.,
-        # fetch) the attributes specified in the YAML-formatted
-        # configuration file.
-        for fetch_method in self.platforms:
+        # Define the member files to be validated for each file
+        # identifier.
+        validate_list = []
+        for fileid_obj in fileid_obj_list:
+            nc_concat = parser_interface.object_getattr(
+                object_in=fileid_obj, key="nc_concat", force=True
+            )
+            if nc_concat is None:
+                continue
 
-            # Define the base-class method to be used for collecting
-            # from the supported interfaces/platforms; proceed
-            # accordingly.
-            method = parser_interface.dict_key_value(
-                dict_in=self.fetch_methods_dict,
-                key=fetch_method,
-                force=True,
-                no_split=True,
+            validate = parser_interface.dict_key_value(
+                dict_in=nc_concat, key="validate", force=True, no_split=True
             )
+            if validate is False:
+                continue
 
-            if method is None:
+            validate = "exclude" if validate in [None, True] else str(validate).lower()
+            if validate not in ["exclude", "refetch"]:
                 msg = (
-                    f"A method for collecting files from the {fetch_method} "
-                    "platform is not supported. Aborting!!!"
+                    f"The netCDF concatenation attribute validate: {validate} is "
+                    "not supported; supported values are exclude, refetch, and "
+                    "False. Aborting!!!"
                 )
                 staging_error(msg=msg)
 
-            # Define the respective file attributes for the respective
-            # supported interface/platform.
-            filesdict = parser_interface.dict_key_value(
-                dict_in=fetch_dict, key=fetch_method, force=True, no_split=True
-            )
+            filepaths_dict = {
+                filepath_dict["local_path"]: filepath_dict
+                for filepath_dict in self.get_filepaths_list(fileid_obj=fileid_obj)
+                if fileio_interface.fileexist(path=filepath_dict["local_path"])
+            }
+            if filepaths_dict:
+                validate_list.append((fileid_obj, validate, filepaths_dict))
+
+        if not validate_list:
+            return
+
+        # Validate the member files; collect the invalid member files
+        # again if specified.
+        invalid_list = ncvalidate.validate_pool(
+            validate_jobs_list=[
+                {"ncfilelist": list(filepaths_dict), "ncdim": fileid_obj.nc_concat["ncdim"]}
+                for (fileid_obj, _, filepaths_dict) in validate_list
+            ]
+        )
 
-            # Parse the configuration file attributes in accordance
-            # with the base-class argument; proceed accordingly.
-            if self.fetch_type_opt is None:
-                fetch_types = list(filesdict.keys())
+        refetch_list = []
+        for (idx, (fileid_obj, validate, filepaths_dict)) in enumerate(validate_list):
+            if validate != "refetch" or not invalid_list[idx]:
+                continue
 
-            if self.fetch_type_opt is not None:
-                fetch_types = self._get_fetch_types()
+            for (local_path, reason) in invalid_list[idx].items():
+                msg = (
+                    f"The netCDF-formatted member file {local_path} is not "
+                    f"valid ({reason}) and will be collected again."
+                )
+                self.logger.warn(msg=msg)
+                self._refetch_member(
+                    platform=platform,
+                    fileid_obj=fileid_obj,
+                    filepath_dict=filepaths_dict[local_path],
+                )
 
-            # Collect files in accordance with the configuration and
-            # options.
-            for fetch_type in fetch_types:
-                if fetch_type in filesdict:
-                    msg = f"Collecting files for fetch type {fetch_type}."
-                    self.logger.info(msg=msg)
-                    method(filesdict=filesdict[fetch_type])
+            refetch_list.append(idx)
+
+        if refetch_list:
+            revalidate_list = ncvalidate.validate_pool(
+                validate_jobs_list=[
+                    {
+                        "ncfilelist": list(validate_list[idx][2]),
+                        "ncdim": validate_list[idx][0].nc_concat["ncdim"],
+                    }
+                    for idx in refetch_list
+                ]
+            )
+            for (idx, invalid_dict) in zip(refetch_list, revalidate_list):
+                invalid_list[idx] = invalid_dict
+
+        # Exclude the invalid member files from the respective
+        # concatenations.
+        nmembers = sum(len(filepaths_dict) for (_, _, filepaths_dict) in validate_list)
+        ninvalid = 0
+        for invalid_dict in invalid_list:
+            for (local_path, reason) in invalid_dict.items():
+                msg = (
+                    f"The netCDF-formatted member file {local_path} is not "
+                    f"valid ({reason}) and will not be included in the netCDF "
+                    f"file concatenation; it has been renamed {local_path}.invalid."
+                )
+                self.logger.warn(msg=msg)
+                os.replace(local_path, f"{local_path}.invalid")
+                ninvalid += 1
 
-                if fetch_type not in filesdict:
-                    msg = (
-                        "The configuration file does not specify a key "
-                        f"for fetch type {fetch_type}; {fetch_type} files "
-                        "will not be collected."
-                    )
-                    self.logger.warn(msg=msg)
+        msg = (
+            f"Validated {nmembers} netCDF-formatted member file(s); "
+            f"{ninvalid} member file(s) were excluded."
+        )
+        self.logger.info(msg=msg)
 
-    def get_checksum_info(self, fetch_dict: dict) -> None:
+    def verify_manifest(self, fileid_obj_list: list) -> None:
         """
         Description
         -----------
 
-        This method collects the checksum attributes for each
-        platform/interface (if applicable) from the YAML-formatted
-        configuration file and defines the base-class attributes
-        checksum and checksum_dict; if the checksum YAML-block is not
-        specified within the YAML-formatted configuration files, not
-        checksum hash values will be defined/determined during the
-        respective fetching application.
+        This method verifies the collected files against the upstream
+        md5 manifests for the file identifiers specifying the
+        md5_manifest attribute (i.e., the manifest object path within
+        the respective AWS s3 bucket; POSIX compliant time and date
+        string attributes are supported); each manifest is collected
+        only once, the md5 hash indices are computed using a pool of
+        processes, and mismatched files are collected again directly
+        from AWS s3 (i.e., bypassing the object cache).
 
         Parameters
         ----------
 
-        fetch_dict: dict
+        fileid_obj_list: list
 
-            A Python dictionary containing the attributes necessary to
-            collect (i.e., fetch) the respective (e.g., specified)
-            files; the dictionary keys correspond to the respective
-            fetching method (see the base-class attribute
-            fetch_methods_dict) and the corresponding values are the
-            YAML-formed dictionaries for the respective files to be
-            retrieved by the respective fetching method.
+            A Python list of Python objects containing the attributes
+            collected from the experiment configuration for the
+            respective file identifiers.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if a collected file does not match the upstream
+              md5 manifest after being collected again.
 
         """
 
-        # Define the checksum hash attributes for the respective
-        # fetching interfaces; proceed accordingly.
-        self.checksum_dict = parser_interface.dict_key_value(
-            dict_in=fetch_dict, key="checksum", force=True, no_split=True
+        # Define the collected files and their upstream md5 hash
+        # indices.
+        verify_list = []
+        for fileid_obj in fileid_obj_list:
+            md5_manifest = parser_interface.object_getattr(
+                object_in=fileid_obj, key="md5_manifest", force=True
+            )
+            if md5_manifest is None:
+                continue
+
+            for filepath_dict in self.get_filepaths_list(fileid_obj=fileid_obj):
+                if not fileio_interface.fileexist(path=filepath_dict["local_path"]):
+                    continue
+
+                manifest_path = datetime_interface.datestrupdate(
+                    datestr=filepath_dict["timestamp"],
+                    in_frmttyp=timestamp_interface.GLOBAL,
+                    out_frmttyp=md5_manifest,
+                )
+                md5 = self.manifest_index.lookup(
+                    bucket=fileid_obj.bucket,
+                    manifest_path=manifest_path,
+                    object_path=filepath_dict["object_path"],
+                    profile_name=fileid_obj.profile_name,
+                )
+
+                if md5 is None:
+                    msg = (
+                        f"The AWS s3 object path {filepath_dict['object_path']} "
+                        f"is not listed within the md5 manifest {manifest_path} "
+                        "and will not be verified."
+                    )
+                    self.logger.warn(msg=msg)
+                    continue
+
+                verify_list.append((fileid_obj, filepath_dict, md5))
+
+        if not verify_list:
+            return
+
+        # Compute the md5 hash indices of the collected files and
+        # collect the mismatched files again.
+        md5s_list = manifest.md5sum_pool(
+            filepaths_list=[filepath_dict["local_path"] for (_, filepath_dict, _) in verify_list]
         )
 
-        if self.checksum_dict is None:
+        refetch_list = []
+        failed_list = []
+        for ((fileid_obj, filepath_dict, md5), local_md5) in zip(verify_list, md5s_list):
+            if local_md5 == md5:
+                continue
+
+            (local_path, object_path) = (
+                filepath_dict["local_path"],
+                filepath_dict["object_path"],
+            )
             msg = (
-                "The checksum attributes for fetched files has not "
-                f"specified in {self.yaml_file}; checksum hash values "
-                "will only be written to standard output."
+                f"The md5 hash index {local_md5} for file path {local_path} "
+                f"does not match the upstream md5 manifest value {md5}; the "
+                f"AWS s3 object path {object_path} will be collected again."
             )
             self.logger.warn(msg=msg)
-            self.checksum = False
+            refetch_list.append(local_path)
+
+            etag = awss3.download(
+                bucket=fileid_obj.bucket,
+                object_path=object_path,
+                local_path=local_path,
+                profile_name=fileid_obj.profile_name,
+                limiter=self.limiter,
+            )
+            if manifest.md5sum(filepath=local_path) != md5:
+                failed_list.append(local_path)
+                continue
+
+            if self.cache is not None:
+                self.cache.store(
+                    filepath=local_path,
+                    bucket=fileid_obj.bucket,
+                    object_path=object_path,
+                    etag=etag,
+                )
 
-        if self.checksum_dict is not None:
-            self.checksum = True
+        msg = (
+            f"Verified {len(verify_list)} file(s) against the upstream md5 "
+            f"manifests; {len(refetch_list)} file(s) were collected again."
+        )
+        self.logger.info(msg=msg)
 
-    def run(self) -> None:
+        if failed_list:
+            msg = (
+                f"The file paths {failed_list} do not match the upstream md5 "
+                "manifests after being collected again. Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+    def write_plan(self) -> str:
         """
         Description
         -----------
 
-        This method performs the following tasks:
+        This method compiles the fetch plan for the respective
+        forecast cycle and writes it beneath the experiment /com path
+        for the respective forecast cycle; the fetch plan contains the
+        validated file identifier attributes, timestamps, and local
+        and remote file paths for each file identifier specified by
+        the base-class attributes.
 
-        (1) Collects and defines the local attributes determined from
-            the YAML-formatted configuration file relative to the
-            fetch application.
+        Returns
+        -------
 
-        (2) For each supported platform/interface collects (e.g.,
-            fetches) the specified files in accordance with to any
-            options specified/defined within the YAML-formatted
-            configuration file.
+        plan_file: str
+
+            A Python string specifying the path to the fetch plan.
 
         """
 
-        # Define the fetching configuration.
+        # Collect the fetch configuration attributes.
         fetch_dict = self.build_fetch_dict()
+        plan_dict = {
+            attr: parser_interface.dict_key_value(
+                dict_in=fetch_dict, key=attr, force=True, no_split=True
+            )
+            for attr in [
+                "bandwidth",
+                "cache",
+                "checksum",
+                "concat",
+                "engine",
+                "queue",
+                "workers",
+            ]
+        }
+
+        # Compile the attributes for each interface/platform, fetch
+        # type, and file identifier.
+        for platform in self.platforms:
 
-        # Collect the specified files for each interface.
-        self.collect(fetch_dict=fetch_dict)
+            filesdict = parser_interface.dict_key_value(
+                dict_in=fetch_dict, key=platform, force=True, no_split=True
+            )
+
+            if filesdict is None:
+                continue
+
+            if self.fetch_type_opt is None:
+                fetch_types = list(filesdict.keys())
+
+            if self.fetch_type_opt is not None:
+                fetch_types = [
+                    fetch_type
+                    for fetch_type in self._get_fetch_types()
+                    if fetch_type in filesdict
+                ]
+
+            attrs_list = fetch_attrs_dict[platform]["mand_attr_list"] + list(
+                fetch_attrs_dict[platform]["opt_attr_dict"].keys()
+            )
+            plan_dict[platform] = {}
+            for fetch_type in fetch_types:
+
+                msg = f"Compiling the fetch plan for fetch type {fetch_type}."
+                self.logger.info(msg=msg)
+
+                fetch_type_dict = self._filter_fileids(
+                    filesdict=self._filter_streams(
+                        fetch_dict=fetch_dict,
+                        platform=platform,
+                        fetch_type=fetch_type,
+                        filesdict=filesdict[fetch_type],
+                    )
+                )
+                plan_dict[platform][fetch_type] = {}
+                for fileid in fetch_type_dict.keys():
+                    fileid_obj = self.get_fileid_obj(
+                        platform=platform, filesdict=fetch_type_dict, fileid=fileid
+                    )
+                    plan_dict[platform][fetch_type][fileid] = plan.build_fileid_dict(
+                        fileid_obj=fileid_obj, attrs_list=attrs_list
+                    )
+
+        # Write the fetch plan.
+        plan_file = plan.plan_filepath(
+            com_root=self.launch.com_root, expt_name=self.launch.expt_name, cycle=self.cycle
+        )
+        msg = f"Writing fetch plan {plan_file}."
+        self.logger.info(msg=msg)
+        plan.write_plan(
+            plan_file=plan_file,
+            plan_dict=plan_dict,
+            cycle=self.cycle,
+            yaml_file=self.yaml_file,
+            launch_dict={
+                attr: parser_interface.object_getattr(object_in=self.launch, key=attr)
+                for attr in plan.PLAN_LAUNCH_ATTRS_LIST
+            },
+        )
+
+        return plan_file
@@ -0,0 +1,400 @@
+# =========================================================================
+
+# Module: ush/staging/manifest.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    manifest.py
+
+Description
+-----------
+
+    This module contains classes and functions to verify collected
+    files against upstream (i.e., bucket-published) md5 manifests;
+    each manifest is collected and indexed only once per process and
+    the md5 hash indices of the collected files are computed using a
+    pool of processes.
+
+    The manifests are md5sum-formatted (i.e., "<md5>  <name>" or
+    "<md5> *<name>") or BSD-formatted (i.e., "MD5 (<name>) = <md5>");
+    the names may be either the full object paths or the object paths
+    relative to the directory containing the respective manifest.
+
+Classes
+-------
+
+    ManifestIndex()
+
+        This is the base-class object for the upstream md5 manifest
+        index.
+
+Functions
+---------
+
+    md5sum(filepath)
+
+        This function computes the md5 hash index for the specified
+        file path.
+
+    md5sum_pool(filepaths_list, nworkers=None)
+
+        This function computes the md5 hash indices for the specified
+        file paths using a pool of processes.
+
+    parse(text)
+
+        This function parses the specified md5 manifest.
+
+Requirements
+------------
+
+- boto3; https://github.com/boto/boto3
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from staging import awss3
+from staging.ncconcat import get_nworkers
+
+# ----
+
+# Define all available attributes.
+__all__ = ["ManifestIndex", "md5sum", "md5sum_pool", "parse"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the block size, in bytes, for computing md5 hash indices.
+BLOCK_SIZE = 8 * 1024 * 1024
+
+# Define the md5sum- and BSD-formatted manifest entries.
+MD5SUM_REGEX = re.compile(r"^([0-9a-fA-F]{32})\s+\*?(.+)$")
+BSD_REGEX = re.compile(r"^MD5\s*\((.+)\)\s*=\s*([0-9a-fA-F]{32})$")
+
+# ----
+
+
+class ManifestIndex:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the upstream md5 manifest index;
+    each manifest (i.e., AWS s3 bucket and object path) is collected
+    and parsed only once, regardless of the number of threads and
+    objects referencing it; missing manifests are recorded such that
+    they are not requested again.
+
+    """
+
+    def __init__(self):
+        """
+        Description
+        -----------
+
+        Creates a new ManifestIndex object.
+
+        """
+
+        # Define the base-class attributes.
+        self.manifests_dict = {}
+        self.locks_dict = {}
+        self.lock = threading.Lock()
+
+    def get(self, bucket: str, manifest_path: str, profile_name: str = None) -> dict:
+        """
+        Description
+        -----------
+
+        This method returns the parsed md5 manifest for the specified
+        AWS s3 bucket and object path.
+
+        Parameters
+        ----------
+
+        bucket: str
+
+            A Python string specifying the AWS s3 bucket name.
+
+        manifest_path: str
+
+            A Python string specifying the manifest object path.
+
+        Keywords
+        --------
+
+        profile_name: str, optional
+
+            A Python string specifying the AWS profile name.
+
+        Returns
+        -------
+
+        manifest_dict: dict
+
+            A Python dictionary containing the md5 hash index for each
+            manifest entry; if the manifest does not exist, NoneType
+            is returned.
+
+        """
+
+        # Collect and parse the manifest; proceed accordingly; each
+        # manifest is locked separately such that distinct manifests
+        # may be collected concurrently.
+        key = (bucket, manifest_path)
+        with self.lock:
+            lock = self.locks_dict.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self.manifests_dict:
+                try:
+                    response = awss3.get_client(profile_name=profile_name).get_object(
+                        Bucket=bucket, Key=manifest_path
+                    )
+                    self.manifests_dict[key] = parse(
+                        text=response["Body"].read().decode("utf-8", errors="replace")
+                    )
+
+                except ClientError as exc:
+                    if exc.response["Error"]["Code"] not in awss3.MISSING_CODES:
+                        raise
+                    self.manifests_dict[key] = None
+
+            manifest_dict = self.manifests_dict[key]
+
+        return manifest_dict
+
+    def lookup(
+        self,
+        bucket: str,
+        manifest_path: str,
+        object_path: str,
+        profile_name: str = None,
+    ) -> str:
+        """
+        Description
+        -----------
+
+        This method returns the upstream md5 hash index for the
+        specified AWS s3 object path; the object path is matched, in
+        order, as the full object path, the object path relative to
+        the manifest directory, and the object path basename.
+
+        Parameters
+        ----------
+
+        bucket: str
+
+            A Python string specifying the AWS s3 bucket name.
+
+        manifest_path: str
+
+            A Python string specifying the manifest object path.
+
+        object_path: str
+
+            A Python string specifying the AWS s3 object path.
+
+        Keywords
+        --------
+
+        profile_name: str, optional
+
+            A Python string specifying the AWS profile name.
+
+        Returns
+        -------
+
+        md5: str
+
+            A Python string specifying the upstream md5 hash index; if
+            the manifest does not exist or does not contain the object
+            path, NoneType is returned.
+
+        """
+
+        # Collect the manifest; proceed accordingly.
+        manifest_dict = self.get(
+            bucket=bucket, manifest_path=manifest_path, profile_name=profile_name
+        )
+
+        if manifest_dict is None:
+            return None
+
+        # Match the object path to the manifest entries.
+        for name in [
+            object_path,
+            os.path.relpath(object_path, os.path.dirname(manifest_path) or "."),
+            os.path.basename(object_path),
+        ]:
+            md5 = manifest_dict.get(name)
+            if md5 is not None:
+                return md5
+
+        return None
+
+
+# ----
+
+
+def md5sum(filepath: str) -> str:
+    """
+    Description
+    -----------
+
+    This function computes the md5 hash index for the specified file
+    path.
+
+    Parameters
+    ----------
+
+    filepath: str
+
+        A Python string specifying the file path.
+
+    Returns
+    -------
+
+    md5: str
+
+        A Python string specifying the md5 hash index.
+
+    """
+
+    # Compute the md5 hash index.
+    md5 = hashlib.md5()
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(BLOCK_SIZE), b""):
+            md5.update(block)
+
+    return md5.hexdigest()
+
+
+def md5sum_pool(filepaths_list: list, nworkers: int = None) -> list:
+    """
+    Description
+    -----------
+
+    This function computes the md5 hash indices for the specified file
+    paths using a pool of processes; if only a single process is
+    available, the hash indices are computed serially.
+
+    Parameters
+    ----------
+
+    filepaths_list: list
+
+        A Python list of file paths.
+
+    Keywords
+    --------
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of processes; if
+        NoneType, the number of processes available to the respective
+        application is used.
+
+    Returns
+    -------
+
+    md5s_list: list
+
+        A Python list, ordered identically to filepaths_list, of the
+        md5 hash indices.
+
+    """
+
+    # Compute the md5 hash indices.
+    nworkers = min(get_nworkers(nworkers=nworkers), max(len(filepaths_list), 1))
+    if nworkers <= 1:
+        return [md5sum(filepath=filepath) for filepath in filepaths_list]
+
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        md5s_list = list(executor.map(md5sum, filepaths_list))
+
+    return md5s_list
+
+
+def parse(text: str) -> dict:
+    """
+    Description
+    -----------
+
+    This function parses the specified md5 manifest; lines which are
+    not md5sum- or BSD-formatted entries are ignored.
+
+    Parameters
+    ----------
+
+    text: str
+
+        A Python string containing the md5 manifest.
+
+    Returns
+    -------
+
+    manifest_dict: dict
+
+        A Python dictionary containing the (lower-case) md5 hash index
+        for each manifest entry name.
+
+    """
+
+    # Parse the manifest entries.
+    manifest_dict = {}
+    for line in text.splitlines():
+        line = line.strip()
+        match = MD5SUM_REGEX.match(line)
+        if match is not None:
+            (md5, name) = match.groups()
+        else:
+            match = BSD_REGEX.match(line)
+            if match is None:
+                continue
+            (name, md5) = match.groups()
+
+        manifest_dict[os.path.normpath(name.strip()).lstrip("/")] = md5.lower()
+
+    return manifest_dict
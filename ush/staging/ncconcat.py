@@ -0,0 +1,1299 @@
+# =========================================================================
+
+# Module: ush/staging/ncconcat.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    ncconcat.py
+
+Description
+-----------
+
+    This module contains functions to concatenate netCDF-formatted
+    member files; the concatenations for independent file identifiers
+    may be executed concurrently using a pool of processes such that
+    the netCDF/HDF5 libraries, which hold the Python global
+    interpreter lock (GIL), do not serialize the concatenations; when
+    the member files are to be subset (e.g., a geographical bounding
+    box, time window, and/or variable allow-list), the member files
+    are streamed, one at a time, into the concatenated file and the
+    subset is applied (vectorized) along the concatenation dimension;
+    the streamed concatenation also supports tunable compression and
+    chunk (or contiguous) storage layouts and the (vectorized) sorting
+    and exact duplicate removal of the locations; for large numbers of
+    member files, the member files may be concatenated as a tree
+    reduction (i.e., contiguous partitions of the member files are
+    concatenated concurrently and the partial files are concatenated
+    in a final pass).
+
+Functions
+---------
+
+    concat_pool(concat_jobs_list, nworkers=None)
+
+        This function executes the specified netCDF-formatted file
+        concatenation jobs using a pool of processes.
+
+    get_nworkers(nworkers=None)
+
+        This function defines the number of processes available to the
+        respective application.
+
+    nc_concat(ncfilelist, ncfile, ncdim, ncfrmt=None, subset=None,
+              layout=None, sort=None, virtual=False, tree=None)
+
+        This function concatenates the specified netCDF-formatted
+        member files along the specified dimension.
+
+    nc_stream(ncfilelist, ncfile, ncdim, ncfrmt=None, subset=None,
+              layout=None, sort=None)
+
+        This function streams the specified netCDF-formatted member
+        files into the concatenated file along the specified
+        dimension.
+
+    nc_tree(ncfilelist, ncfile, ncdim, ncfrmt=None, subset=None,
+            layout=None, sort=None, nworkers=None)
+
+        This function concatenates the specified netCDF-formatted
+        member files as a tree reduction using a pool of processes.
+
+    sort_order(ncfilelist, ncdim, indices_list, sort,
+               variables_list=None)
+
+        This function defines the ordering, along the concatenation
+        dimension, of the sorted and/or unique locations.
+
+    subset_indices(ncobj, ncdim, subset)
+
+        This function defines the indices, along the concatenation
+        dimension, of the locations within the specified subset.
+
+Requirements
+------------
+
+- netCDF4; https://github.com/Unidata/netcdf4-python
+
+- numpy; https://numpy.org/
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import netCDF4
+import numpy
+from ioapps import netcdf4_interface
+from tools import fileio_interface
+from utils import timestamp_interface
+
+from staging import ncvirtual
+
+# ----
+
+# Define all available functions.
+__all__ = [
+    "concat_pool",
+    "get_nworkers",
+    "nc_concat",
+    "nc_stream",
+    "nc_tree",
+    "sort_order",
+    "subset_indices",
+]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+
+def _budget(concat_job: dict, nworkers: int) -> dict:
+    """
+    Description
+    -----------
+
+    This function limits the number of processes for the tree
+    reduction (if any) of the specified netCDF-formatted file
+    concatenation job.
+
+    Parameters
+    ----------
+
+    concat_job: dict
+
+        A Python dictionary containing the keyword arguments for
+        nc_concat.
+
+    nworkers: int
+
+        A Python integer specifying the maximum number of processes
+        for the tree reduction.
+
+    Returns
+    -------
+
+    concat_job: dict
+
+        A Python dictionary containing the keyword arguments for
+        nc_concat; the tree reduction attributes, if specified, are
+        a copy of those for the specified job.
+
+    """
+
+    # Limit the number of processes for the tree reduction.
+    if not concat_job.get("tree"):
+        return concat_job
+
+    tree = dict(concat_job["tree"])
+    tree["nworkers"] = min(get_nworkers(nworkers=tree.get("nworkers")), nworkers)
+
+    return {**concat_job, "tree": tree}
+
+
+def concat_pool(concat_jobs_list: list, nworkers: int = None) -> list:
+    """
+    Description
+    -----------
+
+    This function executes the specified netCDF-formatted file
+    concatenation jobs using a pool of processes; each job is
+    independent and the exception (if any) raised by a respective job
+    is returned to the calling application rather than raised. The
+    processes available to the tree reductions (see nc_tree) are
+    divided amongst the jobs executed concurrently such that the
+    total number of processes does not exceed nworkers.
+
+    Parameters
+    ----------
+
+    concat_jobs_list: list
+
+        A Python list of Python dictionaries, each containing the
+        keyword arguments for nc_concat (see below).
+
+    Keywords
+    --------
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of processes; if
+        NoneType, the number of processes available to the respective
+        application is used.
+
+    Returns
+    -------
+
+    results_list: list
+
+        A Python list, ordered identically to concat_jobs_list, of
+        Python tuples containing the respective job and the exception
+        raised by the respective job (or NoneType if the job
+        succeeded).
+
+    """
+
+    # Define the number of processes; if only a single process is
+    # required, the jobs are executed serially.
+    ncpus = get_nworkers(nworkers=nworkers)
+    nworkers = min(ncpus, max(len(concat_jobs_list), 1))
+    budget_jobs_list = [
+        _budget(concat_job=concat_job, nworkers=max(ncpus // nworkers, 1))
+        for concat_job in concat_jobs_list
+    ]
+    results_list = []
+
+    if nworkers <= 1:
+        for (concat_job, budget_job) in zip(concat_jobs_list, budget_jobs_list):
+            try:
+                nc_concat(**budget_job)
+                results_list.append((concat_job, None))
+            except Exception as exc:  # pylint: disable=broad-except
+                results_list.append((concat_job, exc))
+
+        return results_list
+
+    # Execute the jobs using the pool of processes.
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        futures_list = [
+            executor.submit(nc_concat, **budget_job) for budget_job in budget_jobs_list
+        ]
+
+        for (concat_job, future) in zip(concat_jobs_list, futures_list):
+            results_list.append((concat_job, future.exception()))
+
+    return results_list
+
+
+def get_nworkers(nworkers: int = None) -> int:
+    """
+    Description
+    -----------
+
+    This function defines the number of processes available to the
+    respective application; the processor affinity is used (where
+    available) such that batch-system processor allocations are
+    respected.
+
+    Keywords
+    --------
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of processes; if not
+        NoneType, this value is returned.
+
+    Returns
+    -------
+
+    nworkers: int
+
+        A Python integer specifying the number of processes.
+
+    """
+
+    # Define the number of processes available to the application.
+    if nworkers is None:
+        try:
+            nworkers = len(os.sched_getaffinity(0))
+        except AttributeError:
+            nworkers = os.cpu_count() or 1
+
+    return max(int(nworkers), 1)
+
+
+def _gather(ncfilelist: list, indices_list: list, varpath: str, axis: int) -> numpy.ndarray:
+    """
+    Description
+    -----------
+
+    This function collects the subset of the specified variable from
+    each member file and concatenates the respective values along the
+    concatenation dimension.
+
+    Parameters
+    ----------
+
+    ncfilelist: list
+
+        A Python list of the netCDF-formatted member file paths.
+
+    indices_list: list
+
+        A Python list of Python tuples containing the subset indices
+        (or NoneType for all locations) and the number of locations
+        for each member file.
+
+    varpath: str
+
+        A Python string specifying the variable path relative to the
+        root group.
+
+    axis: int
+
+        A Python integer specifying the axis of the concatenation
+        dimension.
+
+    Returns
+    -------
+
+    values: numpy.ndarray
+
+        A Python numpy.ndarray containing the concatenated values.
+
+    """
+
+    # Collect and concatenate the values from each member file.
+    values_list = []
+    for (ncfilename, (indices, _)) in zip(ncfilelist, indices_list):
+        with netCDF4.Dataset(ncfilename) as ncobj:
+            ncobj.set_auto_maskandscale(False)
+            values = numpy.asarray(_get_variable(ncobj=ncobj, path=varpath)[...])
+            if indices is not None:
+                values = numpy.take(values, indices, axis=axis)
+            values_list.append(values)
+
+    values = numpy.concatenate(values_list, axis=axis)
+
+    return values
+
+
+def _get_coords(ncobj: object, ncdim: str, path: str) -> tuple:
+    """
+    Description
+    -----------
+
+    This function collects the (unpacked) values of the specified
+    subset coordinate variable; missing (i.e., fill) values are
+    defined as NaN.
+
+    Parameters
+    ----------
+
+    ncobj: object
+
+        A Python netCDF4.Dataset object.
+
+    ncdim: str
+
+        A Python string specifying the netCDF concatenation dimension.
+
+    path: str
+
+        A Python string specifying the coordinate variable path
+        relative to the root group.
+
+    Returns
+    -------
+
+    ncvar: object
+
+        A Python netCDF4.Variable object for the coordinate variable.
+
+    values: numpy.ndarray
+
+        A Python numpy.ndarray containing the coordinate variable
+        values.
+
+    Raises
+    ------
+
+    ValueError:
+
+        * raised if the coordinate variable is not dimensioned by
+          only the concatenation dimension.
+
+    """
+
+    # Collect the coordinate variable values.
+    ncvar = _get_variable(ncobj=ncobj, path=path)
+    if ncvar.dimensions != (ncdim,):
+        raise ValueError(
+            f"The subset variable {path} must be dimensioned ({ncdim},); "
+            f"received {ncvar.dimensions}."
+        )
+
+    ncvar.set_auto_maskandscale(True)
+    values = numpy.ma.filled(numpy.ma.asarray(ncvar[...], dtype=float), numpy.nan)
+
+    return (ncvar, values)
+
+
+def _get_variable(ncobj: object, path: str) -> object:
+    """
+    Description
+    -----------
+
+    This function returns the netCDF variable object corresponding to
+    the specified (group) path (e.g., MetaData/latitude).
+
+    Parameters
+    ----------
+
+    ncobj: object
+
+        A Python netCDF4.Dataset object.
+
+    path: str
+
+        A Python string specifying the variable path relative to the
+        root group.
+
+    Returns
+    -------
+
+    ncvar: object
+
+        A Python netCDF4.Variable object.
+
+    """
+
+    # Descend the groups to the respective variable.
+    (*groups_list, varname) = path.strip("/").split("/")
+    for group in groups_list:
+        ncobj = ncobj.groups[group]
+    ncvar = ncobj.variables[varname]
+
+    return ncvar
+
+
+def _layout_kwargs(ncvar: object, ncdim: str, nlocs: int, layout: dict) -> dict:
+    """
+    Description
+    -----------
+
+    This function defines the netCDF4.Dataset.createVariable keyword
+    arguments for the specified storage layout; compression is not
+    applied to variable-length (e.g., string) variables.
+
+    Parameters
+    ----------
+
+    ncvar: object
+
+        A Python netCDF4.Variable object for the respective member
+        file variable.
+
+    ncdim: str
+
+        A Python string specifying the netCDF concatenation dimension.
+
+    nlocs: int
+
+        A Python integer specifying the total number of locations
+        along the concatenation dimension.
+
+    layout: dict
+
+        A Python dictionary containing the storage layout attributes
+        (see nc_stream below).
+
+    Returns
+    -------
+
+    layout_dict: dict
+
+        A Python dictionary containing the netCDF4 variable storage
+        keyword arguments.
+
+    """
+
+    # Define the storage layout keyword arguments; a contiguous
+    # layout requires a fixed (i.e., non-zero) dimension size.
+    if layout.get("contiguous"):
+        return {"contiguous": True} if nlocs > 0 else {}
+
+    layout_dict = {}
+    complevel = int(layout.get("complevel") or 0)
+    if complevel > 0 and isinstance(ncvar.datatype, numpy.dtype):
+        layout_dict.update(
+            {
+                "zlib": True,
+                "complevel": complevel,
+                "shuffle": bool(layout.get("shuffle", True)),
+            }
+        )
+
+    if layout.get("chunksize") is not None:
+        layout_dict["chunksizes"] = [
+            min(int(layout["chunksize"]), max(nlocs, 1))
+            if dimname == ncdim
+            else max(len(dim), 1)
+            for (dimname, dim) in zip(
+                ncvar.dimensions, ncvar.get_dims()
+            )
+        ]
+
+    return layout_dict
+
+
+def _walk(ncobj: object, path: str = "") -> list:
+    """
+    Description
+    -----------
+
+    This function returns the groups, including the root group, of
+    the specified netCDF object; parent groups precede their
+    respective child groups.
+
+    Parameters
+    ----------
+
+    ncobj: object
+
+        A Python netCDF4.Dataset or netCDF4.Group object.
+
+    Keywords
+    --------
+
+    path: str, optional
+
+        A Python string specifying the path of ncobj relative to the
+        root group.
+
+    Returns
+    -------
+
+    groups_list: list
+
+        A Python list of Python tuples containing the path and
+        netCDF4.Group (or netCDF4.Dataset) object for each group.
+
+    """
+
+    # Collect the respective group and all child groups.
+    groups_list = [(path, ncobj)]
+    for (name, group) in ncobj.groups.items():
+        groups_list.extend(_walk(ncobj=group, path=f"{path}/{name}".lstrip("/")))
+
+    return groups_list
+
+
+def nc_concat(
+    ncfilelist: list,
+    ncfile: str,
+    ncdim: str,
+    ncfrmt: str = None,
+    subset: dict = None,
+    layout: dict = None,
+    sort: dict = None,
+    virtual: bool = False,
+    tree: dict = None,
+) -> str:
+    """
+    Description
+    -----------
+
+    This function concatenates the specified netCDF-formatted member
+    files along the specified dimension; if a subset, storage layout,
+    and/or sort is specified, the member files are streamed into the
+    concatenated file via nc_stream (see below); if virtual is True,
+    a virtual aggregation index is written in lieu of the
+    concatenated file (see staging.ncvirtual); if tree is specified,
+    the member files are concatenated as a tree reduction (see
+    nc_tree below).
+
+    Parameters
+    ----------
+
+    ncfilelist: list
+
+        A Python list of the netCDF-formatted member file paths.
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path to
+        contain the concatenated member files.
+
+    ncdim: str
+
+        A Python string specifying the netCDF dimension along which to
+        concatenate the member files.
+
+    Keywords
+    --------
+
+    ncfrmt: str, optional
+
+        A Python string specifying the netCDF file format for the
+        concatenated file path.
+
+    subset: dict, optional
+
+        A Python dictionary containing the subset attributes (see
+        subset_indices below).
+
+    layout: dict, optional
+
+        A Python dictionary containing the storage layout attributes
+        (see nc_stream below).
+
+    sort: dict, optional
+
+        A Python dictionary containing the sort and duplicate removal
+        attributes (see sort_order below).
+
+    virtual: bool, optional
+
+        A Python boolean valued variable specifying whether to write
+        a virtual aggregation index rather than a concatenated file.
+
+    tree: dict, optional
+
+        A Python dictionary containing the tree reduction attributes;
+        the optional key nworkers specifies the number of processes
+        (see nc_tree below).
+
+    Returns
+    -------
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path
+        containing the concatenated member files.
+
+    """
+
+    # Check that the directory tree corresponding to the concatenated
+    # output file exists; proceed accordingly.
+    fileio_interface.dirpath_tree(path=os.path.dirname(ncfile))
+
+    if virtual:
+        return ncvirtual.build_index(ncfilelist=ncfilelist, ncfile=ncfile, ncdim=ncdim)
+
+    if tree:
+        return nc_tree(
+            ncfilelist=ncfilelist,
+            ncfile=ncfile,
+            ncdim=ncdim,
+            ncfrmt=ncfrmt,
+            subset=subset,
+            layout=layout,
+            sort=sort,
+            nworkers=tree.get("nworkers"),
+        )
+
+    if subset or layout or sort:
+        return nc_stream(
+            ncfilelist=ncfilelist,
+            ncfile=ncfile,
+            ncdim=ncdim,
+            ncfrmt=ncfrmt,
+            subset=subset,
+            layout=layout,
+            sort=sort,
+        )
+
+    # Concatenate the respective files to the specified output file
+    # path.
+    netcdf4_interface.ncconcat(
+        ncfilelist=ncfilelist, ncfile=ncfile, ncdim=ncdim, ncfrmt=ncfrmt
+    )
+
+    return ncfile
+
+
+def nc_stream(
+    ncfilelist: list,
+    ncfile: str,
+    ncdim: str,
+    ncfrmt: str = None,
+    subset: dict = None,
+    layout: dict = None,
+    sort: dict = None,
+) -> str:
+    """
+    Description
+    -----------
+
+    This function streams the specified netCDF-formatted member files
+    into the concatenated file along the specified dimension; the
+    groups, dimensions, attributes, and variables of the concatenated
+    file are defined from the first member file, the variables not
+    dependent on the concatenation dimension are copied from the first
+    member file, and only a single member file is read into memory at
+    a time; the concatenated file is written to a temporary file path
+    which is renamed upon completion.
+
+    Parameters
+    ----------
+
+    ncfilelist: list
+
+        A Python list of the netCDF-formatted member file paths.
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path to
+        contain the concatenated member files.
+
+    ncdim: str
+
+        A Python string specifying the netCDF dimension along which to
+        concatenate the member files.
+
+    Keywords
+    --------
+
+    ncfrmt: str, optional
+
+        A Python string specifying the netCDF file format for the
+        concatenated file path; if NoneType, the format of the first
+        member file is used.
+
+    subset: dict, optional
+
+        A Python dictionary containing the subset attributes (see
+        subset_indices below); the optional key variables specifies
+        the allow-list of variable names (or group paths) to be
+        written to the concatenated file.
+
+    layout: dict, optional
+
+        A Python dictionary containing the storage layout attributes
+        for the variables dependent upon the concatenation dimension;
+        the optional keys are complevel (the zlib compression level;
+        0 disables compression), shuffle (enable the HDF5 shuffle
+        filter; defaults to True when compressing), chunksize (the
+        chunk size along the concatenation dimension), and contiguous
+        (write the variables contiguously; the concatenation dimension
+        is then of fixed rather than unlimited size).
+
+    sort: dict, optional
+
+        A Python dictionary containing the sort and duplicate removal
+        attributes (see sort_order below); when specified, the
+        variables dependent upon the concatenation dimension are
+        collected from all member files and permuted by a single
+        gather (i.e., one variable is held in memory at a time).
+
+    Returns
+    -------
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path
+        containing the concatenated member files.
+
+    """
+
+    # Define the locations, within each member file, to be written
+    # to the concatenated file; NoneType denotes all locations.
+    subset = subset or {}
+    layout = layout or {}
+    indices_list = []
+    for ncfilename in ncfilelist:
+        with netCDF4.Dataset(ncfilename) as ncobj:
+            indices = subset_indices(ncobj=ncobj, ncdim=ncdim, subset=subset)
+            count = len(ncobj.dimensions[ncdim]) if indices is None else len(indices)
+            indices_list.append((indices, count))
+
+    nlocs = sum(count for (_, count) in indices_list)
+    variables_list = subset.get("variables")
+
+    # Define the ordering of the (sorted and/or unique) locations
+    # along the concatenation dimension; proceed accordingly.
+    order = None
+    if sort:
+        order = sort_order(
+            ncfilelist=ncfilelist,
+            ncdim=ncdim,
+            indices_list=indices_list,
+            sort=sort,
+            variables_list=variables_list,
+        )
+        nlocs = len(order)
+
+    # Define the concatenated file structure from the first member
+    # file.
+    ncfile_tmp = f"{ncfile}.{os.getpid()}.tmp"
+    streams_list = []
+
+    with netCDF4.Dataset(ncfilelist[0]) as template, netCDF4.Dataset(
+        ncfile_tmp, "w", format=(ncfrmt or template.data_model)
+    ) as ncout:
+        template.set_auto_maskandscale(False)
+        ncout.set_auto_maskandscale(False)
+
+        for (path, group) in _walk(ncobj=template):
+            outgroup = ncout if not path else ncout.createGroup(path)
+            outgroup.setncatts({attr: group.getncattr(attr) for attr in group.ncattrs()})
+            for (dimname, dim) in group.dimensions.items():
+                if dimname == ncdim:
+                    size = nlocs if layout.get("contiguous") else None
+                else:
+                    size = None if dim.isunlimited() else len(dim)
+                outgroup.createDimension(dimname, size)
+
+            for (varname, ncvar) in group.variables.items():
+                varpath = f"{path}/{varname}".lstrip("/")
+                if variables_list and not {varname, varpath} & set(variables_list):
+                    continue
+
+                ncattrs_dict = {
+                    attr: ncvar.getncattr(attr)
+                    for attr in ncvar.ncattrs()
+                    if attr != "_FillValue"
+                }
+                outvar = outgroup.createVariable(
+                    varname,
+                    ncvar.datatype,
+                    ncvar.dimensions,
+                    fill_value=ncvar.__dict__.get("_FillValue"),
+                    **(
+                        _layout_kwargs(ncvar=ncvar, ncdim=ncdim, nlocs=nlocs, layout=layout)
+                        if ncdim in ncvar.dimensions
+                        else {}
+                    ),
+                )
+                outvar.set_auto_maskandscale(False)
+                outvar.setncatts(ncattrs_dict)
+
+                # Variables dependent upon the concatenation dimension
+                # are streamed from each member file; all others are
+                # copied from the first member file.
+                if ncdim in ncvar.dimensions:
+                    streams_list.append(
+                        (varpath, outvar, ncvar.dimensions.index(ncdim))
+                    )
+                else:
+                    outvar[...] = ncvar[...]
+
+        # Gather (i.e., permute) the sorted and/or unique locations of
+        # each variable into the concatenated file.
+        if order is not None:
+            for (varpath, outvar, axis) in streams_list:
+                values = _gather(
+                    ncfilelist=ncfilelist,
+                    indices_list=indices_list,
+                    varpath=varpath,
+                    axis=axis,
+                )
+                index = [slice(None)] * numpy.ndim(values)
+                index[axis] = slice(0, nlocs)
+                outvar[tuple(index)] = numpy.take(values, order, axis=axis)
+
+            streams_list = []
+
+        # Stream the subset of each member file into the concatenated
+        # file.
+        offset = 0
+        for (ncfilename, (indices, count)) in zip(ncfilelist, indices_list):
+            with netCDF4.Dataset(ncfilename) as ncobj:
+                ncobj.set_auto_maskandscale(False)
+                for (varpath, outvar, axis) in streams_list:
+                    values = _get_variable(ncobj=ncobj, path=varpath)[...]
+                    if indices is not None:
+                        values = numpy.take(values, indices, axis=axis)
+                    index = [slice(None)] * numpy.ndim(values)
+                    index[axis] = slice(offset, offset + count)
+                    outvar[tuple(index)] = values
+
+            offset = offset + count
+
+    os.replace(ncfile_tmp, ncfile)
+
+    return ncfile
+
+
+def nc_tree(
+    ncfilelist: list,
+    ncfile: str,
+    ncdim: str,
+    ncfrmt: str = None,
+    subset: dict = None,
+    layout: dict = None,
+    sort: dict = None,
+    nworkers: int = None,
+) -> str:
+    """
+    Description
+    -----------
+
+    This function concatenates the specified netCDF-formatted member
+    files as a tree reduction; the member files are divided into
+    contiguous partitions, one per process, each of which is
+    streamed (see nc_stream) and subset into a partial file
+    concurrently, and the partial files are then concatenated in a
+    final pass in which the storage layout and sort are applied;
+    since the partitions are contiguous and the partial files are
+    defined from the first member file of the respective partition,
+    the concatenated file is identical to that written by a single
+    (sequential) nc_concat; if fewer than two members are available
+    for each of two or more processes, the member files are
+    concatenated sequentially.
+
+    Parameters
+    ----------
+
+    ncfilelist: list
+
+        A Python list of the netCDF-formatted member file paths.
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path to
+        contain the concatenated member files.
+
+    ncdim: str
+
+        A Python string specifying the netCDF dimension along which to
+        concatenate the member files.
+
+    Keywords
+    --------
+
+    ncfrmt: str, optional
+
+        A Python string specifying the netCDF file format for the
+        concatenated file path; the partial files are written using
+        the format of the first member file of the respective
+        partition.
+
+    subset: dict, optional
+
+        A Python dictionary containing the subset attributes (see
+        nc_stream above); the subset is applied to the member files
+        and only the variable allow-list is applied to the partial
+        files.
+
+    layout: dict, optional
+
+        A Python dictionary containing the storage layout attributes
+        (see nc_stream above).
+
+    sort: dict, optional
+
+        A Python dictionary containing the sort and duplicate removal
+        attributes (see sort_order below).
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of processes; if
+        NoneType, the number of processes available to the respective
+        application is used.
+
+    Returns
+    -------
+
+    ncfile: str
+
+        A Python string specifying the netCDF-formatted file path
+        containing the concatenated member files.
+
+    """
+
+    # Define the contiguous partitions of the member files; proceed
+    # accordingly.
+    nparts = min(get_nworkers(nworkers=nworkers), len(ncfilelist) // 2)
+    if nparts < 2:
+        return nc_concat(
+            ncfilelist=ncfilelist,
+            ncfile=ncfile,
+            ncdim=ncdim,
+            ncfrmt=ncfrmt,
+            subset=subset,
+            layout=layout,
+            sort=sort,
+        )
+
+    bounds = numpy.linspace(0, len(ncfilelist), nparts + 1).astype(int)
+
+    # The partial files retain the variable allow-list together with
+    # the sort key and identity variables such that the final pass may
+    # sort the locations; the bounding box and time window are applied
+    # only to the member files.
+    subset = subset or {}
+    sort = sort or {}
+    partial_subset = dict(subset)
+    final_subset = None
+    if subset.get("variables"):
+        final_subset = {"variables": list(subset["variables"])}
+        partial_subset["variables"] = final_subset["variables"] + list(
+            sort.get("keys") or []
+        )
+        if isinstance(sort.get("unique"), list):
+            partial_subset["variables"] += list(sort["unique"])
+
+    # Stream each partition into a partial file concurrently.
+    fileio_interface.dirpath_tree(path=os.path.dirname(ncfile))
+    partials_list = [
+        f"{ncfile}.{os.getpid()}.partial.{idx:04d}.nc" for idx in range(nparts)
+    ]
+    try:
+        with ProcessPoolExecutor(max_workers=nparts) as executor:
+            futures_list = [
+                executor.submit(
+                    nc_stream,
+                    ncfilelist=ncfilelist[bounds[idx]:bounds[idx + 1]],
+                    ncfile=partial,
+                    ncdim=ncdim,
+                    subset=partial_subset,
+                )
+                for (idx, partial) in enumerate(partials_list)
+            ]
+
+        for future in futures_list:
+            future.result()
+
+        # Concatenate the partial files; the concatenation follows
+        # the same path as a sequential concatenation of the member
+        # files.
+        if subset or layout or sort:
+            nc_stream(
+                ncfilelist=partials_list,
+                ncfile=ncfile,
+                ncdim=ncdim,
+                ncfrmt=ncfrmt,
+                subset=final_subset,
+                layout=layout,
+                sort=sort,
+            )
+
+        else:
+            netcdf4_interface.ncconcat(
+                ncfilelist=partials_list, ncfile=ncfile, ncdim=ncdim, ncfrmt=ncfrmt
+            )
+
+    finally:
+        for partial in partials_list:
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    return ncfile
+
+
+def subset_indices(ncobj: object, ncdim: str, subset: dict) -> numpy.ndarray:
+    """
+    Description
+    -----------
+
+    This function defines the indices, along the concatenation
+    dimension, of the locations within the specified subset; the
+    geographical bounding box and time window masks are evaluated
+    (vectorized) over the concatenation dimension; locations with
+    missing (i.e., fill) coordinate values are excluded.
+
+    Parameters
+    ----------
+
+    ncobj: object
+
+        A Python netCDF4.Dataset object for the respective member
+        file.
+
+    ncdim: str
+
+        A Python string specifying the netCDF concatenation dimension.
+
+    subset: dict
+
+        A Python dictionary containing the subset attributes; the
+        optional key bbox specifies the bounding box [lat_min,
+        lat_max, lon_min, lon_max] (degrees; the longitudes may
+        straddle the dateline, e.g., [-10, 10, 170, -170]) and the
+        optional key time_window specifies the (inclusive) start and
+        stop timestamps (formatted as %Y%m%d%H%M%S); the keys
+        latitude, longitude, and time specify the respective variable
+        names (or group paths) and default to latitude, longitude,
+        and time, respectively.
+
+    Returns
+    -------
+
+    indices: numpy.ndarray
+
+        A Python numpy.ndarray containing the indices of the locations
+        within the subset; if neither a bounding box nor time window
+        is specified, NoneType is returned.
+
+    """
+
+    # Define the mask for the locations within the subset.
+    mask = None
+
+    # Define the geographical bounding box mask; the longitudes are
+    # evaluated relative to the western boundary such that both the
+    # [-180, 180) and [0, 360) conventions are supported.
+    if subset.get("bbox") is not None:
+        (lat_min, lat_max, lon_min, lon_max) = [float(val) for val in subset["bbox"]]
+        (_, lats) = _get_coords(
+            ncobj=ncobj, ncdim=ncdim, path=subset.get("latitude", "latitude")
+        )
+        (_, lons) = _get_coords(
+            ncobj=ncobj, ncdim=ncdim, path=subset.get("longitude", "longitude")
+        )
+        width = lon_max - lon_min
+        if width < 0.0:
+            width = width + 360.0
+        with numpy.errstate(invalid="ignore"):
+            mask = (
+                (lats >= lat_min)
+                & (lats <= lat_max)
+                & (numpy.mod(lons - lon_min, 360.0) <= width)
+            )
+
+    # Define the time window mask; the timestamps are converted to the
+    # units (and calendar) of the respective time variable.
+    if subset.get("time_window") is not None:
+        (ncvar, times) = _get_coords(
+            ncobj=ncobj, ncdim=ncdim, path=subset.get("time", "time")
+        )
+        (start, stop) = [
+            netCDF4.date2num(
+                datetime.strptime(str(timestamp), timestamp_interface.GLOBAL),
+                units=ncvar.units,
+                calendar=ncvar.__dict__.get("calendar", "standard"),
+            )
+            for timestamp in subset["time_window"]
+        ]
+        with numpy.errstate(invalid="ignore"):
+            time_mask = (times >= start) & (times <= stop)
+        mask = time_mask if mask is None else (mask & time_mask)
+
+    if mask is None:
+        return None
+
+    indices = numpy.flatnonzero(mask)
+
+    return indices
+
+
+def sort_order(
+    ncfilelist: list,
+    ncdim: str,
+    indices_list: list,
+    sort: dict,
+    variables_list: list = None,
+) -> numpy.ndarray:
+    """
+    Description
+    -----------
+
+    This function defines the ordering, along the concatenation
+    dimension, of the sorted and/or unique locations; the locations
+    are sorted (stably) by the key variables via numpy.lexsort and
+    exact duplicate locations (i.e., locations whose values are
+    identical for each identity variable) are removed, retaining the
+    first location (in sorted order) of each duplicate; the duplicates
+    are identified by successively refining integer location
+    identifiers via numpy.unique such that only a single variable is
+    held in memory at a time.
+
+    Parameters
+    ----------
+
+    ncfilelist: list
+
+        A Python list of the netCDF-formatted member file paths.
+
+    ncdim: str
+
+        A Python string specifying the netCDF concatenation dimension.
+
+    indices_list: list
+
+        A Python list of Python tuples containing the subset indices
+        (or NoneType for all locations) and the number of locations
+        for each member file.
+
+    sort: dict
+
+        A Python dictionary containing the sort attributes; the
+        optional key keys specifies the list of variable names (or
+        group paths), dimensioned only by the concatenation dimension,
+        by which to sort the locations (the first is the primary key);
+        the optional key unique specifies either a boolean (True
+        identifies duplicates using all variables dependent upon the
+        concatenation dimension) or the list of identity variable
+        names (or group paths).
+
+    Keywords
+    --------
+
+    variables_list: list, optional
+
+        A Python list of the variable names (or group paths) to be
+        written to the concatenated file; if unique is True, only
+        these variables identify duplicates.
+
+    Returns
+    -------
+
+    order: numpy.ndarray
+
+        A Python numpy.ndarray containing the indices, relative to
+        the (subset) concatenated locations, of the locations to be
+        written to the concatenated file.
+
+    Raises
+    ------
+
+    ValueError:
+
+        * raised if a sort key variable is not dimensioned by only
+          the concatenation dimension.
+
+    """
+
+    # Define the identity variables for the duplicate removal.
+    nlocs = sum(count for (_, count) in indices_list)
+    keys = [varpath.strip("/") for varpath in sort.get("keys") or []]
+    unique = sort.get("unique") or []
+    if unique is not True:
+        unique = [varpath.strip("/") for varpath in unique]
+    with netCDF4.Dataset(ncfilelist[0]) as ncobj:
+        ncvars_dict = {
+            f"{path}/{varname}".lstrip("/"): ncvar.dimensions
+            for (path, group) in _walk(ncobj=ncobj)
+            for (varname, ncvar) in group.variables.items()
+            if ncdim in ncvar.dimensions
+            and (
+                not variables_list
+                or {varname, f"{path}/{varname}".lstrip("/")} & set(variables_list)
+            )
+        }
+        if unique is True:
+            unique = list(ncvars_dict)
+        for varpath in keys + unique:
+            ncvars_dict[varpath] = _get_variable(ncobj=ncobj, path=varpath).dimensions
+
+    # Sort the locations by the key variables.
+    keys_list = []
+    for varpath in keys:
+        if ncvars_dict[varpath] != (ncdim,):
+            raise ValueError(
+                f"The sort key variable {varpath} must be dimensioned "
+                f"({ncdim},); received {ncvars_dict[varpath]}."
+            )
+        keys_list.append(
+            _gather(
+                ncfilelist=ncfilelist, indices_list=indices_list, varpath=varpath, axis=0
+            )
+        )
+
+    order = (
+        numpy.lexsort(keys_list[::-1])
+        if keys_list
+        else numpy.arange(nlocs, dtype=numpy.int64)
+    )
+
+    # Identify the exact duplicate locations; the values of each
+    # identity variable are compared (bitwise) as a single row for
+    # each location.
+    if unique and nlocs > 0:
+        ids = numpy.zeros(nlocs, dtype=numpy.int64)
+        for varpath in unique:
+            axis = ncvars_dict[varpath].index(ncdim)
+            values = _gather(
+                ncfilelist=ncfilelist, indices_list=indices_list, varpath=varpath, axis=axis
+            )
+            if values.dtype.kind == "O":
+                values = values.astype(str)
+            rows = numpy.ascontiguousarray(
+                numpy.moveaxis(values, axis, 0).reshape(nlocs, -1)
+            )
+            rows = rows.view(numpy.dtype((numpy.void, rows.dtype.itemsize * rows.shape[1])))
+            (_, inverse) = numpy.unique(rows.ravel(), return_inverse=True)
+            (_, ids) = numpy.unique(ids * nlocs + inverse.ravel(), return_inverse=True)
+            ids = ids.ravel()
+
+        (_, first) = numpy.unique(ids[order], return_index=True)
+        order = order[numpy.sort(first)]
+
+    return order
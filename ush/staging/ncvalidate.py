@@ -0,0 +1,683 @@
+# =========================================================================
+
+# Module: ush/staging/ncvalidate.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    ncvalidate.py
+
+Description
+-----------
+
+    This module contains functions to validate netCDF-formatted member
+    files prior to their concatenation; the header of each member file
+    is read using a pool of processes and each member file is checked
+    for the respective file format (including, for the classic
+    formats, that the file is not truncated), the presence of the
+    concatenation dimension, and the consistency of the variable
+    schema (i.e., the variable paths, data types, and dimensions)
+    with the remaining member files to be concatenated; the reference
+    schema is the schema shared by the most member files.
+
+Functions
+---------
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    member_schema(ncfilename, ncdim)
+
+        This function validates the header of the specified
+        netCDF-formatted member file and returns the respective
+        schema.
+
+    validate_pool(validate_jobs_list, nworkers=None)
+
+        This function validates the netCDF-formatted member files for
+        the specified concatenations using a pool of processes.
+
+Requirements
+------------
+
+- netCDF4; https://github.com/Unidata/netcdf4-python
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import json
+import os
+import struct
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import netCDF4
+from exceptions import StagingError
+
+from staging.ncconcat import _walk, get_nworkers
+from staging.stagelog import msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = ["member_schema", "validate_pool"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the classic (i.e., CDF-1, CDF-2, and CDF-5) file format
+# magic numbers and the size, in bytes, of the respective external
+# data types.
+CLASSIC_MAGIC = b"CDF"
+CLASSIC_VERSIONS_LIST = [1, 2, 5]
+CLASSIC_TYPES_DICT = {1: 1, 2: 1, 3: 2, 4: 4, 5: 4, 6: 8, 7: 1, 8: 2, 9: 4, 10: 8, 11: 8}
+
+# Define the classic file format header list tags.
+NC_DIMENSION = 10
+NC_VARIABLE = 11
+NC_ATTRIBUTE = 12
+
+# Define the classic file format record count for files written in
+# streaming mode (i.e., the record count is not known).
+STREAMING = 0xFFFFFFFF
+
+# ----
+
+
+def _classic_size(ncfilename: str) -> int:
+    """
+    Description
+    -----------
+
+    This function computes the minimum size of the specified classic
+    (i.e., CDF-1, CDF-2, or CDF-5) netCDF-formatted file from the
+    respective header; the netCDF library does not verify the size of
+    classic files upon opening and values read beyond the end of a
+    truncated classic file are returned as zeros.
+
+    Parameters
+    ----------
+
+    ncfilename: str
+
+        A Python string specifying the netCDF-formatted file path.
+
+    Returns
+    -------
+
+    size: int
+
+        A Python integer specifying the minimum size, in bytes, of the
+        file path; if the file path is not a classic netCDF-formatted
+        file or the record count is not known, NoneType is returned.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the classic header is truncated.
+
+    """
+
+    # Read the file format version; proceed accordingly.
+    with open(ncfilename, "rb") as file:
+        magic = file.read(4)
+        if magic[:3] != CLASSIC_MAGIC or magic[3:4] == b"" or magic[3] not in CLASSIC_VERSIONS_LIST:
+            return None
+
+        # The counts are 8-byte integers for CDF-5 files and the
+        # offsets are 8-byte integers for CDF-2 and CDF-5 files.
+        version = magic[3]
+        nbytes = 8 if version == 5 else 4
+        offset_nbytes = 4 if version == 1 else 8
+
+        numrecs = _read_int(file=file, nbytes=nbytes)
+        if numrecs == STREAMING:
+            return None
+
+        # Collect the dimension lengths; a zero length denotes the
+        # record dimension.
+        dims_list = []
+        for _ in range(_read_list(file=file, tag=NC_DIMENSION, nbytes=nbytes)):
+            _read_name(file=file, nbytes=nbytes)
+            dims_list.append(_read_int(file=file, nbytes=nbytes))
+
+        _skip_attrs(file=file, nbytes=nbytes)
+
+        # Collect the number of elements (per record for the record
+        # variables), data type size, padded size, and data offset for
+        # each variable.
+        vars_list = []
+        for _ in range(_read_list(file=file, tag=NC_VARIABLE, nbytes=nbytes)):
+            _read_name(file=file, nbytes=nbytes)
+            dimids = [
+                _read_int(file=file, nbytes=nbytes)
+                for _ in range(_read_int(file=file, nbytes=nbytes))
+            ]
+            _skip_attrs(file=file, nbytes=nbytes)
+            nctype = _read_int(file=file, nbytes=4)
+            vsize = _read_int(file=file, nbytes=nbytes)
+            begin = _read_int(file=file, nbytes=offset_nbytes)
+
+            record = bool(dimids) and dims_list[dimids[0]] == 0
+            nelems = 1
+            for dimid in dimids[int(record):]:
+                nelems = nelems * dims_list[dimid]
+            vars_list.append(
+                (record, nelems * CLASSIC_TYPES_DICT.get(nctype, 1), vsize, begin)
+            )
+
+    # Compute the minimum file size; the records contain the padded
+    # record variables unless the file contains a single record
+    # variable.
+    records_list = [var for var in vars_list if var[0]]
+    recsize = sum(vsize for (_, _, vsize, _) in records_list)
+    if len(records_list) == 1:
+        recsize = records_list[0][1]
+
+    size = 0
+    for (record, datasize, _, begin) in vars_list:
+        if record and numrecs > 0:
+            size = max(size, begin + (numrecs - 1) * recsize + datasize)
+        if not record and datasize > 0:
+            size = max(size, begin + datasize)
+
+    return size
+
+
+def _compare(schema: dict, reference: dict) -> str:
+    """
+    Description
+    -----------
+
+    This function compares the specified member file schema to the
+    specified reference schema.
+
+    Parameters
+    ----------
+
+    schema: dict
+
+        A Python dictionary containing the member file schema (see
+        member_schema).
+
+    reference: dict
+
+        A Python dictionary containing the reference schema.
+
+    Returns
+    -------
+
+    reason: str
+
+        A Python string describing the differences between the
+        schemas; if the schemas are identical, NoneType is returned.
+
+    """
+
+    # Compare the file formats and variables; the classic data model
+    # formats (i.e., the netCDF-3 formats and NETCDF4_CLASSIC) may be
+    # concatenated with one another.
+    reasons_list = []
+    if (schema["format"] == "NETCDF4") != (reference["format"] == "NETCDF4"):
+        reasons_list.append(
+            f"file format {schema['format']} differs from {reference['format']}"
+        )
+
+    (variables, reference_variables) = (schema["variables"], reference["variables"])
+    missing_list = sorted(set(reference_variables) - set(variables))
+    if missing_list:
+        reasons_list.append(f"variable(s) {missing_list} are missing")
+
+    extra_list = sorted(set(variables) - set(reference_variables))
+    if extra_list:
+        reasons_list.append(f"variable(s) {extra_list} are not within the other members")
+
+    differ_list = sorted(
+        varpath
+        for varpath in set(variables) & set(reference_variables)
+        if variables[varpath] != reference_variables[varpath]
+    )
+    if differ_list:
+        reasons_list.append(
+            f"variable(s) {differ_list} differ in data type and/or dimensions"
+        )
+
+    if not reasons_list:
+        return None
+
+    return "; ".join(reasons_list)
+
+
+def _probe(ncfilename: str, ncdim: str) -> tuple:
+    """
+    Description
+    -----------
+
+    This function validates the specified netCDF-formatted member
+    file (see member_schema); the exception (if any) is returned to
+    the calling application rather than raised.
+
+    Parameters
+    ----------
+
+    ncfilename: str
+
+        A Python string specifying the netCDF-formatted member file
+        path.
+
+    ncdim: str
+
+        A Python string specifying the concatenation dimension.
+
+    Returns
+    -------
+
+    (schema, reason): tuple
+
+        A Python tuple containing the member file schema (or NoneType
+        if the member file is not valid) and the reason the member
+        file is not valid (or NoneType).
+
+    """
+
+    # Validate the member file.
+    try:
+        return (member_schema(ncfilename=ncfilename, ncdim=ncdim), None)
+
+    except Exception as exc:  # pylint: disable=broad-except
+        return (None, str(exc).strip())
+
+
+def _read_int(file: object, nbytes: int) -> int:
+    """
+    Description
+    -----------
+
+    This function reads a (big-endian) unsigned integer from the
+    specified classic file format header.
+
+    Parameters
+    ----------
+
+    file: object
+
+        A Python file object positioned within the header.
+
+    nbytes: int
+
+        A Python integer specifying the size, in bytes, of the
+        integer.
+
+    Returns
+    -------
+
+    value: int
+
+        A Python integer specifying the value read from the header.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the header is truncated.
+
+    """
+
+    # Read the integer value.
+    buffer = file.read(nbytes)
+    if len(buffer) != nbytes:
+        msg = f"The classic header of {file.name} is truncated."
+        error(msg=msg)
+
+    (value,) = struct.unpack(">Q" if nbytes == 8 else ">I", buffer)
+
+    return value
+
+
+def _read_list(file: object, tag: int, nbytes: int) -> int:
+    """
+    Description
+    -----------
+
+    This function reads the tag and number of elements of the
+    specified classic file format header list.
+
+    Parameters
+    ----------
+
+    file: object
+
+        A Python file object positioned within the header.
+
+    tag: int
+
+        A Python integer specifying the expected list tag.
+
+    nbytes: int
+
+        A Python integer specifying the size, in bytes, of the number
+        of elements.
+
+    Returns
+    -------
+
+    nelems: int
+
+        A Python integer specifying the number of list elements.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the list tag is not valid.
+
+    """
+
+    # Read the list tag and the number of elements; an absent list is
+    # specified by zero-valued tag and number of elements.
+    value = _read_int(file=file, nbytes=4)
+    nelems = _read_int(file=file, nbytes=nbytes)
+    if value not in [0, tag]:
+        msg = f"The classic header of {file.name} is not valid."
+        error(msg=msg)
+
+    return nelems
+
+
+def _read_name(file: object, nbytes: int) -> None:
+    """
+    Description
+    -----------
+
+    This function skips a (padded) name within the specified classic
+    file format header.
+
+    Parameters
+    ----------
+
+    file: object
+
+        A Python file object positioned within the header.
+
+    nbytes: int
+
+        A Python integer specifying the size, in bytes, of the name
+        length.
+
+    """
+
+    # Skip the name and the respective padding.
+    nchars = _read_int(file=file, nbytes=nbytes)
+    file.seek(nchars + (-nchars % 4), os.SEEK_CUR)
+
+
+def _skip_attrs(file: object, nbytes: int) -> None:
+    """
+    Description
+    -----------
+
+    This function skips an attribute list within the specified
+    classic file format header.
+
+    Parameters
+    ----------
+
+    file: object
+
+        A Python file object positioned within the header.
+
+    nbytes: int
+
+        A Python integer specifying the size, in bytes, of the
+        counts.
+
+    """
+
+    # Skip the name and (padded) values of each attribute.
+    for _ in range(_read_list(file=file, tag=NC_ATTRIBUTE, nbytes=nbytes)):
+        _read_name(file=file, nbytes=nbytes)
+        nctype = _read_int(file=file, nbytes=4)
+        size = _read_int(file=file, nbytes=nbytes) * CLASSIC_TYPES_DICT.get(nctype, 1)
+        file.seek(size + (-size % 4), os.SEEK_CUR)
+
+
+def member_schema(ncfilename: str, ncdim: str) -> dict:
+    """
+    Description
+    -----------
+
+    This function validates the header of the specified
+    netCDF-formatted member file; the member file must be readable by
+    the netCDF library, must not be truncated (classic formats only;
+    the netCDF library does not open truncated netCDF-4 files), and
+    must define the concatenation dimension within the root group or
+    a child group.
+
+    Parameters
+    ----------
+
+    ncfilename: str
+
+        A Python string specifying the netCDF-formatted member file
+        path.
+
+    ncdim: str
+
+        A Python string specifying the concatenation dimension.
+
+    Returns
+    -------
+
+    schema: dict
+
+        A Python dictionary containing the file format (i.e., data
+        model) and the data type and dimensions for each variable
+        path of the member file.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the member file cannot be opened, is truncated,
+          or does not define the concatenation dimension.
+
+    """
+
+    # Check that the member file is not truncated.
+    size = _classic_size(ncfilename=ncfilename)
+    if size is not None and os.path.getsize(ncfilename) < size:
+        msg = (
+            f"The netCDF-formatted file path {ncfilename} is truncated; "
+            f"the file size is {os.path.getsize(ncfilename)} bytes and the "
+            f"header requires {size} bytes."
+        )
+        error(msg=msg)
+
+    # Collect the member file schema.
+    try:
+        with netCDF4.Dataset(ncfilename) as ncobj:
+            groups_list = _walk(ncobj=ncobj)
+            if not any(ncdim in group.dimensions for (_, group) in groups_list):
+                msg = (
+                    f"The netCDF-formatted file path {ncfilename} does not "
+                    f"define the concatenation dimension {ncdim}."
+                )
+                error(msg=msg)
+
+            schema = {
+                "format": ncobj.data_model,
+                "variables": {
+                    f"{path}/{varname}".lstrip("/"): [str(ncvar.dtype), list(ncvar.dimensions)]
+                    for (path, group) in groups_list
+                    for (varname, ncvar) in group.variables.items()
+                },
+            }
+
+    except OSError as exc:
+        msg = f"The netCDF-formatted file path {ncfilename} cannot be opened ({exc})."
+        error(msg=msg)
+
+    return schema
+
+
+def validate_pool(validate_jobs_list: list, nworkers: int = None) -> list:
+    """
+    Description
+    -----------
+
+    This function validates the netCDF-formatted member files for the
+    specified concatenations using a pool of processes (see
+    member_schema); the member files of all concatenations are
+    validated by a single pool of processes and the schema of each
+    valid member file is then compared to the reference schema (i.e.,
+    the schema shared by the most member files, where ties are
+    resolved by the member file order) of the respective
+    concatenation.
+
+    Parameters
+    ----------
+
+    validate_jobs_list: list
+
+        A Python list of Python dictionaries, each containing the
+        member file paths (ncfilelist) and the concatenation dimension
+        (ncdim) of a concatenation.
+
+    Keywords
+    --------
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of processes; if
+        NoneType, the number of processes available to the respective
+        application is used.
+
+    Returns
+    -------
+
+    invalid_list: list
+
+        A Python list, ordered identically to validate_jobs_list, of
+        Python dictionaries containing the reason each invalid member
+        file (i.e., key) is not valid; the dictionaries are empty if
+        all member files are valid.
+
+    """
+
+    # Validate the headers of all member files.
+    members_list = [
+        (ncfilename, validate_job["ncdim"])
+        for validate_job in validate_jobs_list
+        for ncfilename in validate_job["ncfilelist"]
+    ]
+    nworkers = min(get_nworkers(nworkers=nworkers), max(len(members_list), 1))
+
+    if nworkers <= 1:
+        results_list = [_probe(ncfilename, ncdim) for (ncfilename, ncdim) in members_list]
+
+    if nworkers > 1:
+        with ProcessPoolExecutor(max_workers=nworkers) as executor:
+            results_list = list(
+                executor.map(
+                    _probe,
+                    [ncfilename for (ncfilename, _) in members_list],
+                    [ncdim for (_, ncdim) in members_list],
+                )
+            )
+
+    # Compare the schema of each valid member file to the reference
+    # schema of the respective concatenation.
+    invalid_list = []
+    offset = 0
+    for validate_job in validate_jobs_list:
+        nmembers = len(validate_job["ncfilelist"])
+        job_results_list = results_list[offset:offset + nmembers]
+        offset = offset + nmembers
+
+        invalid_dict = {
+            ncfilename: reason
+            for (ncfilename, (_, reason)) in zip(validate_job["ncfilelist"], job_results_list)
+            if reason is not None
+        }
+        schemas_list = [
+            (ncfilename, schema)
+            for (ncfilename, (schema, _)) in zip(validate_job["ncfilelist"], job_results_list)
+            if schema is not None
+        ]
+
+        if schemas_list:
+            counts = Counter(
+                json.dumps(schema, sort_keys=True) for (_, schema) in schemas_list
+            )
+            reference = json.loads(counts.most_common(1)[0][0])
+            for (ncfilename, schema) in schemas_list:
+                reason = _compare(schema=schema, reference=reference)
+                if reason is not None:
+                    invalid_dict[ncfilename] = reason
+
+        invalid_list.append(invalid_dict)
+
+    return invalid_list
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -0,0 +1,734 @@
+# =========================================================================
+
+# Module: ush/staging/ncvirtual.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    ncvirtual.py
+
+Description
+-----------
+
+    This module contains classes and functions for the virtual
+    aggregation of netCDF-formatted member files; rather than copying
+    the member files into a concatenated file, a (JSON-formatted)
+    aggregation index containing the member file paths, the offsets of
+    each member file along the concatenation dimension, and the
+    variable metadata is written; the reader (VirtualDataset) exposes
+    the aggregation as a single dataset and reads only the requested
+    slices of the respective member files.
+
+    Variables stored contiguously and uncompressed within HDF5-based
+    (i.e., netCDF-4) member files are read via memory-mapped arrays;
+    the file offsets of such variables are determined using h5py (if
+    available); all other variables are read (lazily) via netCDF4. The
+    values returned by the reader are not masked or scaled; the
+    variable attributes (e.g., _FillValue, scale_factor) are available
+    via the attrs attribute of the respective variable.
+
+Classes
+-------
+
+    VirtualDataset(index_path, check=True)
+
+        This is the base-class object for the virtual aggregation
+        reader.
+
+    VirtualVariable(dataset, varpath)
+
+        This is the base-class object for a variable within the
+        virtual aggregation.
+
+Functions
+---------
+
+    build_index(ncfilelist, ncfile, ncdim)
+
+        This function writes the virtual aggregation index for the
+        specified netCDF-formatted member files.
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+Requirements
+------------
+
+- h5py (optional); https://www.h5py.org/
+
+- netCDF4; https://github.com/Unidata/netcdf4-python
+
+- numpy; https://numpy.org/
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import json
+import os
+
+import netCDF4
+import numpy
+from exceptions import StagingError
+from tools import fileio_interface
+
+from staging.stagelog import msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = ["VirtualDataset", "VirtualVariable", "build_index"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the virtual aggregation index format version.
+INDEX_VERSION = 1
+
+# ----
+
+
+def _get_offsets(ncfilename: str, varpaths_list: list) -> dict:
+    """
+    Description
+    -----------
+
+    This function determines the file offsets, in bytes, of the
+    specified variables which are stored contiguously and uncompressed
+    within the respective HDF5-based member file; if h5py is not
+    available or the member file is not HDF5-based, an empty
+    dictionary is returned.
+
+    Parameters
+    ----------
+
+    ncfilename: str
+
+        A Python string specifying the netCDF-formatted member file
+        path.
+
+    varpaths_list: list
+
+        A Python list of variable paths relative to the root group.
+
+    Returns
+    -------
+
+    offsets_dict: dict
+
+        A Python dictionary containing the file offset and
+        (byte-ordered) data type for each memory-mappable variable.
+
+    """
+
+    # Collect the file offsets of the memory-mappable variables;
+    # proceed accordingly.
+    # pylint: disable=import-outside-toplevel
+    try:
+        import h5py
+
+    except ImportError:
+        return {}
+
+    offsets_dict = {}
+    try:
+        with h5py.File(ncfilename, "r") as h5obj:
+            for varpath in varpaths_list:
+                dset = h5obj.get(varpath)
+                if dset is None or dset.dtype.kind not in "biuf":
+                    continue
+                offset = dset.id.get_offset()
+                if offset is not None:
+                    offsets_dict[varpath] = {
+                        "offset": int(offset),
+                        "dtype": dset.dtype.str,
+                    }
+
+    except OSError:
+        return {}
+
+    return offsets_dict
+
+
+def _jsonify(value: object) -> object:
+    """
+    Description
+    -----------
+
+    This function converts the specified netCDF attribute value to a
+    JSON-serializable value.
+
+    Parameters
+    ----------
+
+    value: object
+
+        A Python object specifying the netCDF attribute value.
+
+    Returns
+    -------
+
+    value: object
+
+        A Python object specifying the JSON-serializable value.
+
+    """
+
+    # Convert the attribute value.
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    if isinstance(value, (numpy.ndarray, numpy.generic)):
+        return value.tolist()
+
+    return value
+
+
+def _walk(ncobj: object, path: str = "") -> list:
+    """
+    Description
+    -----------
+
+    This function returns the variables, within the specified netCDF
+    object and all child groups, and their respective paths relative
+    to the root group.
+
+    Parameters
+    ----------
+
+    ncobj: object
+
+        A Python netCDF4.Dataset or netCDF4.Group object.
+
+    Keywords
+    --------
+
+    path: str, optional
+
+        A Python string specifying the path of ncobj relative to the
+        root group.
+
+    Returns
+    -------
+
+    ncvars_list: list
+
+        A Python list of Python tuples containing the path and
+        netCDF4.Variable object for each variable.
+
+    """
+
+    # Collect the variables within the respective group and all child
+    # groups.
+    ncvars_list = [
+        (f"{path}/{varname}".lstrip("/"), ncvar)
+        for (varname, ncvar) in ncobj.variables.items()
+    ]
+    for (name, group) in ncobj.groups.items():
+        ncvars_list.extend(_walk(ncobj=group, path=f"{path}/{name}".lstrip("/")))
+
+    return ncvars_list
+
+
+# ----
+
+
+class VirtualDataset:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the virtual aggregation reader;
+    the member files are opened on demand and remain open until the
+    respective object is closed; the object may be used as a context
+    manager.
+
+    Parameters
+    ----------
+
+    index_path: str
+
+        A Python string specifying the virtual aggregation index file
+        path.
+
+    Keywords
+    --------
+
+    check: bool, optional
+
+        A Python boolean valued variable specifying whether to check
+        that the member files have not been modified since the
+        aggregation index was written.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if a member file does not exist or has been modified
+          since the aggregation index was written.
+
+    """
+
+    def __init__(self, index_path: str, check: bool = True):
+        """
+        Description
+        -----------
+
+        Creates a new VirtualDataset object.
+
+        """
+
+        # Define the base-class attributes.
+        with open(index_path, "r", encoding="utf-8") as file:
+            self.index = json.load(file)
+
+        self.ncdim = self.index["ncdim"]
+        self.members_list = self.index["members"]
+        self.offsets = numpy.array(
+            [member["offset"] for member in self.members_list], dtype=numpy.int64
+        )
+        self.dimensions = dict(self.index["dimensions"])
+        self.attrs = self.index["attrs"]
+        self.ncobjs_dict = {}
+        self.memmaps_dict = {}
+
+        # Check that the member files are unchanged; proceed
+        # accordingly.
+        if check:
+            for member in self.members_list:
+                if not fileio_interface.fileexist(path=member["path"]):
+                    msg = (
+                        f"The virtual aggregation member file {member['path']} "
+                        "does not exist. Aborting!!!"
+                    )
+                    error(msg=msg)
+
+                stat = os.stat(member["path"])
+                if (stat.st_size, stat.st_mtime_ns) != (
+                    member["size"],
+                    member["mtime_ns"],
+                ):
+                    msg = (
+                        f"The virtual aggregation member file {member['path']} "
+                        f"has been modified since the index {index_path} was "
+                        "written. Aborting!!!"
+                    )
+                    error(msg=msg)
+
+        self.variables = {
+            varpath: VirtualVariable(dataset=self, varpath=varpath)
+            for varpath in self.index["variables"]
+        }
+
+    def __enter__(self) -> object:
+        """
+        Description
+        -----------
+
+        This method returns the respective object for use as a
+        context manager.
+
+        """
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Description
+        -----------
+
+        This method closes the respective object upon exiting the
+        context manager.
+
+        """
+
+        self.close()
+
+    def __getitem__(self, varpath: str) -> object:
+        """
+        Description
+        -----------
+
+        This method returns the virtual variable corresponding to the
+        specified variable path (e.g., MetaData/latitude).
+
+        """
+
+        return self.variables[varpath.strip("/")]
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+
+        This method closes the opened member files and removes the
+        memory-mapped arrays.
+
+        """
+
+        # Close the member files.
+        for ncobj in self.ncobjs_dict.values():
+            ncobj.close()
+
+        self.ncobjs_dict = {}
+        self.memmaps_dict = {}
+
+    def read(self, member: int, varpath: str, key: tuple) -> numpy.ndarray:
+        """
+        Description
+        -----------
+
+        This method reads the specified slice of the respective
+        variable from the specified member file; the variable is
+        memory-mapped if the aggregation index contains its file
+        offset and read via netCDF4 otherwise.
+
+        Parameters
+        ----------
+
+        member: int
+
+            A Python integer specifying the member file index.
+
+        varpath: str
+
+            A Python string specifying the variable path relative to
+            the root group.
+
+        key: tuple
+
+            A Python tuple specifying the slice of the variable within
+            the member file.
+
+        Returns
+        -------
+
+        values: numpy.ndarray
+
+            A Python numpy.ndarray containing the variable values.
+
+        """
+
+        # Read the respective variable slice; proceed accordingly.
+        member_dict = self.members_list[member]
+        mmap_dict = member_dict["memmaps"].get(varpath)
+        if mmap_dict is not None:
+            if (member, varpath) not in self.memmaps_dict:
+                self.memmaps_dict[(member, varpath)] = numpy.memmap(
+                    member_dict["path"],
+                    dtype=numpy.dtype(mmap_dict["dtype"]),
+                    mode="r",
+                    offset=mmap_dict["offset"],
+                    shape=tuple(mmap_dict["shape"]),
+                )
+            return numpy.asarray(self.memmaps_dict[(member, varpath)][key])
+
+        if member not in self.ncobjs_dict:
+            ncobj = netCDF4.Dataset(member_dict["path"])
+            ncobj.set_auto_maskandscale(False)
+            self.ncobjs_dict[member] = ncobj
+
+        values = numpy.asarray(self.ncobjs_dict[member][varpath][key])
+
+        return values
+
+
+class VirtualVariable:
+    """
+    Description
+    -----------
+
+    This is the base-class object for a variable within the virtual
+    aggregation; the variable supports NumPy basic indexing (i.e.,
+    integers and slices) for all dimensions and, additionally, integer
+    and boolean arrays along the concatenation dimension; only the
+    member files (and slices thereof) containing the requested
+    locations are read.
+
+    Parameters
+    ----------
+
+    dataset: object
+
+        A Python VirtualDataset object.
+
+    varpath: str
+
+        A Python string specifying the variable path relative to the
+        root group.
+
+    """
+
+    def __init__(self, dataset: object, varpath: str):
+        """
+        Description
+        -----------
+
+        Creates a new VirtualVariable object.
+
+        """
+
+        # Define the base-class attributes.
+        var_dict = dataset.index["variables"][varpath]
+        self.dataset = dataset
+        self.varpath = varpath
+        self.dimensions = tuple(var_dict["dimensions"])
+        self.shape = tuple(var_dict["shape"])
+        self.dtype = var_dict["dtype"]
+        self.attrs = var_dict["attrs"]
+        self.axis = (
+            self.dimensions.index(dataset.ncdim)
+            if dataset.ncdim in self.dimensions
+            else None
+        )
+
+    def __getitem__(self, key: object) -> numpy.ndarray:
+        """
+        Description
+        -----------
+
+        This method reads the specified slice of the respective
+        variable.
+
+        """
+
+        # Define the key for each dimension.
+        key = key if isinstance(key, tuple) else (key,)
+        if any(dimkey is Ellipsis for dimkey in key):
+            index = [dimkey is Ellipsis for dimkey in key].index(True)
+            key = (
+                key[:index]
+                + (slice(None),) * (len(self.shape) - len(key) + 1)
+                + key[(index + 1):]
+            )
+        key = key + (slice(None),) * (len(self.shape) - len(key))
+
+        # Variables not dependent upon the concatenation dimension are
+        # read from the first member file.
+        if self.axis is None:
+            return self.dataset.read(member=0, varpath=self.varpath, key=key)
+
+        # Define the locations along the concatenation dimension.
+        nlocs = self.shape[self.axis]
+        axis_key = key[self.axis]
+        scalar = isinstance(axis_key, (int, numpy.integer))
+        if scalar:
+            positions = numpy.array([axis_key % nlocs], dtype=numpy.int64)
+        elif isinstance(axis_key, slice):
+            positions = numpy.arange(*axis_key.indices(nlocs), dtype=numpy.int64)
+        else:
+            positions = numpy.asarray(axis_key)
+            if positions.dtype == bool:
+                positions = numpy.flatnonzero(positions)
+            positions = numpy.mod(positions.astype(numpy.int64), nlocs)
+
+        # Read the runs of consecutive locations within the same member
+        # file; the locations are read as a single (bounding) slice of
+        # each member file and gathered accordingly.
+        axis_out = self.axis - sum(
+            isinstance(dimkey, (int, numpy.integer)) for dimkey in key[: self.axis]
+        )
+        members = (
+            numpy.searchsorted(self.dataset.offsets, positions, side="right") - 1
+        )
+        bounds = numpy.flatnonzero(numpy.diff(members)) + 1
+        runs_list = (
+            list(zip(numpy.r_[0, bounds], numpy.r_[bounds, len(positions)]))
+            if len(positions) > 0
+            else []
+        )
+        values_list = []
+        for (start, stop) in runs_list:
+            member = int(members[start])
+            local = positions[start:stop] - self.dataset.offsets[member]
+            (lower, upper) = (int(local.min()), int(local.max()) + 1)
+            member_key = list(key)
+            member_key[self.axis] = slice(lower, upper)
+            values = self.dataset.read(
+                member=member, varpath=self.varpath, key=tuple(member_key)
+            )
+            if not (upper - lower == len(local) and numpy.all(numpy.diff(local) > 0)):
+                values = numpy.take(values, local - lower, axis=axis_out)
+            values_list.append(values)
+
+        if not values_list:
+            member_key = list(key)
+            member_key[self.axis] = slice(0, 0)
+            values_list.append(
+                self.dataset.read(member=0, varpath=self.varpath, key=tuple(member_key))
+            )
+
+        values = numpy.concatenate(values_list, axis=axis_out)
+        if scalar:
+            values = numpy.take(values, 0, axis=axis_out)
+
+        return values
+
+
+# ----
+
+
+def build_index(ncfilelist: list, ncfile: str, ncdim: str) -> str:
+    """
+    Description
+    -----------
+
+    This function writes the virtual aggregation index for the
+    specified netCDF-formatted member files; the variables and
+    dimensions are defined from the first member file and the index
+    is written to a temporary file path which is renamed upon
+    completion.
+
+    Parameters
+    ----------
+
+    ncfilelist: list
+
+        A Python list of the netCDF-formatted member file paths.
+
+    ncfile: str
+
+        A Python string specifying the virtual aggregation index file
+        path.
+
+    ncdim: str
+
+        A Python string specifying the netCDF dimension along which to
+        aggregate the member files.
+
+    Returns
+    -------
+
+    ncfile: str
+
+        A Python string specifying the virtual aggregation index file
+        path.
+
+    """
+
+    # Define the variable metadata from the first member file.
+    with netCDF4.Dataset(ncfilelist[0]) as ncobj:
+        index_dict = {
+            "version": INDEX_VERSION,
+            "ncdim": ncdim,
+            "attrs": {
+                attr: _jsonify(ncobj.getncattr(attr)) for attr in ncobj.ncattrs()
+            },
+            "dimensions": {
+                dimname: len(dim) for (dimname, dim) in ncobj.dimensions.items()
+            },
+            "variables": {},
+            "members": [],
+        }
+        for (varpath, ncvar) in _walk(ncobj=ncobj):
+            index_dict["variables"][varpath] = {
+                "dimensions": list(ncvar.dimensions),
+                "shape": list(ncvar.shape),
+                "dtype": "str" if ncvar.dtype is str else numpy.dtype(ncvar.dtype).str,
+                "attrs": {
+                    attr: _jsonify(ncvar.getncattr(attr)) for attr in ncvar.ncattrs()
+                },
+            }
+
+    # Define the offset of each member file along the aggregation
+    # dimension and the memory-mappable variables of each member
+    # file.
+    offset = 0
+    for ncfilename in ncfilelist:
+        with netCDF4.Dataset(ncfilename) as ncobj:
+            count = len(ncobj.dimensions[ncdim])
+            shapes_dict = {
+                varpath: list(ncvar.shape) for (varpath, ncvar) in _walk(ncobj=ncobj)
+            }
+
+        memmaps_dict = _get_offsets(
+            ncfilename=ncfilename, varpaths_list=list(index_dict["variables"])
+        )
+        for (varpath, mmap_dict) in memmaps_dict.items():
+            mmap_dict["shape"] = shapes_dict[varpath]
+
+        stat = os.stat(ncfilename)
+        index_dict["members"].append(
+            {
+                "path": os.path.abspath(ncfilename),
+                "offset": offset,
+                "count": count,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "memmaps": memmaps_dict,
+            }
+        )
+        offset = offset + count
+
+    # Define the shape of the variables dependent upon the aggregation
+    # dimension.
+    index_dict["dimensions"][ncdim] = offset
+    for var_dict in index_dict["variables"].values():
+        for (axis, dimname) in enumerate(var_dict["dimensions"]):
+            if dimname == ncdim:
+                var_dict["shape"][axis] = offset
+
+    # Write the virtual aggregation index.
+    ncfile_tmp = f"{ncfile}.{os.getpid()}.tmp"
+    with open(ncfile_tmp, "w", encoding="utf-8") as file:
+        json.dump(index_dict, file, indent=1)
+    os.replace(ncfile_tmp, ncfile)
+
+    return ncfile
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
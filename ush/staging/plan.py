@@ -0,0 +1,448 @@
+# =========================================================================
+
+# Module: ush/staging/plan.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    plan.py
+
+Description
+-----------
+
+    This module contains functions to write and read precompiled
+    fetch plans; a fetch plan contains the validated file identifier
+    attributes, the timestamps, and the rendered local and remote file
+    paths for each file identifier for a respective forecast cycle
+    such that the fetch application does not need to parse and
+    evaluate the YAML-formatted configuration file(s).
+
+    The fetch attributes of the fetch plan are organized identically
+    to the fetch YAML-block of the experiment configuration (i.e.,
+    platform/interface, fetching type, and file identifier) and may
+    therefore be filtered by fetching type and file identifier
+    directly; the fetch plan also contains the experiment attributes
+    (see launch.Launch) such that the experiment configuration files
+    are not built by a fetch application using the fetch plan.
+
+Functions
+---------
+
+    build_fileid_dict(fileid_obj, attrs_list)
+
+        This function builds a Python dictionary containing the
+        specified attributes of a compiled file identifier object.
+
+    build_fileid_obj(fileid_dict)
+
+        This function builds a file identifier Python object from a
+        compiled file identifier Python dictionary.
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    is_compiled(fileid_dict)
+
+        This function determines whether a file identifier Python
+        dictionary has been collected from a precompiled fetch plan.
+
+    plan_filepath(com_root, expt_name, cycle)
+
+        This function defines the default fetch plan file path for the
+        respective experiment and forecast cycle.
+
+    read_plan(plan_file, cycle)
+
+        This function reads and validates a fetch plan.
+
+    write_plan(plan_file, plan_dict, cycle, yaml_file, launch_dict=None)
+
+        This function writes a fetch plan.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import json
+import os
+
+from exceptions import StagingError
+from tools import datetime_interface, fileio_interface, parser_interface
+from utils import timestamp_interface
+
+from staging.stagelog import msg_except_handle
+
+# ----
+
+# Define all available functions.
+__all__ = [
+    "build_fileid_dict",
+    "build_fileid_obj",
+    "is_compiled",
+    "plan_filepath",
+    "read_plan",
+    "write_plan",
+]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the fetch plan format version.
+PLAN_VERSION = 2
+
+# Define the compiled file identifier attributes.
+PLAN_ATTRS_LIST = ["filepaths_list", "timestamps_list"]
+
+# Define the experiment attributes (see launch.Launch).
+PLAN_LAUNCH_ATTRS_LIST = ["com_root", "expt_name", "itrc_root", "work_path"]
+
+# ----
+
+
+def build_fileid_dict(fileid_obj: object, attrs_list: list) -> dict:
+    """
+    Description
+    -----------
+
+    This function builds a Python dictionary containing the specified
+    attributes of a compiled file identifier object.
+
+    Parameters
+    ----------
+
+    fileid_obj: object
+
+        A Python object containing the attributes collected from the
+        experiment configuration for the respective file identifier;
+        this object must contain the compiled attributes
+        timestamps_list and filepaths_list.
+
+    attrs_list: list
+
+        A Python list of the file identifier attributes to be
+        included in the fetch plan.
+
+    Returns
+    -------
+
+    fileid_dict: dict
+
+        A Python dictionary containing the compiled file identifier
+        attributes.
+
+    """
+
+    # Define the compiled file identifier attributes.
+    fileid_dict = {}
+    for attr in list(attrs_list) + PLAN_ATTRS_LIST:
+        fileid_dict[attr] = parser_interface.object_getattr(
+            object_in=fileid_obj, key=attr, force=True
+        )
+
+    return fileid_dict
+
+
+def build_fileid_obj(fileid_dict: dict) -> object:
+    """
+    Description
+    -----------
+
+    This function builds a file identifier Python object from a
+    compiled file identifier Python dictionary.
+
+    Parameters
+    ----------
+
+    fileid_dict: dict
+
+        A Python dictionary containing the compiled file identifier
+        attributes.
+
+    Returns
+    -------
+
+    fileid_obj: object
+
+        A Python object containing the compiled file identifier
+        attributes.
+
+    """
+
+    # Define the file identifier object.
+    fileid_obj = parser_interface.object_define()
+    for (attr, value) in fileid_dict.items():
+        fileid_obj = parser_interface.object_setattr(
+            object_in=fileid_obj, key=attr, value=value
+        )
+
+    return fileid_obj
+
+
+def is_compiled(fileid_dict: dict) -> bool:
+    """
+    Description
+    -----------
+
+    This function determines whether a file identifier Python
+    dictionary has been collected from a precompiled fetch plan.
+
+    Parameters
+    ----------
+
+    fileid_dict: dict
+
+        A Python dictionary containing the file identifier
+        attributes.
+
+    Returns
+    -------
+
+    compiled: bool
+
+        A Python boolean valued variable specifying whether the file
+        identifier attributes are precompiled.
+
+    """
+
+    # Check that all compiled attributes are defined.
+    compiled = all(attr in fileid_dict for attr in PLAN_ATTRS_LIST)
+
+    return compiled
+
+
+def plan_filepath(com_root: str, expt_name: str, cycle: str) -> str:
+    """
+    Description
+    -----------
+
+    This function defines the default fetch plan file path for the
+    respective experiment and forecast cycle.
+
+    Parameters
+    ----------
+
+    com_root: str
+
+        A Python string specifying the experiment /com path for the
+        respective forecast cycle.
+
+    expt_name: str
+
+        A Python string specifying the experiment name.
+
+    cycle: str
+
+        A Python string specifying the forecast cycle.
+
+    Returns
+    -------
+
+    plan_file: str
+
+        A Python string specifying the fetch plan file path.
+
+    """
+
+    # Define the fetch plan file path.
+    plan_file = os.path.join(com_root, f"fetch_plan.{expt_name}.{cycle}.json")
+
+    return plan_file
+
+
+def read_plan(plan_file: str, cycle: str) -> dict:
+    """
+    Description
+    -----------
+
+    This function reads and validates a fetch plan.
+
+    Parameters
+    ----------
+
+    plan_file: str
+
+        A Python string specifying the path to the fetch plan.
+
+    cycle: str
+
+        A Python string specifying the forecast cycle; this value must
+        match the forecast cycle for which the fetch plan was
+        compiled.
+
+    Returns
+    -------
+
+    plan_dict: dict
+
+        A Python dictionary containing the fetch plan; the fetch key
+        contains the compiled fetch configuration attributes, which
+        are organized identically to the fetch YAML-block of the
+        experiment configuration, and the launch key contains the
+        experiment attributes.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the fetch plan file path does not exist.
+
+        * raised if the fetch plan format version is not supported.
+
+        * raised if the fetch plan was compiled for a forecast cycle
+          other than that specified upon entry.
+
+    """
+
+    # Check that the fetch plan exists; proceed accordingly.
+    if not fileio_interface.fileexist(path=plan_file):
+        msg = f"The fetch plan {plan_file} does not exist. Aborting!!!"
+        error(msg=msg)
+
+    with open(plan_file, "r", encoding="utf-8") as file:
+        plan_dict = json.load(file)
+
+    # Check that the fetch plan is valid for the respective forecast
+    # cycle; proceed accordingly.
+    if plan_dict.get("version") != PLAN_VERSION:
+        msg = (
+            f"The fetch plan {plan_file} version {plan_dict.get('version')} "
+            f"is not supported; expected version {PLAN_VERSION}. Aborting!!!"
+        )
+        error(msg=msg)
+
+    if str(plan_dict.get("cycle")) != str(cycle):
+        msg = (
+            f"The fetch plan {plan_file} was compiled for forecast cycle "
+            f"{plan_dict.get('cycle')} and cannot be used for forecast "
+            f"cycle {cycle}. Aborting!!!"
+        )
+        error(msg=msg)
+
+    return plan_dict
+
+
+def write_plan(
+    plan_file: str, plan_dict: dict, cycle: str, yaml_file: str, launch_dict: dict = None
+) -> None:
+    """
+    Description
+    -----------
+
+    This function writes a fetch plan; the fetch plan is first
+    written to a temporary file path and then renamed such that a
+    partially written fetch plan is never collected by a fetch
+    application.
+
+    Parameters
+    ----------
+
+    plan_file: str
+
+        A Python string specifying the path to the fetch plan.
+
+    plan_dict: dict
+
+        A Python dictionary containing the compiled fetch
+        configuration attributes.
+
+    cycle: str
+
+        A Python string specifying the forecast cycle for which the
+        fetch plan was compiled.
+
+    yaml_file: str
+
+        A Python string specifying the YAML-formatted configuration
+        file from which the fetch plan was compiled.
+
+    Keywords
+    --------
+
+    launch_dict: dict, optional
+
+        A Python dictionary containing the experiment attributes (see
+        launch.Launch).
+
+    """
+
+    # Define the fetch plan attributes.
+    timestamp = datetime_interface.current_date(
+        frmttyp=timestamp_interface.INFO, is_utc=True
+    )
+    plan_out_dict = {
+        "version": PLAN_VERSION,
+        "cycle": str(cycle),
+        "yaml_file": yaml_file,
+        "created": timestamp,
+        "launch": launch_dict,
+        "fetch": plan_dict,
+    }
+
+    # Write the fetch plan.
+    fileio_interface.dirpath_tree(path=os.path.dirname(plan_file))
+    tmp_plan_file = f"{plan_file}.{os.getpid()}.tmp"
+    with open(tmp_plan_file, "w", encoding="utf-8") as file:
+        json.dump(plan_out_dict, file, separators=(",", ":"))
+
+    os.replace(tmp_plan_file, plan_file)
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -0,0 +1,538 @@
+# =========================================================================
+
+# Module: ush/staging/prefetch.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    prefetch.py
+
+Description
+-----------
+
+    This module contains classes and methods relative to the prefetch
+    application; the files for the forecast cycles following the
+    respective forecast cycle are predictable from the experiment
+    configuration and are therefore collected into the local object
+    cache while the respective forecast cycle executes such that the
+    subsequent fetch applications collect the files from the local
+    object cache.
+
+Classes
+-------
+
+    Prefetch(options_obj)
+
+        This is the base-class object for the prefetch application;
+        it is a subclass of Fetch.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+# pylint: disable=attribute-defined-outside-init
+# pylint: disable=no-member
+
+# ----
+
+import os
+import shutil
+import time
+
+from botocore.exceptions import ClientError
+from tools import datetime_interface, parser_interface
+from utils import timestamp_interface
+
+from staging import awss3
+from staging import error as staging_error
+from staging.fetch import Fetch
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the default prefetch attribute values.
+prefetch_opt_attr_dict = {
+    "cycle_interval_seconds": 21600,
+    "max_wait_seconds": 5.0,
+    "min_free_bytes": 0,
+    "poll_seconds": 300,
+    "timeout_seconds": 0,
+}
+
+# -----
+
+
+class Prefetch(Fetch):
+    """
+    Description
+    -----------
+
+    This is the base-class object for the prefetch application; it is
+    a subclass of Fetch.
+
+    Parameters
+    ----------
+
+    options_obj: object
+
+        A Python object containing the attributes collect via the
+        command line from the application driver script; the
+        attribute prefetch_cycles specifies the number of forecast
+        cycles, following the respective forecast cycle, for which to
+        collect files.
+
+    Keywords
+    --------
+
+    task_id: str, optional
+
+        A Python string specifying the base-name for the respective
+        task identifier.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the attribute prefetch_cycles is not specified
+          or is not a positive integer.
+
+        * raised if a precompiled fetch plan has been specified.
+
+    """
+
+    def __init__(self, options_obj: object, task_id: str = "prefetch"):
+        """
+        Description
+        -----------
+
+        Creates a new Prefetch object.
+
+        """
+
+        # Define the base-class attributes.
+        super().__init__(options_obj=options_obj, task_id=task_id)
+
+        prefetch_cycles = parser_interface.object_getattr(
+            object_in=options_obj, key="prefetch_cycles", force=True
+        )
+
+        if prefetch_cycles is None or int(prefetch_cycles) <= 0:
+            msg = (
+                "The prefetch application requires a positive number of "
+                f"prefetch cycles; received {prefetch_cycles}. Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        if self.plan_file is not None:
+            msg = (
+                "The prefetch application cannot use a precompiled fetch plan "
+                "since fetch plans are compiled for a single forecast cycle. "
+                "Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        if self.shard is not None:
+            msg = (
+                "The prefetch application does not support sharded fetches. "
+                "Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        self.prefetch_cycles = int(prefetch_cycles)
+        self.base_cycle = self.cycle
+
+    def _get_fileid_objs(self, fetch_dict: dict) -> list:
+        """
+        Description
+        -----------
+
+        This method builds the compiled file identifier objects for
+        each interface/platform, fetch type, and file identifier
+        specified by the base-class attributes for the respective
+        base-class attribute cycle.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the fetch configuration
+            attributes.
+
+        Returns
+        -------
+
+        fileid_obj_list: list
+
+            A Python list of the compiled file identifier objects.
+
+        """
+
+        # Build the compiled file identifier objects; only AWS s3
+        # hosted files may be collected into the local object cache.
+        fileid_obj_list = []
+        for platform in self.platforms:
+
+            filesdict = parser_interface.dict_key_value(
+                dict_in=fetch_dict, key=platform, force=True, no_split=True
+            )
+
+            if filesdict is None:
+                continue
+
+            if platform != "aws_s3":
+                msg = f"Files from the {platform} platform will not be prefetched."
+                self.logger.warn(msg=msg)
+                continue
+
+            if self.fetch_type_opt is None:
+                fetch_types = list(filesdict.keys())
+
+            if self.fetch_type_opt is not None:
+                fetch_types = [
+                    fetch_type
+                    for fetch_type in self._get_fetch_types()
+                    if fetch_type in filesdict
+                ]
+
+            for fetch_type in fetch_types:
+                fetch_type_dict = self._filter_fileids(
+                    filesdict=self._filter_streams(
+                        fetch_dict=fetch_dict,
+                        platform=platform,
+                        fetch_type=fetch_type,
+                        filesdict=filesdict[fetch_type],
+                    )
+                )
+                for fileid in fetch_type_dict.keys():
+                    fileid_obj_list.append(
+                        self.get_fileid_obj(
+                            platform=platform, filesdict=fetch_type_dict, fileid=fileid
+                        )
+                    )
+
+        return fileid_obj_list
+
+    def check_pressure(self, prefetch_obj: object) -> str:
+        """
+        Description
+        -----------
+
+        This method determines whether the host is under disk or
+        bandwidth pressure; the disk pressure is determined from the
+        free space on the filesystem containing the local object
+        cache and the bandwidth pressure is determined from the wait
+        time for the bandwidth limiter (if specified).
+
+        Parameters
+        ----------
+
+        prefetch_obj: object
+
+            A Python object containing the prefetch attributes.
+
+        Returns
+        -------
+
+        reason: str
+
+            A Python string describing the respective pressure; if the
+            host is not under pressure, NoneType is returned.
+
+        """
+
+        # Check the free space on the filesystem containing the local
+        # object cache.
+        free_bytes = shutil.disk_usage(self.cache.cache_path).free
+        if free_bytes < int(prefetch_obj.min_free_bytes):
+            return (
+                f"disk pressure ({free_bytes} bytes free; minimum "
+                f"{prefetch_obj.min_free_bytes} bytes)"
+            )
+
+        # Check the wait time for the bandwidth limiter; a
+        # reservation of zero bytes does not consume any tokens.
+        if self.limiter is not None:
+            wait = self.limiter.reserve(nbytes=0)
+            if wait > float(prefetch_obj.max_wait_seconds):
+                return (
+                    f"bandwidth pressure ({wait:.2f} seconds wait; maximum "
+                    f"{prefetch_obj.max_wait_seconds} seconds)"
+                )
+
+        return None
+
+    def get_prefetch_info(self, fetch_dict: dict) -> object:
+        """
+        Description
+        -----------
+
+        This method collects the prefetch attributes from the
+        YAML-formatted configuration file; attributes that are not
+        specified are assigned their default values (see
+        prefetch_opt_attr_dict).
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the fetch configuration
+            attributes.
+
+        Returns
+        -------
+
+        prefetch_obj: object
+
+            A Python object containing the prefetch attributes.
+
+        """
+
+        # Define the prefetch attributes.
+        prefetch_dict = parser_interface.dict_key_value(
+            dict_in=fetch_dict, key="prefetch", force=True, no_split=True
+        )
+
+        if prefetch_dict is None:
+            prefetch_dict = {}
+
+        prefetch_obj = parser_interface.object_define()
+        for (prefetch_attr, default) in prefetch_opt_attr_dict.items():
+            value = parser_interface.dict_key_value(
+                dict_in=prefetch_dict, key=prefetch_attr, force=True, no_split=True
+            )
+
+            prefetch_obj = parser_interface.object_setattr(
+                object_in=prefetch_obj,
+                key=prefetch_attr,
+                value=default if value is None else value,
+            )
+
+        return prefetch_obj
+
+    def prefetch_cycle(self, fetch_dict: dict, prefetch_obj: object) -> tuple:
+        """
+        Description
+        -----------
+
+        This method collects the files for the respective base-class
+        attribute cycle into the local object cache; files that
+        already exist within the local object cache are not
+        collected.
+
+        Parameters
+        ----------
+
+        fetch_dict: dict
+
+            A Python dictionary containing the fetch configuration
+            attributes.
+
+        prefetch_obj: object
+
+            A Python object containing the prefetch attributes.
+
+        Returns
+        -------
+
+        (nstaged, nmissing, reason): tuple
+
+            A Python tuple containing the number of files collected
+            into (or found within) the local object cache, the number
+            of files not (yet) available, and the pressure (see
+            check_pressure) that stopped the collection (or NoneType).
+
+        """
+
+        # Collect the files for each file identifier.
+        (nstaged, nmissing) = (0, 0)
+        staging_path = os.path.join(self.cache.cache_path, "prefetch")
+        os.makedirs(staging_path, exist_ok=True)
+
+        for fileid_obj in self._get_fileid_objs(fetch_dict=fetch_dict):
+            for filepath_dict in fileid_obj.filepaths_list:
+
+                # Check whether the host is under pressure; proceed
+                # accordingly.
+                reason = self.check_pressure(prefetch_obj=prefetch_obj)
+                if reason is not None:
+                    return (nstaged, nmissing, reason)
+
+                # Check whether the object exists and whether it has
+                # already been collected.
+                object_path = filepath_dict["object_path"]
+                try:
+                    etag = awss3.get_etag(
+                        bucket=fileid_obj.bucket,
+                        object_path=object_path,
+                        profile_name=fileid_obj.profile_name,
+                    )
+                except ClientError as exc:
+                    if exc.response.get("Error", {}).get("Code") in awss3.MISSING_CODES:
+                        nmissing = nmissing + 1
+                        continue
+                    raise
+
+                nstaged = nstaged + 1
+                if (
+                    self.cache.lookup(
+                        bucket=fileid_obj.bucket, object_path=object_path, etag=etag
+                    )
+                    is not None
+                ):
+                    continue
+
+                # Collect the object into the local object cache.
+                tmp_path = os.path.join(staging_path, f"{os.getpid()}.object")
+                etag = awss3.download(
+                    bucket=fileid_obj.bucket,
+                    object_path=object_path,
+                    local_path=tmp_path,
+                    profile_name=fileid_obj.profile_name,
+                    limiter=self.limiter,
+                )
+                self.cache.store(
+                    filepath=tmp_path,
+                    bucket=fileid_obj.bucket,
+                    object_path=object_path,
+                    etag=etag,
+                )
+                os.remove(tmp_path)
+
+                msg = f"Prefetched AWS s3 object path {object_path}."
+                self.logger.info(msg=msg)
+
+        return (nstaged, nmissing, None)
+
+    def run(self) -> None:
+        """
+        Description
+        -----------
+
+        This method performs the following tasks:
+
+        (1) Collects the local object cache, bandwidth, and prefetch
+            attributes from the YAML-formatted configuration file.
+
+        (2) For each of the forecast cycles following the respective
+            forecast cycle, collects the respective files into the
+            local object cache.
+
+        (3) Repeats (2), for files not yet available, until all files
+            have been collected or the prefetch timeout has been
+            reached; if the host is under disk or bandwidth pressure,
+            the collection is stopped until the subsequent attempt.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the local object cache attributes are not
+              specified within the YAML-formatted configuration file.
+
+        """
+
+        # Define the prefetch configuration.
+        fetch_dict = self.build_fetch_dict()
+        self.get_cache_info(fetch_dict=fetch_dict)
+        self.get_bandwidth_info(fetch_dict=fetch_dict)
+        prefetch_obj = self.get_prefetch_info(fetch_dict=fetch_dict)
+
+        if self.cache is None:
+            msg = (
+                "The prefetch application requires the cache attributes to be "
+                "specified within the YAML-formatted configuration file. "
+                "Aborting!!!"
+            )
+            staging_error(msg=msg)
+
+        # Collect the files for the following forecast cycles until
+        # all files have been collected or the prefetch timeout has
+        # been reached.
+        deadline = time.time() + float(prefetch_obj.timeout_seconds)
+        cycles_list = [
+            datetime_interface.datestrupdate(
+                datestr=str(self.base_cycle),
+                in_frmttyp=timestamp_interface.GLOBAL,
+                out_frmttyp=timestamp_interface.GLOBAL,
+                offset_seconds=(idx * int(prefetch_obj.cycle_interval_seconds)),
+            )
+            for idx in range(1, self.prefetch_cycles + 1)
+        ]
+
+        while True:
+
+            pending_cycles_list = []
+            for cycle in cycles_list:
+                self.cycle = cycle
+                (nstaged, nmissing, reason) = self.prefetch_cycle(
+                    fetch_dict=fetch_dict, prefetch_obj=prefetch_obj
+                )
+                msg = (
+                    f"Prefetch for forecast cycle {cycle}: {nstaged} files in the "
+                    f"object cache and {nmissing} files not yet available."
+                )
+                self.logger.info(msg=msg)
+
+                if reason is not None:
+                    msg = f"Stopping the prefetch for forecast cycle {cycle} due to {reason}."
+                    self.logger.warn(msg=msg)
+                    pending_cycles_list.extend(cycles_list[cycles_list.index(cycle):])
+                    break
+
+                if nmissing > 0:
+                    pending_cycles_list.append(cycle)
+
+            self.cycle = self.base_cycle
+            cycles_list = pending_cycles_list
+            if not cycles_list:
+                break
+
+            if time.time() + float(prefetch_obj.poll_seconds) > deadline:
+                msg = (
+                    f"The prefetch timeout has been reached; the forecast cycles "
+                    f"{cycles_list} have not been completely prefetched."
+                )
+                self.logger.warn(msg=msg)
+                break
+
+            time.sleep(float(prefetch_obj.poll_seconds))
@@ -0,0 +1,483 @@
+# =========================================================================
+
+# Module: ush/staging/ratelimit.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    ratelimit.py
+
+Description
+-----------
+
+    This module contains classes for token-bucket bandwidth limiters;
+    a limiter may be bounded per process and/or across all processes
+    on the respective host (i.e., node); the node-wide token bucket is
+    maintained within a (node-local) broker file path that is locked
+    for each reservation such that concurrent fetch applications share
+    the node-wide bandwidth fairly without being serialized.
+
+Classes
+-------
+
+    NodeTokenBucket(rate, broker_path, burst=None)
+
+        This is the base-class object for a token bucket shared by all
+        processes on the respective host.
+
+    RateLimiter(max_rate=None, node_max_rate=None, broker_path=None)
+
+        This is the base-class object for the fetch bandwidth limiter.
+
+    TokenBucket(rate, burst=None)
+
+        This is the base-class object for a token bucket local to the
+        respective process.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import fcntl
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from tools import fileio_interface
+
+# ----
+
+# Define all available attributes.
+__all__ = ["NodeTokenBucket", "RateLimiter", "TokenBucket"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the node-wide token bucket state format; the values are the
+# available tokens (bytes) and the time of the last reservation.
+BROKER_FORMAT = "dd"
+
+# ----
+
+
+class TokenBucket:
+    """
+    Description
+    -----------
+
+    This is the base-class object for a token bucket local to the
+    respective process; reservations are permitted to overdraw the
+    token bucket and the calling application waits until the
+    overdrawn tokens have been replenished.
+
+    Parameters
+    ----------
+
+    rate: float
+
+        A Python float specifying the rate, in bytes per second, at
+        which tokens are replenished.
+
+    Keywords
+    --------
+
+    burst: float, optional
+
+        A Python float specifying the maximum number of tokens (i.e.,
+        bytes) that may accumulate; if NoneType, the value is one
+        second of the replenishment rate.
+
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        """
+        Description
+        -----------
+
+        Creates a new TokenBucket object.
+
+        """
+
+        # Define the base-class attributes.
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self.tokens = self.burst
+        self.timestamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, nbytes: int) -> float:
+        """
+        Description
+        -----------
+
+        This method reserves the specified number of bytes from the
+        token bucket.
+
+        Parameters
+        ----------
+
+        nbytes: int
+
+            A Python integer specifying the number of bytes to
+            reserve.
+
+        Returns
+        -------
+
+        wait: float
+
+            A Python float specifying the time, in seconds, the
+            calling application must wait prior to transferring the
+            reserved bytes.
+
+        """
+
+        # Replenish the token bucket and reserve the specified number
+        # of bytes.
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.timestamp) * self.rate
+            )
+            self.timestamp = now
+            self.tokens = self.tokens - nbytes
+            wait = max(-self.tokens / self.rate, 0.0)
+
+        return wait
+
+
+class NodeTokenBucket:
+    """
+    Description
+    -----------
+
+    This is the base-class object for a token bucket shared by all
+    processes on the respective host; the token bucket state is
+    maintained within the broker file path which is exclusively
+    locked (using fcntl.flock, such that threads of the same process
+    also exclude one another) for the duration of each reservation.
+
+    Parameters
+    ----------
+
+    rate: float
+
+        A Python float specifying the rate, in bytes per second, at
+        which tokens are replenished for all processes on the
+        respective host.
+
+    broker_path: str
+
+        A Python string specifying the broker file path; this path
+        must be local to the respective host (e.g., beneath /tmp) and
+        is created such that it may be shared by all users.
+
+    Keywords
+    --------
+
+    burst: float, optional
+
+        A Python float specifying the maximum number of tokens (i.e.,
+        bytes) that may accumulate; if NoneType, the value is one
+        second of the replenishment rate.
+
+    """
+
+    def __init__(self, rate: float, broker_path: str, burst: float = None):
+        """
+        Description
+        -----------
+
+        Creates a new NodeTokenBucket object.
+
+        """
+
+        # Define the base-class attributes.
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self.broker_path = broker_path
+        self.size = struct.calcsize(BROKER_FORMAT)
+        self.lock = threading.Lock()
+        fileio_interface.dirpath_tree(path=os.path.dirname(self.broker_path))
+
+    def _open(self) -> int:
+        """
+        Description
+        -----------
+
+        This method opens the broker file path; if the broker file
+        path does not exist, it is created such that it may be read
+        and written by all users (i.e., the node-wide token bucket is
+        shared by all users of the respective host).
+
+        Returns
+        -------
+
+        fd: int
+
+            A Python integer specifying the file descriptor for the
+            broker file path.
+
+        """
+
+        # Open the broker file path; the broker file path is opened
+        # without O_CREAT if it exists since the creation of a file
+        # owned by another user within a sticky (e.g., /tmp) directory
+        # may not be permitted.
+        try:
+            return os.open(self.broker_path, os.O_RDWR)
+        except FileNotFoundError:
+            pass
+
+        try:
+            fd = os.open(self.broker_path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            return os.open(self.broker_path, os.O_RDWR)
+
+        os.fchmod(fd, 0o666)
+
+        return fd
+
+    def _reserve(self, nbytes: int) -> float:
+        """
+        Description
+        -----------
+
+        This method reserves the specified number of bytes from the
+        node-wide token bucket while the broker file path is locked;
+        the lock (see fcntl.flock) belongs to the respective open
+        file description and is released when it is closed.
+
+        Parameters
+        ----------
+
+        nbytes: int
+
+            A Python integer specifying the number of bytes to
+            reserve.
+
+        Returns
+        -------
+
+        tokens: float
+
+            A Python float specifying the tokens (i.e., bytes)
+            remaining within the node-wide token bucket.
+
+        """
+
+        # Update the node-wide token bucket state.
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = time.time()
+            state = os.pread(fd, self.size, 0)
+            (tokens, timestamp) = (
+                struct.unpack(BROKER_FORMAT, state)
+                if len(state) == self.size
+                else (self.burst, now)
+            )
+            tokens = min(self.burst, tokens + max(now - timestamp, 0.0) * self.rate)
+            tokens = tokens - nbytes
+            os.pwrite(fd, struct.pack(BROKER_FORMAT, tokens, now), 0)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+        return tokens
+
+    def reserve(self, nbytes: int) -> float:
+        """
+        Description
+        -----------
+
+        This method reserves the specified number of bytes from the
+        node-wide token bucket.
+
+        Parameters
+        ----------
+
+        nbytes: int
+
+            A Python integer specifying the number of bytes to
+            reserve.
+
+        Returns
+        -------
+
+        wait: float
+
+            A Python float specifying the time, in seconds, the
+            calling application must wait prior to transferring the
+            reserved bytes.
+
+        """
+
+        # Lock the broker file path, replenish the node-wide token
+        # bucket, and reserve the specified number of bytes; the wall
+        # clock is used since the timestamps are shared by processes.
+        with self.lock:
+            tokens = self._reserve(nbytes=nbytes)
+
+        wait = max(-tokens / self.rate, 0.0)
+
+        return wait
+
+
+class RateLimiter:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the fetch bandwidth limiter;
+    each transfer reserves its bytes (typically one chunk at a time)
+    from the per-process and/or node-wide token buckets and waits for
+    the longer of the respective reservations.
+
+    Keywords
+    --------
+
+    max_rate: float, optional
+
+        A Python float specifying the maximum bandwidth, in bytes per
+        second, for the respective process; if NoneType, the
+        per-process bandwidth is not bounded.
+
+    node_max_rate: float, optional
+
+        A Python float specifying the maximum bandwidth, in bytes per
+        second, for all processes on the respective host; if
+        NoneType, the node-wide bandwidth is not bounded.
+
+    broker_path: str, optional
+
+        A Python string specifying the node-wide broker file path; if
+        NoneType, a file path, shared by all users, beneath the host
+        temporary directory is used.
+
+    """
+
+    def __init__(
+        self,
+        max_rate: float = None,
+        node_max_rate: float = None,
+        broker_path: str = None,
+    ):
+        """
+        Description
+        -----------
+
+        Creates a new RateLimiter object.
+
+        """
+
+        # Define the token buckets for the respective bandwidth
+        # limits.
+        self.buckets_list = []
+        if max_rate is not None:
+            self.buckets_list.append(TokenBucket(rate=max_rate))
+
+        if node_max_rate is not None:
+            if broker_path is None:
+                broker_path = os.path.join(tempfile.gettempdir(), "ufs_staging_bandwidth")
+            self.buckets_list.append(
+                NodeTokenBucket(rate=node_max_rate, broker_path=broker_path)
+            )
+
+    def acquire(self, nbytes: int) -> None:
+        """
+        Description
+        -----------
+
+        This method reserves the specified number of bytes and blocks
+        the calling thread until the bytes may be transferred.
+
+        Parameters
+        ----------
+
+        nbytes: int
+
+            A Python integer specifying the number of bytes to
+            transfer.
+
+        """
+
+        # Wait for the reserved bytes.
+        wait = self.reserve(nbytes=nbytes)
+        if wait > 0.0:
+            time.sleep(wait)
+
+    def reserve(self, nbytes: int) -> float:
+        """
+        Description
+        -----------
+
+        This method reserves the specified number of bytes from each
+        token bucket; this method does not block such that it may be
+        used by asynchronous applications (e.g., via asyncio.sleep).
+
+        Parameters
+        ----------
+
+        nbytes: int
+
+            A Python integer specifying the number of bytes to
+            transfer.
+
+        Returns
+        -------
+
+        wait: float
+
+            A Python float specifying the time, in seconds, the
+            calling application must wait prior to transferring the
+            reserved bytes.
+
+        """
+
+        # Reserve the specified number of bytes from each token
+        # bucket.
+        wait = max(
+            [bucket.reserve(nbytes=nbytes) for bucket in self.buckets_list],
+            default=0.0,
+        )
+
+        return wait
@@ -0,0 +1,641 @@
+# =========================================================================
+
+# Module: ush/staging/service.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    service.py
+
+Description
+-----------
+
+    This module contains classes and functions for the (optional)
+    resident staging service; the staging service accepts fetch
+    requests from (thin) clients via a Unix domain socket, removes
+    duplicate (in-flight) requests, and executes the requests from a
+    single request queue such that all transfers on the respective
+    host are scheduled by a single application which maintains warm
+    AWS s3 clients and local object caches between requests.
+
+    The request protocol is a single JSON-formatted line sent by the
+    client followed by a single JSON-formatted line returned by the
+    staging service; the supported operations are fetch, status, and
+    shutdown.
+
+Classes
+-------
+
+    StagingService(socket_path, nworkers=1)
+
+        This is the base-class object for the resident staging
+        service.
+
+Functions
+---------
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    request(socket_path, request_dict, timeout=None)
+
+        This function sends a request to the staging service and
+        returns the response.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+
+from exceptions import StagingError
+from tools import parser_interface
+
+from staging.fetch import Fetch
+from staging.stagelog import StagingLogger, msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = ["StagingService", "request"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the mandatory and optional fetch request attributes.
+FETCH_MAND_ATTR_LIST = ["cycle", "expt_name", "work_path", "yaml_file"]
+FETCH_OPT_ATTR_LIST = ["fetch_type", "fileid", "plan_file", "platform", "shard"]
+
+# ----
+
+
+class _Request:
+    """
+    Description
+    -----------
+
+    This is the base-class object for a queued fetch request; all
+    clients submitting the same (in-flight) fetch request wait upon
+    the same queued fetch request.
+
+    Parameters
+    ----------
+
+    key: tuple
+
+        A Python tuple uniquely identifying the fetch request.
+
+    request_dict: dict
+
+        A Python dictionary containing the fetch request attributes.
+
+    """
+
+    def __init__(self, key: tuple, request_dict: dict):
+        """
+        Description
+        -----------
+
+        Creates a new _Request object.
+
+        """
+
+        # Define the base-class attributes.
+        self.key = key
+        self.request_dict = request_dict
+        self.event = threading.Event()
+        self.response = None
+        self.nclients = 1
+
+    def wait(self, timeout: float = None) -> dict:
+        """
+        Description
+        -----------
+
+        This method waits for the fetch request to complete.
+
+        Keywords
+        --------
+
+        timeout: float, optional
+
+            A Python float specifying the maximum time, in seconds,
+            to wait; if NoneType, the wait is not bounded.
+
+        Returns
+        -------
+
+        response: dict
+
+            A Python dictionary containing the fetch request
+            response; if the fetch request did not complete within
+            the specified time, NoneType is returned.
+
+        """
+
+        # Wait for the fetch request.
+        self.event.wait(timeout=timeout)
+
+        return self.response
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """
+    Description
+    -----------
+
+    This is the base-class object for the staging service Unix domain
+    socket connection handler; it is a sub-class of
+    socketserver.StreamRequestHandler.
+
+    """
+
+    def handle(self) -> None:
+        """
+        Description
+        -----------
+
+        This method collects a JSON-formatted request from the
+        respective client and returns the JSON-formatted response.
+
+        """
+
+        # Collect the request and define the response.
+        try:
+            request_dict = json.loads(self.rfile.readline().decode("utf-8"))
+            response = self.server.service.dispatch(request_dict=request_dict)
+        except Exception as exc:  # pylint: disable=broad-except
+            response = {"status": "error", "message": str(exc)}
+
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class StagingService:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the resident staging service.
+
+    Parameters
+    ----------
+
+    socket_path: str
+
+        A Python string specifying the Unix domain socket path for the
+        staging service.
+
+    Keywords
+    --------
+
+    nworkers: int, optional
+
+        A Python integer specifying the number of fetch requests that
+        may be executed concurrently; the default is a single fetch
+        request (i.e., the fetch requests are executed serially).
+
+    """
+
+    def __init__(self, socket_path: str, nworkers: int = 1):
+        """
+        Description
+        -----------
+
+        Creates a new StagingService object.
+
+        """
+
+        # Define the base-class attributes.
+        self.logger = StagingLogger()
+        self.socket_path = socket_path
+        self.queue = queue.Queue()
+        self.inflight_dict = {}
+        self.lock = threading.Lock()
+        self.stats_dict = {"deduplicated": 0, "executed": 0, "failed": 0}
+        self.nworkers = max(1, int(nworkers))
+        self.server = None
+        self.workers_list = []
+
+    @staticmethod
+    def build_key(request_dict: dict) -> tuple:
+        """
+        Description
+        -----------
+
+        This method defines the unique key for the specified fetch
+        request.
+
+        Parameters
+        ----------
+
+        request_dict: dict
+
+            A Python dictionary containing the fetch request
+            attributes.
+
+        Returns
+        -------
+
+        key: tuple
+
+            A Python tuple uniquely identifying the fetch request.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if a mandatory fetch request attribute is not
+              specified.
+
+        """
+
+        # Check that the mandatory fetch request attributes have been
+        # specified; proceed accordingly.
+        for attr in FETCH_MAND_ATTR_LIST:
+            if request_dict.get(attr) is None:
+                msg = (
+                    f"The fetch request does not specify the mandatory attribute "
+                    f"{attr}. Aborting!!!"
+                )
+                error(msg=msg)
+
+        # Define the unique key; file paths are normalized and
+        # comma-delimited values are sorted such that equivalent fetch
+        # requests share the same key.
+        key = []
+        for attr in FETCH_MAND_ATTR_LIST + FETCH_OPT_ATTR_LIST:
+            value = request_dict.get(attr)
+            if value is not None and attr in ["plan_file", "work_path", "yaml_file"]:
+                value = os.path.abspath(str(value))
+            if value is not None and attr in ["fetch_type", "fileid", "platform"]:
+                value = ",".join(sorted(str(value).split(",")))
+            key.append(None if value is None else str(value))
+
+        return tuple(key)
+
+    def dispatch(self, request_dict: dict) -> dict:
+        """
+        Description
+        -----------
+
+        This method executes the specified client request.
+
+        Parameters
+        ----------
+
+        request_dict: dict
+
+            A Python dictionary containing the client request; the
+            attribute op specifies the requested operation.
+
+        Returns
+        -------
+
+        response: dict
+
+            A Python dictionary containing the response to the client
+            request.
+
+        """
+
+        # Execute the client request; proceed accordingly.
+        operation = request_dict.get("op", "fetch")
+
+        if operation == "status":
+            with self.lock:
+                response = {
+                    "status": "ok",
+                    "queued": self.queue.qsize(),
+                    "inflight": len(self.inflight_dict),
+                    **self.stats_dict,
+                }
+            return response
+
+        if operation == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"status": "ok"}
+
+        if operation != "fetch":
+            return {"status": "error", "message": f"Unknown operation {operation}."}
+
+        return self.enqueue(request_dict=request_dict).wait()
+
+    def enqueue(self, request_dict: dict) -> object:
+        """
+        Description
+        -----------
+
+        This method queues the specified fetch request; if an
+        identical fetch request is queued or executing, the respective
+        fetch request is returned rather than queued again.
+
+        Parameters
+        ----------
+
+        request_dict: dict
+
+            A Python dictionary containing the fetch request
+            attributes.
+
+        Returns
+        -------
+
+        fetch_request: object
+
+            A Python object containing the queued fetch request; the
+            method wait returns the fetch request response.
+
+        """
+
+        # Queue the fetch request; proceed accordingly.
+        key = self.build_key(request_dict=request_dict)
+
+        with self.lock:
+            fetch_request = self.inflight_dict.get(key)
+            if fetch_request is not None:
+                fetch_request.nclients = fetch_request.nclients + 1
+                self.stats_dict["deduplicated"] += 1
+                msg = f"Fetch request {key} is already in-flight; sharing the result."
+                self.logger.info(msg=msg)
+
+                return fetch_request
+
+            fetch_request = _Request(key=key, request_dict=request_dict)
+            self.inflight_dict[key] = fetch_request
+
+        self.queue.put(fetch_request)
+
+        return fetch_request
+
+    def execute(self, request_dict: dict) -> None:
+        """
+        Description
+        -----------
+
+        This method executes the specified fetch request using the
+        fetch application.
+
+        Parameters
+        ----------
+
+        request_dict: dict
+
+            A Python dictionary containing the fetch request
+            attributes.
+
+        """
+
+        # Build the Python object containing the fetch application
+        # options and execute the fetch application.
+        options_obj = parser_interface.object_define()
+        for attr in FETCH_MAND_ATTR_LIST + FETCH_OPT_ATTR_LIST:
+            options_obj = parser_interface.object_setattr(
+                object_in=options_obj, key=attr, value=request_dict.get(attr)
+            )
+
+        Fetch(options_obj=options_obj).run()
+
+    def run_queue(self) -> None:
+        """
+        Description
+        -----------
+
+        This method executes the queued fetch requests in the order
+        received; each fetch request is executed by a separate fetch
+        application instance such that the fetch request queue may be
+        executed by several threads (see nworkers above).
+
+        """
+
+        # Execute the queued fetch requests until the staging service
+        # is shutdown.
+        while True:
+            fetch_request = self.queue.get()
+            if fetch_request is None:
+                break
+
+            msg = f"Executing fetch request {fetch_request.key}."
+            self.logger.info(msg=msg)
+
+            try:
+                self.execute(request_dict=fetch_request.request_dict)
+                response = {"status": "ok"}
+                stat = "executed"
+            except (Exception, SystemExit) as exc:  # pylint: disable=broad-except
+                response = {"status": "error", "message": str(exc)}
+                stat = "failed"
+
+            with self.lock:
+                self.stats_dict[stat] += 1
+                del self.inflight_dict[fetch_request.key]
+
+            fetch_request.response = response
+            fetch_request.event.set()
+
+    def serve(self) -> None:
+        """
+        Description
+        -----------
+
+        This method starts the fetch request queue and listens for
+        client requests on the Unix domain socket path until the
+        staging service is shutdown.
+
+        """
+
+        # Start the fetch request queue.
+        self.start()
+
+        # Listen for client requests; a (stale) Unix domain socket
+        # path is removed.
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, _Handler)
+        self.server.daemon_threads = True
+        self.server.service = self
+
+        msg = f"Staging service listening on {self.socket_path}."
+        self.logger.info(msg=msg)
+
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self) -> None:
+        """
+        Description
+        -----------
+
+        This method stops the fetch request queue, after all queued
+        fetch requests have been executed, and stops listening for
+        client requests.
+
+        """
+
+        # Stop the fetch request queue and the Unix domain socket
+        # server.
+        for _ in self.workers_list:
+            self.queue.put(None)
+        for worker in self.workers_list:
+            worker.join()
+        self.workers_list = []
+
+        if self.server is not None:
+            self.server.shutdown()
+
+    def start(self) -> None:
+        """
+        Description
+        -----------
+
+        This method starts the fetch request queue.
+
+        """
+
+        # Start the fetch request queue.
+        if not self.workers_list:
+            self.workers_list = [
+                threading.Thread(target=self.run_queue, daemon=True)
+                for _ in range(self.nworkers)
+            ]
+            for worker in self.workers_list:
+                worker.start()
+
+
+# ----
+
+
+def request(socket_path: str, request_dict: dict, timeout: float = None) -> dict:
+    """
+    Description
+    -----------
+
+    This function sends a request to the staging service and returns
+    the response.
+
+    Parameters
+    ----------
+
+    socket_path: str
+
+        A Python string specifying the Unix domain socket path for the
+        staging service.
+
+    request_dict: dict
+
+        A Python dictionary containing the client request; the
+        attribute op specifies the requested operation (fetch, status,
+        or shutdown).
+
+    Keywords
+    --------
+
+    timeout: float, optional
+
+        A Python float specifying the maximum time, in seconds, to
+        wait for the response; if NoneType, the wait is not bounded.
+
+    Returns
+    -------
+
+    response: dict
+
+        A Python dictionary containing the response to the client
+        request.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the staging service cannot be reached.
+
+    """
+
+    # Send the request and collect the response.
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            sock.sendall((json.dumps(request_dict) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as file:
+                response = json.loads(file.readline().decode("utf-8"))
+
+    except (OSError, ValueError) as exc:
+        msg = (
+            f"The staging service {socket_path} could not be reached; "
+            f"received {exc}. Aborting!!!"
+        )
+        error(msg=msg)
+
+    return response
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -0,0 +1,1136 @@
+# =========================================================================
+
+# Module: ush/staging/shard.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    shard.py
+
+Description
+-----------
+
+    This module contains classes and functions to partition the
+    objects (i.e., file identifier and timestamp) of a fetch across
+    multiple independent fetch applications (i.e., shards); the
+    shards may execute on different hosts (e.g., Slurm job array
+    tasks) provided that they share a filesystem.
+
+    The objects are partitioned by size: the objects are sorted by
+    decreasing size (ties are ordered by a hash of the respective
+    object key) and each object is assigned to the least-loaded shard.
+    The object sizes are determined once, by the first shard to claim
+    the respective task, and written to the shared filesystem such
+    that all shards compute an identical partition.
+
+    Each shard writes a marker file upon completion; the shard which
+    observes the markers for all shards and claims the reduce task
+    executes the tasks which require all objects (e.g., file
+    concatenation) exactly once and, upon success, removes the
+    coordination files such that a subsequent fetch (e.g., a rerun of
+    the respective forecast cycle) is coordinated anew.
+
+    Alternatively, the objects are collected from a work queue on the
+    shared filesystem by any number of fetch applications (i.e.,
+    workers); the objects are queued in order of decreasing size and
+    each worker claims the next object by atomically renaming it
+    beneath the claimed objects. A worker renews the lease on its
+    claimed object while it is collected; objects whose leases have
+    expired (e.g., the respective worker has failed) are returned to
+    the queue. Once the queue is empty and no objects are claimed, the
+    worker which claims the reduce task executes it exactly once.
+
+Classes
+-------
+
+    Coordinator(dirpath, timeout=TIMEOUT_SECONDS)
+
+        This is the base-class object for the coordination of
+        multiple fetch applications via a shared filesystem.
+
+    Shard(shard, dirpath, timeout=TIMEOUT_SECONDS)
+
+        This is the base-class object for a fetch application shard;
+        it is a sub-class of Coordinator.
+
+    WorkQueue(dirpath, lease_seconds=LEASE_SECONDS,
+              poll_seconds=POLL_SECONDS, timeout=TIMEOUT_SECONDS)
+
+        This is the base-class object for a fetch application work
+        queue; it is a sub-class of Coordinator.
+
+Functions
+---------
+
+    assign(sizes_list, count)
+
+        This function partitions the specified objects across the
+        specified number of shards.
+
+    parse(shard)
+
+        This function parses the specified shard attribute.
+
+    sort(sizes_list)
+
+        This function sorts the specified objects by decreasing size.
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import functools
+import hashlib
+import heapq
+import json
+import os
+import re
+import shutil
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+from exceptions import StagingError
+
+from staging.stagelog import msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = ["Coordinator", "Shard", "WorkQueue", "assign", "parse", "sort"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the supported shard attribute formats.
+SHARD_REGEX = re.compile(r"^(\d+)/(\d+)$")
+QUEUE_SHARD = "queue"
+SLURM_SHARD = "slurm"
+
+# Define the interval and the maximum time, in seconds, to wait for
+# the object sizes (or work queue) to be written by another fetch
+# application.
+POLL_SECONDS = 2.0
+TIMEOUT_SECONDS = 3600.0
+
+# Define the default work queue lease, in seconds.
+LEASE_SECONDS = 600.0
+
+# ----
+
+
+class Coordinator:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the coordination of multiple
+    fetch applications via a shared filesystem.
+
+    Parameters
+    ----------
+
+    dirpath: str
+
+        A Python string specifying the directory path, on the shared
+        filesystem, for the coordination files.
+
+    Keywords
+    --------
+
+    timeout: float, optional
+
+        A Python float specifying the maximum time, in seconds, to
+        wait for the coordination files (e.g., the object sizes) to be
+        written by another fetch application.
+
+    """
+
+    def __init__(self, dirpath: str, timeout: float = TIMEOUT_SECONDS):
+        """
+        Description
+        -----------
+
+        Creates a new Coordinator object.
+
+        """
+
+        # Define the base-class attributes.
+        self.dirpath = dirpath
+        self.timeout = timeout
+        os.makedirs(self.dirpath, exist_ok=True)
+
+    def _claim(self, name: str) -> bool:
+        """
+        Description
+        -----------
+
+        This method claims the specified task; exactly one fetch
+        application succeeds for the respective task.
+
+        Parameters
+        ----------
+
+        name: str
+
+            A Python string specifying the task name.
+
+        Returns
+        -------
+
+        claimed: bool
+
+            A Python boolean valued variable specifying whether the
+            task has been claimed by the respective fetch application.
+
+        """
+
+        # Claim the task by creating the respective lock file.
+        try:
+            fd = os.open(
+                os.path.join(self.dirpath, f"{name}.lock"),
+                os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+            )
+
+        except (FileExistsError, FileNotFoundError):
+            return False
+
+        with os.fdopen(fd, "w") as file:
+            file.write(f"{socket.gethostname()}:{os.getpid()}\n")
+
+        return True
+
+    def _publish(self, name: str, builder: object) -> object:
+        """
+        Description
+        -----------
+
+        This method returns the JSON-formatted attributes shared by
+        all fetch applications; if the attributes have not been
+        written, the first fetch application to claim the respective
+        task defines and writes the attributes while the remaining
+        fetch applications wait.
+
+        Parameters
+        ----------
+
+        name: str
+
+            A Python string specifying the task name.
+
+        builder: object
+
+            A Python function which returns the JSON-serializable
+            attributes; this function is called only by the fetch
+            application which claims the respective task.
+
+        Returns
+        -------
+
+        attrs: object
+
+            A Python object containing the attributes.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the attributes have not been written within
+              the base-class attribute timeout.
+
+        """
+
+        # Collect or define the attributes; proceed accordingly.
+        path = os.path.join(self.dirpath, f"{name}.json")
+        start_time = time.time()
+        while not os.path.exists(path):
+
+            if self._claim(name=name):
+                try:
+                    attrs = builder()
+                    with open(f"{path}.{os.getpid()}.tmp", "w", encoding="utf-8") as file:
+                        json.dump(attrs, file)
+                    os.replace(f"{path}.{os.getpid()}.tmp", path)
+
+                except BaseException:
+                    self._release(name=name)
+                    raise
+
+                break
+
+            if (time.time() - start_time) > self.timeout:
+                msg = (
+                    f"The file {path} has not been written within {self.timeout} "
+                    "seconds; if the fetch application which claimed it has "
+                    f"failed, remove {os.path.join(self.dirpath, name)}.lock and "
+                    "try again. Aborting!!!"
+                )
+                error(msg=msg)
+
+            time.sleep(POLL_SECONDS)
+
+        with open(path, "r", encoding="utf-8") as file:
+            attrs = json.load(file)
+
+        return attrs
+
+    def _release(self, name: str) -> None:
+        """
+        Description
+        -----------
+
+        This method releases the specified task such that it may be
+        claimed again.
+
+        Parameters
+        ----------
+
+        name: str
+
+            A Python string specifying the task name.
+
+        """
+
+        # Remove the respective lock file.
+        try:
+            os.remove(os.path.join(self.dirpath, f"{name}.lock"))
+
+        except FileNotFoundError:
+            pass
+
+    def get_sizes(self, keys_list: list, sizer: object) -> dict:
+        """
+        Description
+        -----------
+
+        This method returns the object sizes shared by all fetch
+        applications; the object sizes are determined only once (see
+        _publish).
+
+        Parameters
+        ----------
+
+        keys_list: list
+
+            A Python list of the (unique) object keys.
+
+        sizer: object
+
+            A Python function which returns a Python list, ordered
+            identically to keys_list, of the object sizes in bytes
+            (NoneType for missing objects).
+
+        Returns
+        -------
+
+        sizes_dict: dict
+
+            A Python dictionary containing the size for each object
+            key.
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the object sizes do not correspond to the
+              specified object keys (e.g., the configuration has been
+              modified since the object sizes were written).
+
+        """
+
+        # Collect the object sizes; proceed accordingly.
+        sizes_dict = self._publish(
+            name="sizes", builder=lambda: dict(zip(keys_list, sizer()))
+        )
+
+        if set(keys_list) != set(sizes_dict):
+            msg = (
+                f"The object sizes within {self.dirpath} do not correspond to "
+                "the objects to be collected; the fetch applications must be "
+                f"launched using identical attributes; otherwise remove "
+                f"{self.dirpath}. Aborting!!!"
+            )
+            error(msg=msg)
+
+        return sizes_dict
+
+    def release(self) -> None:
+        """
+        Description
+        -----------
+
+        This method releases the reduce task (e.g., if it has failed)
+        such that it is executed again once a fetch application
+        completes.
+
+        """
+
+        # Release the reduce task.
+        self._release(name="reduce")
+
+    def remove(self) -> None:
+        """
+        Description
+        -----------
+
+        This method removes the coordination files once the reduce
+        task has been executed such that a subsequent fetch (e.g., a
+        rerun of the respective forecast cycle) is coordinated anew;
+        fetch applications which have not yet completed observe the
+        removed coordination files as an empty work queue (i.e., they
+        do not claim the reduce task).
+
+        """
+
+        # Remove the coordination files.
+        shutil.rmtree(self.dirpath, ignore_errors=True)
+
+
+class Shard(Coordinator):
+    """
+    Description
+    -----------
+
+    This is the base-class object for a fetch application shard; it
+    is a sub-class of Coordinator.
+
+    Parameters
+    ----------
+
+    shard: str
+
+        A Python string specifying the shard attribute (see parse).
+
+    dirpath: str
+
+        A Python string specifying the directory path, on the shared
+        filesystem, for the shard coordination files; the number of
+        shards is appended such that partitions for different numbers
+        of shards do not interact.
+
+    Keywords
+    --------
+
+    timeout: float, optional
+
+        A Python float specifying the maximum time, in seconds, to
+        wait for the object sizes to be written by another shard.
+
+    """
+
+    def __init__(self, shard: str, dirpath: str, timeout: float = TIMEOUT_SECONDS):
+        """
+        Description
+        -----------
+
+        Creates a new Shard object.
+
+        """
+
+        # Define the base-class attributes.
+        (self.index, self.count) = parse(shard=shard)
+        super().__init__(dirpath=f"{dirpath}.{self.count}", timeout=timeout)
+
+    def assign(self, keys_list: list, sizer: object) -> list:
+        """
+        Description
+        -----------
+
+        This method determines which of the specified objects are
+        assigned to the respective shard.
+
+        Parameters
+        ----------
+
+        keys_list: list
+
+            A Python list of the (unique) object keys; the list must
+            be identical for all shards.
+
+        sizer: object
+
+            A Python function which returns a Python list, ordered
+            identically to keys_list, of the object sizes in bytes
+            (NoneType for missing objects); this function is called
+            only by the shard which claims the respective task.
+
+        Returns
+        -------
+
+        assigned_list: list
+
+            A Python list, ordered identically to keys_list, of Python
+            boolean valued variables specifying whether the respective
+            object is assigned to the respective shard.
+
+        """
+
+        # Partition the objects across the shards.
+        sizes_dict = self.get_sizes(keys_list=keys_list, sizer=sizer)
+        shards_list = assign(
+            sizes_list=[(key, sizes_dict[key]) for key in keys_list], count=self.count
+        )
+
+        return [shard == self.index for shard in shards_list]
+
+    def complete(self) -> bool:
+        """
+        Description
+        -----------
+
+        This method writes the marker file for the respective shard
+        and determines whether the respective shard is to execute the
+        reduce task.
+
+        Returns
+        -------
+
+        reduce: bool
+
+            A Python boolean valued variable specifying whether the
+            markers for all shards exist and the respective shard has
+            claimed the reduce task.
+
+        """
+
+        # Write the marker file for the respective shard.
+        marker_path = os.path.join(self.dirpath, f"shard.{self.index}.done")
+        with open(f"{marker_path}.{os.getpid()}.tmp", "w", encoding="utf-8") as file:
+            file.write(f"{time.time()}\n")
+        os.replace(f"{marker_path}.{os.getpid()}.tmp", marker_path)
+
+        # Check whether all shards have completed; proceed
+        # accordingly.
+        for index in range(self.count):
+            if not os.path.exists(os.path.join(self.dirpath, f"shard.{index}.done")):
+                return False
+
+        return self._claim(name="reduce")
+
+
+class WorkQueue(Coordinator):
+    """
+    Description
+    -----------
+
+    This is the base-class object for a fetch application work queue;
+    it is a sub-class of Coordinator.
+
+    Parameters
+    ----------
+
+    dirpath: str
+
+        A Python string specifying the directory path, on the shared
+        filesystem, for the work queue.
+
+    Keywords
+    --------
+
+    lease_seconds: float, optional
+
+        A Python float specifying the time, in seconds, after which a
+        claimed object whose lease has not been renewed is returned
+        to the work queue.
+
+    poll_seconds: float, optional
+
+        A Python float specifying the interval, in seconds, between
+        attempts to claim an object while the objects claimed by
+        other workers are collected.
+
+    timeout: float, optional
+
+        A Python float specifying the maximum time, in seconds, to
+        wait for the work queue to be written by another worker.
+
+    """
+
+    def __init__(
+        self,
+        dirpath: str,
+        lease_seconds: float = LEASE_SECONDS,
+        poll_seconds: float = POLL_SECONDS,
+        timeout: float = TIMEOUT_SECONDS,
+    ):
+        """
+        Description
+        -----------
+
+        Creates a new WorkQueue object.
+
+        """
+
+        # Define the base-class attributes.
+        super().__init__(dirpath=f"{dirpath}.{QUEUE_SHARD}", timeout=timeout)
+        self.lease_seconds = float(lease_seconds)
+        self.poll_seconds = float(poll_seconds)
+        self.pending_path = os.path.join(self.dirpath, "pending")
+        self.claimed_path = os.path.join(self.dirpath, "claimed")
+        self.done_path = os.path.join(self.dirpath, "done")
+        self.keys_list = None
+
+    def _build_queue(self, sizes_list: list) -> list:
+        """
+        Description
+        -----------
+
+        This method writes the queued objects in order of decreasing
+        size (see sort).
+
+        Parameters
+        ----------
+
+        sizes_list: list
+
+            A Python list of (key, size) tuples for each object.
+
+        Returns
+        -------
+
+        queue_list: list
+
+            A Python list of the object keys in order of decreasing
+            size; the queued object names are the respective indices
+            (i.e., ranks) within this list.
+
+        """
+
+        # Write the queued objects.
+        queue_list = [sizes_list[idx][0] for idx in sort(sizes_list=sizes_list)]
+        for path in [self.pending_path, self.claimed_path, self.done_path]:
+            os.makedirs(path, exist_ok=True)
+
+        for rank in range(len(queue_list)):
+            with open(os.path.join(self.pending_path, f"{rank:08d}"), "w", encoding="utf-8"):
+                pass
+
+        return queue_list
+
+    def _listdir(self, path: str) -> list:
+        """
+        Description
+        -----------
+
+        This method lists the object names beneath the specified
+        work queue directory path; if the work queue has been removed
+        (see Coordinator.remove), no object names are returned.
+
+        Parameters
+        ----------
+
+        path: str
+
+            A Python string specifying the work queue directory path.
+
+        Returns
+        -------
+
+        names_list: list
+
+            A Python list of the object names.
+
+        """
+
+        # List the object names; proceed accordingly.
+        try:
+            names_list = os.listdir(path)
+
+        except FileNotFoundError:
+            names_list = []
+
+        return names_list
+
+    def _now(self) -> float:
+        """
+        Description
+        -----------
+
+        This method returns the current time in accordance with the
+        shared filesystem (rather than the respective host) such that
+        the leases are compared using a single clock.
+
+        Returns
+        -------
+
+        now: float
+
+            A Python float specifying the current time, in seconds
+            since the POSIX epoch, of the shared filesystem.
+
+        """
+
+        # Update and collect the status change time of a file path
+        # for the respective worker.
+        path = os.path.join(self.dirpath, f"clock.{socket.gethostname()}.{os.getpid()}")
+        with open(path, "a", encoding="utf-8"):
+            os.utime(path)
+
+        return os.stat(path).st_ctime
+
+    def _renew(self, path: str, stop: object) -> None:
+        """
+        Description
+        -----------
+
+        This method renews the lease for the specified claimed object
+        until the specified event is set.
+
+        Parameters
+        ----------
+
+        path: str
+
+            A Python string specifying the claimed object path.
+
+        stop: object
+
+            A Python threading.Event object specifying when to stop
+            renewing the lease.
+
+        """
+
+        # Renew the lease (i.e., the status change time of the
+        # claimed object path).
+        while not stop.wait(self.lease_seconds / 3.0):
+            try:
+                os.utime(path)
+
+            except FileNotFoundError:
+                return
+
+    def claim(self) -> int:
+        """
+        Description
+        -----------
+
+        This method claims the next (i.e., largest) queued object;
+        if no objects are queued, the claimed objects whose leases
+        have expired are returned to the work queue and, if none have
+        expired, this method waits for the objects claimed by other
+        workers to be collected.
+
+        Returns
+        -------
+
+        rank: int
+
+            A Python integer specifying the rank (i.e., the index
+            within the base-class attribute keys_list) of the claimed
+            object; if the work queue is empty and no objects are
+            claimed, NoneType is returned.
+
+        """
+
+        # Claim the next queued object; proceed accordingly.
+        while True:
+            for name in sorted(self._listdir(path=self.pending_path)):
+                try:
+                    os.rename(
+                        os.path.join(self.pending_path, name),
+                        os.path.join(self.claimed_path, name),
+                    )
+
+                except FileNotFoundError:
+                    continue
+
+                os.utime(os.path.join(self.claimed_path, name))
+                return int(name)
+
+            claimed_list = self._listdir(path=self.claimed_path)
+            if not claimed_list:
+                return None
+
+            # Return the claimed objects whose leases have expired to
+            # the work queue.
+            now = self._now()
+            reclaimed = False
+            for name in claimed_list:
+                path = os.path.join(self.claimed_path, name)
+                try:
+                    if (now - os.stat(path).st_ctime) > self.lease_seconds:
+                        os.rename(path, os.path.join(self.pending_path, name))
+                        reclaimed = True
+
+                except FileNotFoundError:
+                    continue
+
+            if not reclaimed:
+                time.sleep(self.poll_seconds)
+
+    def complete(self) -> bool:
+        """
+        Description
+        -----------
+
+        This method determines whether the respective worker is to
+        execute the reduce task; this method is to be called once
+        claim returns NoneType.
+
+        Returns
+        -------
+
+        reduce: bool
+
+            A Python boolean valued variable specifying whether all
+            objects have been collected and the respective worker has
+            claimed the reduce task.
+
+        """
+
+        # Check whether all objects have been collected; proceed
+        # accordingly.
+        if not os.path.isdir(self.dirpath):
+            return False
+
+        if self._listdir(path=self.pending_path) or self._listdir(
+            path=self.claimed_path
+        ):
+            return False
+
+        return self._claim(name="reduce")
+
+    @contextmanager
+    def lease(self, rank: int) -> str:
+        """
+        Description
+        -----------
+
+        This method renews the lease for the specified claimed object
+        while the respective context is executed; upon success the
+        object is marked as collected and upon failure the object is
+        returned to the work queue.
+
+        Parameters
+        ----------
+
+        rank: int
+
+            A Python integer specifying the rank of the claimed
+            object (see claim).
+
+        Yields
+        ------
+
+        key: str
+
+            A Python string specifying the object key.
+
+        """
+
+        # Renew the lease while the object is collected.
+        name = f"{rank:08d}"
+        path = os.path.join(self.claimed_path, name)
+        stop = threading.Event()
+        thread = threading.Thread(target=self._renew, args=(path, stop), daemon=True)
+        thread.start()
+
+        try:
+            yield self.keys_list[rank]
+
+        except BaseException:
+            stop.set()
+            thread.join()
+            try:
+                os.rename(path, os.path.join(self.pending_path, name))
+
+            except FileNotFoundError:
+                pass
+
+            raise
+
+        stop.set()
+        thread.join()
+        try:
+            os.rename(path, os.path.join(self.done_path, name))
+
+        except FileNotFoundError:
+            pass
+
+    def populate(self, keys_list: list, sizer: object) -> None:
+        """
+        Description
+        -----------
+
+        This method defines the work queue; the work queue is written
+        only once, by the first worker to claim the respective task,
+        and the objects are queued in order of decreasing size (see
+        sort).
+
+        Parameters
+        ----------
+
+        keys_list: list
+
+            A Python list of the (unique) object keys; the list must
+            be identical for all workers.
+
+        sizer: object
+
+            A Python function which returns a Python list, ordered
+            identically to keys_list, of the object sizes in bytes
+            (NoneType for missing objects).
+
+        Raises
+        ------
+
+        StagingError:
+
+            * raised if the work queue does not correspond to the
+              specified object keys.
+
+        """
+
+        # Define the work queue; proceed accordingly.
+        sizes_dict = self.get_sizes(keys_list=keys_list, sizer=sizer)
+        self.keys_list = self._publish(
+            name="queue",
+            builder=functools.partial(
+                self._build_queue,
+                sizes_list=[(key, sizes_dict[key]) for key in keys_list],
+            ),
+        )
+
+        if set(self.keys_list) != set(keys_list):
+            msg = (
+                f"The work queue {self.dirpath} does not correspond to the "
+                "objects to be collected; the workers must be launched using "
+                f"identical attributes; otherwise remove {self.dirpath}. "
+                "Aborting!!!"
+            )
+            error(msg=msg)
+
+
+# ----
+
+
+def assign(sizes_list: list, count: int) -> list:
+    """
+    Description
+    -----------
+
+    This function partitions the specified objects across the
+    specified number of shards; the objects are sorted by decreasing
+    size (see sort) and each object is assigned to the least-loaded
+    shard (ties are assigned to the lowest shard index); missing and
+    empty objects are weighted as a single byte such that they are
+    distributed evenly.
+
+    Parameters
+    ----------
+
+    sizes_list: list
+
+        A Python list of (key, size) tuples for each object.
+
+    count: int
+
+        A Python integer specifying the number of shards.
+
+    Returns
+    -------
+
+    shards_list: list
+
+        A Python list, ordered identically to sizes_list, of the shard
+        index for each object.
+
+    """
+
+    # Assign each object to the least-loaded shard.
+    weights_list = [max(int(size or 0), 1) for (_, size) in sizes_list]
+    loads_list = [(0, index) for index in range(count)]
+    shards_list = [None] * len(sizes_list)
+    for idx in sort(sizes_list=sizes_list):
+        (load, index) = heapq.heappop(loads_list)
+        shards_list[idx] = index
+        heapq.heappush(loads_list, (load + weights_list[idx], index))
+
+    return shards_list
+
+
+def parse(shard: str) -> tuple:
+    """
+    Description
+    -----------
+
+    This function parses the specified shard attribute; the shard
+    attribute is either i/N, where i is the (zero-based) shard index
+    and N is the number of shards, or slurm, in which case the shard
+    index and number of shards are determined from the Slurm job
+    array environment variables.
+
+    Parameters
+    ----------
+
+    shard: str
+
+        A Python string specifying the shard attribute.
+
+    Returns
+    -------
+
+    index: int
+
+        A Python integer specifying the shard index.
+
+    count: int
+
+        A Python integer specifying the number of shards.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the shard attribute is not supported.
+
+        * raised if the Slurm job array environment variables cannot
+          be determined.
+
+        * raised if the shard index is not within the number of
+          shards.
+
+    """
+
+    # Parse the shard attribute; proceed accordingly.
+    shard = str(shard).strip()
+    if shard.lower() == SLURM_SHARD:
+        try:
+            task_id = int(os.environ["SLURM_ARRAY_TASK_ID"])
+            task_min = int(os.environ.get("SLURM_ARRAY_TASK_MIN", 0))
+            count = int(
+                os.environ.get("SLURM_ARRAY_TASK_COUNT")
+                or (int(os.environ["SLURM_ARRAY_TASK_MAX"]) - task_min + 1)
+            )
+
+        except (KeyError, ValueError):
+            msg = (
+                "The Slurm job array environment variables SLURM_ARRAY_TASK_ID "
+                "and SLURM_ARRAY_TASK_COUNT (or SLURM_ARRAY_TASK_MAX) could not "
+                "be determined. Aborting!!!"
+            )
+            error(msg=msg)
+
+        index = task_id - task_min
+
+    else:
+        match = SHARD_REGEX.match(shard)
+        if match is None:
+            msg = (
+                f"The shard attribute {shard} is not supported; the shard "
+                f"attribute must be i/N, {SLURM_SHARD}, or {QUEUE_SHARD}. "
+                "Aborting!!!"
+            )
+            error(msg=msg)
+
+        (index, count) = (int(match.group(1)), int(match.group(2)))
+
+    if not 0 <= index < count:
+        msg = (
+            f"The shard index {index} must be greater than or equal to zero "
+            f"and less than the number of shards {count}. Aborting!!!"
+        )
+        error(msg=msg)
+
+    return (index, count)
+
+
+def sort(sizes_list: list) -> list:
+    """
+    Description
+    -----------
+
+    This function sorts the specified objects by decreasing size;
+    ties are ordered by a hash of the object key such that the order
+    is independent of the order of the objects upon entry.
+
+    Parameters
+    ----------
+
+    sizes_list: list
+
+        A Python list of (key, size) tuples for each object; missing
+        objects (i.e., NoneType sizes) are sorted as empty objects.
+
+    Returns
+    -------
+
+    order_list: list
+
+        A Python list of the indices of the objects within sizes_list
+        in order of decreasing size.
+
+    """
+
+    # Sort the objects by decreasing size.
+    order_list = sorted(
+        range(len(sizes_list)),
+        key=lambda idx: (
+            -max(int(sizes_list[idx][1] or 0), 1),
+            hashlib.md5(str(sizes_list[idx][0]).encode("utf-8")).hexdigest(),
+        ),
+    )
+
+    return order_list
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -0,0 +1,532 @@
+# =========================================================================
+
+# Module: ush/staging/stagelog.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    stagelog.py
+
+Description
+-----------
+
+    This module contains the logger for the staging applications; the
+    messages are level-gated, such that a message for a disabled level
+    is neither formatted nor queued, and are written by a background
+    thread, such that neither the formatting of the messages nor the
+    writing of the messages (via utils.logger_interface.Logger) blocks
+    the calling (e.g., fetch worker) threads.
+
+    The messages are specified using Python logging (i.e., %-style)
+    arguments which are formatted by the background thread; the
+    arguments should therefore not be modified once passed to the
+    logger.
+
+    The logger level is specified by the STAGING_LOG_LEVEL environment
+    variable (i.e., debug, info, warn, or error); the default is info.
+
+Classes
+-------
+
+    StagingLogger(level=None)
+
+        This is the base-class object for the staging application
+        logger.
+
+Functions
+---------
+
+    flush()
+
+        This function writes all queued messages.
+
+    msg_except_handle(err_cls)
+
+        This function (a decorator) defines a module exception handler
+        which writes all queued messages prior to raising the
+        exception.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import atexit
+import functools
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueListener
+
+from utils import error_interface
+from utils.logger_interface import Logger
+
+# ----
+
+# Define all available attributes.
+__all__ = ["StagingLogger", "flush", "msg_except_handle"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the environment variable specifying the logger level and the
+# supported logger levels.
+LOG_LEVEL_ENV = "STAGING_LOG_LEVEL"
+LEVELS_DICT = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+# Define the name assigned to the queued messages.
+LOGGER_NAME = "ufs_apps.staging"
+
+# Define the background thread attributes; the background thread is
+# started once per process (e.g., again within a forked process).
+_LISTENER_DICT = {"listener": None, "queue": None, "pid": None}
+_LISTENER_LOCK = threading.Lock()
+
+# ----
+
+
+class _LoggerHandler(logging.Handler):
+    """
+    Description
+    -----------
+
+    This is the base-class object for writing the queued messages via
+    utils.logger_interface.Logger; it is a sub-class of
+    logging.Handler.
+
+    """
+
+    def __init__(self):
+        """
+        Description
+        -----------
+
+        Creates a new _LoggerHandler object.
+
+        """
+
+        # Define the base-class attributes.
+        super().__init__()
+        self.logger = Logger()
+        self.methods_dict = {
+            logging.DEBUG: self.logger.debug,
+            logging.INFO: self.logger.info,
+            logging.WARNING: self.logger.warn,
+            logging.ERROR: self.logger.error,
+        }
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Description
+        -----------
+
+        This method formats and writes the specified record.
+
+        Parameters
+        ----------
+
+        record: logging.LogRecord
+
+            A Python logging.LogRecord object.
+
+        """
+
+        # Format and write the message; a flush record signals that
+        # all previously queued messages have been written.
+        flush_event = getattr(record, "flush_event", None)
+        if flush_event is not None:
+            flush_event.set()
+            return
+
+        try:
+            self.methods_dict.get(record.levelno, self.logger.info)(
+                msg=record.getMessage()
+            )
+
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+# ----
+
+
+class StagingLogger:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the staging application logger;
+    the methods accept the same (msg) keyword as
+    utils.logger_interface.Logger together with (optional) %-style
+    arguments.
+
+    Keywords
+    --------
+
+    level: str, optional
+
+        A Python string specifying the logger level (i.e., debug,
+        info, warn, or error); if NoneType, the logger level is
+        specified by the STAGING_LOG_LEVEL environment variable and
+        otherwise defaults to info.
+
+    """
+
+    def __init__(self, level: str = None):
+        """
+        Description
+        -----------
+
+        Creates a new StagingLogger object.
+
+        """
+
+        # Define the base-class attributes.
+        level = str(level or os.environ.get(LOG_LEVEL_ENV) or "info").lower()
+        self.level = LEVELS_DICT.get(level, logging.INFO)
+
+    def _log(self, levelno: int, msg: str, args: tuple) -> None:
+        """
+        Description
+        -----------
+
+        This method queues the specified message if the respective
+        level is enabled.
+
+        Parameters
+        ----------
+
+        levelno: int
+
+            A Python integer specifying the logging level.
+
+        msg: str
+
+            A Python string specifying the message (or %-style
+            format).
+
+        args: tuple
+
+            A Python tuple containing the %-style arguments.
+
+        """
+
+        # Queue the message, without formatting it, for the
+        # background thread; proceed accordingly.
+        if levelno >= self.level:
+            record = logging.LogRecord(
+                name=LOGGER_NAME,
+                level=levelno,
+                pathname=__file__,
+                lineno=0,
+                msg=msg,
+                args=args,
+                exc_info=None,
+            )
+            _start().put(record)
+
+    def debug(self, msg: str, *args) -> None:
+        """
+        Description
+        -----------
+
+        This method queues the specified debug message.
+
+        Parameters
+        ----------
+
+        msg: str
+
+            A Python string specifying the message (or %-style
+            format).
+
+        Other Parameters
+        ----------------
+
+        args: tuple
+
+            The %-style arguments for the message.
+
+        """
+
+        # Queue the message.
+        self._log(levelno=logging.DEBUG, msg=msg, args=args)
+
+    def enabled(self, level: str) -> bool:
+        """
+        Description
+        -----------
+
+        This method determines whether the specified level is enabled
+        (e.g., prior to collecting the attributes of a message).
+
+        Parameters
+        ----------
+
+        level: str
+
+            A Python string specifying the level (i.e., debug, info,
+            warn, or error).
+
+        Returns
+        -------
+
+        enabled: bool
+
+            A Python boolean valued variable specifying whether the
+            level is enabled.
+
+        """
+
+        # Check the level.
+        enabled = LEVELS_DICT[level] >= self.level
+
+        return enabled
+
+    def error(self, msg: str, *args) -> None:
+        """
+        Description
+        -----------
+
+        This method queues the specified error message.
+
+        Parameters
+        ----------
+
+        msg: str
+
+            A Python string specifying the message (or %-style
+            format).
+
+        Other Parameters
+        ----------------
+
+        args: tuple
+
+            The %-style arguments for the message.
+
+        """
+
+        # Queue the message.
+        self._log(levelno=logging.ERROR, msg=msg, args=args)
+
+    def info(self, msg: str, *args) -> None:
+        """
+        Description
+        -----------
+
+        This method queues the specified informational message.
+
+        Parameters
+        ----------
+
+        msg: str
+
+            A Python string specifying the message (or %-style
+            format).
+
+        Other Parameters
+        ----------------
+
+        args: tuple
+
+            The %-style arguments for the message.
+
+        """
+
+        # Queue the message.
+        self._log(levelno=logging.INFO, msg=msg, args=args)
+
+    def warn(self, msg: str, *args) -> None:
+        """
+        Description
+        -----------
+
+        This method queues the specified warning message.
+
+        Parameters
+        ----------
+
+        msg: str
+
+            A Python string specifying the message (or %-style
+            format).
+
+        Other Parameters
+        ----------------
+
+        args: tuple
+
+            The %-style arguments for the message.
+
+        """
+
+        # Queue the message.
+        self._log(levelno=logging.WARNING, msg=msg, args=args)
+
+
+# ----
+
+
+def _start() -> queue.SimpleQueue:
+    """
+    Description
+    -----------
+
+    This function starts the background thread, and the respective
+    queue, for the respective process if it has not been started.
+
+    Returns
+    -------
+
+    messages: queue.SimpleQueue
+
+        A Python queue.SimpleQueue object to which the messages are
+        queued.
+
+    """
+
+    # Start the background thread; proceed accordingly.
+    if _LISTENER_DICT["pid"] == os.getpid():
+        return _LISTENER_DICT["queue"]
+
+    with _LISTENER_LOCK:
+        if _LISTENER_DICT["pid"] == os.getpid():
+            return _LISTENER_DICT["queue"]
+
+        messages = queue.SimpleQueue()
+        listener = QueueListener(messages, _LoggerHandler())
+        listener.start()
+        if _LISTENER_DICT["listener"] is None:
+            atexit.register(_stop)
+
+        _LISTENER_DICT.update(
+            {"listener": listener, "queue": messages, "pid": os.getpid()}
+        )
+
+    return messages
+
+
+def _stop() -> None:
+    """
+    Description
+    -----------
+
+    This function writes all queued messages and stops the background
+    thread for the respective process (i.e., upon exit).
+
+    """
+
+    # Stop the background thread once the queued messages have been
+    # written.
+    with _LISTENER_LOCK:
+        if _LISTENER_DICT["pid"] != os.getpid():
+            return
+
+        _LISTENER_DICT["listener"].stop()
+        _LISTENER_DICT["pid"] = None
+
+
+def flush() -> None:
+    """
+    Description
+    -----------
+
+    This function blocks until all messages queued by the respective
+    process have been written (e.g., prior to raising an exception or
+    writing to standard output directly).
+
+    """
+
+    # Queue a flush record and wait until it has been reached by the
+    # background thread.
+    with _LISTENER_LOCK:
+        if _LISTENER_DICT["pid"] != os.getpid():
+            return
+        messages = _LISTENER_DICT["queue"]
+
+    flush_event = threading.Event()
+    messages.put(logging.makeLogRecord({"flush_event": flush_event}))
+    flush_event.wait()
+
+
+def msg_except_handle(err_cls: object) -> object:
+    """
+    Description
+    -----------
+
+    This function (a decorator) defines a module exception handler
+    (see utils.error_interface.msg_except_handle) which writes all
+    queued messages (see flush) prior to raising the exception such
+    that the messages precede the exception.
+
+    Parameters
+    ----------
+
+    err_cls: object
+
+        A Python object specifying the exception class to be raised.
+
+    Returns
+    -------
+
+    decorator: object
+
+        A Python function which decorates the module exception
+        handler.
+
+    """
+
+    # Define the module exception handler.
+    def decorator(func: object) -> object:
+        handler = error_interface.msg_except_handle(err_cls)(func)
+
+        @functools.wraps(func)
+        def call_function(msg: str) -> None:
+            flush()
+            handler(msg=msg)
+
+        return call_function
+
+    return decorator
@@ -0,0 +1,397 @@
+# =========================================================================
+
+# Module: ush/staging/streams.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    streams.py
+
+Description
+-----------
+
+    This module contains classes and functions to determine the file
+    identifiers whose datestreams (i.e., stream_start and stream_stop
+    attributes) are active for a given analysis cycle.
+
+    Each file identifier defines an interval of analysis cycles for
+    which at least one of its timestamps (i.e., the analysis cycle
+    offset by offset_seconds and, if applicable, the multifile window)
+    may be within the respective datestream; the intervals for all
+    file identifiers are indexed once per configuration such that the
+    active file identifiers for an analysis cycle are determined
+    without building the file identifier attributes and timestamps
+    for each file identifier.
+
+    The index is conservative: a file identifier reported as active
+    may still have no valid timestamps (e.g., due to the multifile
+    interval) and is subsequently handled as before; a file
+    identifier reported as inactive has no valid timestamps.
+
+Classes
+-------
+
+    StreamIndex(intervals_list)
+
+        This is the base-class object for the datestream interval
+        index.
+
+Functions
+---------
+
+    get_index(fetch_dict, fetch_attrs_dict, key=None)
+
+        This function returns the datestream interval index for the
+        specified fetch configuration.
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import bisect
+import calendar
+import threading
+from datetime import datetime
+
+from utils import timestamp_interface
+
+# ----
+
+# Define all available attributes.
+__all__ = ["StreamIndex", "get_index"]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the datestream interval indices collected within the
+# respective process.
+INDEX_CACHE_DICT = {}
+INDEX_CACHE_LOCK = threading.Lock()
+
+# ----
+
+
+class StreamIndex:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the datestream interval index;
+    the intervals are sorted by their beginning and the maximum end of
+    the intervals within each (binary) subtree is retained such that
+    the intervals containing an analysis cycle are determined in
+    O(log(n) + k) for n intervals of which k are active.
+
+    Parameters
+    ----------
+
+    intervals_list: list
+
+        A Python list of (key, start, stop) tuples where key is the
+        respective file identifier key and start and stop are the
+        first and last analysis cycles, in seconds since the POSIX
+        epoch, for which the file identifier may be active; if either
+        start or stop is NoneType, the file identifier is always
+        active.
+
+    """
+
+    def __init__(self, intervals_list: list):
+        """
+        Description
+        -----------
+
+        Creates a new StreamIndex object.
+
+        """
+
+        # Define the base-class attributes; the file identifiers
+        # without a valid interval are always active while the file
+        # identifiers with an empty interval are never active.
+        self.nkeys = len(intervals_list)
+        self.always_list = [
+            key for (key, start, stop) in intervals_list if start is None or stop is None
+        ]
+        intervals_list = sorted(
+            [
+                (start, stop, key)
+                for (key, start, stop) in intervals_list
+                if start is not None and stop is not None and start <= stop
+            ],
+            key=lambda interval: interval[0],
+        )
+        self.starts_list = [interval[0] for interval in intervals_list]
+        self.keys_list = [interval[2] for interval in intervals_list]
+
+        # Build the maximum interval end for each subtree.
+        self.size = 1
+        while self.size < len(intervals_list):
+            self.size *= 2
+
+        self.tree_list = [float("-inf")] * (2 * self.size)
+        for (idx, interval) in enumerate(intervals_list):
+            self.tree_list[self.size + idx] = interval[1]
+        for idx in reversed(range(1, self.size)):
+            self.tree_list[idx] = max(self.tree_list[2 * idx], self.tree_list[2 * idx + 1])
+
+    def __len__(self) -> int:
+        """
+        Description
+        -----------
+
+        This method returns the total number of indexed file
+        identifiers.
+
+        """
+
+        return self.nkeys
+
+    def active(self, cycle: str) -> set:
+        """
+        Description
+        -----------
+
+        This method returns the file identifier keys which are active
+        for the specified analysis cycle.
+
+        Parameters
+        ----------
+
+        cycle: str
+
+            A Python string specifying the analysis cycle; format is
+            %Y%m%d%H%M%S assuming the POSIX convention.
+
+        Returns
+        -------
+
+        active_set: set
+
+            A Python set containing the active file identifier keys.
+
+        """
+
+        # Collect the intervals beginning on or before the analysis
+        # cycle and descend only into the subtrees containing an
+        # interval ending on or after the analysis cycle.
+        seconds = _get_seconds(timestamp=cycle)
+        active_set = set(self.always_list)
+        end = bisect.bisect_right(self.starts_list, seconds)
+
+        nodes_list = [(1, 0, self.size)]
+        while nodes_list:
+            (node, start, stop) = nodes_list.pop()
+            if start >= end or self.tree_list[node] < seconds:
+                continue
+
+            if node >= self.size:
+                active_set.add(self.keys_list[node - self.size])
+                continue
+
+            middle = (start + stop) // 2
+            nodes_list.append((2 * node, start, middle))
+            nodes_list.append((2 * node + 1, middle, stop))
+
+        return active_set
+
+
+# ----
+
+
+def _get_interval(fileid_dict: dict, opt_attr_dict: dict) -> tuple:
+    """
+    Description
+    -----------
+
+    This function defines the interval of analysis cycles for which
+    the specified file identifier may be active.
+
+    Parameters
+    ----------
+
+    fileid_dict: dict
+
+        A Python dictionary containing the file identifier attributes.
+
+    opt_attr_dict: dict
+
+        A Python dictionary containing the default values for the
+        optional file identifier attributes.
+
+    Returns
+    -------
+
+    start: int
+
+        A Python integer specifying the first analysis cycle, in
+        seconds since the POSIX epoch; NoneType if the interval
+        cannot be determined.
+
+    stop: int
+
+        A Python integer specifying the last analysis cycle, in
+        seconds since the POSIX epoch; NoneType if the interval
+        cannot be determined.
+
+    """
+
+    # Define the timestamp offsets relative to the analysis cycle;
+    # invalid attributes are reported when the file identifier
+    # attributes are built and the file identifier is therefore
+    # always considered active.
+    try:
+        offset_seconds = int(fileid_dict.get("offset_seconds", opt_attr_dict.get("offset_seconds", 0)))
+        (min_offset, max_offset) = (offset_seconds, offset_seconds)
+
+        multifile_dict = fileid_dict.get("multifile", opt_attr_dict.get("multifile"))
+        if multifile_dict is not None:
+            min_offset = offset_seconds + int(multifile_dict["start_offset_seconds"])
+            max_offset = offset_seconds + int(multifile_dict["stop_offset_seconds"])
+
+        stream_start = _get_seconds(
+            timestamp=fileid_dict.get("stream_start", opt_attr_dict.get("stream_start"))
+        )
+        stream_stop = _get_seconds(
+            timestamp=fileid_dict.get("stream_stop", opt_attr_dict.get("stream_stop"))
+        )
+
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return (None, None)
+
+    return (stream_start - max_offset, stream_stop - min_offset)
+
+
+def _get_seconds(timestamp: str) -> int:
+    """
+    Description
+    -----------
+
+    This function returns the number of seconds since the POSIX epoch
+    for the specified timestamp.
+
+    Parameters
+    ----------
+
+    timestamp: str
+
+        A Python string specifying the timestamp; format is
+        %Y%m%d%H%M%S assuming the POSIX convention.
+
+    Returns
+    -------
+
+    seconds: int
+
+        A Python integer specifying the number of seconds since the
+        POSIX epoch.
+
+    """
+
+    # Compute the number of seconds since the POSIX epoch.
+    seconds = calendar.timegm(
+        datetime.strptime(str(timestamp), timestamp_interface.GLOBAL).timetuple()
+    )
+
+    return seconds
+
+
+def get_index(fetch_dict: dict, fetch_attrs_dict: dict, key: tuple = None) -> StreamIndex:
+    """
+    Description
+    -----------
+
+    This function returns the datestream interval index for the
+    specified fetch configuration; the file identifier keys are
+    (platform, fetch type, file identifier) tuples.
+
+    Parameters
+    ----------
+
+    fetch_dict: dict
+
+        A Python dictionary containing the fetch configuration
+        attributes.
+
+    fetch_attrs_dict: dict
+
+        A Python dictionary containing the mandatory and optional
+        file identifier attributes for each supported
+        interface/platform; all supported interfaces/platforms are
+        indexed.
+
+    Keywords
+    --------
+
+    key: tuple, optional
+
+        A Python tuple identifying the fetch configuration (e.g., the
+        configuration file path and modification time); if specified,
+        the index is built only once within the respective process
+        for the respective key.
+
+    Returns
+    -------
+
+    stream_index: StreamIndex
+
+        A Python object containing the datestream interval index.
+
+    """
+
+    # Check whether the index has been built; proceed accordingly.
+    with INDEX_CACHE_LOCK:
+        if key is not None and key in INDEX_CACHE_DICT:
+            return INDEX_CACHE_DICT[key]
+
+    # Define the datestream intervals for each file identifier.
+    intervals_list = []
+    for (platform, attrs_dict) in fetch_attrs_dict.items():
+        opt_attr_dict = attrs_dict["opt_attr_dict"]
+        filesdict = fetch_dict.get(platform) or {}
+        for (fetch_type, fetch_type_dict) in filesdict.items():
+            if not isinstance(fetch_type_dict, dict):
+                continue
+            for (fileid, fileid_dict) in fetch_type_dict.items():
+                (start, stop) = _get_interval(
+                    fileid_dict=fileid_dict, opt_attr_dict=opt_attr_dict
+                )
+                intervals_list.append(((platform, fetch_type, fileid), start, stop))
+
+    stream_index = StreamIndex(intervals_list=intervals_list)
+
+    if key is not None:
+        with INDEX_CACHE_LOCK:
+            INDEX_CACHE_DICT[key] = stream_index
+
+    return stream_index
@@ -0,0 +1,595 @@
+# =========================================================================
+
+# Module: ush/staging/tarindex.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    tarindex.py
+
+Description
+-----------
+
+    This module contains classes and functions to extract individual
+    members from (uncompressed) tar archives without reading the
+    respective archives; the data offset and size of each (regular
+    file) member are recorded within a sidecar index, which is built
+    once per archive (i.e., by reading only the member headers) and
+    is subsequently used to copy the member data directly from the
+    respective offsets.
+
+    The sidecar index is a JSON-formatted file containing the archive
+    size and modification time, such that an index is rebuilt if the
+    respective archive is modified, and the members; the sidecar
+    index is written to <tar_path>.index unless specified otherwise.
+
+Classes
+-------
+
+    TarIndex()
+
+        This is the base-class object for the tar archive member
+        indices.
+
+Functions
+---------
+
+    build_index(tar_path, index_path=None)
+
+        This function builds and writes the sidecar index for the
+        specified tar archive.
+
+    error(msg)
+
+        This function is the exception handler for the respective
+        module.
+
+    extract(tar_path, offset, size, dst_path)
+
+        This function extracts the specified tar archive member data
+        to the specified destination file path.
+
+    index_filepath(tar_path, index_path=None)
+
+        This function defines the sidecar index file path for the
+        specified tar archive.
+
+    normalize(name)
+
+        This function normalizes the specified tar archive member
+        name.
+
+    read_index(tar_path, index_path=None)
+
+        This function reads the sidecar index for the specified tar
+        archive.
+
+Requirements
+------------
+
+- ufs_pyutils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import json
+import os
+import tarfile
+import threading
+
+from exceptions import StagingError
+
+from staging.stagelog import StagingLogger, msg_except_handle
+
+# ----
+
+# Define all available attributes.
+__all__ = [
+    "TarIndex",
+    "build_index",
+    "extract",
+    "index_filepath",
+    "normalize",
+    "read_index",
+]
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the block size, in bytes, for copying member data when the
+# kernel copy path is not available.
+BLOCK_SIZE = 8 * 1024 * 1024
+
+# Define the sidecar index file path suffix and format version.
+INDEX_SUFFIX = ".index"
+INDEX_VERSION = 1
+
+# ----
+
+
+class TarIndex:
+    """
+    Description
+    -----------
+
+    This is the base-class object for the tar archive member indices;
+    each sidecar index is read (or built) only once, regardless of
+    the number of threads and members referencing it.
+
+    """
+
+    def __init__(self):
+        """
+        Description
+        -----------
+
+        Creates a new TarIndex object.
+
+        """
+
+        # Define the base-class attributes.
+        self.indices_dict = {}
+        self.locks_dict = {}
+        self.lock = threading.Lock()
+
+    def get(self, tar_path: str, index_path: str = None) -> dict:
+        """
+        Description
+        -----------
+
+        This method returns the members of the specified tar archive;
+        if the sidecar index does not exist or does not correspond to
+        the tar archive, the sidecar index is built.
+
+        Parameters
+        ----------
+
+        tar_path: str
+
+            A Python string specifying the tar archive path.
+
+        Keywords
+        --------
+
+        index_path: str, optional
+
+            A Python string specifying the sidecar index file path;
+            if NoneType, the default sidecar index file path (see
+            index_filepath) is used.
+
+        Returns
+        -------
+
+        members_dict: dict
+
+            A Python dictionary containing the (offset, size) of each
+            member (see normalize); if the tar archive does not exist,
+            NoneType is returned.
+
+        """
+
+        # Collect the sidecar index; proceed accordingly; each tar
+        # archive is locked separately such that distinct indices may
+        # be read or built concurrently.
+        key = (tar_path, index_path)
+        with self.lock:
+            lock = self.locks_dict.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self.indices_dict:
+                if not os.path.isfile(tar_path):
+                    self.indices_dict[key] = None
+                    return None
+
+                index_dict = read_index(tar_path=tar_path, index_path=index_path)
+                if index_dict is None:
+                    index_dict = build_index(tar_path=tar_path, index_path=index_path)
+
+                self.indices_dict[key] = {
+                    name: tuple(member) for (name, member) in index_dict["members"].items()
+                }
+
+            members_dict = self.indices_dict[key]
+
+        return members_dict
+
+    def lookup(self, tar_path: str, name: str, index_path: str = None) -> tuple:
+        """
+        Description
+        -----------
+
+        This method returns the data offset and size of the specified
+        tar archive member.
+
+        Parameters
+        ----------
+
+        tar_path: str
+
+            A Python string specifying the tar archive path.
+
+        name: str
+
+            A Python string specifying the member name.
+
+        Keywords
+        --------
+
+        index_path: str, optional
+
+            A Python string specifying the sidecar index file path;
+            if NoneType, the default sidecar index file path (see
+            index_filepath) is used.
+
+        Returns
+        -------
+
+        member: tuple
+
+            A Python tuple containing the data offset and size, in
+            bytes, of the member; if the tar archive does not exist or
+            does not contain the member, NoneType is returned.
+
+        """
+
+        # Collect the member attributes.
+        members_dict = self.get(tar_path=tar_path, index_path=index_path)
+        if members_dict is None:
+            return None
+
+        return members_dict.get(normalize(name=name))
+
+
+# ----
+
+
+def build_index(tar_path: str, index_path: str = None) -> dict:
+    """
+    Description
+    -----------
+
+    This function builds the sidecar index for the specified tar
+    archive by reading only the member headers (i.e., the member data
+    is skipped); the sidecar index is written atomically and, if the
+    sidecar index file path cannot be written (e.g., a read-only
+    archive), the sidecar index is returned only.
+
+    Parameters
+    ----------
+
+    tar_path: str
+
+        A Python string specifying the tar archive path.
+
+    Keywords
+    --------
+
+    index_path: str, optional
+
+        A Python string specifying the sidecar index file path; if
+        NoneType, the default sidecar index file path (see
+        index_filepath) is used.
+
+    Returns
+    -------
+
+    index_dict: dict
+
+        A Python dictionary containing the sidecar index attributes.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the tar archive is compressed or cannot be
+          read.
+
+    """
+
+    # Collect the data offset and size for each regular file member;
+    # compressed archives do not support random access.
+    stat = os.stat(tar_path)
+    members_dict = {}
+    try:
+        with tarfile.open(tar_path, mode="r:") as tar:
+            for member in tar:
+                if member.isreg() and not member.issparse():
+                    members_dict[normalize(name=member.name)] = [
+                        member.offset_data,
+                        member.size,
+                    ]
+
+    except tarfile.TarError as exc:
+        msg = (
+            f"The tar archive {tar_path} could not be indexed; only "
+            f"uncompressed tar archives are supported ({exc}). Aborting!!!"
+        )
+        error(msg=msg)
+
+    index_dict = {
+        "version": INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "members": members_dict,
+    }
+
+    # Write the sidecar index; proceed accordingly.
+    index_path = index_filepath(tar_path=tar_path, index_path=index_path)
+    tmp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(index_dict, file)
+        os.replace(tmp_path, index_path)
+
+    except OSError as exc:
+        msg = (
+            f"The sidecar index {index_path} for tar archive {tar_path} "
+            f"could not be written ({exc}); the sidecar index will be "
+            "built again by subsequent applications."
+        )
+        StagingLogger().warn(msg=msg)
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+
+    return index_dict
+
+
+def extract(tar_path: str, offset: int, size: int, dst_path: str) -> None:
+    """
+    Description
+    -----------
+
+    This function extracts the specified tar archive member data to
+    the specified destination file path; the member data is copied
+    using os.copy_file_range (i.e., within the kernel) where
+    supported and the destination file path is replaced atomically.
+
+    Parameters
+    ----------
+
+    tar_path: str
+
+        A Python string specifying the tar archive path.
+
+    offset: int
+
+        A Python integer specifying the data offset, in bytes, of the
+        member.
+
+    size: int
+
+        A Python integer specifying the data size, in bytes, of the
+        member.
+
+    dst_path: str
+
+        A Python string specifying the destination file path.
+
+    Raises
+    ------
+
+    StagingError:
+
+        * raised if the tar archive does not contain the member data
+          (e.g., the tar archive is truncated).
+
+    """
+
+    # Copy the member data; if the kernel copy path is not available
+    # or is not supported for the respective filesystems, the member
+    # data is read and written by the application.
+    tmp_path = f"{dst_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    copied = 0
+    with open(tar_path, "rb") as src, open(tmp_path, "wb") as dst:
+        copy_file_range = getattr(os, "copy_file_range", None)
+        try:
+            while copy_file_range is not None and copied < size:
+                nbytes = copy_file_range(
+                    src.fileno(), dst.fileno(), size - copied, offset_src=offset + copied
+                )
+                if nbytes == 0:
+                    break
+                copied += nbytes
+
+        except OSError:
+            pass
+
+        src.seek(offset + copied)
+        while copied < size:
+            block = src.read(min(BLOCK_SIZE, size - copied))
+            if not block:
+                break
+            dst.write(block)
+            copied += len(block)
+
+    if copied < size:
+        os.remove(tmp_path)
+        msg = (
+            f"The tar archive {tar_path} contains {copied} of {size} bytes "
+            f"for the member at offset {offset}. Aborting!!!"
+        )
+        error(msg=msg)
+
+    os.replace(tmp_path, dst_path)
+
+
+def index_filepath(tar_path: str, index_path: str = None) -> str:
+    """
+    Description
+    -----------
+
+    This function defines the sidecar index file path for the
+    specified tar archive.
+
+    Parameters
+    ----------
+
+    tar_path: str
+
+        A Python string specifying the tar archive path.
+
+    Keywords
+    --------
+
+    index_path: str, optional
+
+        A Python string specifying the sidecar index file path; if
+        not NoneType, this value is returned.
+
+    Returns
+    -------
+
+    index_path: str
+
+        A Python string specifying the sidecar index file path.
+
+    """
+
+    # Define the sidecar index file path.
+    if index_path is None:
+        index_path = f"{tar_path}{INDEX_SUFFIX}"
+
+    return index_path
+
+
+def normalize(name: str) -> str:
+    """
+    Description
+    -----------
+
+    This function normalizes the specified tar archive member name
+    (e.g., ./spam/ham and spam/ham are identical members).
+
+    Parameters
+    ----------
+
+    name: str
+
+        A Python string specifying the member name.
+
+    Returns
+    -------
+
+    name: str
+
+        A Python string specifying the normalized member name.
+
+    """
+
+    # Normalize the member name.
+    name = os.path.normpath(name).lstrip("/")
+
+    return name
+
+
+def read_index(tar_path: str, index_path: str = None) -> dict:
+    """
+    Description
+    -----------
+
+    This function reads the sidecar index for the specified tar
+    archive.
+
+    Parameters
+    ----------
+
+    tar_path: str
+
+        A Python string specifying the tar archive path.
+
+    Keywords
+    --------
+
+    index_path: str, optional
+
+        A Python string specifying the sidecar index file path; if
+        NoneType, the default sidecar index file path (see
+        index_filepath) is used.
+
+    Returns
+    -------
+
+    index_dict: dict
+
+        A Python dictionary containing the sidecar index attributes;
+        if the sidecar index does not exist, cannot be read, or does
+        not correspond to the tar archive (i.e., the tar archive has
+        been modified since the sidecar index was built), NoneType is
+        returned.
+
+    """
+
+    # Read the sidecar index; proceed accordingly.
+    try:
+        with open(index_filepath(tar_path=tar_path, index_path=index_path), "r", encoding="utf-8") as file:
+            index_dict = json.load(file)
+
+    except (OSError, ValueError):
+        return None
+
+    stat = os.stat(tar_path)
+    if (
+        not isinstance(index_dict, dict)
+        or index_dict.get("version") != INDEX_VERSION
+        or index_dict.get("size") != stat.st_size
+        or index_dict.get("mtime_ns") != stat.st_mtime_ns
+        or not isinstance(index_dict.get("members"), dict)
+    ):
+        return None
+
+    return index_dict
+
+
+# ----
+
+
+@msg_except_handle(StagingError)
+def error(msg: str) -> None:
+    """
+    Description
+    -----------
+
+    This function is the exception handler for the respective module.
+
+    Parameters
+    ----------
+
+    msg: str
+
+        A Python string containing a message to accompany the
+        exception.
+
+    """
@@ -0,0 +1,244 @@
+# =========================================================================
+
+# Module: staging/tests/test_awss3.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_awss3.py
+
+Description
+-----------
+
+    This module provides unit-tests for the resumable AWS s3
+    downloads; the AWS s3 interface is emulated locally.
+
+Classes
+-------
+
+    TestAWSS3Methods()
+
+        This is the base-class object for all AWS s3 download
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- moto; https://github.com/getmoto/moto
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import tempfile
+from unittest import TestCase
+
+import boto3
+from moto import mock_s3
+from staging import awss3
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the AWS s3 download unit-test attributes.
+AWSS3_BUCKET = "aws-s3-resume-bucket"
+AWSS3_OBJECT_PATH = "aws_s3_resume.bin"
+AWSS3_PROFILE = "unit_tests"
+AWSS3_REGION = "us-east-1"
+AWSS3_TEST_BODY = bytes(range(256)) * 4096
+
+# ----
+
+
+class TestAWSS3Methods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all AWS s3 download unit-tests;
+    it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all AWS s3
+        download unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.local_path = os.path.join(self.tmpdir.name, AWSS3_OBJECT_PATH)
+        (self.part_path, self.checkpoint_path) = awss3.part_filepaths(
+            local_path=self.local_path
+        )
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the AWS s3 download unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def build_partial(self, data: bytes, etag: str, offset: int) -> None:
+        """
+        Description
+        -----------
+
+        This method writes a partial file path and the respective
+        checkpoint emulating an interrupted download.
+
+        """
+
+        # Write the partial file path and checkpoint.
+        with open(self.part_path, "wb") as file:
+            file.write(data)
+
+        awss3.write_checkpoint(
+            local_path=self.local_path,
+            bucket=AWSS3_BUCKET,
+            object_path=AWSS3_OBJECT_PATH,
+            etag=etag,
+            offset=offset,
+        )
+
+    def check_download(self) -> None:
+        """
+        Description
+        -----------
+
+        This method downloads the unit-test object and checks that the
+        local file path is complete and that the partial and
+        checkpoint file paths have been removed.
+
+        """
+
+        # Download the unit-test object and check the local file path.
+        awss3.download(
+            bucket=AWSS3_BUCKET,
+            object_path=AWSS3_OBJECT_PATH,
+            local_path=self.local_path,
+            profile_name=AWSS3_PROFILE,
+        )
+
+        with open(self.local_path, "rb") as file:
+            assert file.read() == AWSS3_TEST_BODY
+        assert not os.path.exists(self.part_path)
+        assert not os.path.exists(self.checkpoint_path)
+
+    @mock_s3
+    def test_download_resume(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for resuming an interrupted
+        download; bytes written beyond the recorded offset are
+        discarded and, if the object has changed, the download is
+        restarted.
+
+        """
+
+        # Create the mock AWS s3 bucket and object path.
+        client = boto3.client("s3", region_name=AWSS3_REGION)
+        client.create_bucket(Bucket=AWSS3_BUCKET)
+        client.put_object(Bucket=AWSS3_BUCKET, Key=AWSS3_OBJECT_PATH, Body=AWSS3_TEST_BODY)
+        etag = client.head_object(Bucket=AWSS3_BUCKET, Key=AWSS3_OBJECT_PATH)["ETag"]
+
+        # Resume from the recorded offset.
+        offset = len(AWSS3_TEST_BODY) // 3
+        self.build_partial(
+            data=AWSS3_TEST_BODY[0:offset] + b"INCOMPLETE",
+            etag=etag.strip('"'),
+            offset=offset,
+        )
+        self.check_download()
+
+        # Restart since the partial file path corresponds to a
+        # different version of the object.
+        os.remove(self.local_path)
+        self.build_partial(data=b"STALE" * 100, etag="stale", offset=500)
+        self.check_download()
+
+    @mock_s3
+    def test_list_objects(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the paginated AWS s3
+        object path listing.
+
+        """
+
+        # Create the mock AWS s3 bucket and object paths; the number
+        # of object paths spans multiple pages.
+        client = boto3.client("s3", region_name=AWSS3_REGION)
+        client.create_bucket(Bucket=AWSS3_BUCKET)
+        object_paths_list = [f"insitu/{idx:05d}.nc" for idx in range(2500)]
+        for object_path in object_paths_list:
+            client.put_object(Bucket=AWSS3_BUCKET, Key=object_path, Body=b"")
+
+        # Check the complete listing and the listing for only the
+        # requested object paths.
+        assert (
+            list(
+                awss3.list_objects(
+                    bucket=AWSS3_BUCKET, prefix="insitu/", profile_name=AWSS3_PROFILE
+                )
+            )
+            == object_paths_list
+        )
+
+        wanted = {"insitu/00002.nc", "insitu/01500.nc", "insitu/09999.nc", "other/00001.nc"}
+        assert set(
+            awss3.list_objects(
+                bucket=AWSS3_BUCKET,
+                prefix="insitu/",
+                profile_name=AWSS3_PROFILE,
+                wanted=wanted,
+            )
+        ) == {"insitu/00002.nc", "insitu/01500.nc"}
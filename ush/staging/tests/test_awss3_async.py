@@ -0,0 +1,304 @@
+# =========================================================================
+
+# Module: staging/tests/test_awss3_async.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_awss3_async.py
+
+Description
+-----------
+
+    This module provides unit-tests for the asyncio AWS s3 fetch
+    engine; the AWS s3 interface is emulated locally by a moto server
+    since the asynchronous AWS s3 client cannot be emulated in-process.
+
+Classes
+-------
+
+    TestAWSS3AsyncMethods()
+
+        This is the base-class object for all asyncio AWS s3 fetch
+        engine unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- aiobotocore; https://github.com/aio-libs/aiobotocore
+
+- moto[server]; https://github.com/getmoto/moto
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import socket
+import tempfile
+from unittest import TestCase, mock
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from staging import awss3, awss3_async
+from staging.cache import ObjectCache
+from tools import parser_interface
+
+pytest.importorskip("aiobotocore")
+moto_server = pytest.importorskip("moto.server")
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the asyncio AWS s3 fetch engine unit-test attributes.
+AWSS3_BUCKET = "aws-s3-async-bucket"
+AWSS3_OBJECTS_DICT = {
+    "async/object_0.bin": bytes(range(256)) * 4096,
+    "async/object_1.bin": b"UNIT TEST FOR ASYNCIO FETCH ENGINE",
+}
+AWSS3_MISSING_OBJECT_PATH = "async/missing.bin"
+AWSS3_PROFILE = "unit_tests"
+AWSS3_REGION = "us-east-1"
+
+# ----
+
+
+class TestAWSS3AsyncMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all asyncio AWS s3 fetch engine
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method launches the moto server and defines the
+        base-class attributes for all asyncio AWS s3 fetch engine
+        unit-tests.
+
+        """
+
+        # Launch the moto server; the AWS s3 clients are directed to
+        # the moto server via the AWS endpoint environment variable.
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        self.server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port)
+        self.server.start()
+        self.environ = mock.patch.dict(
+            os.environ, {"AWS_ENDPOINT_URL": f"http://127.0.0.1:{port}"}
+        )
+        self.environ.start()
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ObjectCache(cache_path=os.path.join(self.tmpdir.name, "cache"))
+        self.client = boto3.Session(profile_name=AWSS3_PROFILE).client(
+            "s3", region_name=AWSS3_REGION
+        )
+        self.client.create_bucket(Bucket=AWSS3_BUCKET)
+        for (object_path, body) in AWSS3_OBJECTS_DICT.items():
+            self.client.put_object(Bucket=AWSS3_BUCKET, Key=object_path, Body=body)
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method stops the moto server and removes the asyncio AWS
+        s3 fetch engine unit-test files.
+
+        """
+
+        # Stop the moto server and remove the unit-test files.
+        self.environ.stop()
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def build_fileid_obj(self) -> object:
+        """
+        Description
+        -----------
+
+        This method defines the compiled file identifier object for
+        the unit-test AWS s3 object paths.
+
+        Returns
+        -------
+
+        fileid_obj: object
+
+            A Python object containing the compiled attributes for the
+            unit-test file identifier.
+
+        """
+
+        # Define the compiled file identifier object.
+        filepaths_list = [
+            {
+                "local_path": os.path.join(self.tmpdir.name, "com", object_path),
+                "object_path": object_path,
+            }
+            for object_path in list(AWSS3_OBJECTS_DICT) + [AWSS3_MISSING_OBJECT_PATH]
+        ]
+
+        fileid_obj = parser_interface.object_define()
+        for (key, value) in [
+            ("bucket", AWSS3_BUCKET),
+            ("profile_name", AWSS3_PROFILE),
+            ("filepaths_list", filepaths_list),
+        ]:
+            fileid_obj = parser_interface.object_setattr(
+                object_in=fileid_obj, key=key, value=value
+            )
+
+        return fileid_obj
+
+    def test_fetch(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the asyncio AWS s3 fetch
+        engine; an interrupted download is resumed, missing AWS s3
+        object paths are ignored, and the collected objects are
+        subsequently collected from the local object cache.
+
+        """
+
+        # Emulate an interrupted download of the first object; bytes
+        # written beyond the recorded offset are discarded.
+        fileid_obj = self.build_fileid_obj()
+        (object_path, body) = list(AWSS3_OBJECTS_DICT.items())[0]
+        local_path = fileid_obj.filepaths_list[0]["local_path"]
+        os.makedirs(os.path.dirname(local_path))
+        offset = len(body) // 3
+        with open(awss3.part_filepaths(local_path=local_path)[0], "wb") as file:
+            file.write(body[0:offset] + b"INCOMPLETE")
+        awss3.write_checkpoint(
+            local_path=local_path,
+            bucket=AWSS3_BUCKET,
+            object_path=object_path,
+            etag=self.client.head_object(Bucket=AWSS3_BUCKET, Key=object_path)[
+                "ETag"
+            ].strip('"'),
+            offset=offset,
+        )
+
+        # Collect the objects and check the local file paths.
+        local_paths_list = awss3_async.fetch(
+            fileid_obj_list=[fileid_obj], max_concurrency=2, cache=self.cache
+        )
+
+        assert local_paths_list == [
+            [filepath_dict["local_path"] for filepath_dict in fileid_obj.filepaths_list[0:-1]]
+        ]
+        for (local_path, body) in zip(local_paths_list[0], AWSS3_OBJECTS_DICT.values()):
+            with open(local_path, "rb") as file:
+                assert file.read() == body
+            assert not any(
+                os.path.exists(filepath)
+                for filepath in awss3.part_filepaths(local_path=local_path)
+            )
+            os.remove(local_path)
+
+        # Collect the objects again; the objects are collected from
+        # the local object cache.
+        with mock.patch.object(self.cache, "store") as store:
+            assert (
+                awss3_async.fetch(
+                    fileid_obj_list=[fileid_obj], max_concurrency=2, cache=self.cache
+                )
+                == local_paths_list
+            )
+
+        store.assert_not_called()
+        for (local_path, body) in zip(local_paths_list[0], AWSS3_OBJECTS_DICT.values()):
+            with open(local_path, "rb") as file:
+                assert file.read() == body
+
+    def test_fetch_error(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the asyncio AWS s3 fetch
+        engine when an AWS s3 object cannot be collected; the
+        exception is raised once the remaining collections have been
+        cancelled.
+
+        """
+
+        # Collect the objects from the unit-test AWS s3 bucket and
+        # from an AWS s3 bucket that does not exist.
+        fileid_obj_list = [self.build_fileid_obj() for _ in range(2)]
+        fileid_obj_list[1].bucket = "aws-s3-async-missing-bucket"
+        for filepath_dict in fileid_obj_list[1].filepaths_list:
+            filepath_dict["local_path"] = filepath_dict["local_path"] + ".missing"
+
+        # Check that all collections have completed once the AWS s3
+        # clients are closed.
+        (tasks_list, done_list) = ([], [])
+        create_task = awss3_async.asyncio.create_task
+
+        def _create_task(coro: object) -> object:
+            task = create_task(coro)
+            tasks_list.append(task)
+            return task
+
+        class _AsyncExitStack(awss3_async.contextlib.AsyncExitStack):
+            async def __aexit__(self, *exc_details) -> bool:
+                done_list.append(all(task.done() for task in tasks_list))
+                return await super().__aexit__(*exc_details)
+
+        with mock.patch.object(
+            awss3_async.asyncio, "create_task", side_effect=_create_task
+        ), mock.patch.object(
+            awss3_async.contextlib, "AsyncExitStack", _AsyncExitStack
+        ), self.assertRaises(ClientError) as context:
+            awss3_async.fetch(fileid_obj_list=fileid_obj_list, max_concurrency=2)
+
+        assert context.exception.response["Error"]["Code"] == "NoSuchBucket"
+        assert len(tasks_list) == 6
+        assert done_list and all(done_list)
@@ -0,0 +1,221 @@
+# =========================================================================
+
+# Module: staging/tests/test_cache.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_cache.py
+
+Description
+-----------
+
+    This module provides unit-tests for the local content-addressed
+    object cache.
+
+Classes
+-------
+
+    TestCacheMethods()
+
+        This is the base-class object for all object cache
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
+
+from staging.cache import ObjectCache, materialize
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the object cache unit-test attributes.
+BUCKET = "cache-test-bucket"
+CACHE_TEST_MESSAGE = "UNIT TEST FOR OBJECT CACHE"
+
+# ----
+
+
+class TestCacheMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all object cache unit-tests; it
+    is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all object
+        cache unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmpdir.name, "cache")
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the object cache unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def write_file(self, filename: str, nbytes: int = None) -> str:
+        """
+        Description
+        -----------
+
+        This method writes a unit-test file and returns the
+        respective file path.
+
+        """
+
+        # Write the unit-test file.
+        filepath = os.path.join(self.tmpdir.name, filename)
+        with open(filepath, "w", encoding="utf-8") as file:
+            file.write(CACHE_TEST_MESSAGE if nbytes is None else "x" * nbytes)
+
+        return filepath
+
+    def test_cache_store_lookup(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for storing, collecting, and
+        materializing objects within the object cache.
+
+        """
+
+        # Store an object and check that it is only collected for
+        # the matching ETag.
+        cache = ObjectCache(cache_path=self.cache_path)
+        filepath = self.write_file(filename="object.file")
+        cache.store(filepath=filepath, bucket=BUCKET, object_path="a/b", etag="1")
+
+        assert cache.lookup(bucket=BUCKET, object_path="a/b", etag="2") is None
+        cache_filepath = cache.lookup(bucket=BUCKET, object_path="a/b", etag="1")
+
+        assert cache_filepath is not None
+
+        # Materialize the cached object at a new local file path.
+        local_path = os.path.join(self.tmpdir.name, "local.file")
+        method = materialize(src_path=cache_filepath, dst_path=local_path)
+
+        assert method == "hardlink"
+        with open(local_path, "r", encoding="utf-8") as file:
+            assert file.read() == CACHE_TEST_MESSAGE
+
+    def test_cache_evict(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the least recently used
+        object cache eviction.
+
+        """
+
+        # Store three objects within the object cache; the first
+        # object is the most recently used object.
+        cache = ObjectCache(cache_path=self.cache_path)
+        for (object_path, atime) in [("a", 30), ("b", 10), ("c", 20)]:
+            filepath = self.write_file(filename=f"{object_path}.file", nbytes=100)
+            cache_filepath = cache.store(
+                filepath=filepath, bucket=BUCKET, object_path=object_path, etag="1"
+            )
+            os.utime(cache_filepath, (time.time() + atime, time.time() + atime))
+
+        # Bound the object cache such that it may only contain two
+        # objects and check that the least recently used object is
+        # removed.
+        cache.max_size = 200
+        cache.evict()
+
+        assert os.path.isfile(cache.cache_filepath(bucket=BUCKET, object_path="a", etag="1"))
+        assert not os.path.isfile(cache.cache_filepath(bucket=BUCKET, object_path="b", etag="1"))
+        assert os.path.isfile(cache.cache_filepath(bucket=BUCKET, object_path="c", etag="1"))
+
+    def test_cache_size_index(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the recorded object
+        cache size of a bounded object cache.
+
+        """
+
+        # Store objects within a bounded object cache and check that
+        # the object cache is only scanned when the recorded size is
+        # not defined or exceeds the maximum size.
+        cache = ObjectCache(cache_path=self.cache_path, max_size=1000)
+        with mock.patch.object(cache, "_evict", wraps=cache._evict) as evict:
+            for idx in range(11):
+                filepath = self.write_file(filename=f"{idx}.file", nbytes=100)
+                os.utime(filepath, (time.time() + idx, time.time() + idx))
+                cache.store(
+                    filepath=filepath, bucket=BUCKET, object_path=str(idx), etag="1"
+                )
+
+        assert evict.call_count == 2
+        with open(cache.size_path, "r", encoding="utf-8") as file:
+            assert int(file.read()) == 900
+        for idx in range(11):
+            assert os.path.isfile(
+                cache.cache_filepath(bucket=BUCKET, object_path=str(idx), etag="1")
+            ) == (idx >= 2)
@@ -0,0 +1,179 @@
+# =========================================================================
+
+# Module: staging/tests/test_decompress.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_decompress.py
+
+Description
+-----------
+
+    This module provides unit-tests for the collected file
+    decompression.
+
+Classes
+-------
+
+    TestDecompressMethods()
+
+        This is the base-class object for all collected file
+        decompression unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import bz2
+import gzip
+import os
+import tempfile
+from unittest import TestCase
+
+from staging.decompress import decompress_pool, detect, get_attrs
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the collected file decompression unit-test attributes.
+DATA = b"UNIT TEST FOR COLLECTED FILE DECOMPRESSION" * 1000
+
+# ----
+
+
+class TestDecompressMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all collected file
+    decompression unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all
+        collected file decompression unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the collected file decompression
+        unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def test_decompress_pool(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the collected file
+        decompression.
+
+        """
+
+        # Check that the compressed files are decompressed in place
+        # and that the remaining files are not modified.
+        filepaths_dict = {
+            "gzip": gzip.compress(DATA),
+            "bzip2": bz2.compress(DATA),
+            "plain": DATA,
+            "mismatch": gzip.compress(DATA),
+        }
+        for (name, data) in filepaths_dict.items():
+            with open(os.path.join(self.tmpdir.name, name), "wb") as file:
+                file.write(data)
+
+        filepaths_list = [os.path.join(self.tmpdir.name, name) for name in filepaths_dict]
+        assert [detect(filepath=filepath) for filepath in filepaths_list] == [
+            "gzip",
+            "bzip2",
+            None,
+            "gzip",
+        ]
+
+        fmts_list = decompress_pool(
+            filepaths_list=filepaths_list,
+            fmts_list=["auto", "bzip2", "auto", "bzip2"],
+            nworkers=2,
+        )
+
+        assert fmts_list == ["gzip", "bzip2", None, None]
+        for filepath in filepaths_list[0:3]:
+            with open(filepath, "rb") as file:
+                assert file.read() == DATA
+
+    def test_get_attrs(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the decompress attribute
+        parser.
+
+        """
+
+        # Check the decompress attribute defaults and shorthand.
+        assert get_attrs(decompress_attr=None) is None
+        assert get_attrs(decompress_attr="gzip") == {
+            "format": "gzip",
+            "mode": "pool",
+            "checksum": "decompressed",
+        }
+        assert get_attrs(decompress_attr={"mode": "each", "checksum": "compressed"}) == {
+            "format": "auto",
+            "mode": "each",
+            "checksum": "compressed",
+        }
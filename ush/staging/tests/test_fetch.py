@@ -66,13 +66,19 @@ History
 
 # ----
 
+import gzip
+import hashlib
+import io
 import os
-from unittest import TestCase
+import tarfile
+from unittest import TestCase, mock
 
 import boto3
 import pytest
 from confs.yaml_interface import YAML
+from exceptions import StagingError
 from moto import mock_s3
+from staging import awss3, plan
 from staging.fetch import Fetch
 from tools import fileio_interface, parser_interface
 
@@ -92,6 +98,15 @@ YAML_FILE = "test_fetch.yaml"
 AWSS3_REGION = "us-east-1"
 AWSS3_TEST_MESSAGE = "UNIT TEST FOR FETCH APPLICATION AWS S3 INTERFACE"
 
+# Define the (unmodified) AWS s3 object path download function.
+DOWNLOAD = awss3.download
+
+# Define the POSIX fetch application unit-test attributes.
+POSIX_TEST_MESSAGE = "UNIT TEST FOR FETCH APPLICATION POSIX INTERFACE"
+
+# Define the tar archive fetch application unit-test attributes.
+TAR_TEST_MESSAGE = "UNIT TEST FOR FETCH APPLICATION TAR INTERFACE"
+
 # ----
 
 
@@ -124,7 +139,7 @@ class TestFetchMethods(TestCase):
         # file.
         self.yaml_dict = YAML().read_yaml(yaml_file=self.yaml_file)["fetch"]
 
-    def build_options_obj(self, platform: str) -> object:
+    def build_options_obj(self, platform: str, plan_file: str = None) -> object:
         """
         Description
         -----------
@@ -140,6 +155,14 @@ class TestFetchMethods(TestCase):
 
             A Python string specifying the platform/interface type.
 
+        Keywords
+        --------
+
+        plan_file: str, optional
+
+            A Python string specifying the path to a precompiled fetch
+            plan.
+
         Returns
         -------
 
@@ -171,50 +194,40 @@ class TestFetchMethods(TestCase):
         options_obj = parser_interface.object_setattr(
             object_in=options_obj, key="work_path", value=os.getcwd()
         )
+        options_obj = parser_interface.object_setattr(
+            object_in=options_obj, key="plan_file", value=plan_file
+        )
 
         # Initialize the fetch application.
         fetch = Fetch(options_obj=options_obj)
 
         return fetch
 
-    def cleanup(self, filelist: list) -> None:
+    def build_awss3_mock(self, platform: str) -> dict:
         """
         Description
         -----------
 
-        This method removes the specified no-longer necessary
-        unit-test files.
+        This method creates the mock AWS s3 bucket and object path
+        for the AWS s3 platform/interface unit-tests.
 
         Parameters
         ----------
 
-        filelist: list
+        platform: str
 
-            A Python list contianing the no-longer necessary unit-test
-            files to be removed.
+            A Python string specifying the platform/interface type.
 
-        """
+        Returns
+        -------
 
-        # Remove the specified files.
-        fileio_interface.removefiles(filelist=filelist)
+        awss3_test_dict: dict
 
-    @pytest.mark.order(1)
-    @mock_s3
-    def test_fetch_awss3(self) -> None:
-        """
-        Description
-        -----------
-
-        This method provides a unit-test for the fetch application AWS
-        s3 platform/interface.
+            A Python dictionary containing the YAML-formatted key and
+            value pairs for the AWS s3 unit-test file identifier.
 
         """
 
-        # Define the platform/interface against which to test the
-        # fetch application.
-        platform = "aws_s3"
-        fetch = self.build_options_obj(platform=platform)
-
         # Collect the relevant YAML-formatted key and value pairs.
         awss3_test_dict = self.yaml_dict[platform]["test_awss3"]["test_awss3_file"]
 
@@ -238,11 +251,81 @@ class TestFetchMethods(TestCase):
         conn.create_bucket(Bucket=mock_obj.bucket)
 
         # Create the mock AWS s3 bucket object path.
-        awss3 = boto3.client("s3", region_name=AWSS3_REGION)
-        awss3.put_object(
+        client = boto3.client("s3", region_name=AWSS3_REGION)
+        client.put_object(
             Bucket=mock_obj.bucket, Key=mock_obj.object_path, Body=AWSS3_TEST_MESSAGE
         )
 
+        return awss3_test_dict
+
+    def corrupt_download(self, **kwargs) -> str:
+        """
+        Description
+        -----------
+
+        This method collects the specified AWS s3 object path (see
+        staging.awss3.download) and corrupts the first collected file.
+
+        Returns
+        -------
+
+        etag: str
+
+            A Python string specifying the ETag of the collected AWS
+            s3 object path.
+
+        """
+
+        # Collect the AWS s3 object path; proceed accordingly.
+        etag = DOWNLOAD(**kwargs)
+        self.ndownloads += 1
+        if self.ndownloads == 1:
+            with open(kwargs["local_path"], "a", encoding="utf-8") as file:
+                file.write("CORRUPTED")
+
+        return etag
+
+    def cleanup(self, filelist: list) -> None:
+        """
+        Description
+        -----------
+
+        This method removes the specified no-longer necessary
+        unit-test files.
+
+        Parameters
+        ----------
+
+        filelist: list
+
+            A Python list contianing the no-longer necessary unit-test
+            files to be removed.
+
+        """
+
+        # Remove the specified files.
+        fileio_interface.removefiles(filelist=filelist)
+
+    @pytest.mark.order(1)
+    @mock_s3
+    def test_fetch_awss3(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the fetch application AWS
+        s3 platform/interface.
+
+        """
+
+        # Define the platform/interface against which to test the
+        # fetch application.
+        platform = "aws_s3"
+        fetch = self.build_options_obj(platform=platform)
+
+        # Create the mock AWS s3 bucket and object path.
+        awss3_test_dict = self.build_awss3_mock(platform=platform)
+
         # Collect the attribute from the specified AWS s3 bucket
         # object path.
         fetch.run()
@@ -260,6 +343,307 @@ class TestFetchMethods(TestCase):
         filelist.append(awss3_test_dict["local_path"])
         self.cleanup(filelist=filelist)
 
+    @pytest.mark.order(2)
+    @mock_s3
+    def test_fetch_awss3_plan(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the fetch application AWS
+        s3 platform/interface using a precompiled fetch plan.
+
+        """
+
+        # Compile the fetch plan for the platform/interface against
+        # which to test the fetch application.
+        platform = "aws_s3"
+        fetch = self.build_options_obj(platform=platform)
+        plan_file = fetch.write_plan()
+
+        assert os.path.isfile(plan_file)
+        assert {"bandwidth", "cache", "engine", "queue", "workers"} <= set(
+            plan.read_plan(plan_file=plan_file, cycle=fetch.cycle)["fetch"]
+        )
+
+        # Collect the attribute from the specified AWS s3 bucket
+        # object path using the fetch plan; check that the
+        # YAML-formatted configuration file is not parsed.
+        awss3_test_dict = self.build_awss3_mock(platform=platform)
+        with mock.patch.object(YAML, "read_yaml") as read_yaml, mock.patch.object(
+            YAML, "read_concat_yaml"
+        ) as read_concat_yaml:
+            fetch = self.build_options_obj(platform=platform, plan_file=plan_file)
+            fetch.run()
+
+        assert not read_yaml.called and not read_concat_yaml.called
+        assert fetch.launch.com_root == os.path.dirname(plan_file)
+
+        # Check that the contents of the collected file are valid.
+        with open(awss3_test_dict["local_path"], "r", encoding="utf-8") as file:
+            data = file.read()
+
+        assert data == AWSS3_TEST_MESSAGE
+
+        # Define and remove the test files.
+        filelist = [awss3_test_dict["local_path"], plan_file]
+        self.cleanup(filelist=filelist)
+
+    @mock_s3
+    def test_fetch_awss3_manifest(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the fetch application AWS
+        s3 platform/interface md5 manifest verification; the first
+        collection of the AWS s3 object path is corrupted.
+
+        """
+
+        # Define the md5 manifest and checksum attributes for the AWS
+        # s3 platform/interface file identifier.
+        yaml_dict = YAML().read_yaml(yaml_file=self.yaml_file)
+        awss3_test_dict = yaml_dict["fetch"]["aws_s3"]["test_awss3"]["test_awss3_file"]
+        awss3_test_dict["md5_manifest"] = "aws_s3_manifest.md5"
+        checksum_filepath = os.path.join(self.dirpath, "aws_s3.manifest.md5")
+        yaml_dict["fetch"]["checksum"]["aws_s3_filepath"] = checksum_filepath
+        self.yaml_file = os.path.join(self.dirpath, "test_fetch.manifest.yaml")
+        YAML().write_yaml(yaml_file=self.yaml_file, in_dict=yaml_dict)
+
+        # Create the mock AWS s3 bucket, object path, and md5
+        # manifest.
+        self.build_awss3_mock(platform="aws_s3")
+        md5 = hashlib.md5(AWSS3_TEST_MESSAGE.encode("utf-8")).hexdigest()
+        boto3.client("s3", region_name=AWSS3_REGION).put_object(
+            Bucket=awss3_test_dict["bucket"],
+            Key=awss3_test_dict["md5_manifest"],
+            Body=f"{md5}  {awss3_test_dict['object_path']}\n",
+        )
+
+        # Collect the file, corrupting the first collection, and check
+        # that the file is collected again and that the checksum hash
+        # index is that of the verified file.
+        self.ndownloads = 0
+        with mock.patch.object(awss3, "download", side_effect=self.corrupt_download):
+            self.build_options_obj(platform="aws_s3").run()
+
+        assert self.ndownloads == 2
+        with open(awss3_test_dict["local_path"], "r", encoding="utf-8") as file:
+            assert file.read() == AWSS3_TEST_MESSAGE
+        with open(checksum_filepath, "r", encoding="utf-8") as file:
+            assert file.read().split() == [md5, awss3_test_dict["local_path"]]
+
+        # Define and remove the test files.
+        filelist = [awss3_test_dict["local_path"], checksum_filepath, self.yaml_file]
+        self.cleanup(filelist=filelist)
+
+    @mock_s3
+    def test_fetch_awss3_workers(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the fetch application AWS
+        s3 platform/interface when the fetch type worker budgets are
+        specified (i.e., the fetch types are collected concurrently);
+        the AWS s3 bucket for one of the fetch types does not exist.
+
+        """
+
+        # Define the fetch type worker budgets and a fetch type for
+        # which the AWS s3 bucket does not exist.
+        yaml_dict = YAML().read_yaml(yaml_file=self.yaml_file)
+        awss3_dict = yaml_dict["fetch"]["aws_s3"]
+        awss3_dict["test_awss3_missing"] = {
+            "test_awss3_missing_file": dict(
+                awss3_dict["test_awss3"]["test_awss3_file"],
+                local_path="aws_s3_missing_local_path.file",
+                bucket="aws-s3-missing-bucket",
+            )
+        }
+        yaml_dict["fetch"]["workers"] = {"default": 1, "test_awss3": 2}
+        self.yaml_file = os.path.join(self.dirpath, "test_fetch.workers.yaml")
+        YAML().write_yaml(yaml_file=self.yaml_file, in_dict=yaml_dict)
+
+        # Collect the files for both fetch types; check that the
+        # failed fetch type does not stop the collection of the
+        # remaining fetch type and that the application fails once
+        # both fetch types have been collected.
+        awss3_test_dict = self.build_awss3_mock(platform="aws_s3")
+        fetch = self.build_options_obj(platform="aws_s3")
+        method = mock.Mock(wraps=fetch.fetch_methods_dict["aws_s3"])
+        fetch.fetch_methods_dict["aws_s3"] = method
+        with mock.patch.object(fetch.logger, "info") as info:
+            with self.assertRaises(StagingError) as context:
+                fetch.run()
+
+        assert "test_awss3_missing" in str(context.exception)
+        with open(awss3_test_dict["local_path"], "r", encoding="utf-8") as file:
+            assert file.read() == AWSS3_TEST_MESSAGE
+
+        # Check the worker budget for each fetch type and the summary
+        # for all fetch types.
+        assert sorted(
+            (list(call.kwargs["filesdict"])[0], call.kwargs["nworkers"])
+            for call in method.call_args_list
+        ) == [("test_awss3_file", 2), ("test_awss3_missing_file", 1)]
+
+        (summary,) = [
+            call.kwargs["msg"]
+            for call in info.call_args_list
+            if call.kwargs.get("msg", "").startswith("Fetch summary")
+        ]
+        assert "aws_s3/test_awss3: 1 file identifiers" in summary
+        assert "aws_s3/test_awss3_missing: FAILED" in summary
+
+        # Define and remove the test files.
+        filelist = [awss3_test_dict["local_path"], self.yaml_file]
+        self.cleanup(filelist=filelist)
+
+    def test_fetch_nc_sort(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the netCDF-formatted file
+        concatenation sort attributes.
+
+        """
+
+        # Check that the locations are sorted by the subset time
+        # variable unless the sort keys are specified.
+        fetch = self.build_options_obj(platform="aws_s3")
+        for (nc_concat, sort) in [
+            ({"sort": {"unique": True}}, {"keys": ["time"], "unique": True}),
+            (
+                {"sort": {"unique": True}, "subset": {"time": "MetaData/dateTime"}},
+                {"keys": ["MetaData/dateTime"], "unique": True},
+            ),
+            ({"sort": {"keys": [], "unique": True}}, {"keys": [], "unique": True}),
+            ({"sort": {"keys": []}}, None),
+        ]:
+            fileconcat_obj = parser_interface.object_setattr(
+                object_in=parser_interface.object_define(),
+                key="nc_concat",
+                value=nc_concat,
+            )
+            assert fetch._nc_sort(fileconcat_obj=fileconcat_obj) == sort
+
+    @pytest.mark.order(3)
+    def test_fetch_posix(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the fetch application
+        POSIX platform/interface.
+
+        """
+
+        # Create the object paths, one of which is compressed,
+        # beneath the root path.
+        posix_test_dict = self.yaml_dict["posix"]["test_posix"]["test_posix_file"]
+        gzip_test_dict = self.yaml_dict["posix"]["test_posix"]["test_posix_gzip_file"]
+        (src_path, gzip_src_path) = [
+            os.path.join(
+                test_dict["root_path"],
+                test_dict["object_path"].replace("%Y%m%d", self.cycle[0:8]),
+            )
+            for test_dict in [posix_test_dict, gzip_test_dict]
+        ]
+        os.makedirs(os.path.dirname(src_path), exist_ok=True)
+        with open(src_path, "w", encoding="utf-8") as file:
+            file.write(POSIX_TEST_MESSAGE)
+        with gzip.open(gzip_src_path, "wt", encoding="utf-8") as file:
+            file.write(POSIX_TEST_MESSAGE)
+
+        # Collect the file beneath the root path.
+        fetch = self.build_options_obj(platform="posix")
+        fetch.run()
+
+        # Check that the contents of the collected files are valid,
+        # that the compressed file has been decompressed, and that the
+        # collected files are not hardlinks to the root path files.
+        for test_dict in [posix_test_dict, gzip_test_dict]:
+            with open(test_dict["local_path"], "r", encoding="utf-8") as file:
+                data = file.read()
+
+            assert data == POSIX_TEST_MESSAGE
+
+        assert not os.path.samefile(src_path, posix_test_dict["local_path"])
+        with gzip.open(gzip_src_path, "rt", encoding="utf-8") as file:
+            assert file.read() == POSIX_TEST_MESSAGE
+
+        # Define and remove the test files.
+        filelist = [
+            posix_test_dict["local_path"],
+            gzip_test_dict["local_path"],
+            src_path,
+            gzip_src_path,
+        ]
+        self.cleanup(filelist=filelist)
+        os.removedirs(os.path.dirname(src_path))
+
+    def test_fetch_instances(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for multiple fetch
+        application instances within a single process.
+
+        """
+
+        # Initialize fetch applications for successive forecast
+        # cycles and check that the attributes of each fetch
+        # application are not shared.
+        fetch_list = []
+        for cycle in [CYCLE, "20000101060000"]:
+            self.cycle = cycle
+            fetch_list.append(self.build_options_obj(platform="posix"))
+
+        assert [fetch.cycle for fetch in fetch_list] == [CYCLE, "20000101060000"]
+        assert [fetch.launch.cycle for fetch in fetch_list] == [CYCLE, "20000101060000"]
+        assert fetch_list[0].launch is not fetch_list[1].launch
+        assert not hasattr(Fetch, "cycle")
+
+    @pytest.mark.order(4)
+    def test_fetch_tar(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the fetch application tar
+        archive platform/interface.
+
+        """
+
+        # Create the tar archive containing the member.
+        tar_test_dict = self.yaml_dict["tar"]["test_tar"]["test_tar_file"]
+        tar_path = tar_test_dict["tar_path"].replace("%Y%m%d", self.cycle[0:8])
+        with tarfile.open(tar_path, mode="w") as tar:
+            for name in ["other.file", f"{self.cycle[0:10]}/tar_object_path.file"]:
+                tarinfo = tarfile.TarInfo(name=name)
+                tarinfo.size = len(TAR_TEST_MESSAGE)
+                tar.addfile(tarinfo, io.BytesIO(TAR_TEST_MESSAGE.encode("utf-8")))
+
+        # Collect the member from the tar archive.
+        fetch = self.build_options_obj(platform="tar")
+        fetch.run()
+
+        # Check that the contents of the collected file are valid and
+        # that the sidecar index has been written.
+        with open(tar_test_dict["local_path"], "r", encoding="utf-8") as file:
+            data = file.read()
+
+        assert data == TAR_TEST_MESSAGE
+        assert os.path.isfile(f"{tar_path}.index")
+
+        # Define and remove the test files.
+        filelist = [tar_test_dict["local_path"], tar_path, f"{tar_path}.index"]
+        self.cleanup(filelist=filelist)
+
 
 # ----
 
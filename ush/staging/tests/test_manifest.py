@@ -0,0 +1,202 @@
+# =========================================================================
+
+# Module: staging/tests/test_manifest.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_manifest.py
+
+Description
+-----------
+
+    This module provides unit-tests for the upstream md5 manifest
+    verification; the AWS s3 interface is emulated locally.
+
+Classes
+-------
+
+    TestManifestMethods()
+
+        This is the base-class object for all md5 manifest
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- moto; https://github.com/getmoto/moto
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import hashlib
+import os
+import tempfile
+from unittest import TestCase
+
+import boto3
+from moto import mock_s3
+from staging import manifest
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the md5 manifest unit-test attributes.
+AWSS3_BUCKET = "aws-s3-manifest-bucket"
+AWSS3_PROFILE = "unit_tests"
+AWSS3_REGION = "us-east-1"
+MANIFEST_PATH = "observations/2000010100/md5sum.txt"
+TEST_BODIES = {
+    "observations/2000010100/bufr/gdas.t00z.sstgrb": b"sstgrb" * 1000,
+    "observations/2000010100/bufr/gdas.t00z.snogrb": b"snogrb" * 1000,
+}
+
+# ----
+
+
+class TestManifestMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all md5 manifest unit-tests; it
+    is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all md5
+        manifest unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.md5s_dict = {
+            object_path: hashlib.md5(body).hexdigest()
+            for (object_path, body) in TEST_BODIES.items()
+        }
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the md5 manifest unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def test_md5sum_pool(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the md5 hash indices
+        computed using a pool of processes.
+
+        """
+
+        # Check the md5 hash indices for each file path.
+        filepaths_list = []
+        for (object_path, body) in TEST_BODIES.items():
+            filepath = os.path.join(self.tmpdir.name, os.path.basename(object_path))
+            with open(filepath, "wb") as file:
+                file.write(body)
+            filepaths_list.append(filepath)
+
+        md5s_list = manifest.md5sum_pool(filepaths_list=filepaths_list, nworkers=2)
+
+        assert md5s_list == list(self.md5s_dict.values())
+
+    @mock_s3
+    def test_manifest_index(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the md5 manifest index;
+        the manifest contains both md5sum- and BSD-formatted entries
+        relative to the manifest directory.
+
+        """
+
+        # Create the mock AWS s3 bucket and md5 manifest.
+        (sstgrb, snogrb) = list(TEST_BODIES)
+        text = (
+            f"{self.md5s_dict[sstgrb]}  bufr/gdas.t00z.sstgrb\n"
+            f"MD5 (bufr/gdas.t00z.snogrb) = {self.md5s_dict[snogrb].upper()}\n"
+        )
+        client = boto3.client("s3", region_name=AWSS3_REGION)
+        client.create_bucket(Bucket=AWSS3_BUCKET)
+        client.put_object(Bucket=AWSS3_BUCKET, Key=MANIFEST_PATH, Body=text.encode())
+
+        # Check the upstream md5 hash indices; objects not listed and
+        # missing manifests are not verified.
+        manifest_index = manifest.ManifestIndex()
+        for object_path in [sstgrb, snogrb]:
+            md5 = manifest_index.lookup(
+                bucket=AWSS3_BUCKET,
+                manifest_path=MANIFEST_PATH,
+                object_path=object_path,
+                profile_name=AWSS3_PROFILE,
+            )
+            assert md5 == self.md5s_dict[object_path]
+
+        assert (
+            manifest_index.lookup(
+                bucket=AWSS3_BUCKET,
+                manifest_path=MANIFEST_PATH,
+                object_path="observations/2000010100/bufr/gdas.t00z.engicegrb",
+                profile_name=AWSS3_PROFILE,
+            )
+            is None
+        )
+        assert (
+            manifest_index.get(
+                bucket=AWSS3_BUCKET,
+                manifest_path="observations/missing/md5sum.txt",
+                profile_name=AWSS3_PROFILE,
+            )
+            is None
+        )
@@ -0,0 +1,450 @@
+# =========================================================================
+
+# Module: staging/tests/test_ncconcat.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_ncconcat.py
+
+Description
+-----------
+
+    This module provides unit-tests for the netCDF-formatted member
+    file concatenations (i.e., subsets, storage layouts, sorting, tree
+    reductions, virtual aggregations, and member file validation).
+
+Classes
+-------
+
+    TestNCConcatMethods()
+
+        This is the base-class object for all netCDF-formatted file
+        concatenation unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- netCDF4; https://github.com/Unidata/netcdf4-python
+
+- numpy; https://numpy.org/
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, mock
+
+import netCDF4
+import numpy
+from staging import ncconcat
+from staging.ncconcat import nc_concat
+from staging.ncvalidate import validate_pool
+from staging.ncvirtual import VirtualDataset
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the netCDF-formatted file concatenation unit-test attributes.
+NCDIM = "nlocs"
+NLOCS = 1000
+NMEMBERS = 3
+
+# ----
+
+
+class TestNCConcatMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all netCDF-formatted file
+    concatenation unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all
+        netCDF-formatted file concatenation unit-tests; the member
+        files contain randomly distributed locations observed at
+        one-second intervals.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ncfilelist = []
+
+        rng = numpy.random.default_rng(seed=0)
+        for member in range(NMEMBERS):
+            ncfilename = os.path.join(self.tmpdir.name, f"member.{member}.nc")
+            with netCDF4.Dataset(ncfilename, "w") as ncobj:
+                ncobj.createDimension(NCDIM, None)
+                group = ncobj.createGroup("MetaData")
+                for varname in ["latitude", "longitude"]:
+                    group.createVariable(varname, "f4", (NCDIM,))
+                group.createVariable("time", "i8", (NCDIM,))
+                group["time"].units = "seconds since 2000-01-01 00:00:00"
+                ncobj.createVariable("sst", "f4", (NCDIM,))
+
+                group["latitude"][:] = rng.uniform(-90.0, 90.0, NLOCS)
+                group["longitude"][:] = rng.uniform(-180.0, 180.0, NLOCS)
+                group["time"][:] = member * NLOCS + numpy.arange(NLOCS)
+                ncobj["sst"][:] = rng.uniform(270.0, 300.0, NLOCS)
+
+            self.ncfilelist.append(ncfilename)
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the netCDF-formatted file concatenation
+        unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def test_layout(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the netCDF-formatted
+        file concatenation storage layouts.
+
+        """
+
+        # Check that the compressed and chunked layout is applied to
+        # the variables dependent upon the concatenation dimension.
+        ncfile = os.path.join(self.tmpdir.name, "chunked.nc")
+        layout = {"complevel": 4, "shuffle": True, "chunksize": 256}
+        nc_concat(
+            ncfilelist=self.ncfilelist, ncfile=ncfile, ncdim=NCDIM, layout=layout
+        )
+
+        with netCDF4.Dataset(ncfile) as ncobj:
+            assert ncobj["sst"].chunking() == [256]
+            assert ncobj["sst"].filters()["zlib"]
+            assert ncobj["MetaData"]["latitude"].filters()["complevel"] == 4
+            assert len(ncobj.dimensions[NCDIM]) == NMEMBERS * NLOCS
+
+        # Check that the contiguous layout defines a fixed size
+        # concatenation dimension.
+        ncfile = os.path.join(self.tmpdir.name, "contiguous.nc")
+        nc_concat(
+            ncfilelist=self.ncfilelist,
+            ncfile=ncfile,
+            ncdim=NCDIM,
+            layout={"contiguous": True},
+        )
+
+        with netCDF4.Dataset(ncfile) as ncobj:
+            assert not ncobj.dimensions[NCDIM].isunlimited()
+            assert ncobj["sst"].chunking() == "contiguous"
+            assert ncobj["MetaData"]["time"][-1] == NMEMBERS * NLOCS - 1
+
+    def test_sort(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the netCDF-formatted
+        file concatenation time-sort and exact duplicate removal.
+
+        """
+
+        # Concatenate the member files, twice, such that each location
+        # is duplicated; the first member is reversed such that the
+        # member order is not the time order.
+        with netCDF4.Dataset(self.ncfilelist[0], "a") as ncobj:
+            ncobj["MetaData"]["time"][:] = ncobj["MetaData"]["time"][::-1]
+
+        ncfile = os.path.join(self.tmpdir.name, "sorted.nc")
+        sort = {"keys": ["MetaData/time"], "unique": True}
+        nc_concat(
+            ncfilelist=self.ncfilelist + self.ncfilelist[::-1],
+            ncfile=ncfile,
+            ncdim=NCDIM,
+            sort=sort,
+        )
+
+        # Check that the locations are unique and sorted and that all
+        # variables are permuted identically.
+        sst = {}
+        for ncfilename in self.ncfilelist:
+            with netCDF4.Dataset(ncfilename) as ncobj:
+                sst.update(zip(ncobj["MetaData"]["time"][:], ncobj["sst"][:]))
+
+        with netCDF4.Dataset(ncfile) as ncobj:
+            times = ncobj["MetaData"]["time"][:]
+            numpy.testing.assert_array_equal(times, numpy.arange(NMEMBERS * NLOCS))
+            numpy.testing.assert_array_equal(
+                ncobj["sst"][:], [sst[time] for time in times]
+            )
+
+    def test_subset(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the netCDF-formatted
+        file concatenation subset (i.e., bounding box, time window,
+        and variable allow-list).
+
+        """
+
+        # Concatenate the member files in accordance with the subset;
+        # the bounding box straddles the dateline.
+        ncfile = os.path.join(self.tmpdir.name, "subset.nc")
+        subset = {
+            "bbox": [-30.0, 30.0, 90.0, -90.0],
+            "latitude": "MetaData/latitude",
+            "longitude": "MetaData/longitude",
+            "time": "MetaData/time",
+            "time_window": ["20000101000640", "20000101003000"],
+            "variables": ["sst", "MetaData/latitude", "MetaData/time"],
+        }
+        nc_concat(
+            ncfilelist=self.ncfilelist,
+            ncfile=ncfile,
+            ncdim=NCDIM,
+            subset=subset,
+        )
+
+        # Check that the subset is identical to the locations, within
+        # the member files, satisfying the subset attributes.
+        values_dict = {}
+        for ncfilename in self.ncfilelist:
+            with netCDF4.Dataset(ncfilename) as ncobj:
+                for varpath in ["MetaData/latitude", "MetaData/longitude", "MetaData/time", "sst"]:
+                    values_dict.setdefault(varpath, []).append(ncobj[varpath][:])
+
+        (lats, lons, times, sst) = [
+            numpy.concatenate(values_list) for values_list in values_dict.values()
+        ]
+        mask = (
+            (lats >= -30.0)
+            & (lats <= 30.0)
+            & ((lons >= 90.0) | (lons <= -90.0))
+            & (times >= 400)
+            & (times <= 1800)
+        )
+
+        with netCDF4.Dataset(ncfile) as ncobj:
+            assert "longitude" not in ncobj["MetaData"].variables
+            assert len(ncobj.dimensions[NCDIM]) == mask.sum() > 0
+            numpy.testing.assert_array_equal(ncobj["sst"][:], sst[mask])
+            numpy.testing.assert_array_equal(ncobj["MetaData"]["time"][:], times[mask])
+
+    def test_tree(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the netCDF-formatted
+        file concatenation tree reduction.
+
+        """
+
+        # Concatenate the member files, twice, both sequentially and as
+        # a tree reduction, without and with a subset and sort.
+        ncfilelist = self.ncfilelist + self.ncfilelist[::-1]
+        subset = {
+            "bbox": [-30.0, 30.0, 90.0, -90.0],
+            "latitude": "MetaData/latitude",
+            "longitude": "MetaData/longitude",
+            "variables": ["sst", "MetaData/latitude"],
+        }
+        sort = {"keys": ["MetaData/time"], "unique": True}
+        for kwargs in [{}, {"subset": subset, "sort": sort}]:
+            ncfiles = [
+                os.path.join(self.tmpdir.name, f"{name}.nc") for name in ["sequential", "tree"]
+            ]
+            nc_concat(ncfilelist=ncfilelist, ncfile=ncfiles[0], ncdim=NCDIM, **kwargs)
+            nc_concat(
+                ncfilelist=ncfilelist,
+                ncfile=ncfiles[1],
+                ncdim=NCDIM,
+                tree={"nworkers": 3},
+                **kwargs,
+            )
+
+            # Check that the groups, the variables, their ordering, and
+            # their values are identical and that the partial files
+            # have been removed.
+            with netCDF4.Dataset(ncfiles[0]) as sequential, netCDF4.Dataset(ncfiles[1]) as tree:
+                groups_list = ncconcat._walk(ncobj=sequential)
+                tree_groups_list = ncconcat._walk(ncobj=tree)
+                assert [path for (path, _) in groups_list] == [
+                    path for (path, _) in tree_groups_list
+                ]
+                for ((_, group), (_, tree_group)) in zip(groups_list, tree_groups_list):
+                    assert list(group.variables) == list(tree_group.variables)
+                    for (varname, ncvar) in group.variables.items():
+                        assert ncvar.dimensions == tree_group[varname].dimensions
+                        numpy.testing.assert_array_equal(ncvar[:], tree_group[varname][:])
+
+            assert sorted(os.listdir(self.tmpdir.name)) == sorted(
+                [os.path.basename(ncfile) for ncfile in ncfilelist[0:NMEMBERS] + ncfiles]
+            )
+
+    def test_tree_pool(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the division of the
+        processes amongst the tree reductions executed concurrently by
+        the netCDF-formatted file concatenation pool.
+
+        """
+
+        # Execute two tree reduction jobs using four processes; check
+        # that each tree reduction is limited to two processes and that
+        # the returned jobs are those specified.
+        concat_jobs_list = [
+            {
+                "ncfilelist": self.ncfilelist,
+                "ncfile": os.path.join(self.tmpdir.name, f"concat.{idx}.nc"),
+                "ncdim": NCDIM,
+                "tree": {"nworkers": nworkers},
+            }
+            for (idx, nworkers) in enumerate([8, 3])
+        ]
+        with mock.patch.object(
+            ncconcat, "ProcessPoolExecutor", ThreadPoolExecutor
+        ), mock.patch.object(ncconcat, "nc_tree") as nc_tree:
+            results_list = ncconcat.concat_pool(concat_jobs_list=concat_jobs_list, nworkers=4)
+
+        assert [call.kwargs["nworkers"] for call in nc_tree.call_args_list] == [2, 2]
+        assert results_list == [(concat_job, None) for concat_job in concat_jobs_list]
+        assert concat_jobs_list[0]["tree"] == {"nworkers": 8}
+
+        # Check that a single tree reduction job uses all processes.
+        with mock.patch.object(ncconcat, "nc_tree") as nc_tree:
+            ncconcat.concat_pool(concat_jobs_list=concat_jobs_list[0:1], nworkers=4)
+
+        assert nc_tree.call_args.kwargs["nworkers"] == 4
+
+    def test_validate(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the netCDF-formatted
+        member file validation.
+
+        """
+
+        # Define a truncated netCDF-4 member file, a truncated classic
+        # member file, and a member file with a differing variable
+        # schema.
+        ncfilelist = list(self.ncfilelist)
+        for (ncfilename, ncfrmt) in [("netcdf4.nc", "NETCDF4"), ("classic.nc", "NETCDF3_CLASSIC")]:
+            ncfilename = os.path.join(self.tmpdir.name, ncfilename)
+            with netCDF4.Dataset(ncfilename, "w", format=ncfrmt) as ncobj:
+                ncobj.createDimension(NCDIM, None)
+                ncobj.createVariable("sst", "f4", (NCDIM,))[:] = numpy.zeros(NLOCS)
+
+            with open(ncfilename, "rb+") as file:
+                file.truncate(os.path.getsize(ncfilename) - 1)
+            ncfilelist.append(ncfilename)
+
+        with netCDF4.Dataset(self.ncfilelist[-1], "a") as ncobj:
+            ncobj.createVariable("sst_error", "f4", (NCDIM,))
+
+        # Check that only the invalid member files are reported.
+        (invalid_dict, missing_dict) = validate_pool(
+            validate_jobs_list=[
+                {"ncfilelist": ncfilelist, "ncdim": NCDIM},
+                {"ncfilelist": self.ncfilelist[0:1], "ncdim": "nobs"},
+            ],
+            nworkers=2,
+        )
+
+        assert sorted(invalid_dict) == sorted(ncfilelist[-3:])
+        assert "truncated" in invalid_dict[ncfilelist[-1]]
+        assert "sst_error" in invalid_dict[self.ncfilelist[-1]]
+        assert list(missing_dict) == self.ncfilelist[0:1]
+
+    def test_virtual(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the virtual aggregation
+        index and reader.
+
+        """
+
+        # Write the virtual aggregation index.
+        ncfile = os.path.join(self.tmpdir.name, "virtual.json")
+        nc_concat(
+            ncfilelist=self.ncfilelist, ncfile=ncfile, ncdim=NCDIM, virtual=True
+        )
+
+        sst = []
+        for ncfilename in self.ncfilelist:
+            with netCDF4.Dataset(ncfilename) as ncobj:
+                sst.append(ncobj["sst"][:])
+        sst = numpy.concatenate(sst)
+
+        # Check that slices spanning multiple member files, integer
+        # and boolean arrays, and scalar indices match the member
+        # files.
+        rng = numpy.random.default_rng(seed=1)
+        window = slice(NLOCS - 10, 2 * NLOCS + 10, 3)
+        indices = rng.integers(0, NMEMBERS * NLOCS, 100)
+        with VirtualDataset(index_path=ncfile) as dataset:
+            assert dataset.dimensions[NCDIM] == NMEMBERS * NLOCS
+            assert dataset["MetaData/time"].shape == (NMEMBERS * NLOCS,)
+            numpy.testing.assert_array_equal(dataset["sst"][:], sst)
+            numpy.testing.assert_array_equal(dataset["sst"][window], sst[window])
+            numpy.testing.assert_array_equal(dataset["sst"][indices], sst[indices])
+            numpy.testing.assert_array_equal(
+                dataset["sst"][sst > 285.0], sst[sst > 285.0]
+            )
+            assert dataset["MetaData/time"][-1] == NMEMBERS * NLOCS - 1
@@ -0,0 +1,347 @@
+# =========================================================================
+
+# Module: staging/tests/test_prefetch.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_prefetch.py
+
+Description
+-----------
+
+    This module provides unit-tests for the prefetch application; the
+    AWS s3 interface is emulated locally.
+
+Classes
+-------
+
+    TestPrefetchMethods()
+
+        This is the base-class object for all prefetch application
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- moto; https://github.com/getmoto/moto
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import tempfile
+from unittest import TestCase, mock
+
+import boto3
+from confs.yaml_interface import YAML
+from moto import mock_s3
+from staging import awss3
+from staging.prefetch import Prefetch
+from tools import parser_interface
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the prefetch application unit-test attributes.
+AWSS3_BUCKET = "prefetch-test-bucket"
+AWSS3_REGION = "us-east-1"
+AWSS3_TEST_MESSAGE = "UNIT TEST FOR PREFETCH APPLICATION"
+CYCLE = "20000101000000"
+PREFETCH_CYCLES_LIST = ["20000101060000", "20000101120000", "20000101180000"]
+
+# ----
+
+
+class TestPrefetchMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all prefetch application
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all prefetch
+        application unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.yaml_file = os.path.join(self.tmpdir.name, "test_prefetch.yaml")
+        self.cycles_list = []
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the prefetch application unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def build_prefetch(self, timeout_seconds: int = 0) -> Prefetch:
+        """
+        Description
+        -----------
+
+        This method writes the YAML-formatted configuration file and
+        initializes the prefetch application for the forecast cycles
+        following the unit-test forecast cycle.
+
+        Parameters
+        ----------
+
+        timeout_seconds: int, optional
+
+            A Python integer specifying the prefetch timeout; if 0, a
+            single prefetch attempt is performed.
+
+        Returns
+        -------
+
+        prefetch: Prefetch
+
+            A Python object containing the prefetch application.
+
+        """
+
+        # Write the YAML-formatted configuration file.
+        fetch_dict = {
+            "cache": {"cache_path": os.path.join(self.tmpdir.name, "cache")},
+            "prefetch": {"poll_seconds": 1, "timeout_seconds": timeout_seconds},
+            "aws_s3": {
+                "test_prefetch": {
+                    "test_prefetch_file": {
+                        "local_path": os.path.join(self.tmpdir.name, "prefetch.file"),
+                        "offset_seconds": 0,
+                        "bucket": AWSS3_BUCKET,
+                        "object_path": "%Y%m%d%H/prefetch_object.file",
+                        "profile_name": "unit_tests",
+                        "ignore_missing": True,
+                    }
+                }
+            },
+        }
+        YAML().write_yaml(yaml_file=self.yaml_file, in_dict={"fetch": fetch_dict})
+
+        # Initialize the prefetch application.
+        options_obj = parser_interface.object_define()
+        for (key, value) in [
+            ("cycle", CYCLE),
+            ("yaml_file", self.yaml_file),
+            ("platform", "aws_s3"),
+            ("expt_name", "UNIT_TEST"),
+            ("work_path", self.tmpdir.name),
+            ("prefetch_cycles", len(PREFETCH_CYCLES_LIST)),
+        ]:
+            options_obj = parser_interface.object_setattr(
+                object_in=options_obj, key=key, value=value
+            )
+
+        prefetch = Prefetch(options_obj=options_obj)
+
+        return prefetch
+
+    def object_path(self, cycle: str) -> str:
+        """
+        Description
+        -----------
+
+        This method defines the AWS s3 object path for the specified
+        forecast cycle.
+
+        """
+
+        # Define the AWS s3 object path.
+        return f"{cycle[0:10]}/prefetch_object.file"
+
+    def put_object(self, cycle: str) -> None:
+        """
+        Description
+        -----------
+
+        This method creates the mock AWS s3 object path for the
+        specified forecast cycle.
+
+        """
+
+        # Create the mock AWS s3 object path.
+        boto3.client("s3", region_name=AWSS3_REGION).put_object(
+            Bucket=AWSS3_BUCKET, Key=self.object_path(cycle=cycle), Body=AWSS3_TEST_MESSAGE
+        )
+
+    def cached(self, prefetch: Prefetch, cycle: str) -> bool:
+        """
+        Description
+        -----------
+
+        This method determines whether the AWS s3 object path for the
+        specified forecast cycle exists within the local object
+        cache.
+
+        """
+
+        # Check the local object cache.
+        etag = awss3.get_etag(
+            bucket=AWSS3_BUCKET,
+            object_path=self.object_path(cycle=cycle),
+            profile_name="unit_tests",
+        )
+
+        return (
+            prefetch.cache.lookup(
+                bucket=AWSS3_BUCKET, object_path=self.object_path(cycle=cycle), etag=etag
+            )
+            is not None
+        )
+
+    @mock_s3
+    def test_prefetch_cache(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the prefetch application
+        collection of the available files into the local object cache
+        and for the files that already exist within the local object
+        cache.
+
+        """
+
+        # Create the mock AWS s3 object paths for all but the last
+        # forecast cycle and prefetch the files; the prefetch timeout
+        # is reached since the last forecast cycle is not available.
+        boto3.resource("s3", region_name=AWSS3_REGION).create_bucket(Bucket=AWSS3_BUCKET)
+        for cycle in PREFETCH_CYCLES_LIST[0:-1]:
+            self.put_object(cycle=cycle)
+
+        prefetch = self.build_prefetch()
+        prefetch.run()
+
+        for cycle in PREFETCH_CYCLES_LIST[0:-1]:
+            assert self.cached(prefetch=prefetch, cycle=cycle)
+
+        # Prefetch the files again and check that the files that
+        # exist within the local object cache are not collected
+        # again.
+        self.put_object(cycle=PREFETCH_CYCLES_LIST[-1])
+        with mock.patch.object(awss3, "download", wraps=awss3.download) as download:
+            self.build_prefetch().run()
+
+        assert download.call_count == 1
+        assert self.cached(prefetch=prefetch, cycle=PREFETCH_CYCLES_LIST[-1])
+
+    @mock_s3
+    def test_prefetch_pressure(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the prefetch application
+        when the collection is stopped due to disk or bandwidth
+        pressure.
+
+        """
+
+        # Check that the host is under disk pressure when the minimum
+        # free space cannot be satisfied.
+        boto3.resource("s3", region_name=AWSS3_REGION).create_bucket(Bucket=AWSS3_BUCKET)
+        prefetch = self.build_prefetch()
+        prefetch.get_cache_info(fetch_dict=prefetch.build_fetch_dict())
+        prefetch.limiter = None
+        prefetch_obj = prefetch.get_prefetch_info(fetch_dict=prefetch.build_fetch_dict())
+        prefetch_obj.min_free_bytes = 2**62
+
+        assert prefetch.check_pressure(prefetch_obj=prefetch_obj).startswith("disk pressure")
+
+        # The file for the first forecast cycle is not yet available
+        # and the host is under pressure for the second forecast
+        # cycle; check that all forecast cycles are collected during
+        # the subsequent attempt (during which the file for the first
+        # forecast cycle is available).
+        for cycle in PREFETCH_CYCLES_LIST[1:]:
+            self.put_object(cycle=cycle)
+
+        prefetch = self.build_prefetch(timeout_seconds=60)
+        reasons_list = [None, "disk pressure (unit-test)"] + [None] * 10
+        with mock.patch.object(
+            prefetch, "check_pressure", side_effect=reasons_list
+        ), mock.patch.object(
+            prefetch, "prefetch_cycle", side_effect=self.record_cycle(prefetch=prefetch)
+        ), mock.patch(
+            "staging.prefetch.time.sleep",
+            side_effect=lambda _: self.put_object(cycle=PREFETCH_CYCLES_LIST[0]),
+        ):
+            prefetch.run()
+
+        assert self.cycles_list == [
+            PREFETCH_CYCLES_LIST[0],
+            PREFETCH_CYCLES_LIST[1],
+        ] + PREFETCH_CYCLES_LIST
+        for cycle in PREFETCH_CYCLES_LIST:
+            assert self.cached(prefetch=prefetch, cycle=cycle)
+
+    def record_cycle(self, prefetch: Prefetch) -> object:
+        """
+        Description
+        -----------
+
+        This method returns a function which records the forecast
+        cycle for each prefetch attempt and subsequently prefetches
+        the respective forecast cycle.
+
+        """
+
+        # Define the prefetch function.
+        prefetch_cycle = prefetch.prefetch_cycle
+
+        def _prefetch_cycle(**kwargs) -> tuple:
+            self.cycles_list.append(prefetch.cycle)
+            return prefetch_cycle(**kwargs)
+
+        return _prefetch_cycle
@@ -0,0 +1,201 @@
+# =========================================================================
+
+# Module: staging/tests/test_ratelimit.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_ratelimit.py
+
+Description
+-----------
+
+    This module provides unit-tests for the token-bucket bandwidth
+    limiters.
+
+Classes
+-------
+
+    TestRateLimitMethods()
+
+        This is the base-class object for all bandwidth limiter
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import stat
+import struct
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from staging.ratelimit import BROKER_FORMAT, NodeTokenBucket, RateLimiter, TokenBucket
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the bandwidth limiter unit-test attributes.
+NRESERVE = 2000
+NTHREADS = 8
+RATE = 1000.0
+
+# ----
+
+
+class TestRateLimitMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all bandwidth limiter
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all
+        bandwidth limiter unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.broker_path = os.path.join(self.tmpdir.name, "broker")
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the bandwidth limiter unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def test_token_bucket(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the per-process token
+        bucket.
+
+        """
+
+        # Check that the burst is available without waiting and that
+        # overdrawing the token bucket requires a wait proportional
+        # to the overdrawn bytes.
+        bucket = TokenBucket(rate=RATE)
+
+        assert bucket.reserve(nbytes=RATE) == 0.0
+        assert 0.45 < bucket.reserve(nbytes=RATE / 2.0) <= 0.5
+
+    def test_node_token_bucket(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the node-wide token
+        bucket shared by multiple limiters.
+
+        """
+
+        # Check that two limiters sharing the broker file path share
+        # the node-wide token bucket.
+        limiters = [
+            RateLimiter(node_max_rate=RATE, broker_path=self.broker_path)
+            for _ in range(2)
+        ]
+
+        assert limiters[0].reserve(nbytes=RATE) == 0.0
+        assert 0.95 < limiters[1].reserve(nbytes=RATE) <= 1.0
+
+        # Check that a limiter using a separate broker file path is
+        # not bounded by the shared node-wide token bucket.
+        bucket = NodeTokenBucket(
+            rate=RATE, broker_path=os.path.join(self.tmpdir.name, "other")
+        )
+
+        assert bucket.reserve(nbytes=RATE) == 0.0
+
+        # Check that the broker file path may be shared by all users.
+        assert stat.S_IMODE(os.stat(self.broker_path).st_mode) == 0o666
+
+    def test_node_token_bucket_threads(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the node-wide token
+        bucket shared by multiple threads.
+
+        """
+
+        # Reserve the bytes from multiple threads, each using its own
+        # limiter or the shared limiter, and check that all reserved
+        # bytes are charged to the node-wide token bucket; the
+        # replenishment rate is such that the replenished tokens are
+        # negligible.
+        rate = 1.0e-6
+        shared = NodeTokenBucket(rate=rate, broker_path=self.broker_path, burst=0.0)
+        buckets_list = [shared] * (NTHREADS // 2) + [
+            NodeTokenBucket(rate=rate, broker_path=self.broker_path, burst=0.0)
+            for _ in range(NTHREADS // 2)
+        ]
+
+        def _reserve(bucket: NodeTokenBucket) -> None:
+            for _ in range(NRESERVE):
+                bucket.reserve(nbytes=1)
+
+        with ThreadPoolExecutor(max_workers=NTHREADS) as executor:
+            list(executor.map(_reserve, buckets_list))
+
+        with open(self.broker_path, "rb") as file:
+            (tokens, _) = struct.unpack(BROKER_FORMAT, file.read())
+
+        assert abs(tokens + NTHREADS * NRESERVE) < 1.0
@@ -0,0 +1,198 @@
+# =========================================================================
+
+# Module: staging/tests/test_service.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_service.py
+
+Description
+-----------
+
+    This module provides unit-tests for the resident staging service;
+    the AWS s3 interface is emulated locally.
+
+Classes
+-------
+
+    TestServiceMethods()
+
+        This is the base-class object for all staging service
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- moto; https://github.com/getmoto/moto
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+import boto3
+from confs.yaml_interface import YAML
+from moto import mock_s3
+from staging.service import StagingService, request
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the staging service unit-test attributes.
+AWSS3_REGION = "us-east-1"
+AWSS3_TEST_MESSAGE = "UNIT TEST FOR STAGING SERVICE"
+CYCLE = "20000101000000"
+YAML_FILE = "test_fetch.yaml"
+
+# ----
+
+
+class TestServiceMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all staging service unit-tests;
+    it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all staging
+        service unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmpdir.name, "staging.sock")
+        self.yaml_file = os.path.join(os.getcwd(), "test_files", YAML_FILE)
+        self.awss3_test_dict = YAML().read_yaml(yaml_file=self.yaml_file)["fetch"][
+            "aws_s3"
+        ]["test_awss3"]["test_awss3_file"]
+        self.request_dict = {
+            "cycle": CYCLE,
+            "expt_name": "UNIT_TEST",
+            "platform": "aws_s3",
+            "work_path": os.getcwd(),
+            "yaml_file": self.yaml_file,
+        }
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the staging service unit-test files.
+
+        """
+
+        # Remove the unit-test files.
+        if os.path.exists(self.awss3_test_dict["local_path"]):
+            os.remove(self.awss3_test_dict["local_path"])
+        self.tmpdir.cleanup()
+
+    @mock_s3
+    def test_service_fetch(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the staging service
+        fetch requests, including the removal of duplicate in-flight
+        fetch requests.
+
+        """
+
+        # Create the mock AWS s3 bucket and object path.
+        boto3.resource("s3", region_name=AWSS3_REGION).create_bucket(
+            Bucket=self.awss3_test_dict["bucket"]
+        )
+        boto3.client("s3", region_name=AWSS3_REGION).put_object(
+            Bucket=self.awss3_test_dict["bucket"],
+            Key=self.awss3_test_dict["object_path"],
+            Body=AWSS3_TEST_MESSAGE,
+        )
+
+        # Queue two identical fetch requests prior to starting the
+        # staging service and check that they are shared.
+        service = StagingService(socket_path=self.socket_path)
+        fetch_requests = [
+            service.enqueue(request_dict=dict(self.request_dict)) for _ in range(2)
+        ]
+
+        assert fetch_requests[0] is fetch_requests[1]
+
+        # Start the staging service and check that the queued fetch
+        # request is executed once.
+        threading.Thread(target=service.serve, daemon=True).start()
+
+        assert fetch_requests[0].wait(timeout=60) == {"status": "ok"}
+
+        for _ in range(100):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.1)
+
+        response = request(socket_path=self.socket_path, request_dict={"op": "status"})
+
+        assert response["executed"] == 1
+        assert response["deduplicated"] == 1
+
+        # Submit a fetch request via the Unix domain socket and check
+        # that the contents of the collected file are valid.
+        response = request(
+            socket_path=self.socket_path,
+            request_dict={"op": "fetch", **self.request_dict},
+            timeout=60,
+        )
+
+        assert response == {"status": "ok"}
+        with open(self.awss3_test_dict["local_path"], "r", encoding="utf-8") as file:
+            assert file.read() == AWSS3_TEST_MESSAGE
+
+        # Shutdown the staging service.
+        request(socket_path=self.socket_path, request_dict={"op": "shutdown"})
@@ -0,0 +1,236 @@
+# =========================================================================
+
+# Module: staging/tests/test_shard.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_shard.py
+
+Description
+-----------
+
+    This module provides unit-tests for the fetch application shards
+    and work queues.
+
+Classes
+-------
+
+    TestShardMethods()
+
+        This is the base-class object for all fetch application shard
+        and work queue unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from staging.shard import Shard, WorkQueue, assign, parse
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+
+class TestShardMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all fetch application shard
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all fetch
+        application shard unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirpath = os.path.join(self.tmpdir.name, "fetch.shards")
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the fetch application shard unit-test
+        files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def test_assign(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the size-balanced object
+        partition.
+
+        """
+
+        # Check that the partition is independent of the object order
+        # and that the shard loads are balanced.
+        sizes_list = [(f"object.{idx}", (idx * 7919) % 1000 + 1) for idx in range(200)]
+        shards_list = assign(sizes_list=sizes_list, count=4)
+        reversed_list = assign(sizes_list=sizes_list[::-1], count=4)
+
+        assert shards_list == reversed_list[::-1]
+        loads_list = [
+            sum(size for ((_, size), shard) in zip(sizes_list, shards_list) if shard == index)
+            for index in range(4)
+        ]
+        assert max(loads_list) - min(loads_list) <= max(size for (_, size) in sizes_list)
+
+    def test_parse(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the shard attribute
+        parser.
+
+        """
+
+        # Check the explicit and Slurm job array shard attributes.
+        assert parse(shard="1/4") == (1, 4)
+
+        environ = {"SLURM_ARRAY_TASK_ID": "12", "SLURM_ARRAY_TASK_MIN": "10", "SLURM_ARRAY_TASK_MAX": "13"}
+        with mock.patch.dict(os.environ, environ):
+            assert parse(shard="slurm") == (2, 4)
+
+    def test_complete(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the shard object sizes
+        and the reduce task coordination.
+
+        """
+
+        # Check that the object sizes are determined once and that
+        # only the last shard to complete claims the reduce task.
+        keys_list = [f"object.{idx}" for idx in range(10)]
+        sizes_calls = []
+
+        def sizer():
+            sizes_calls.append(True)
+            return list(range(10))
+
+        shards_list = [Shard(shard=f"{index}/3", dirpath=self.dirpath) for index in range(3)]
+        assigned_list = [shard.assign(keys_list=keys_list, sizer=sizer) for shard in shards_list]
+
+        assert len(sizes_calls) == 1
+        assert [sum(assigned) for assigned in zip(*assigned_list)] == [1] * 10
+        assert [shard.complete() for shard in shards_list] == [False, False, True]
+        assert not shards_list[2].complete()
+
+        # Check that the shards are coordinated anew once the
+        # coordination files have been removed (e.g., a rerun of the
+        # respective forecast cycle).
+        shards_list[2].remove()
+        shards_list = [Shard(shard=f"{index}/3", dirpath=self.dirpath) for index in range(3)]
+        for shard in shards_list:
+            shard.assign(keys_list=keys_list, sizer=sizer)
+
+        assert len(sizes_calls) == 2
+        assert [shard.complete() for shard in shards_list] == [False, False, True]
+
+    def test_work_queue(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the work queue claims,
+        leases, and the reduce task coordination.
+
+        """
+
+        # Check that the objects are claimed in order of decreasing
+        # size, that failed and expired claims are returned to the
+        # work queue, and that only a single worker claims the reduce
+        # task.
+        keys_list = ["small", "large", "medium"]
+        workers_list = [
+            WorkQueue(dirpath=self.dirpath, lease_seconds=3600.0, poll_seconds=0.01)
+            for _ in range(2)
+        ]
+        for worker in workers_list:
+            worker.populate(keys_list=keys_list, sizer=lambda: [1, 100, 10])
+
+        with workers_list[0].lease(rank=workers_list[0].claim()) as key:
+            assert key == "large"
+
+        with self.assertRaises(RuntimeError):
+            with workers_list[0].lease(rank=workers_list[0].claim()) as key:
+                assert key == "medium"
+                raise RuntimeError
+
+        rank = workers_list[1].claim()
+        assert workers_list[1].keys_list[rank] == "medium"
+
+        workers_list[0].lease_seconds = 0.0
+        with workers_list[0].lease(rank=workers_list[0].claim()) as key:
+            assert key == "small"
+        assert not workers_list[0].complete()
+        with workers_list[0].lease(rank=workers_list[0].claim()) as key:
+            assert key == "medium"
+
+        assert workers_list[0].claim() is None
+        assert [worker.complete() for worker in workers_list] == [True, False]
+
+        # Check that the workers which have not completed observe the
+        # removed work queue as empty.
+        workers_list[0].remove()
+        assert workers_list[1].claim() is None
+        assert not workers_list[1].complete()
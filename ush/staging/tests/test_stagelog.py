@@ -0,0 +1,182 @@
+# =========================================================================
+
+# Module: staging/tests/test_stagelog.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_stagelog.py
+
+Description
+-----------
+
+    This module provides unit-tests for the staging application
+    logger.
+
+Classes
+-------
+
+    TestStagelogMethods()
+
+        This is the base-class object for all staging application
+        logger unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import threading
+from unittest import TestCase
+
+from exceptions import StagingError
+from staging.stagelog import StagingLogger, flush, msg_except_handle
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+
+class FormatRecorder:
+    """
+    Description
+    -----------
+
+    This is the base-class object for recording the threads within
+    which a message argument is formatted.
+
+    """
+
+    def __init__(self):
+        """
+        Description
+        -----------
+
+        Creates a new FormatRecorder object.
+
+        """
+
+        # Define the base-class attributes.
+        self.threads_list = []
+
+    def __str__(self) -> str:
+        """
+        Description
+        -----------
+
+        This method records the thread within which the message
+        argument is formatted.
+
+        """
+
+        # Record the thread.
+        self.threads_list.append(threading.current_thread())
+
+        return "unit-test"
+
+
+# ----
+
+
+class TestStagelogMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all staging application logger
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def test_staging_logger(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the level-gated and
+        background-thread formatting of the staging application
+        logger messages.
+
+        """
+
+        # Check that the messages for a disabled level are never
+        # formatted and that the messages for an enabled level are
+        # formatted by the background thread.
+        logger = StagingLogger(level="info")
+        assert not logger.enabled(level="debug")
+        assert logger.enabled(level="warn")
+
+        disabled = FormatRecorder()
+        logger.debug("Disabled message %s.", disabled)
+        enabled = FormatRecorder()
+        logger.info("Enabled message %s.", enabled)
+        flush()
+
+        assert not disabled.threads_list
+        assert len(enabled.threads_list) == 1
+        assert enabled.threads_list[0] is not threading.current_thread()
+
+    def test_msg_except_handle(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the staging application
+        logger exception handler.
+
+        """
+
+        # Check that the queued messages are written prior to raising
+        # the exception.
+        @msg_except_handle(StagingError)
+        def error(msg: str) -> None:
+            """
+            Description
+            -----------
+
+            This function is the unit-test exception handler.
+
+            """
+
+        logger = StagingLogger(level="info")
+        queued = FormatRecorder()
+        logger.info("Queued message %s.", queued)
+        with self.assertRaises(StagingError):
+            try:
+                error(msg="unit-test")
+            finally:
+                assert len(queued.threads_list) == 1
@@ -0,0 +1,178 @@
+# =========================================================================
+
+# Module: staging/tests/test_streams.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_streams.py
+
+Description
+-----------
+
+    This module provides unit-tests for the datestream interval index.
+
+Classes
+-------
+
+    TestStreamsMethods()
+
+        This is the base-class object for all datestream interval
+        index unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import random
+import time
+from unittest import TestCase
+
+from staging.streams import StreamIndex, get_index
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the datestream interval index unit-test attributes.
+OPT_ATTR_DICT = {
+    "multifile": None,
+    "offset_seconds": 0,
+    "stream_start": 19000101000000,
+    "stream_stop": 20991231230000,
+}
+
+# ----
+
+
+class TestStreamsMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all datestream interval index
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def test_stream_index(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the datestream interval
+        index queries.
+
+        """
+
+        # Check that the index queries match a linear search of the
+        # intervals.
+        rng = random.Random(10)
+        intervals_list = []
+        for idx in range(500):
+            start = rng.randint(0, 10**9)
+            intervals_list.append((idx, start, start + rng.randint(-(10**7), 10**8)))
+        intervals_list.append((500, None, None))
+        stream_index = StreamIndex(intervals_list=intervals_list)
+
+        assert len(stream_index) == 501
+        for _ in range(50):
+            seconds = rng.randint(0, 10**9) // 3600 * 3600
+            cycle = time.strftime("%Y%m%d%H%M%S", time.gmtime(seconds))
+            expected_set = {
+                key
+                for (key, start, stop) in intervals_list
+                if start is None or start <= seconds <= stop
+            }
+            assert stream_index.active(cycle=cycle) == expected_set
+
+    def test_get_index(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the datestream interval
+        index built from a fetch configuration.
+
+        """
+
+        # Check that the file identifier offsets and multifile windows
+        # are applied and that invalid datestreams are always active.
+        fetch_dict = {
+            "aws_s3": {
+                "sst": {
+                    "avhrr_noaa07": {
+                        "stream_start": 19810825000000,
+                        "stream_stop": 19850201000000,
+                    },
+                    "avhrr_metop_b": {"stream_start": 20130101000000},
+                    "window": {
+                        "stream_start": 20200101000000,
+                        "stream_stop": 20200101060000,
+                        "multifile": {
+                            "offset_seconds": 3600,
+                            "start_offset_seconds": -10800,
+                            "stop_offset_seconds": 10800,
+                        },
+                    },
+                    "malformed": {"stream_start": 200305310000000},
+                }
+            }
+        }
+        fetch_attrs_dict = {"aws_s3": {"opt_attr_dict": OPT_ATTR_DICT}}
+        stream_index = get_index(
+            fetch_dict=fetch_dict, fetch_attrs_dict=fetch_attrs_dict, key=("unit-test",)
+        )
+
+        assert {key[2] for key in stream_index.active(cycle="19840101000000")} == {
+            "avhrr_noaa07",
+            "malformed",
+        }
+        assert {key[2] for key in stream_index.active(cycle="20200101090000")} == {
+            "avhrr_metop_b",
+            "window",
+            "malformed",
+        }
+        assert {key[2] for key in stream_index.active(cycle="20200101100000")} == {
+            "avhrr_metop_b",
+            "malformed",
+        }
+        assert (
+            get_index(fetch_dict={}, fetch_attrs_dict=fetch_attrs_dict, key=("unit-test",))
+            is stream_index
+        )
@@ -0,0 +1,173 @@
+# =========================================================================
+
+# Module: staging/tests/test_streams.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_tarindex.py
+
+Description
+-----------
+
+    This module provides unit-tests for the tar archive member
+    indices.
+
+Classes
+-------
+
+    TestTarIndexMethods()
+
+        This is the base-class object for all tar archive member index
+        unit-tests; it is a sub-class of TestCase.
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org/en/7.2.x/
+
+Author(s)
+---------
+
+    Henry R. Winterbottom; 19 October 2026
+
+History
+-------
+
+    2026-10-19: Henry Winterbottom -- Initial implementation.
+
+"""
+
+# ----
+
+import io
+import os
+import tarfile
+import tempfile
+from unittest import TestCase
+
+from staging.tarindex import TarIndex, build_index, extract, index_filepath, read_index
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+# Define the tar archive member index unit-test attributes.
+MEMBERS_DICT = {
+    "./obs/2000010100/sst.nc": b"SST" * 1000,
+    "obs/2000010100/ice.nc": b"",
+    "obs/2000010106/sst.nc": os.urandom(70000),
+}
+
+# ----
+
+
+class TestTarIndexMethods(TestCase):
+    """
+    Description
+    -----------
+
+    This is the base-class object for all tar archive member index
+    unit-tests; it is a sub-class of TestCase.
+
+    """
+
+    def setUp(self):
+        """
+        Description
+        -----------
+
+        This method defines the base-class attributes for all tar
+        archive member index unit-tests.
+
+        """
+
+        # Define base-class attributes.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.tar_path = os.path.join(self.tmpdir.name, "obs.tar")
+        with tarfile.open(self.tar_path, mode="w") as tar:
+            for (name, data) in MEMBERS_DICT.items():
+                tarinfo = tarfile.TarInfo(name=name)
+                tarinfo.size = len(data)
+                tar.addfile(tarinfo, io.BytesIO(data))
+
+    def tearDown(self):
+        """
+        Description
+        -----------
+
+        This method removes the tar archive member index unit-test
+        files.
+
+        """
+
+        # Remove the unit-test files.
+        self.tmpdir.cleanup()
+
+    def test_extract(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the tar archive member
+        lookup and extraction.
+
+        """
+
+        # Check that each member is extracted from its data offset and
+        # that missing members are not reported.
+        tar_index = TarIndex()
+        for (name, data) in MEMBERS_DICT.items():
+            (offset, size) = tar_index.lookup(tar_path=self.tar_path, name=name)
+            dst_path = os.path.join(self.tmpdir.name, os.path.basename(name))
+            extract(tar_path=self.tar_path, offset=offset, size=size, dst_path=dst_path)
+            with open(dst_path, "rb") as file:
+                assert file.read() == data
+
+        assert tar_index.lookup(tar_path=self.tar_path, name="obs/missing.nc") is None
+        assert tar_index.lookup(tar_path=f"{self.tar_path}.missing", name="obs") is None
+
+    def test_read_index(self) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the sidecar index.
+
+        """
+
+        # Check that the sidecar index is written and that it is no
+        # longer valid once the tar archive has been modified.
+        index_dict = build_index(tar_path=self.tar_path)
+
+        assert os.path.isfile(index_filepath(tar_path=self.tar_path))
+        assert read_index(tar_path=self.tar_path) == index_dict
+        assert set(index_dict["members"]) == {
+            "obs/2000010100/sst.nc",
+            "obs/2000010100/ice.nc",
+            "obs/2000010106/sst.nc",
+        }
+
+        with open(self.tar_path, "ab") as file:
+            file.write(b"\0" * 512)
+        assert read_index(tar_path=self.tar_path) is None